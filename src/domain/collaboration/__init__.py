@@ -47,9 +47,11 @@ Examples
 
 from .task_schema import (
     TaskIOError,
+    TaskMove,
     TaskSchemaError,
     TaskValidationError,
     load_task_safe,
+    move_tasks,
     read_task,
     write_task,
 )
@@ -61,6 +63,8 @@ __all__ = [
     "read_task",
     "write_task",
     "load_task_safe",
+    "move_tasks",
+    "TaskMove",
     # Task validation
     "validate_task",
     # Types and enums
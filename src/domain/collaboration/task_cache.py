@@ -0,0 +1,208 @@
+"""
+Task Cache - Process-wide LRU cache of parsed task files.
+
+Every task loader in a process (read_task/load_task_safe, TaskLinker,
+TaskRepository, task_query, the dashboard FileWatcher and the tools/scripts
+CLIs) goes through ParsedTaskCache, so an unchanged file is parsed once per
+process instead of once per consumer per request.
+
+Entries are keyed by file identity, (path, st_mtime_ns, st_size, st_ino),
+taken from the open file descriptor so the key always describes the bytes
+that were parsed. Files modified within RACY_WINDOW_NS of being read are
+not cached: a rewrite within the same timestamp tick could otherwise keep
+an identical key (the "racy git" problem).
+
+Documents are stored marshalled: the stored size is what the memory cap
+counts, and every hit returns a fresh copy that callers may mutate.
+
+Related ADRs:
+    - ADR-042: Shared Task Domain Model
+    - ADR-046: Domain Module Refactoring
+
+Usage Example:
+    >>> document = get_task_cache().load(Path("work/collaboration/inbox/t.yaml"))
+    >>> get_task_cache().stats().hit_rate
+    0.0
+"""
+
+from __future__ import annotations
+
+import marshal
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from src.domain.collaboration.task_codec import (
+    decode_task,
+    get_task_codec,
+    pack_document,
+    unpack_document,
+)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # Marshalled documents held in memory
+DEFAULT_MAX_ENTRIES = 100_000
+
+# File timestamps are coarse (kernel clock ticks, 1-2s on some filesystems)
+RACY_WINDOW_NS = 2_000_000_000
+
+CacheKey = tuple[str, int, int, int, str]
+
+
+@dataclass(frozen=True)
+class TaskCacheStats:
+    """Counters of a ParsedTaskCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class ParsedTaskCache:
+    """
+    LRU cache of decoded task documents with a memory cap.
+
+    Thread-safe. Parse errors are never cached, so a broken file is
+    reported on every load until it is fixed.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        decoder: Callable[[bytes], Any] = decode_task,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Upper bound on stored (marshalled) document bytes
+            max_entries: Upper bound on number of cached files
+            decoder: Turns raw file bytes into a document (default: task codec)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.decoder = decoder
+        self._entries: OrderedDict[str, tuple[CacheKey, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path: Path) -> Any:
+        """
+        Return the decoded document of a file, parsing only on a miss.
+
+        Args:
+            path: File to load
+
+        Returns:
+            Decoded document (a fresh copy on every call)
+
+        Raises:
+            OSError: If the file cannot be opened or read
+            Exception: Whatever the decoder raises for invalid content
+        """
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            name = os.fspath(path)
+            key = (
+                name,
+                stat.st_mtime_ns,
+                stat.st_size,
+                stat.st_ino,
+                get_task_codec().name,
+            )
+
+            with self._lock:
+                cached = self._entries.get(name)
+                if cached is not None and cached[0] == key:
+                    self._entries.move_to_end(name)
+                    self.hits += 1
+                    blob = cached[1]
+                else:
+                    self.misses += 1
+                    blob = None
+
+            if blob is not None:
+                return unpack_document(marshal.loads(blob))
+
+            document = self.decoder(f.read())
+
+        if time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS:
+            self._store(name, key, document)
+        return document
+
+    def _store(self, name: str, key: CacheKey, document: Any) -> None:
+        """Insert a document, evicting least recently used entries."""
+        try:
+            blob = marshal.dumps(pack_document(document))
+        except (TypeError, ValueError):
+            # Not representable (exotic YAML types): just don't cache it
+            return
+        if len(blob) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(name, None)
+            if previous is not None:
+                self._bytes -= len(previous[1])
+            self._entries[name] = (key, blob)
+            self._bytes += len(blob)
+
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def invalidate(self, path: Path) -> None:
+        """Drop the entry for one file (optional; keys already detect change)."""
+        with self._lock:
+            entry = self._entries.pop(os.fspath(path), None)
+            if entry is not None:
+                self._bytes -= len(entry[1])
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> TaskCacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return TaskCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+
+_task_cache = ParsedTaskCache()
+
+
+def get_task_cache() -> ParsedTaskCache:
+    """Return the process-wide parsed-task cache."""
+    return _task_cache
@@ -0,0 +1,311 @@
+"""
+Task Codec - Serialization layer beneath read_task() and write_task().
+
+TaskCodec turns task file content into Python objects and back. The
+default YAMLTaskCodec uses libyaml (CSafeLoader/CSafeDumper) when PyYAML
+was built with it, falling back to the pure-Python SafeLoader/SafeDumper.
+
+An optional content-addressed sidecar cache stores the decoded document
+of each distinct file content as a marshal blob, keyed by a BLAKE2 digest
+of the raw bytes. Unchanged task files are then loaded without YAML
+parsing in any process that shares the cache directory. YAML files remain
+the source of truth: a changed file has a new digest and is simply parsed
+again, and the cache directory can be deleted at any time. The directory
+is capped at ``max_entries`` files: beyond that the oldest-written entries
+are pruned, which drops those of deleted, renamed or rewritten tasks
+(entries still in use are simply written again on their next miss).
+
+The sidecar is disabled by default. Enable it with
+configure_sidecar_cache() or the TASK_SIDECAR_CACHE_DIR environment
+variable.
+
+Related ADRs:
+    - ADR-042: Shared Task Domain Model
+    - ADR-046: Domain Module Refactoring
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import marshal
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from pathlib import Path
+from typing import IO, Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+LIBYAML_AVAILABLE: bool = getattr(yaml, "__with_libyaml__", False)
+YAML_LOADER = yaml.CSafeLoader if LIBYAML_AVAILABLE else yaml.SafeLoader
+YAML_DUMPER = yaml.CSafeDumper if LIBYAML_AVAILABLE else yaml.SafeDumper
+
+SIDECAR_ENV_VAR = "TASK_SIDECAR_CACHE_DIR"
+
+# Bump when the decoded representation changes (codec or tagging)
+SIDECAR_FORMAT_VERSION = 1
+
+# Sidecar entries kept on disk; pruning goes down to 90% of this
+DEFAULT_MAX_ENTRIES = 10_000
+
+# safe_load never produces tuples, so tagged tuples cannot collide with data
+_DATETIME_TAG = "__datetime__"
+_DATE_TAG = "__date__"
+
+
+class TaskCodec(ABC):
+    """
+    Interface for task document serialization.
+
+    Subclasses implement :meth:`loads` and :meth:`dump`; ``name`` is part
+    of the sidecar cache key so different codecs never share entries.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def loads(self, content: str) -> Any:
+        """Parse file content into a Python object."""
+
+    @abstractmethod
+    def dump(self, task: dict[str, Any], stream: IO[str]) -> None:
+        """Serialize a task document to a text stream."""
+
+
+class YAMLTaskCodec(TaskCodec):
+    """YAML codec using libyaml when available."""
+
+    name = "yaml"
+
+    def loads(self, content: str) -> Any:
+        """Parse a single YAML document."""
+        return yaml.load(content, Loader=YAML_LOADER)
+
+    def dump(self, task: dict[str, Any], stream: IO[str]) -> None:
+        """Write a task as block-style YAML, preserving key order."""
+        yaml.dump(
+            task, stream, Dumper=YAML_DUMPER, sort_keys=False, default_flow_style=False
+        )
+
+
+class SidecarCache:
+    """
+    Content-addressed cache of decoded task documents.
+
+    Entries live at ``<directory>/<digest[:2]>/<digest>.bin``. Writes are
+    atomic (temp file + rename), so concurrent readers never see partial
+    entries; corrupt or unreadable entries are treated as misses. Entries
+    are unmarshalled as-is, so the directory must be trusted (local to the
+    work tree).
+    """
+
+    def __init__(self, directory: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+            max_entries: Entries kept before the oldest are pruned
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Approximate entry count (other processes may write too); counted
+        # on the first write, recounted by prune()
+        self._entries: int | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(content: bytes, codec: TaskCodec) -> str:
+        """Cache key for raw file content decoded by ``codec``."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{codec.name}:{SIDECAR_FORMAT_VERSION}:".encode())
+        h.update(content)
+        return h.hexdigest()
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / f"{digest}.bin"
+
+    def get(self, digest: str) -> tuple[bool, Any]:
+        """
+        Look up a decoded document.
+
+        Returns:
+            (True, document) on a hit, (False, None) on a miss
+        """
+        try:
+            blob = self._entry_path(digest).read_bytes()
+            document = unpack_document(marshal.loads(blob))
+        except (OSError, EOFError, ValueError, TypeError):
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, document
+
+    def put(self, digest: str, document: Any) -> None:
+        """Store a decoded document; values marshal can't hold are skipped."""
+        try:
+            blob = marshal.dumps(pack_document(document))
+        except (TypeError, ValueError):
+            return
+
+        entry = self._entry_path(digest)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.debug(f"Sidecar cache write failed for {entry}: {e}")
+            return
+
+        with self._lock:
+            if self._entries is None:
+                self._entries = len(self._list_entries())
+            else:
+                self._entries += 1
+            full = self._entries > self.max_entries
+        if full:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete the oldest-written entries down to 90% of ``max_entries``.
+
+        Returns:
+            Number of entries deleted
+        """
+        entries = []
+        for path in self._list_entries():
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        entries.sort()
+
+        removed = 0
+        for _, path in entries[: max(0, len(entries) - self.max_entries * 9 // 10)]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        with self._lock:
+            self._entries = len(entries) - removed
+        if removed:
+            logger.debug(f"Pruned {removed} sidecar cache entries in {self.directory}")
+        return removed
+
+    def _list_entries(self) -> list[Path]:
+        """All entry files in the cache directory."""
+        return list(self.directory.glob("*/*.bin"))
+
+
+_codec: TaskCodec = YAMLTaskCodec()
+_sidecar: SidecarCache | None = (
+    SidecarCache(Path(os.environ[SIDECAR_ENV_VAR]))
+    if os.environ.get(SIDECAR_ENV_VAR)
+    else None
+)
+
+
+def get_task_codec() -> TaskCodec:
+    """Return the codec used by read_task() and write_task()."""
+    return _codec
+
+
+def set_task_codec(codec: TaskCodec) -> None:
+    """Replace the codec used by read_task() and write_task()."""
+    global _codec
+    _codec = codec
+
+
+def configure_sidecar_cache(
+    directory: Path | None, max_entries: int = DEFAULT_MAX_ENTRIES
+) -> SidecarCache | None:
+    """
+    Enable (or with None, disable) the binary sidecar cache.
+
+    Args:
+        directory: Cache directory, e.g. work/collaboration/.task_cache
+        max_entries: Entries kept before the oldest are pruned
+
+    Returns:
+        The active SidecarCache, or None when disabled
+    """
+    global _sidecar
+    _sidecar = SidecarCache(directory, max_entries) if directory is not None else None
+    return _sidecar
+
+
+def get_sidecar_cache() -> SidecarCache | None:
+    """Return the active sidecar cache, if enabled."""
+    return _sidecar
+
+
+def decode_task(content: bytes) -> Any:
+    """
+    Decode raw task file content, using the sidecar cache when enabled.
+
+    Args:
+        content: Raw file bytes (UTF-8)
+
+    Returns:
+        Decoded document (not yet validated as a task)
+
+    Raises:
+        yaml.YAMLError: If the content is not valid for the codec
+        UnicodeDecodeError: If the content is not UTF-8
+    """
+    codec = _codec
+    sidecar = _sidecar
+    if sidecar is None:
+        return codec.loads(content.decode("utf-8"))
+
+    digest = SidecarCache.digest(content, codec)
+    hit, document = sidecar.get(digest)
+    if hit:
+        return document
+
+    document = codec.loads(content.decode("utf-8"))
+    sidecar.put(digest, document)
+    return document
+
+
+def encode_task(task: dict[str, Any], stream: IO[str]) -> None:
+    """Encode a task document to a text stream with the active codec."""
+    _codec.dump(task, stream)
+
+
+def pack_document(value: Any) -> Any:
+    """Convert a decoded document to marshal-safe values (tagged datetimes)."""
+    if isinstance(value, dict):
+        return {key: pack_document(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [pack_document(item) for item in value]
+    if isinstance(value, datetime):
+        return (_DATETIME_TAG, value.isoformat())
+    if isinstance(value, date):
+        return (_DATE_TAG, value.isoformat())
+    return value
+
+
+def unpack_document(value: Any) -> Any:
+    """Reverse :func:`pack_document` (returns fresh objects)."""
+    if isinstance(value, dict):
+        return {key: unpack_document(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [unpack_document(item) for item in value]
+    if isinstance(value, tuple) and len(value) == 2:
+        if value[0] == _DATETIME_TAG:
+            return datetime.fromisoformat(value[1])
+        if value[0] == _DATE_TAG:
+            return date.fromisoformat(value[1])
+    return value
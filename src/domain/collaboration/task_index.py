@@ -0,0 +1,1037 @@
+"""
+Task Index - Persistent metadata index for collaboration task files.
+
+Keeps a SQLite index of every task file under work/collaboration so that
+queries (open tasks, per-agent workload, timeouts, follow-ups) can be
+answered without YAML-parsing the whole tree on every call.
+
+The YAML files remain the source of truth. The index is reconciled against
+the file system by comparing (path, st_mtime_ns, st_size): unchanged files
+are served from the index, changed files are re-parsed once, and removed
+files are dropped. Reconciliation therefore costs one directory walk plus
+one parse per *changed* file.
+
+Listings can be paginated with page(): keyset pagination over (sort key,
+path) with an opaque cursor, so a page costs the same however many tasks
+precede it, and tasks moving between directories never shift later pages.
+
+The same database also holds the coordinator's follow-up ledger: one row
+per completed task whose follow-up has been created. Unlike the task rows
+this is durable state, so it is kept across schema rebuilds; if the
+database is lost, existing follow-up files are used to re-seed it.
+
+Related ADRs:
+    - ADR-042: Shared Task Domain Model
+    - ADR-046: Domain Module Refactoring
+
+Usage Example:
+    >>> index = get_task_index(Path("work/collaboration"))
+    >>> for entry in index.entries(("assigned",), status=TaskStatus.IN_PROGRESS):
+    ...     print(entry.task_id, entry.started_at)
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from src.domain.collaboration.task_loader import PoolKind, load_tasks_bulk
+from src.domain.collaboration.task_schema import TaskSchemaError, read_task
+from src.domain.collaboration.types import TaskPriority, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".task_index.db"
+STAGES = ("inbox", "assigned", "done")
+# Suffix of task files, shared by every reader of the collaboration tree
+TASK_SUFFIX = ".yaml"
+
+# Bump when the table layout or row derivation changes; the task rows are a
+# cache, so a version mismatch simply rebuilds them (the ledger is kept).
+SCHEMA_VERSION = 2
+
+# page() sort keys (prefix with "-" for descending) and their columns
+SORT_COLUMNS = {
+    "updated": "updated_at",
+    "priority": "priority_rank",
+    "id": "IFNULL(task_id, '')",
+}
+DEFAULT_SORT = "-updated"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Rank of missing or unknown priorities (after TaskPriority.LOW)
+UNKNOWN_PRIORITY_RANK = len(TaskPriority)
+
+_DATETIME_TAG = "__datetime__"
+_DATE_TAG = "__date__"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    path TEXT PRIMARY KEY,      -- path relative to work_dir (posix)
+    stage TEXT NOT NULL,        -- inbox, assigned, done
+    bucket TEXT,                -- agent directory directly holding the file
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    task_id TEXT,
+    status TEXT,
+    agent TEXT,
+    priority TEXT,
+    specification TEXT,
+    feature TEXT,
+    created_at TEXT,
+    assigned_at TEXT,
+    started_at TEXT,
+    completed_at TEXT,
+    next_agent TEXT,
+    artefacts TEXT,             -- JSON list of artefact paths
+    document TEXT,              -- JSON task document (NULL: re-read file)
+    error TEXT,                 -- load error, NULL when the file parsed
+    updated_at TEXT NOT NULL,   -- latest lifecycle timestamp, UTC ('' if none)
+    priority_rank INTEGER NOT NULL  -- TaskPriority.order, for sorting
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_stage_status ON tasks(stage, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_task_id ON tasks(task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_agent ON tasks(agent);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated ON tasks(updated_at, path);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority_rank, path);
+CREATE INDEX IF NOT EXISTS idx_tasks_id_path ON tasks(IFNULL(task_id, ''), path);
+CREATE TABLE IF NOT EXISTS followups (
+    source_task_id TEXT PRIMARY KEY,    -- completed task that requested it
+    followup_id TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+# Follow-up task files are named <timestamp>-<next_agent>-followup-<source id>
+FOLLOWUP_MARKER = "-followup-"
+
+_COLUMNS = (
+    "path",
+    "stage",
+    "bucket",
+    "mtime_ns",
+    "size",
+    "task_id",
+    "status",
+    "agent",
+    "priority",
+    "specification",
+    "feature",
+    "created_at",
+    "assigned_at",
+    "started_at",
+    "completed_at",
+    "next_agent",
+    "artefacts",
+    "document",
+    "error",
+    "updated_at",
+    "priority_rank",
+)
+
+
+@dataclass(frozen=True)
+class IndexedTask:
+    """
+    Index row describing one task file.
+
+    Metadata fields are available without touching the file; call
+    :meth:`load` for the full task document.
+    """
+
+    path: Path
+    stage: str
+    bucket: str | None
+    mtime_ns: int
+    size: int
+    task_id: str | None = None
+    status: str | None = None
+    agent: str | None = None
+    priority: str | None = None
+    specification: str | None = None
+    feature: str | None = None
+    created_at: str | None = None
+    assigned_at: str | None = None
+    started_at: str | None = None
+    completed_at: str | None = None
+    next_agent: str | None = None
+    artefacts: list[str] = field(default_factory=list)
+    error: str | None = None
+    updated_at: str | None = None
+    """Latest of completed/started/assigned/created, as UTC ISO 8601."""
+    document: str | None = field(default=None, repr=False)
+
+    @property
+    def is_open(self) -> bool:
+        """True when the task parsed and has a known, non-terminal status."""
+        if self.error is not None:
+            return False
+        try:
+            return not TaskStatus.is_terminal(TaskStatus(self.status))
+        except ValueError:
+            return False
+
+    def load(self) -> dict[str, Any] | None:
+        """
+        Return the full task document.
+
+        Served from the index when possible, otherwise re-read from disk.
+        Every call returns a fresh dictionary that callers may mutate.
+
+        Returns:
+            Task dictionary, or None if the file failed to load
+        """
+        if self.error is not None:
+            return None
+        if self.document is not None:
+            return json.loads(self.document, object_hook=_decode_json_value)
+        try:
+            return read_task(self.path)
+        except TaskSchemaError as e:
+            logger.warning(f"Failed to load task {self.path}: {e}")
+            return None
+
+
+@dataclass(frozen=True)
+class TaskPage:
+    """One page of a TaskIndex.page() listing."""
+
+    entries: list[IndexedTask]
+    next_cursor: str | None
+    """Cursor of the following page; None on the last page."""
+
+    def load(self) -> list[dict[str, Any]]:
+        """Full task documents of the page (unreadable files are skipped)."""
+        return [task for entry in self.entries if (task := entry.load()) is not None]
+
+
+class TaskIndex:
+    """
+    SQLite-backed index of the task files below a collaboration directory.
+
+    The database lives next to the task directories (``.task_index.db``)
+    so it survives across processes and coordinator cycles. When the
+    directory is missing or not writable, an in-memory index is used.
+
+    Thread-safe: a single connection is shared behind a lock.
+    """
+
+    def __init__(
+        self,
+        work_dir: Path,
+        db_path: Path | None = None,
+        load_pool: PoolKind = "process",
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            work_dir: Path to work/collaboration directory
+            db_path: Index database location (default: work_dir/.task_index.db)
+            load_pool: Pool used to parse large batches of changed files
+                (see task_loader.load_tasks_bulk)
+        """
+        self.work_dir = Path(work_dir)
+        self.db_path = db_path or self.work_dir / INDEX_FILENAME
+        self.load_pool = load_pool
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+
+    @property
+    def persistent(self) -> bool:
+        """Whether the index is stored on disk (False for in-memory fallback)."""
+        return self._persistent
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database, falling back to memory if unavailable."""
+        self._persistent = False
+        if self.db_path.parent.is_dir():
+            try:
+                conn = sqlite3.connect(
+                    self.db_path, timeout=30, check_same_thread=False
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                self._init_schema(conn)
+                self._persistent = True
+                return conn
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"Task index unavailable at {self.db_path} ({e}); using memory"
+                )
+
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._init_schema(conn)
+        return conn
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        """Create tables, rebuilding them if the schema version changed."""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS tasks")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Reconciliation
+    # ------------------------------------------------------------------
+
+    def reconcile(
+        self, stages: Iterable[str] = STAGES, *, bucket: str | None = None
+    ) -> int:
+        """
+        Bring the index in sync with the files of the given stages.
+
+        Args:
+            stages: Lifecycle directories to reconcile (inbox, assigned, done)
+            bucket: Only reconcile this agent directory of each stage
+                (e.g. ``assigned/<agent>/``) instead of the whole stage
+
+        Returns:
+            Number of index rows inserted, updated or removed
+        """
+        stages = tuple(stages)
+        on_disk = self._scan(stages, bucket)
+
+        if bucket is None:
+            where = f"stage IN ({', '.join('?' * len(stages))})"
+            params: tuple[str, ...] = stages
+        else:
+            where = " OR ".join(["path LIKE ? ESCAPE '\\'"] * len(stages))
+            params = tuple(f"{stage}/{_escape_like(bucket)}/%" for stage in stages)
+
+        with self._lock:
+            known = {
+                row[0]: (row[1], row[2])
+                for row in self._conn.execute(
+                    f"SELECT path, mtime_ns, size FROM tasks WHERE {where}", params
+                )
+            }
+
+        changed = [
+            rel
+            for rel, (_, _, mtime_ns, size) in on_disk.items()
+            if known.get(rel) != (mtime_ns, size)
+        ]
+        removed = [(rel,) for rel in known.keys() - on_disk.keys()]
+
+        # Cold or bulk changes are parsed across a worker pool
+        loaded = load_tasks_bulk(
+            [self.work_dir / rel for rel in changed], pool=self.load_pool
+        )
+        rows = [
+            self._build_row(rel, *on_disk[rel], task=result.task, error=result.error)
+            for rel, result in zip(changed, loaded, strict=True)
+        ]
+
+        if rows or removed:
+            with self._lock:
+                self._conn.executemany(_UPSERT_SQL, rows)
+                self._conn.executemany("DELETE FROM tasks WHERE path = ?", removed)
+                self._conn.commit()
+
+        return len(rows) + len(removed)
+
+    def _scan(
+        self, stages: tuple[str, ...], bucket: str | None = None
+    ) -> dict[str, tuple[str, Any, int, int]]:
+        """
+        Walk the stage directories and stat each task file.
+
+        Mirrors task_query.find_task_files: inbox is flat, assigned and done
+        are searched recursively.
+
+        Returns:
+            Mapping of relative path to (stage, bucket, mtime_ns, size)
+        """
+        found: dict[str, tuple[str, Any, int, int]] = {}
+
+        for stage in stages:
+            parts = (stage,) if bucket is None else (stage, bucket)
+            stage_dir = self.work_dir.joinpath(*parts)
+            if not stage_dir.is_dir():
+                continue
+            self._scan_dir(stage_dir, stage, parts, stage != "inbox", found)
+
+        return found
+
+    def _scan_dir(
+        self,
+        directory: Path,
+        stage: str,
+        parts: tuple[str, ...],
+        recursive: bool,
+        found: dict[str, tuple[str, Any, int, int]],
+    ) -> None:
+        """Collect task files below one directory into ``found``."""
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as e:
+            logger.warning(f"Cannot scan {directory}: {e}")
+            return
+
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if recursive:
+                        self._scan_dir(
+                            Path(entry.path),
+                            stage,
+                            (*parts, entry.name),
+                            recursive,
+                            found,
+                        )
+                    continue
+                if not entry.name.endswith(TASK_SUFFIX):
+                    continue
+                stat = entry.stat()
+            except OSError:
+                # File vanished between listing and stat
+                continue
+
+            # Bucket is the agent directory that directly holds the file
+            # (assigned/<agent>/task.yaml), matching <agent>/*.yaml globs.
+            bucket = parts[1] if len(parts) == 2 else None
+            rel = "/".join((*parts, entry.name))
+            found[rel] = (stage, bucket, stat.st_mtime_ns, stat.st_size)
+
+    def _build_row(
+        self,
+        rel: str,
+        stage: str,
+        bucket: str | None,
+        mtime_ns: int,
+        size: int,
+        task: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> tuple[Any, ...]:
+        """Parse (unless ``task`` or ``error`` is given) and derive one row."""
+        if task is None and error is None:
+            try:
+                task = read_task(self.work_dir / rel)
+            except TaskSchemaError as e:
+                logger.warning(f"Failed to load task {self.work_dir / rel}: {e}")
+                error = str(e)
+
+        if task is None:
+            return (
+                rel,
+                stage,
+                bucket,
+                mtime_ns,
+                size,
+                *([None] * 13),
+                error,
+                "",
+                UNKNOWN_PRIORITY_RANK,
+            )
+
+        result = task.get("result")
+        result = result if isinstance(result, dict) else {}
+        completed_at = task.get("completed_at") or result.get("completed_at")
+        artefacts = task.get("artefacts")
+        artefacts = artefacts if isinstance(artefacts, list) else []
+
+        try:
+            document = json.dumps(_to_json_value(task), separators=(",", ":"))
+        except TypeError:
+            # Exotic YAML types (sets, binary, non-string keys): keep the
+            # metadata and let IndexedTask.load() re-read the file.
+            document = None
+
+        return (
+            rel,
+            stage,
+            bucket,
+            mtime_ns,
+            size,
+            _as_text(task.get("id")),
+            _as_text(task.get("status")),
+            _as_text(task.get("agent")),
+            _as_text(task.get("priority")),
+            _as_text(task.get("specification")),
+            _as_text(task.get("feature")),
+            _as_text(task.get("created_at")),
+            _as_text(task.get("assigned_at")),
+            _as_text(task.get("started_at")),
+            _as_text(completed_at),
+            _as_text(result.get("next_agent")),
+            json.dumps([str(a) for a in artefacts]),
+            document,
+            None,
+            timestamp_key(
+                completed_at
+                or task.get("started_at")
+                or task.get("assigned_at")
+                or task.get("created_at")
+            ),
+            _priority_rank(task.get("priority")),
+        )
+
+    # ------------------------------------------------------------------
+    # Write-through hooks
+    # ------------------------------------------------------------------
+
+    def record(self, path: Path, task: dict[str, Any]) -> IndexedTask | None:
+        """
+        Index a task file that the caller has just written.
+
+        Avoids re-parsing a file whose content is already known. Paths
+        outside the stage directories are ignored.
+
+        Args:
+            path: Path of the written task file
+            task: Task dictionary that was written to ``path``
+
+        Returns:
+            The new index entry, or None if ``path`` is not indexed
+        """
+        located = self._locate(path)
+        if located is None:
+            return None
+        rel, stage, bucket = located
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        row = self._build_row(rel, stage, bucket, stat.st_mtime_ns, stat.st_size, task)
+        with self._lock:
+            self._conn.execute(_UPSERT_SQL, row)
+            self._conn.commit()
+        return self._to_entry(row)
+
+    def forget(self, path: Path) -> None:
+        """
+        Drop a task file that the caller has just moved or deleted.
+
+        Args:
+            path: Path of the removed task file
+        """
+        located = self._locate(path)
+        if located is None:
+            return
+        with self._lock:
+            self._conn.execute("DELETE FROM tasks WHERE path = ?", (located[0],))
+            self._conn.commit()
+
+    def refresh(self, path: Path) -> IndexedTask | None:
+        """
+        Reconcile a single task file, e.g. in response to a watcher event.
+
+        Re-parses the file only if its (mtime_ns, size) changed; drops the
+        row if the file no longer exists.
+
+        Args:
+            path: Path of the task file
+
+        Returns:
+            Current index entry, or None if ``path`` is gone or not indexed
+        """
+        located = self._locate(path)
+        if located is None:
+            return None
+        rel, stage, bucket = located
+
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            self.forget(path)
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM tasks WHERE path = ?", (rel,)
+            ).fetchone()
+        if row is not None and (row[3], row[4]) == (stat.st_mtime_ns, stat.st_size):
+            return self._to_entry(row)
+
+        row = self._build_row(rel, stage, bucket, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            self._conn.execute(_UPSERT_SQL, row)
+            self._conn.commit()
+        return self._to_entry(row)
+
+    def _locate(self, path: Path) -> tuple[str, str, str | None] | None:
+        """Map an absolute task path to (relative path, stage, bucket)."""
+        try:
+            parts = Path(path).relative_to(self.work_dir).parts
+        except ValueError:
+            return None
+        if len(parts) < 2 or parts[0] not in STAGES:
+            return None
+        if parts[0] == "inbox" and len(parts) != 2:
+            return None
+        if not parts[-1].endswith(TASK_SUFFIX):
+            return None
+        bucket = parts[1] if len(parts) == 3 else None
+        return "/".join(parts), parts[0], bucket
+
+    # ------------------------------------------------------------------
+    # Follow-up ledger
+    # ------------------------------------------------------------------
+
+    def pending_followups(self, *, reconcile: bool = True) -> list[IndexedTask]:
+        """
+        List done/ tasks whose requested follow-up is not in the ledger yet.
+
+        Unreadable done/ files are included so callers can report them;
+        tasks without an id can't have a follow-up and are left out.
+
+        Args:
+            reconcile: Sync with the file system first (default: True); all
+                stages, so existing follow-up files are visible to
+                :meth:`find_followup`
+
+        Returns:
+            List of IndexedTask rows, sorted by path
+        """
+        if reconcile:
+            self.reconcile()
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM tasks "
+                "WHERE stage = 'done' AND (error IS NOT NULL OR ("
+                "next_agent IS NOT NULL AND next_agent != '' AND "
+                "task_id IS NOT NULL AND task_id NOT IN "
+                "(SELECT source_task_id FROM followups)))"
+            ).fetchall()
+
+        return sorted((self._to_entry(row) for row in rows), key=lambda e: e.path)
+
+    def find_followup(self, source_task_id: str) -> str | None:
+        """
+        Look up the follow-up of a completed task.
+
+        Args:
+            source_task_id: Id of the completed task
+
+        Returns:
+            Id of the follow-up recorded in the ledger or, failing that, of
+            an indexed follow-up file for the task in any stage (e.g. written
+            just before a crash, or before the ledger existed); None if
+            there is none
+        """
+        pattern = f"%{FOLLOWUP_MARKER}{_escape_like(source_task_id)}{TASK_SUFFIX}"
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT followup_id FROM followups WHERE source_task_id = ?",
+                (source_task_id,),
+            ).fetchone()
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT IFNULL(task_id, path) FROM tasks "
+                    "WHERE path LIKE ? ESCAPE '\\' LIMIT 1",
+                    (pattern,),
+                ).fetchone()
+
+        return row[0] if row else None
+
+    def record_followup(self, source_task_id: str, followup_id: str) -> None:
+        """
+        Record in the ledger that a completed task's follow-up exists.
+
+        Call only once the follow-up file is written: a crash in between
+        leaves the task pending, and the retry finds the file through
+        :meth:`find_followup`. The first recorded follow-up id is kept.
+
+        Args:
+            source_task_id: Id of the completed task
+            followup_id: Id of its follow-up task
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO followups "
+                "(source_task_id, followup_id, created_at) VALUES (?, ?, ?)",
+                (source_task_id, followup_id, now),
+            )
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def entries(
+        self,
+        stages: Iterable[str] = STAGES,
+        *,
+        status: str | TaskStatus | None = None,
+        agent: str | None = None,
+        bucket: str | None = None,
+        reconcile: bool = True,
+    ) -> list[IndexedTask]:
+        """
+        List indexed task files, sorted by path.
+
+        Args:
+            stages: Lifecycle directories to include
+            status: Only include tasks with this status
+            agent: Only include tasks with this agent field
+            bucket: Only include files directly in this agent directory
+                (only that directory is reconciled)
+            reconcile: Sync with the file system first (default: True)
+
+        Returns:
+            List of IndexedTask rows in the same order as find_task_files()
+        """
+        stages = tuple(stages)
+        if reconcile:
+            self.reconcile(stages, bucket=bucket)
+
+        query = (
+            f"SELECT {', '.join(_COLUMNS)} FROM tasks WHERE stage IN "
+            f"({', '.join('?' * len(stages))})"
+        )
+        params: list[Any] = list(stages)
+
+        if status:
+            query += " AND status = ?"
+            params.append(status.value if isinstance(status, TaskStatus) else status)
+
+        if agent:
+            query += " AND agent = ?"
+            params.append(agent)
+
+        if bucket:
+            query += " AND bucket = ?"
+            params.append(bucket)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        entries = [self._to_entry(row) for row in rows]
+        entries.sort(key=lambda entry: entry.path)
+        return entries
+
+    def load_tasks(
+        self, stages: Iterable[str] = STAGES, *, open_only: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Load full task documents for the given stages.
+
+        Args:
+            stages: Lifecycle directories to include
+            open_only: Only include tasks in non-terminal states
+
+        Returns:
+            List of task dictionaries; unreadable files are skipped
+        """
+        tasks = []
+        for entry in self.entries(stages):
+            if open_only and not entry.is_open:
+                continue
+            task = entry.load()
+            if task is not None:
+                tasks.append(task)
+        return tasks
+
+    def find_by_id(self, task_id: str) -> IndexedTask | None:
+        """
+        Look up a task by its ``id`` field.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            First matching IndexedTask (by path order), or None
+        """
+        self.reconcile()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM tasks WHERE task_id = ?",
+                (task_id,),
+            ).fetchall()
+        entries = sorted((self._to_entry(row) for row in rows), key=lambda e: e.path)
+        return entries[0] if entries else None
+
+    def page(
+        self,
+        stages: Iterable[str] = STAGES,
+        *,
+        statuses: Iterable[str | TaskStatus] | None = None,
+        agent: str | None = None,
+        priorities: Iterable[str] | None = None,
+        since: str | None = None,
+        sort: str = DEFAULT_SORT,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        reconcile: bool = True,
+    ) -> TaskPage:
+        """
+        List one page of parsed tasks, filtered and sorted in the index.
+
+        Pages are keyed on (sort key, path) rather than offsets: the cursor
+        of a page names the last row returned, and the next page starts
+        strictly after it. Tasks created, changed or moved in the meantime
+        never cause rows to repeat or be skipped on later pages (a moved
+        task shows up wherever its new sort key puts it).
+
+        Args:
+            stages: Lifecycle directories to include
+            statuses: Only include tasks with one of these statuses
+            agent: Only include tasks with this agent field
+            priorities: Only include these priorities (case-insensitive)
+            since: Only include tasks updated at or after this ISO 8601 time
+            sort: Sort key (updated, priority, id); "-" prefix for descending
+            limit: Page size (1 to MAX_PAGE_SIZE)
+            cursor: ``next_cursor`` of the previous page
+            reconcile: Sync with the file system first (default: True)
+
+        Returns:
+            TaskPage with the entries and the cursor of the next page
+
+        Raises:
+            ValueError: If sort, limit, since or cursor are invalid
+        """
+        descending = sort.startswith("-")
+        key = sort.lstrip("-")
+        if key not in SORT_COLUMNS:
+            raise ValueError(
+                f"Invalid sort {sort!r}; expected one of {sorted(SORT_COLUMNS)}"
+            )
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        if since:
+            try:
+                _parse_iso(since)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid since {since!r}; expected an ISO 8601 time"
+                ) from None
+
+        stages = tuple(stages)
+        if reconcile:
+            self.reconcile(stages)
+
+        column = SORT_COLUMNS[key]
+        # Unary "+" keeps SQLite off idx_tasks_stage_status: walking the sort
+        # index and stopping after `limit` rows beats sorting every match
+        query = (
+            f"SELECT {', '.join(_COLUMNS)} FROM tasks WHERE error IS NULL "
+            f"AND +stage IN ({', '.join('?' * len(stages))})"
+        )
+        params: list[Any] = list(stages)
+
+        if statuses is not None:
+            values = [s.value if isinstance(s, TaskStatus) else s for s in statuses]
+            query += f" AND +status IN ({', '.join('?' * len(values))})"
+            params.extend(values)
+
+        if agent:
+            query += " AND agent = ?"
+            params.append(agent)
+
+        if priorities is not None:
+            values = [p.lower() for p in priorities]
+            query += f" AND LOWER(priority) IN ({', '.join('?' * len(values))})"
+            params.extend(values)
+
+        if since:
+            query += " AND updated_at >= ?"
+            params.append(timestamp_key(since))
+
+        if cursor is not None:
+            after_key, after_path = _decode_cursor(cursor, sort)
+            op = "<" if descending else ">"
+            query += f" AND ({column}, path) {op} (?, ?)"
+            params.extend((after_key, after_path))
+
+        order = "DESC" if descending else "ASC"
+        query += f" ORDER BY {column} {order}, path {order} LIMIT ?"
+        params.append(limit + 1)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        entries = [self._to_entry(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = dict(zip(_COLUMNS, rows[limit - 1], strict=True))
+            sort_value = (last["task_id"] or "") if key == "id" else last[column]
+            next_cursor = _encode_cursor(sort, sort_value, last["path"])
+        return TaskPage(entries, next_cursor)
+
+    def _to_entry(self, row: tuple[Any, ...]) -> IndexedTask:
+        """Convert a database row to an IndexedTask."""
+        values = dict(zip(_COLUMNS, row, strict=True))
+        rel = values.pop("path")
+        artefacts = values.pop("artefacts")
+        values.pop("priority_rank")
+        values["updated_at"] = values["updated_at"] or None
+        return IndexedTask(
+            path=self.work_dir / rel,
+            artefacts=json.loads(artefacts) if artefacts else [],
+            **values,
+        )
+
+
+_UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO tasks ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_COLUMNS))})"
+)
+
+
+_indexes: dict[Path, TaskIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_task_index(work_dir: Path) -> TaskIndex:
+    """
+    Get the shared TaskIndex for a collaboration directory.
+
+    One index is kept per directory per process so repeated queries reuse
+    the same connection.
+
+    Args:
+        work_dir: Path to work/collaboration directory
+
+    Returns:
+        TaskIndex for ``work_dir``
+    """
+    key = Path(work_dir).absolute()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = TaskIndex(key)
+            # Don't pin an in-memory fallback; the directory may appear later
+            if index.persistent:
+                _indexes[key] = index
+        return index
+
+
+def _as_text(value: Any) -> str | None:
+    """Normalize a scalar task field for storage in a TEXT column."""
+    if value is None:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def timestamp_key(value: Any) -> str:
+    """
+    Normalize a task timestamp for ordering and range comparisons.
+
+    Datetimes, dates and ISO 8601 strings become fixed-width UTC strings
+    (naive values are taken as UTC) so that text order is time order.
+    Unparsable strings are returned unchanged; None becomes "".
+
+    Args:
+        value: Timestamp field value
+
+    Returns:
+        Sortable timestamp string
+    """
+    if value is None or value == "":
+        return ""
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, date):
+        moment = datetime(value.year, value.month, value.day)
+    else:
+        try:
+            moment = _parse_iso(str(value))
+        except ValueError:
+            return str(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 time, accepting a "Z" suffix on any Python version."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _priority_rank(value: Any) -> int:
+    """Sort rank of a priority field (unknown priorities sort last)."""
+    try:
+        return TaskPriority(str(value).lower()).order
+    except ValueError:
+        return UNKNOWN_PRIORITY_RANK
+
+
+def _encode_cursor(sort: str, sort_value: Any, path: str) -> str:
+    """Opaque page cursor naming the last row of a page."""
+    raw = json.dumps([sort, sort_value, path], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple[Any, str]:
+    """
+    Decode a page cursor into (sort value, path).
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        cursor_sort, sort_value, path = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if cursor_sort != sort:
+        raise ValueError(f"Cursor was issued for sort {cursor_sort!r}, not {sort!r}")
+    return sort_value, path
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards (``%`` and ``_``) using backslash."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _to_json_value(value: Any) -> Any:
+    """
+    Convert a parsed YAML value to a JSON-safe structure.
+
+    Datetimes and dates (which yaml.safe_load produces for unquoted
+    timestamps) are tagged so they round-trip exactly.
+
+    Raises:
+        TypeError: If the value cannot be represented losslessly
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, dict):
+        converted = {}
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Non-string key: {key!r}")
+            converted[key] = _to_json_value(item)
+        return converted
+    if isinstance(value, list):
+        return [_to_json_value(item) for item in value]
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    raise TypeError(f"Unsupported type: {type(value).__name__}")
+
+
+def _decode_json_value(obj: dict[str, Any]) -> Any:
+    """json object_hook reversing the tagging done by _to_json_value."""
+    if len(obj) == 1:
+        if _DATETIME_TAG in obj:
+            return datetime.fromisoformat(obj[_DATETIME_TAG])
+        if _DATE_TAG in obj:
+            return date.fromisoformat(obj[_DATE_TAG])
+    return obj
@@ -0,0 +1,164 @@
+"""
+Task Loader - Bulk parsing of task files across a worker pool.
+
+Cold loads (a fresh task index, a dashboard start on a large work tree)
+have to YAML-parse every task file. load_tasks_bulk() spreads that work
+over a process (or thread) pool in chunks, while keeping the semantics of
+load_task_safe(): results come back in input order and unreadable files
+are reported, not raised.
+
+Small batches are parsed inline, where pool start-up would cost more than
+it saves. The pool handling itself is map_chunked(), which the
+specification cache uses for its cold loads too.
+
+Related ADRs:
+    - ADR-042: Shared Task Domain Model
+    - ADR-046: Domain Module Refactoring
+
+Usage Example:
+    >>> results = load_tasks_bulk(find_task_files(work_dir, include_done=True))
+    >>> tasks = [r.task for r in results if r.task is not None]
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, TypeVar
+
+from src.domain.collaboration.task_schema import TaskSchemaError, read_task
+
+logger = logging.getLogger(__name__)
+
+# Below this many files, parse inline (pool start-up dominates)
+PARALLEL_THRESHOLD = 256
+
+# Files per task submitted to the pool
+DEFAULT_CHUNK_SIZE = 128
+
+PoolKind = Literal["process", "thread", "serial"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class TaskLoadResult:
+    """Outcome of loading one task file."""
+
+    path: Path
+    task: dict[str, Any] | None
+    error: str | None = None
+
+
+def load_tasks_bulk(
+    paths: Iterable[Path],
+    *,
+    pool: PoolKind = "process",
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+) -> list[TaskLoadResult]:
+    """
+    Parse many task files, in parallel when worthwhile.
+
+    Args:
+        paths: Task files to load
+        pool: "process" (default, uses every core), "thread" or "serial"
+        workers: Pool size (default: os.cpu_count())
+        chunk_size: Files per pool task
+        parallel_threshold: Minimum number of files before a pool is used
+
+    Returns:
+        One TaskLoadResult per input path, in input order. Failed loads
+        have ``task=None`` and the error message, and are logged like
+        load_task_safe() does.
+    """
+    paths = [Path(p) for p in paths]
+    raw = map_chunked(
+        _load_chunk,
+        paths,
+        pool=pool,
+        workers=workers,
+        chunk_size=chunk_size,
+        parallel_threshold=parallel_threshold,
+    )
+
+    results = []
+    for path, (task, error) in zip(paths, raw, strict=True):
+        if error is not None:
+            logger.warning(f"Failed to load task {path}: {error}")
+        results.append(TaskLoadResult(path=path, task=task, error=error))
+    return results
+
+
+def map_chunked(
+    func: Callable[[Sequence[T]], list[R]],
+    items: Sequence[T],
+    *,
+    pool: PoolKind = "process",
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+) -> list[R]:
+    """
+    Apply func to chunks of items, in a worker pool when worthwhile.
+
+    Shared by the bulk loaders of task files and specifications. If the
+    pool can't be started, func is called once on all items instead.
+
+    Args:
+        func: Maps a chunk to one result per item. Must be picklable for
+            the process pool (a module-level function or a partial of one)
+        items: Items to process
+        pool: "process" (default, uses every core), "thread" or "serial"
+        workers: Pool size (default: os.cpu_count())
+        chunk_size: Items per pool task
+        parallel_threshold: Minimum number of items before a pool is used
+
+    Returns:
+        The results of all chunks, in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    if pool == "serial" or workers == 1 or len(items) < parallel_threshold:
+        return func(items)
+
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    try:
+        with _make_executor(pool, min(workers, len(chunks))) as executor:
+            return [result for chunk in executor.map(func, chunks) for result in chunk]
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"Parallel loading unavailable ({e}); loading serially")
+        return func(items)
+
+
+def _make_executor(pool: PoolKind, workers: int) -> Executor:
+    """Create the executor for a pool kind."""
+    if pool == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    if pool == "process":
+        # spawn, not fork: callers (dashboard, coordinator daemon) run
+        # watcher threads, and forking a threaded process can deadlock.
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    raise ValueError(f"Unknown pool kind: {pool!r}")
+
+
+def _load_chunk(
+    paths: Sequence[Path],
+) -> list[tuple[dict[str, Any] | None, str | None]]:
+    """Parse a chunk of task files; runs inside pool workers."""
+    loaded: list[tuple[dict[str, Any] | None, str | None]] = []
+    for path in paths:
+        try:
+            loaded.append((read_task(path), None))
+        except TaskSchemaError as e:
+            loaded.append((None, str(e)))
+    return loaded
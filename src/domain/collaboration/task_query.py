@@ -23,7 +23,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from src.domain.collaboration.task_schema import load_task_safe
+from src.domain.collaboration.task_index import get_task_index
 from src.domain.collaboration.types import TaskStatus
 
 
@@ -76,6 +76,8 @@ def load_open_tasks(work_dir: Path) -> list[dict[str, Any]]:
 
     Finds and loads all tasks excluding those in terminal states (done, error).
     Useful for dashboard displays, active task lists, and orchestration queries.
+    Answered from the persistent task index; only files changed since the
+    last call are parsed.
 
     Args:
         work_dir: Work collaboration directory
@@ -89,25 +91,8 @@ def load_open_tasks(work_dir: Path) -> list[dict[str, Any]]:
         >>> all(not TaskStatus.is_terminal(TaskStatus(t['status'])) for t in open_tasks)
         True
     """
-    task_files = find_task_files(work_dir, include_done=False)
-    open_tasks = []
-
-    for task_file in task_files:
-        task = load_task_safe(task_file)
-        if task is None:
-            continue
-
-        # Skip terminal states (done, error)
-        status = task.get("status", "")
-        try:
-            task_status = TaskStatus(status)
-            if not TaskStatus.is_terminal(task_status):
-                open_tasks.append(task)
-        except ValueError:
-            # Invalid status, skip silently
-            continue
-
-    return open_tasks
+    index = get_task_index(work_dir)
+    return index.load_tasks(("inbox", "assigned"), open_only=True)
 
 
 def filter_tasks(
@@ -170,12 +155,11 @@ def count_tasks_by_status(work_dir: Path) -> dict[str, int]:
         >>> counts
         {'assigned': 5, 'in_progress': 3, 'blocked': 1}
     """
-    tasks = load_open_tasks(work_dir)
     counts: dict[str, int] = {}
 
-    for task in tasks:
-        status = task.get("status", "unknown")
-        counts[status] = counts.get(status, 0) + 1
+    for entry in get_task_index(work_dir).entries(("inbox", "assigned")):
+        if entry.is_open:
+            counts[entry.status] = counts.get(entry.status, 0) + 1
 
     return counts
 
@@ -198,11 +182,11 @@ def count_tasks_by_agent(work_dir: Path) -> dict[str, int]:
         >>> counts
         {'python-pedro': 4, 'backend-benny': 3, 'frontend-freddy': 2}
     """
-    tasks = load_open_tasks(work_dir)
     counts: dict[str, int] = {}
 
-    for task in tasks:
-        agent = task.get("agent", "unassigned")
-        counts[agent] = counts.get(agent, 0) + 1
+    for entry in get_task_index(work_dir).entries(("inbox", "assigned")):
+        if entry.is_open:
+            agent = entry.agent or "unassigned"
+            counts[agent] = counts.get(agent, 0) + 1
 
     return counts
@@ -10,6 +10,9 @@ The repository encapsulates:
 - Query operations for task discovery
 - Read operations with proper error handling
 
+Queries are answered from the persistent task index (task_index.py), which
+re-parses only task files that changed since the previous query.
+
 Related ADRs:
     - ADR-042: Shared Task Domain Model
     - ADR-043: Status Enumeration Standard
@@ -34,7 +37,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from src.domain.collaboration.task_schema import load_task_safe
+from src.domain.collaboration.task_index import TaskIndex, get_task_index
 from src.domain.collaboration.types import TaskStatus
 
 
@@ -79,6 +82,11 @@ class TaskRepository:
         """
         self.work_dir = work_dir
 
+    @property
+    def index(self) -> TaskIndex:
+        """Persistent task index backing this repository."""
+        return get_task_index(self.work_dir)
+
     def find_all(self, include_done: bool = False) -> TaskQueryResult:
         """
         Find all tasks in the repository.
@@ -89,14 +97,7 @@ class TaskRepository:
         Returns:
             TaskQueryResult with all tasks
         """
-        task_files = self._discover_task_files(include_done=include_done)
-        tasks = []
-
-        for task_file in task_files:
-            task = load_task_safe(task_file)
-            if task is not None:
-                tasks.append(task)
-
+        tasks = self.index.load_tasks(self._stages(include_done))
         return TaskQueryResult(tasks=tasks, total_count=len(tasks))
 
     def find_open_tasks(self) -> TaskQueryResult:
@@ -106,24 +107,7 @@ class TaskRepository:
         Returns:
             TaskQueryResult with non-terminal tasks (not done/error)
         """
-        task_files = self._discover_task_files(include_done=False)
-        open_tasks = []
-
-        for task_file in task_files:
-            task = load_task_safe(task_file)
-            if task is None:
-                continue
-
-            # Skip terminal states
-            status = task.get("status", "")
-            try:
-                task_status = TaskStatus(status)
-                if not TaskStatus.is_terminal(task_status):
-                    open_tasks.append(task)
-            except ValueError:
-                # Invalid status, skip
-                continue
-
+        open_tasks = self.index.load_tasks(self._stages(), open_only=True)
         return TaskQueryResult(tasks=open_tasks, total_count=len(open_tasks))
 
     def find_by_status(self, status: TaskStatus | str) -> TaskQueryResult:
@@ -162,11 +146,8 @@ class TaskRepository:
         Returns:
             Task dictionary or None if not found
         """
-        all_tasks = self.find_all(include_done=True)
-        for task in all_tasks.tasks:
-            if task.get("id") == task_id:
-                return task
-        return None
+        entry = self.index.find_by_id(task_id)
+        return entry.load() if entry is not None else None
 
     def count_by_status(self) -> dict[str, int]:
         """
@@ -175,12 +156,11 @@ class TaskRepository:
         Returns:
             Dictionary mapping status to count
         """
-        open_tasks = self.find_open_tasks()
         counts: dict[str, int] = {}
 
-        for task in open_tasks.tasks:
-            status = task.get("status", "unknown")
-            counts[status] = counts.get(status, 0) + 1
+        for entry in self.index.entries(self._stages()):
+            if entry.is_open:
+                counts[entry.status] = counts.get(entry.status, 0) + 1
 
         return counts
 
@@ -191,43 +171,24 @@ class TaskRepository:
         Returns:
             Dictionary mapping agent to count
         """
-        open_tasks = self.find_open_tasks()
         counts: dict[str, int] = {}
 
-        for task in open_tasks.tasks:
-            agent = task.get("agent", "unassigned")
-            counts[agent] = counts.get(agent, 0) + 1
+        for entry in self.index.entries(self._stages()):
+            if entry.is_open:
+                agent = entry.agent or "unassigned"
+                counts[agent] = counts.get(agent, 0) + 1
 
         return counts
 
-    def _discover_task_files(self, include_done: bool = False) -> list[Path]:
+    @staticmethod
+    def _stages(include_done: bool = False) -> tuple[str, ...]:
         """
-        Discover task YAML files in the work directory.
-
-        Internal method that handles file system traversal.
+        Lifecycle directories to query.
 
         Args:
             include_done: Include tasks from done/ directory
 
         Returns:
-            List of paths to task YAML files
+            Tuple of stage directory names
         """
-        task_files: list[Path] = []
-
-        # Search inbox
-        inbox_dir = self.work_dir / "inbox"
-        if inbox_dir.exists():
-            task_files.extend(inbox_dir.glob("*.yaml"))
-
-        # Search assigned (recursive for agent subdirs)
-        assigned_dir = self.work_dir / "assigned"
-        if assigned_dir.exists():
-            task_files.extend(assigned_dir.rglob("*.yaml"))
-
-        # Optionally include done
-        if include_done:
-            done_dir = self.work_dir / "done"
-            if done_dir.exists():
-                task_files.extend(done_dir.rglob("*.yaml"))
-
-        return sorted(task_files)
+        return ("inbox", "assigned", "done") if include_done else ("inbox", "assigned")
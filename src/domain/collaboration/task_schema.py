@@ -3,17 +3,27 @@ Shared task schema and I/O operations.
 
 This module provides a single source of truth for task file operations,
 ensuring consistency across framework orchestration and dashboard modules.
+Parsing and serialization are delegated to task_codec (libyaml when
+available, optional binary sidecar cache); parsed files are cached
+process-wide by task_cache.
 
 Related ADR:
 - ADR-042: Shared Task Domain Model
 """
 
 import logging
+import os
+import secrets
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from src.domain.collaboration.task_cache import get_task_cache
+from src.domain.collaboration.task_codec import encode_task
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,29 +60,17 @@ def read_task(path: Path) -> dict[str, Any]:
         TaskValidationError: If task structure is invalid
     """
     try:
-        with open(path, encoding="utf-8") as f:
-            content = f.read()
-
-        # Detect common YAML issues before parsing
-        if content.count("\n---\n") > 0 or content.count("\n--- \n") > 0:
-            # Multiple document separators detected
-            raise TaskIOError(
-                f"Invalid YAML in {path}: expected a single document in the stream\n"
-                "  Found multiple '---' separators (YAML multi-document format not supported)\n"
-                "  Hint: Remove extra '---' lines or wrap content in 'description: |' block"
-            )
-
-        task = yaml.safe_load(content)
-
+        # Served from the process-wide cache while the file is unchanged
+        task = get_task_cache().load(path)
     except FileNotFoundError:
         raise TaskIOError(f"Task file not found: {path}") from None
     except yaml.YAMLError as e:
-        # Check if it's the multi-document error
-        error_msg = str(e)
-        if "expected a single document" in error_msg:
+        # Multiple document separators (frontmatter-style task files)
+        if "expected a single document" in str(e):
             raise TaskIOError(
                 f"Invalid YAML in {path}: expected a single document in the stream\n"
-                "  Hint: Check for multiple '---' separators in the file"
+                "  Found multiple '---' separators (YAML multi-document format not supported)\n"
+                "  Hint: Remove extra '---' lines or wrap content in 'description: |' block"
             ) from e
         raise TaskIOError(f"Invalid YAML in {path}: {e}") from e
     except Exception as e:
@@ -107,6 +105,9 @@ def write_task(path: Path, task: dict[str, Any]) -> None:
     """
     Write a task to file.
 
+    The file is replaced atomically (temp file + rename), so readers and
+    crashes never observe a half-written task.
+
     Args:
         path: Path to task YAML file
         task: Task dictionary to write
@@ -115,6 +116,109 @@ def write_task(path: Path, task: dict[str, Any]) -> None:
         TaskIOError: If file cannot be written
         TaskValidationError: If task structure is invalid
     """
+    _validate_for_write(task)
+
+    try:
+        # Ensure parent directory exists
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = _write_temp_file(path, task, durable=False)
+        try:
+            os.replace(temp_path, path)
+        except OSError:
+            _remove_quietly(temp_path)
+            raise
+    except Exception as e:
+        raise TaskIOError(f"Failed to write task to {path}: {e}") from e
+
+
+@dataclass(frozen=True)
+class TaskMove:
+    """
+    One entry of a move_tasks() batch.
+
+    Attributes:
+        dest: Path the task is written to
+        task: Task dictionary to write at ``dest``
+        source: File removed once ``dest`` is in place (None: plain write)
+    """
+
+    dest: Path
+    task: dict[str, Any]
+    source: Path | None = None
+
+
+def move_tasks(
+    moves: Sequence[TaskMove], *, durable: bool = True
+) -> list[TaskSchemaError | None]:
+    """
+    Write and move a batch of tasks transactionally per file.
+
+    Each task is written to a temp file in its destination directory and
+    renamed into place, so no reader ever sees a truncated task. Sources
+    are removed only after every destination has been renamed (and, when
+    durable, synced), so a crash can at worst leave a task in both places,
+    never in neither. With ``durable`` set, file data is fsynced before
+    the rename and each affected directory is fsynced once per batch
+    rather than once per file.
+
+    Args:
+        moves: Tasks to write, each optionally replacing a source file
+        durable: fsync data and directories (default: True)
+
+    Returns:
+        One entry per move, in order: None on success, or the error that
+        left that move undone (other moves still complete)
+    """
+    results: list[TaskSchemaError | None] = [None] * len(moves)
+    temp_files: dict[int, Path] = {}
+
+    # Phase 1: write every task to a temp file next to its destination
+    for i, move in enumerate(moves):
+        try:
+            _validate_for_write(move.task)
+            move.dest.parent.mkdir(parents=True, exist_ok=True)
+            temp_files[i] = _write_temp_file(move.dest, move.task, durable=durable)
+        except TaskSchemaError as e:
+            results[i] = e
+        except Exception as e:
+            results[i] = TaskIOError(f"Failed to write task to {move.dest}: {e}")
+
+    # Phase 2: rename into place
+    renamed: list[int] = []
+    for i, temp_path in temp_files.items():
+        try:
+            os.replace(temp_path, moves[i].dest)
+            renamed.append(i)
+        except OSError as e:
+            _remove_quietly(temp_path)
+            results[i] = TaskIOError(f"Failed to write task to {moves[i].dest}: {e}")
+
+    if durable:
+        _fsync_directories(moves[i].dest.parent for i in renamed)
+
+    # Phase 3: remove sources now that their destinations are durable
+    removed_from: list[Path] = []
+    for i in renamed:
+        source = moves[i].source
+        if source is None or source == moves[i].dest:
+            continue
+        try:
+            source.unlink()
+            removed_from.append(source.parent)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            results[i] = TaskIOError(f"Failed to remove {source} after move: {e}")
+
+    if durable:
+        _fsync_directories(removed_from)
+
+    return results
+
+
+def _validate_for_write(task: Any) -> None:
+    """Check a task is writable (dictionary with required fields)."""
     if not isinstance(task, dict):
         raise TaskValidationError(f"Task must be a dictionary, got {type(task)}")
 
@@ -126,14 +230,51 @@ def write_task(path: Path, task: dict[str, Any]) -> None:
             f"Cannot write task with missing fields: {missing_fields}"
         )
 
-    try:
-        # Ensure parent directory exists
-        path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.dump(task, f, sort_keys=False, default_flow_style=False)
-    except Exception as e:
-        raise TaskIOError(f"Failed to write task to {path}: {e}") from e
+def _write_temp_file(path: Path, task: dict[str, Any], durable: bool) -> Path:
+    """
+    Encode a task into a new temp file in the directory of ``path``.
+
+    The dot prefix and ``.tmp`` suffix keep watchers and the task index
+    from treating it as a task. Created with the default file mode
+    (umask applied), like a plain open() would.
+    """
+    temp_path = path.parent / f".{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            encode_task(task, f)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        _remove_quietly(temp_path)
+        raise
+    return temp_path
+
+
+def _fsync_directories(directories: Iterable[Path]) -> None:
+    """fsync each distinct directory once (persists renames and unlinks)."""
+    for directory in set(directories):
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            # Not supported on every platform (e.g. Windows)
+            continue
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.warning(f"Failed to fsync directory {directory}: {e}")
+        finally:
+            os.close(fd)
+
+
+def _remove_quietly(path: Path) -> None:
+    """Delete a leftover temp file, ignoring errors."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 
 def load_task_safe(path: Path) -> dict[str, Any] | None:
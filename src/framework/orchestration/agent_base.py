@@ -5,6 +5,17 @@ Agent Base Class - Standard Template for File-Based Orchestration Agents
 Provides standardized lifecycle hooks, status transitions, error handling,
 and work log creation for agents in the file-based orchestration framework.
 
+With ``max_concurrency`` > 1 the agent runs several assigned tasks at once
+on a thread pool (agents mostly wait on LLM subprocesses). Per-task state
+(``current_task``, ``current_task_file``, ``start_time``,
+``artifacts_created``) lives in a TaskContext bound to the worker thread,
+so subclass code keeps using the same attributes unchanged.
+
+In continuous mode the agent sleeps until a file notification for its
+assigned/<agent>/ directory arrives (adaptive polling when notifications
+are unavailable) and reads task statuses from the task index instead of
+parsing every queued file.
+
 Usage:
     class MyAgent(AgentBase):
         def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
@@ -14,17 +25,79 @@ Usage:
 
 from __future__ import annotations
 
+import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from task_utils import get_utc_timestamp, log_event, read_task, write_task
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
 
+from src.domain.collaboration.task_index import IndexedTask, get_task_index
 from src.domain.collaboration.types import TaskStatus
 
+# Continuous mode: safety re-scan interval while file notifications work
+IDLE_RESCAN_SECONDS = 60
+
+# Continuous mode without notifications: adaptive polling bounds
+MIN_POLL_INTERVAL_SECONDS = 0.5
+MAX_POLL_INTERVAL_SECONDS = 15
+
+
+@dataclass
+class TaskContext:
+    """State of the task being processed by one worker thread."""
+
+    task: dict[str, Any] | None = None
+    task_file: Path | None = None
+    start_time: float | None = None
+    artifacts_created: list[str] = field(default_factory=list)
+
+
+class AssignedTaskHandler(FileSystemEventHandler):
+    """
+    Wakes a continuous agent when a task file lands in its directory.
+
+    Runs on the watchdog observer thread and only sets an event; the agent
+    loop re-checks task statuses through the task index.
+    """
+
+    def __init__(self, wakeup: threading.Event):
+        """
+        Initialize handler.
+
+        Args:
+            wakeup: Event set whenever a task file may have changed
+        """
+        super().__init__()
+        self.wakeup = wakeup
+
+    def _notify(self, path: str | bytes) -> None:
+        if str(path).endswith(".yaml"):
+            self.wakeup.set()
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle a new task file."""
+        if not event.is_directory:
+            self._notify(event.src_path)
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        """Handle a rewritten task file (e.g. status reset to assigned)."""
+        if not event.is_directory:
+            self._notify(event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle a task file renamed into place (atomic writes, moves)."""
+        if not event.is_directory:
+            self._notify(event.dest_path)
+
 
 class AgentBase(ABC):
     """
@@ -38,6 +111,7 @@ class AgentBase(ABC):
     - Work log creation
     - Error handling with proper error status
     - Artifact validation
+    - Concurrent execution of assigned tasks (max_concurrency)
     """
 
     def __init__(
@@ -46,6 +120,7 @@ class AgentBase(ABC):
         work_dir: Path | str = "work",
         mode: str = "/analysis-mode",
         log_level: str = "INFO",
+        max_concurrency: int = 1,
     ):
         """
         Initialize the agent.
@@ -55,11 +130,19 @@ class AgentBase(ABC):
             work_dir: Path to work directory (default: "work")
             mode: Reasoning mode (/analysis-mode, /creative-mode, /meta-mode)
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            max_concurrency: Number of tasks executed at once (default: 1)
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
         self.agent_name = agent_name
         self.work_dir = Path(work_dir)
         self.mode = mode
         self.log_level = log_level
+        self.max_concurrency = max_concurrency
 
         # Directory paths
         self.collaboration_dir = self.work_dir / "collaboration"
@@ -75,14 +158,64 @@ class AgentBase(ABC):
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
 
-        # Task tracking
-        self.current_task: dict[str, Any] | None = None
-        self.current_task_file: Path | None = None
-        self.start_time: float | None = None
-        self.artifacts_created: list[str] = []
+        # Task tracking: one TaskContext per worker thread
+        self._local = threading.local()
+        self._in_flight: set[Path] = set()
+
+        # Continuous mode wake-ups (see run())
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._observer: BaseObserver | None = None
+        self._poll_interval = MIN_POLL_INTERVAL_SECONDS
 
         self._log(f"✅ Agent '{agent_name}' initialized in mode: {mode}")
 
+    # Per-task state (bound to the calling thread)
+
+    @property
+    def task_context(self) -> TaskContext:
+        """TaskContext of the task processed by the calling thread."""
+        context = getattr(self._local, "context", None)
+        if context is None:
+            context = self._local.context = TaskContext()
+        return context
+
+    @property
+    def current_task(self) -> dict[str, Any] | None:
+        """Task being processed by the calling thread."""
+        return self.task_context.task
+
+    @current_task.setter
+    def current_task(self, task: dict[str, Any] | None) -> None:
+        self.task_context.task = task
+
+    @property
+    def current_task_file(self) -> Path | None:
+        """File of the task being processed by the calling thread."""
+        return self.task_context.task_file
+
+    @current_task_file.setter
+    def current_task_file(self, task_file: Path | None) -> None:
+        self.task_context.task_file = task_file
+
+    @property
+    def start_time(self) -> float | None:
+        """Start time of the task being processed by the calling thread."""
+        return self.task_context.start_time
+
+    @start_time.setter
+    def start_time(self, start_time: float | None) -> None:
+        self.task_context.start_time = start_time
+
+    @property
+    def artifacts_created(self) -> list[str]:
+        """Artifacts created by the task being processed by the calling thread."""
+        return self.task_context.artifacts_created
+
+    @artifacts_created.setter
+    def artifacts_created(self, artifacts: list[str]) -> None:
+        self.task_context.artifacts_created = artifacts
+
     def _log(self, message: str, level: str = "INFO") -> None:
         """Log a message with timestamp."""
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -417,6 +550,22 @@ class AgentBase(ABC):
 
     # Main execution flow
 
+    def find_ready_tasks(self) -> list[IndexedTask]:
+        """
+        List this agent's tasks with status "assigned", sorted by path.
+
+        Statuses come from the task index: only assigned/<agent>/ is
+        re-scanned, and only files whose (mtime, size) changed since the
+        last call are parsed.
+
+        Returns:
+            Index entries of tasks ready to execute
+        """
+        index = get_task_index(self.collaboration_dir)
+        return index.entries(
+            ("assigned",), status=TaskStatus.ASSIGNED, bucket=self.agent_name
+        )
+
     def process_next_task(self) -> bool:
         """
         Find and process the next assigned task.
@@ -424,28 +573,167 @@ class AgentBase(ABC):
         Returns:
             True if a task was processed, False if no tasks available
         """
-        tasks = self.find_assigned_tasks()
-
-        if not tasks:
-            self._log("No tasks assigned", level="INFO")
+        claimed = self.claim_assigned_tasks(1)
+        if not claimed:
+            self._log("No tasks with status 'assigned'", level="INFO")
             return False
 
-        # Pick first task with status "assigned"
-        for task_file in tasks:
-            task = self.read_task(task_file)
-            if task.get("status") == TaskStatus.ASSIGNED.value:
-                self._process_task(task_file, task)
-                return True
+        task_file, task = claimed[0]
+        try:
+            self._process_task(task_file, task)
+        finally:
+            self._in_flight.discard(task_file)
+        return True
+
+    def claim_assigned_tasks(self, limit: int) -> list[tuple[Path, dict[str, Any]]]:
+        """
+        Reserve up to ``limit`` tasks with status "assigned" for execution.
 
-        self._log("No tasks with status 'assigned'", level="INFO")
-        return False
+        Tasks already running on this agent are skipped; claimed tasks stay
+        reserved until their worker finishes.
+
+        Args:
+            limit: Maximum number of tasks to claim
+
+        Returns:
+            List of (task_file, task) tuples
+        """
+        claimed: list[tuple[Path, dict[str, Any]]] = []
+        for entry in self.find_ready_tasks():
+            if len(claimed) >= limit:
+                break
+            if entry.path in self._in_flight:
+                continue
+            task = entry.load()
+            if task is not None:
+                self._in_flight.add(entry.path)
+                claimed.append((entry.path, task))
+        return claimed
+
+    def process_available_tasks(self) -> int:
+        """
+        Process up to max_concurrency assigned tasks concurrently.
+
+        Failures are recorded in each task's error block and do not stop
+        the other workers.
+
+        Returns:
+            Number of tasks processed (successfully or not)
+        """
+        claimed = self.claim_assigned_tasks(self.max_concurrency)
+        if not claimed:
+            self._log("No tasks with status 'assigned'", level="INFO")
+            return 0
+
+        with self._make_executor() as executor:
+            running = {
+                executor.submit(self._process_task, task_file, task): task_file
+                for task_file, task in claimed
+            }
+            for future, task_file in running.items():
+                self._release(task_file, future)
+        return len(claimed)
+
+    def _make_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool for concurrent execution."""
+        return ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix=f"{self.agent_name}-worker",
+        )
+
+    def _release(self, task_file: Path, future: Future) -> bool:
+        """Free the claim on a task once it finishes; returns whether it succeeded."""
+        self._in_flight.discard(task_file)
+        # _process_task already logged the failure and wrote the error block
+        return future.exception() is None
+
+    # Continuous mode
+
+    def stop(self) -> None:
+        """Ask a continuous run() to return (safe to call from any thread)."""
+        self._stopping.set()
+        self._wakeup.set()
+
+    def _start_watching(self) -> None:
+        """Watch assigned/<agent>/ for new tasks; poll if notifications fail."""
+        self._poll_interval = MIN_POLL_INTERVAL_SECONDS
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(
+            AssignedTaskHandler(self._wakeup),
+            str(self.assigned_dir.absolute()),
+            recursive=False,
+        )
+        try:
+            observer.start()
+        except OSError as exc:
+            # e.g. inotify watch limit reached
+            self._log(
+                f"File notifications unavailable ({exc}); polling instead",
+                level="WARNING",
+            )
+            return
+        self._observer = observer
+
+    def _stop_watching(self) -> None:
+        """Stop the notification observer, if running."""
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
+
+    def _wait_for_work(self) -> None:
+        """
+        Block until assigned/<agent>/ changes, a worker finishes or stop().
+
+        With notifications the directory is still re-scanned every
+        IDLE_RESCAN_SECONDS as a safety net. Without them the poll interval
+        doubles while idle (up to MAX_POLL_INTERVAL_SECONDS) and resets on
+        activity.
+        """
+        if self._observer is not None:
+            timeout = IDLE_RESCAN_SECONDS
+        else:
+            timeout = self._poll_interval
+            self._poll_interval = min(
+                self._poll_interval * 2, MAX_POLL_INTERVAL_SECONDS
+            )
+
+        if self._wakeup.wait(timeout):
+            self._poll_interval = MIN_POLL_INTERVAL_SECONDS
+        self._wakeup.clear()
+
+    def _run_serial(self) -> None:
+        """Continuous mode without a pool: one task at a time."""
+        while not self._stopping.is_set():
+            if not self.process_next_task():
+                self._wait_for_work()
+
+    def _run_pool(self) -> None:
+        """Continuous mode with a pool: keep every worker slot busy."""
+        with self._make_executor() as executor:
+            running: dict[Future, Path] = {}
+            try:
+                while not self._stopping.is_set():
+                    for future in [f for f in running if f.done()]:
+                        self._release(running.pop(future), future)
+
+                    free = self.max_concurrency - len(running)
+                    for task_file, task in self.claim_assigned_tasks(free):
+                        future = executor.submit(self._process_task, task_file, task)
+                        future.add_done_callback(lambda _: self._wakeup.set())
+                        running[future] = task_file
+
+                    self._wait_for_work()
+            finally:
+                if running:
+                    self._log(f"Waiting for {len(running)} running task(s) to finish")
 
     def _process_task(self, task_file: Path, task: dict[str, Any]) -> None:
         """Internal method to process a single task."""
-        self.current_task = task
-        self.current_task_file = task_file
-        self.start_time = time.time()
-        self.artifacts_created = []
+        self._local.context = TaskContext(
+            task=task, task_file=task_file, start_time=time.time()
+        )
 
         task_id = task.get("id", task_file.name)
         self._log(f"🤖 Processing task: {task_id}")
@@ -506,19 +794,27 @@ class AgentBase(ABC):
         Run the agent to process tasks.
 
         Args:
-            continuous: If True, keep polling for tasks; if False, process one task and exit
+            continuous: If True, keep processing tasks as they arrive until
+                stop() or Ctrl+C; if False, process one task (or, with
+                max_concurrency > 1, one batch of tasks) and exit
         """
         self._log(f"🚀 Agent {self.agent_name} starting...")
 
         if continuous:
             self._log("Running in continuous mode (Ctrl+C to stop)")
+            self._stopping.clear()
+            self._start_watching()
             try:
-                while True:
-                    processed = self.process_next_task()
-                    if not processed:
-                        time.sleep(5)  # Poll every 5 seconds
+                if self.max_concurrency > 1:
+                    self._run_pool()
+                else:
+                    self._run_serial()
             except KeyboardInterrupt:
                 self._log("Agent stopped by user")
+            finally:
+                self._stop_watching()
+        elif self.max_concurrency > 1:
+            self.process_available_tasks()
         else:
             self.process_next_task()
 
@@ -9,22 +9,45 @@ Responsibilities:
 - Detect artifact conflicts
 - Update status dashboard
 - Archive old completed tasks
+
+Task state is read through the persistent task index (ADR-042 task files
+remain the source of truth), so a cycle only parses files that changed
+since the previous cycle. run_cycle() takes a single TaskSnapshot of
+inbox/assigned/done and runs every phase against it, so the tree is walked
+once per cycle rather than once per phase.
+
+With ``--daemon`` the coordinator runs continuously (CoordinatorDaemon):
+watchdog events for new inbox files and tasks landing in done/ are handled
+one file at a time, and a low-frequency run_cycle() sweep reconciles
+anything the events missed and runs the periodic phases (timeouts,
+conflicts, archival, status).
 """
 
 from __future__ import annotations
 
+import argparse
+import os
+import queue
 import shutil
+import sys
+import threading
+import time
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from task_utils import (
-    log_event,
-    read_task,
-    write_task,
-)
+from task_utils import log_event, write_task
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
 
+from src.domain.collaboration.task_index import (
+    IndexedTask,
+    TaskIndex,
+    get_task_index,
+)
+from src.domain.collaboration.task_schema import TaskMove, move_tasks
 from src.domain.collaboration.types import TaskStatus
 
 # Configuration
@@ -38,6 +61,9 @@ ARCHIVE_DIR = COLLAB_DIR / "archive"
 TIMEOUT_HOURS = 2  # Flag tasks in_progress for > 2 hours
 ARCHIVE_RETENTION_DAYS = 30  # Archive tasks older than 30 days
 
+RECONCILE_INTERVAL_SECONDS = 300  # Daemon: full run_cycle() sweep interval
+EVENT_SETTLE_SECONDS = 0.2  # Daemon: quiet period before handling a file
+
 
 def _log_event(message: str) -> None:
     """Append event to workflow log."""
@@ -45,39 +71,165 @@ def _log_event(message: str) -> None:
     log_event(message, log_file)
 
 
-def assign_tasks() -> int:
-    """Process inbox and assign tasks to agents."""
-    tasks_assigned = 0
+def _task_index() -> TaskIndex:
+    """Task index for the directory holding inbox/, assigned/ and done/."""
+    # Resolved per call: the directory globals are reassigned by tests and
+    # the benchmark, which keep COLLAB_DIR apart from the task directories.
+    return get_task_index(INBOX_DIR.parent)
+
+
+@dataclass
+class TaskSnapshot:
+    """Indexed view of the task directories shared by one coordinator cycle."""
+
+    inbox: list[IndexedTask] = field(default_factory=list)
+    assigned: list[IndexedTask] = field(default_factory=list)
+    done: list[IndexedTask] = field(default_factory=list)
+
+
+@dataclass
+class CycleReport:
+    """Outcome and per-phase timings (seconds) of one coordinator cycle."""
+
+    assigned: int = 0
+    followups: int = 0
+    timeouts: int = 0
+    conflicts: int = 0
+    archived: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+    total_time: float = 0.0
+
+    def metrics(self) -> dict[str, float]:
+        """Flatten into the metric names used by benchmark_orchestrator."""
+        return {
+            "tasks_assigned": self.assigned,
+            "followups_created": self.followups,
+            "timeouts_flagged": self.timeouts,
+            "conflicts_detected": self.conflicts,
+            "tasks_archived": self.archived,
+            **{f"{phase}_duration": t for phase, t in self.timings.items()},
+            "total_cycle_time": self.total_time,
+        }
 
-    for task_file in INBOX_DIR.glob("*.yaml"):
-        try:
-            task = read_task(task_file)
-            agent = task.get("agent")
 
-            if not agent:
-                _log_event(f"⚠️ Task {task_file.name} missing 'agent' field")
-                continue
+def take_snapshot() -> TaskSnapshot:
+    """Reconcile the task index once and group its entries by stage."""
+    snapshot = TaskSnapshot()
+    for entry in _task_index().entries():
+        getattr(snapshot, entry.stage).append(entry)
+    return snapshot
 
-            agent_dir = ASSIGNED_DIR / agent
-            if not agent_dir.exists():
-                _log_event(f"❗️ Unknown agent: {agent}")
-                continue
 
-            dest = agent_dir / task_file.name
+def _stage_entries(snapshot: TaskSnapshot | None, stage: str) -> list[IndexedTask]:
+    """Entries of one stage, from the snapshot or a fresh index query."""
+    if snapshot is not None:
+        return getattr(snapshot, stage)
+    return _task_index().entries((stage,))
 
-            task["status"] = TaskStatus.ASSIGNED.value
-            task["assigned_at"] = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
-            write_task(dest, task)
-            task_file.unlink()
 
-            _log_event(f"Assigned task {task['id']} to {agent}")
-            tasks_assigned += 1
-        except Exception as exc:  # noqa: BLE001
-            _log_event(f"❗️ Error assigning {task_file.name}: {exc}")
+def _plan_assignment(entry: IndexedTask) -> TaskMove | None:
+    """Work out where an inbox task goes; None (logged) if it stays put."""
+    task_file = entry.path
+    try:
+        task = entry.load()
+        if task is None:
+            raise ValueError(entry.error)
+        agent = task.get("agent")
 
-    return tasks_assigned
+        if not agent:
+            _log_event(f"⚠️ Task {task_file.name} missing 'agent' field")
+            return None
+
+        agent_dir = ASSIGNED_DIR / agent
+        if not agent_dir.exists():
+            _log_event(f"❗️ Unknown agent: {agent}")
+            return None
+
+        task["status"] = TaskStatus.ASSIGNED.value
+        task["assigned_at"] = (
+            datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        )
+        return TaskMove(dest=agent_dir / task_file.name, task=task, source=task_file)
+    except Exception as exc:  # noqa: BLE001
+        _log_event(f"❗️ Error assigning {task_file.name}: {exc}")
+        return None
+
+
+def _assign_entries(
+    index: TaskIndex,
+    entries: list[IndexedTask],
+    snapshot: TaskSnapshot | None = None,
+) -> tuple[int, list[IndexedTask]]:
+    """
+    Move inbox tasks to their agents' directories as one batch.
+
+    All moves are committed together by move_tasks(): atomic per file, with
+    one directory fsync per batch instead of one per task.
+
+    Returns:
+        Number of tasks assigned and the entries that stayed in the inbox
+    """
+    remaining: list[IndexedTask] = []
+    planned: list[tuple[IndexedTask, TaskMove]] = []
+    for entry in entries:
+        move = _plan_assignment(entry)
+        if move is None:
+            remaining.append(entry)
+        else:
+            planned.append((entry, move))
+
+    errors = move_tasks([move for _, move in planned])
+    assigned = 0
+
+    for (entry, move), error in zip(planned, errors, strict=True):
+        if error is not None:
+            _log_event(f"❗️ Error assigning {entry.path.name}: {error}")
+            # Left in the inbox unless the file has gone meanwhile
+            if entry.path.exists():
+                remaining.append(entry)
+            continue
+
+        assigned_entry = index.record(move.dest, move.task)
+        index.forget(entry.path)
+
+        # Keep the snapshot current for the phases that follow
+        if snapshot is not None and assigned_entry is not None:
+            snapshot.assigned.append(assigned_entry)
+
+        _log_event(f"Assigned task {move.task['id']} to {move.task['agent']}")
+        assigned += 1
+
+    return assigned, remaining
+
+
+def assign_tasks(snapshot: TaskSnapshot | None = None) -> int:
+    """Process inbox and assign tasks to agents."""
+    assigned, remaining = _assign_entries(
+        _task_index(), _stage_entries(snapshot, "inbox"), snapshot
+    )
+
+    if snapshot is not None:
+        snapshot.inbox = remaining
+
+    return assigned
+
+
+def assign_task_file(task_file: Path) -> bool:
+    """
+    Assign a single inbox task, e.g. in response to a file system event.
+
+    Args:
+        task_file: Path of the task file in the inbox
+
+    Returns:
+        True if the task was moved to its agent's directory
+    """
+    index = _task_index()
+    entry = index.refresh(task_file)
+    if entry is None or entry.stage != "inbox":
+        return False
+    assigned, _ = _assign_entries(index, [entry])
+    return assigned == 1
 
 
 def log_handoff(
@@ -95,111 +247,182 @@ def log_handoff(
         f.write("**Status:** Created\n\n")
 
 
-def process_completed_tasks() -> int:
-    """Create follow-up tasks based on next_agent."""
-    followups_created = 0
+def _create_followup(
+    index: TaskIndex, entry: IndexedTask, snapshot: TaskSnapshot | None = None
+) -> bool:
+    """Write the follow-up task requested by one completed task."""
+    task_file = entry.path
+    try:
+        task = entry.load()
+        if task is None:
+            raise ValueError(entry.error)
+        result = task.get("result", {})
+        next_agent = result.get("next_agent")
+        source_id = str(task["id"])
+
+        # Named after the source task (timestamp included), so a retry
+        # after a crash between the write and the ledger update finds the
+        # file instead of creating a second follow-up
+        followup_id = (
+            f"{_followup_stamp(entry, source_id)}-{next_agent}-followup-{source_id}"
+        )
+        followup_file = INBOX_DIR / f"{followup_id}.yaml"
+
+        existing = index.find_followup(source_id)
+        if existing is None and followup_file.exists():
+            existing = followup_id
+        if existing is not None:
+            index.record_followup(source_id, existing)
+            return False
+
+        followup = {
+            "id": followup_id,
+            "agent": next_agent,
+            "status": TaskStatus.NEW.value,
+            "title": result.get("next_task_title", f"Follow-up to {task['id']}"),
+            "artefacts": result.get("next_artefacts", task.get("artefacts", [])),
+            "context": {
+                "previous_task": task.get("id"),
+                "previous_agent": task.get("agent"),
+                "notes": result.get("next_task_notes", []),
+            },
+            "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "created_by": "coordinator",
+        }
 
-    for task_file in DONE_DIR.glob("**/*.yaml"):
+        write_task(followup_file, followup)
+        index.record_followup(source_id, followup_id)
+        followup_entry = index.record(followup_file, followup)
+        if snapshot is not None and followup_entry is not None:
+            snapshot.inbox.append(followup_entry)
+        log_handoff(
+            task.get("agent", "unknown"),
+            next_agent,
+            followup.get("artefacts", []),
+            followup_id,
+        )
+        return True
+    except Exception as exc:  # noqa: BLE001
+        _log_event(f"❗️ Error processing {task_file.name}: {exc}")
+        return False
+
+
+def _followup_stamp(entry: IndexedTask, source_id: str) -> str:
+    """
+    Deterministic YYYY-MM-DDTHHMM prefix of a follow-up task id.
+
+    Taken from the source task's completed_at, else the timestamp its own
+    id starts with, else the modification time of its file, so the name
+    is the same on every retry (and archive_old_tasks can date the file).
+    """
+    if entry.completed_at:
         try:
-            task = read_task(task_file)
-            result = task.get("result", {})
-            next_agent = result.get("next_agent")
+            completed = datetime.fromisoformat(
+                entry.completed_at.replace("Z", "+00:00")
+            )
+        except ValueError:
+            pass
+        else:
+            if completed.tzinfo is not None:
+                completed = completed.astimezone(timezone.utc)
+            return completed.strftime("%Y-%m-%dT%H%M")
+    try:
+        return datetime.strptime(source_id[:15], "%Y-%m-%dT%H%M").strftime(
+            "%Y-%m-%dT%H%M"
+        )
+    except ValueError:
+        modified = datetime.fromtimestamp(entry.mtime_ns / 1e9, timezone.utc)
+        return modified.strftime("%Y-%m-%dT%H%M")
 
-            if not next_agent:
-                continue
 
-            followup_id = f"{datetime.now(timezone.utc).strftime('%Y-%m-%dT%H%M')}-{next_agent}-followup-{task['id']}"
-            followup_file = INBOX_DIR / f"{followup_id}.yaml"
+def process_completed_tasks(snapshot: TaskSnapshot | None = None) -> int:
+    """Create follow-up tasks based on next_agent."""
+    followups_created = 0
+    index = _task_index()
 
-            if followup_file.exists():
-                continue
+    # Only completions not yet in the follow-up ledger; done/ tasks that
+    # were handed off in earlier cycles are neither loaded nor re-checked.
+    pending = index.pending_followups(reconcile=snapshot is None)
+    if snapshot is not None:
+        in_snapshot = {entry.path for entry in snapshot.done}
+        pending = [entry for entry in pending if entry.path in in_snapshot]
 
-            followup = {
-                "id": followup_id,
-                "agent": next_agent,
-                "status": TaskStatus.NEW.value,
-                "title": result.get("next_task_title", f"Follow-up to {task['id']}"),
-                "artefacts": result.get("next_artefacts", task.get("artefacts", [])),
-                "context": {
-                    "previous_task": task.get("id"),
-                    "previous_agent": task.get("agent"),
-                    "notes": result.get("next_task_notes", []),
-                },
-                "created_at": datetime.now(timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z"),
-                "created_by": "coordinator",
-            }
-
-            write_task(followup_file, followup)
-            log_handoff(
-                task.get("agent", "unknown"),
-                next_agent,
-                followup.get("artefacts", []),
-                followup_id,
-            )
+    for entry in pending:
+        if _create_followup(index, entry, snapshot):
             followups_created += 1
-        except Exception as exc:  # noqa: BLE001
-            _log_event(f"❗️ Error processing {task_file.name}: {exc}")
 
     return followups_created
 
 
-def check_timeouts() -> int:
+def process_completed_file(task_file: Path) -> bool:
+    """
+    Create the follow-up for a single completed task, e.g. on a watcher event.
+
+    Args:
+        task_file: Path of the task file below done/
+
+    Returns:
+        True if a follow-up task was written to the inbox
+    """
+    index = _task_index()
+    entry = index.refresh(task_file)
+    if entry is None or entry.stage != "done":
+        return False
+    if entry.error is None and not entry.next_agent:
+        return False
+    return _create_followup(index, entry)
+
+
+def check_timeouts(snapshot: TaskSnapshot | None = None) -> int:
     """Flag tasks stuck in in_progress."""
     timeout_cutoff = datetime.now(timezone.utc) - timedelta(hours=TIMEOUT_HOURS)
     flagged = 0
 
-    for agent_dir in ASSIGNED_DIR.iterdir():
-        if not agent_dir.is_dir():
+    for entry in _stage_entries(snapshot, "assigned"):
+        if entry.bucket is None:
             continue
 
-        for task_file in agent_dir.glob("*.yaml"):
-            try:
-                task = read_task(task_file)
-
-                if task.get("status") != TaskStatus.IN_PROGRESS.value:
-                    continue
+        try:
+            if entry.error is not None:
+                raise ValueError(entry.error)
 
-                started_at_raw = task.get("started_at")
-                if not started_at_raw:
-                    _log_event(
-                        f"⚠️ Task {task.get('id', task_file.name)} missing started_at; skipping timeout check"
-                    )
-                    continue
+            if entry.status != TaskStatus.IN_PROGRESS.value:
+                continue
 
-                started_at = datetime.fromisoformat(
-                    str(started_at_raw).replace("Z", "+00:00")
+            if not entry.started_at:
+                _log_event(
+                    f"⚠️ Task {entry.task_id or entry.path.name} missing started_at; skipping timeout check"
                 )
+                continue
 
-                if started_at < timeout_cutoff:
-                    _log_event(f"⚠️ Task {task['id']} stalled (>{TIMEOUT_HOURS}h)")
-                    flagged += 1
-            except Exception as exc:  # noqa: BLE001
-                _log_event(f"❗️ Error checking timeout for {task_file.name}: {exc}")
+            started_at = datetime.fromisoformat(entry.started_at.replace("Z", "+00:00"))
+
+            if started_at < timeout_cutoff:
+                _log_event(f"⚠️ Task {entry.task_id} stalled (>{TIMEOUT_HOURS}h)")
+                flagged += 1
+        except Exception as exc:  # noqa: BLE001
+            _log_event(f"❗️ Error checking timeout for {entry.path.name}: {exc}")
 
     return flagged
 
 
-def detect_conflicts() -> int:
+def detect_conflicts(snapshot: TaskSnapshot | None = None) -> int:
     """Warn when multiple tasks target same artifact."""
     artifact_map: dict[str, list[str]] = defaultdict(list)
 
-    for agent_dir in ASSIGNED_DIR.iterdir():
-        if not agent_dir.is_dir():
+    for entry in _stage_entries(snapshot, "assigned"):
+        if entry.bucket is None:
             continue
 
-        for task_file in agent_dir.glob("*.yaml"):
-            try:
-                task = read_task(task_file)
+        if entry.error is not None:
+            _log_event(
+                f"❗️ Error checking conflicts for {entry.path.name}: {entry.error}"
+            )
+            continue
 
-                if task.get("status") == TaskStatus.IN_PROGRESS.value:
-                    for artifact in task.get("artefacts", []):
-                        artifact_map[str(artifact)].append(
-                            task.get("id", task_file.name)
-                        )
-            except Exception as exc:  # noqa: BLE001
-                _log_event(f"❗️ Error checking conflicts for {task_file.name}: {exc}")
+        if entry.status == TaskStatus.IN_PROGRESS.value:
+            for artifact in entry.artefacts:
+                artifact_map[artifact].append(entry.task_id or entry.path.name)
 
     conflicts = 0
     for artifact, task_ids in artifact_map.items():
@@ -210,35 +433,30 @@ def detect_conflicts() -> int:
     return conflicts
 
 
-def update_agent_status() -> None:
+def update_agent_status(snapshot: TaskSnapshot | None = None) -> None:
     """Update agent status dashboard."""
     status: dict[str, dict[str, Any]] = {}
 
+    entries_by_agent: dict[str, list[IndexedTask]] = defaultdict(list)
+    for entry in _stage_entries(snapshot, "assigned"):
+        if entry.bucket is not None:
+            entries_by_agent[entry.bucket].append(entry)
+
     for agent_dir in ASSIGNED_DIR.iterdir():
         if not agent_dir.is_dir():
             continue
 
         agent = agent_dir.name
-        tasks = list(agent_dir.glob("*.yaml"))
+        entries = entries_by_agent.get(agent, [])
 
-        in_progress = []
-        assigned = []
-
-        for task_file in tasks:
-            try:
-                task = read_task(task_file)
-                if task.get("status") == TaskStatus.IN_PROGRESS.value:
-                    in_progress.append(task)
-                elif task.get("status") == TaskStatus.ASSIGNED.value:
-                    assigned.append(task)
-            except Exception:
-                continue
+        in_progress = [e for e in entries if e.status == TaskStatus.IN_PROGRESS.value]
+        assigned = [e for e in entries if e.status == TaskStatus.ASSIGNED.value]
 
         status[agent] = {
             "assigned": len(assigned),
             "in_progress": len(in_progress),
-            "current_task": in_progress[0]["id"] if in_progress else "Idle",
-            "last_seen": max([t.stat().st_mtime for t in tasks]) if tasks else None,
+            "current_task": in_progress[0].task_id if in_progress else "Idle",
+            "last_seen": (max(e.mtime_ns for e in entries) / 1e9 if entries else None),
         }
 
     status_file = COLLAB_DIR / "AGENT_STATUS.md"
@@ -262,12 +480,18 @@ def update_agent_status() -> None:
             f.write("\n")
 
 
-def archive_old_tasks() -> int:
+def archive_old_tasks(snapshot: TaskSnapshot | None = None) -> int:
     """Move completed tasks to archive."""
     cutoff = datetime.now(timezone.utc) - timedelta(days=ARCHIVE_RETENTION_DAYS)
-    archived = 0
+    archived_files: set[Path] = set()
+    index = _task_index()
 
-    for task_file in DONE_DIR.glob("**/*.yaml"):
+    if snapshot is not None:
+        done_files = [entry.path for entry in snapshot.done]
+    else:
+        done_files = list(DONE_DIR.glob("**/*.yaml"))
+
+    for task_file in done_files:
         try:
             task_date_str = task_file.name[:10]
             task_date = datetime.strptime(task_date_str, "%Y-%m-%d")
@@ -279,40 +503,288 @@ def archive_old_tasks() -> int:
 
                 dest = archive_month / task_file.name
                 shutil.move(str(task_file), str(dest))
-                archived += 1
+                index.forget(task_file)
+                archived_files.add(task_file)
         except Exception as exc:  # noqa: BLE001
             _log_event(f"❗️ Error archiving {task_file.name}: {exc}")
 
-    return archived
+    if snapshot is not None:
+        snapshot.done = [e for e in snapshot.done if e.path not in archived_files]
+
+    return len(archived_files)
+
 
+def run_cycle() -> CycleReport:
+    """
+    Run all coordinator phases against a single task snapshot.
 
-def main() -> None:
+    Returns:
+        CycleReport with phase results and per-phase timings, including
+        the one-off snapshot (discovery + parse) cost
+    """
+    report = CycleReport()
+    start_total = time.perf_counter()
+
+    start = time.perf_counter()
+    snapshot = take_snapshot()
+    report.timings["snapshot"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report.assigned = assign_tasks(snapshot)
+    report.timings["assign_tasks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report.followups = process_completed_tasks(snapshot)
+    report.timings["process_completed"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report.timeouts = check_timeouts(snapshot)
+    report.timings["check_timeouts"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report.conflicts = detect_conflicts(snapshot)
+    report.timings["detect_conflicts"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report.archived = archive_old_tasks(snapshot)
+    report.timings["archive_old_tasks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    update_agent_status(snapshot)
+    report.timings["update_agent_status"] = time.perf_counter() - start
+
+    report.total_time = time.perf_counter() - start_total
+    return report
+
+
+class CoordinatorEventHandler(FileSystemEventHandler):
+    """
+    Forward task file events to the coordinator daemon.
+
+    Runs on the watchdog observer thread, so it only queues paths; all task
+    handling happens on the daemon thread.
+    """
+
+    def __init__(self, events: queue.Queue[Path | None]):
+        """
+        Initialize handler.
+
+        Args:
+            events: Queue consumed by CoordinatorDaemon
+        """
+        super().__init__()
+        self.events = events
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle file creation events."""
+        self._enqueue(event, event.src_path)
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        """Handle file modification events (writer still flushing)."""
+        self._enqueue(event, event.src_path)
+
+    def on_closed(self, event: FileSystemEvent) -> None:
+        """Handle close-after-write events."""
+        self._enqueue(event, event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file moves (atomic writes, assigned/ → done/)."""
+        self._enqueue(event, event.dest_path)
+
+    def _enqueue(self, event: FileSystemEvent, path: str | bytes) -> None:
+        """Queue a task file path."""
+        if event.is_directory:
+            return
+        task_file = Path(os.fsdecode(path))
+        if task_file.suffix == ".yaml":
+            self.events.put(task_file)
+
+
+class CoordinatorDaemon:
+    """
+    Long-running coordinator driven by file system events.
+
+    Inbox arrivals are assigned and done/ arrivals get their follow-up as
+    soon as the file has been quiet for ``settle_seconds`` (so half-written
+    files are not picked up). A full run_cycle() runs on start and every
+    ``reconcile_interval`` seconds to catch missed events and run the
+    time-based phases.
+    """
+
+    def __init__(
+        self,
+        reconcile_interval: float = RECONCILE_INTERVAL_SECONDS,
+        settle_seconds: float = EVENT_SETTLE_SECONDS,
+    ):
+        """
+        Initialize daemon.
+
+        Args:
+            reconcile_interval: Seconds between full reconciliation sweeps
+            settle_seconds: Quiet period before an event's file is handled
+        """
+        self.reconcile_interval = reconcile_interval
+        self.settle_seconds = settle_seconds
+        self.events: queue.Queue[Path | None] = queue.Queue()
+        self.observer: Observer | None = None
+        self.sweeps = 0
+        self._stop = threading.Event()
+        self._pending: dict[Path, float] = {}
+
+    def start(self) -> None:
+        """Start watching inbox/ and done/."""
+        for directory in [INBOX_DIR, ASSIGNED_DIR, DONE_DIR, ARCHIVE_DIR, COLLAB_DIR]:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        handler = CoordinatorEventHandler(self.events)
+        self.observer = Observer()
+        self.observer.schedule(handler, str(INBOX_DIR.absolute()), recursive=False)
+        self.observer.schedule(handler, str(DONE_DIR.absolute()), recursive=True)
+        self.observer.start()
+
+    def stop(self) -> None:
+        """Ask run() to return and stop the observer."""
+        self._stop.set()
+        self.events.put(None)  # Wake the event loop
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+    def run(self) -> None:
+        """Handle events until stop() is called."""
+        if self.observer is None:
+            self.start()
+
+        # Watching starts before the first sweep so no arrival is missed
+        next_sweep = time.monotonic()
+        while not self._stop.is_set():
+            now = time.monotonic()
+            if now >= next_sweep:
+                self.sweep()
+                next_sweep = now + self.reconcile_interval
+
+            deadline = next_sweep
+            if self._pending:
+                deadline = min(deadline, min(self._pending.values()))
+            try:
+                task_file = self.events.get(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except queue.Empty:
+                task_file = None
+            if task_file is not None:
+                self._pending[task_file.absolute()] = (
+                    time.monotonic() + self.settle_seconds
+                )
+
+            self.process_pending()
+
+    def process_pending(self, force: bool = False) -> int:
+        """
+        Handle queued files whose settle period has elapsed.
+
+        Args:
+            force: Handle every queued file regardless of settle period
+
+        Returns:
+            Number of tasks assigned or follow-ups created
+        """
+        now = time.monotonic()
+        ready = [p for p, due in self._pending.items() if force or due <= now]
+        handled = 0
+        assigned = 0
+
+        for task_file in sorted(ready):
+            del self._pending[task_file]
+            if task_file.parent == INBOX_DIR.absolute():
+                if assign_task_file(task_file):
+                    assigned += 1
+            elif DONE_DIR.absolute() in task_file.parents:
+                if process_completed_file(task_file):
+                    handled += 1
+
+        if assigned:
+            update_agent_status()
+        return handled + assigned
+
+    def sweep(self) -> CycleReport:
+        """Run a full reconciliation cycle."""
+        report = run_cycle()
+        self.sweeps += 1
+        if report.assigned or report.followups or report.archived:
+            _log_event(
+                "Coordinator sweep: "
+                f"{report.assigned} assigned, {report.followups} follow-ups, "
+                f"{report.archived} archived"
+            )
+        return report
+
+
+def run_daemon(reconcile_interval: float = RECONCILE_INTERVAL_SECONDS) -> None:
+    """Run the event-driven coordinator until interrupted."""
+    daemon = CoordinatorDaemon(reconcile_interval=reconcile_interval)
+    print(
+        "🤖 Coordinator Agent - Watching "
+        f"{INBOX_DIR} and {DONE_DIR} (sweep every {reconcile_interval:g}s)"
+    )
+    daemon.start()
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+    print("🛑 Coordinator Agent - Stopped")
+
+
+def main(argv: list[str] | None = None) -> None:
     """Main coordinator loop."""
+    parser = argparse.ArgumentParser(
+        description="Coordinate multi-agent task files in work/collaboration",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run continuously, reacting to file system events",
+    )
+    parser.add_argument(
+        "--reconcile-interval",
+        type=float,
+        default=RECONCILE_INTERVAL_SECONDS,
+        help=(
+            "Seconds between full sweeps in daemon mode "
+            f"(default: {RECONCILE_INTERVAL_SECONDS})"
+        ),
+    )
+    args = parser.parse_args(argv or [])
+
+    if args.daemon:
+        run_daemon(args.reconcile_interval)
+        return
+
     print("🤖 Coordinator Agent - Starting cycle")
 
     for directory in [INBOX_DIR, ASSIGNED_DIR, DONE_DIR, ARCHIVE_DIR, COLLAB_DIR]:
         directory.mkdir(parents=True, exist_ok=True)
 
-    assigned = assign_tasks()
-    followups = process_completed_tasks()
-    timeouts = check_timeouts()
-    conflicts = detect_conflicts()
-    archived = archive_old_tasks()
-    update_agent_status()
+    report = run_cycle()
 
     print("✅ Cycle complete:")
-    print(f"   - Assigned: {assigned} tasks")
-    print(f"   - Follow-ups created: {followups}")
-    print(f"   - Timeouts flagged: {timeouts}")
-    print(f"   - Conflicts detected: {conflicts}")
-    print(f"   - Archived: {archived} tasks")
+    print(f"   - Assigned: {report.assigned} tasks")
+    print(f"   - Follow-ups created: {report.followups}")
+    print(f"   - Timeouts flagged: {report.timeouts}")
+    print(f"   - Conflicts detected: {report.conflicts}")
+    print(f"   - Archived: {report.archived} tasks")
+    print(f"   - Cycle time: {report.total_time:.3f}s")
 
     _log_event(
         "Coordinator cycle: "
-        f"{assigned} assigned, {followups} follow-ups, "
-        f"{timeouts} timeouts, {conflicts} conflicts, {archived} archived"
+        f"{report.assigned} assigned, {report.followups} follow-ups, "
+        f"{report.timeouts} timeouts, {report.conflicts} conflicts, "
+        f"{report.archived} archived"
     )
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
@@ -30,15 +30,7 @@ import yaml
 
 # Import orchestrator functions
 sys.path.insert(0, str(Path(__file__).parent))
-from agent_orchestrator import (
-    WORK_DIR,
-    archive_old_tasks,
-    assign_tasks,
-    check_timeouts,
-    detect_conflicts,
-    process_completed_tasks,
-    update_agent_status,
-)
+from agent_orchestrator import WORK_DIR, run_cycle
 
 BENCHMARK_DIR = WORK_DIR / "benchmarks"
 RESULTS_DIR = BENCHMARK_DIR / "results"
@@ -221,7 +213,7 @@ def setup_benchmark_environment(
 
 
 def run_orchestrator_cycle() -> dict[str, Any]:
-    """Execute a full orchestrator cycle with timing."""
+    """Execute a full orchestrator cycle with per-phase timing."""
     metrics: dict[str, float] = {}
 
     # Override global directories temporarily
@@ -248,39 +240,8 @@ def run_orchestrator_cycle() -> dict[str, Any]:
         agent_orchestrator.COLLAB_DIR = test_work_dir / "collaboration"
         agent_orchestrator.ARCHIVE_DIR = test_work_dir / "archive"
 
-        # Time each operation
-        start_total = time.perf_counter()
-
-        start = time.perf_counter()
-        assigned = assign_tasks()
-        metrics["assign_tasks_duration"] = time.perf_counter() - start
-        metrics["tasks_assigned"] = assigned
-
-        start = time.perf_counter()
-        followups = process_completed_tasks()
-        metrics["process_completed_duration"] = time.perf_counter() - start
-        metrics["followups_created"] = followups
-
-        start = time.perf_counter()
-        timeouts = check_timeouts()
-        metrics["check_timeouts_duration"] = time.perf_counter() - start
-        metrics["timeouts_flagged"] = timeouts
-
-        start = time.perf_counter()
-        conflicts = detect_conflicts()
-        metrics["detect_conflicts_duration"] = time.perf_counter() - start
-        metrics["conflicts_detected"] = conflicts
-
-        start = time.perf_counter()
-        archived = archive_old_tasks()
-        metrics["archive_old_tasks_duration"] = time.perf_counter() - start
-        metrics["tasks_archived"] = archived
-
-        start = time.perf_counter()
-        update_agent_status()
-        metrics["update_agent_status_duration"] = time.perf_counter() - start
-
-        metrics["total_cycle_time"] = time.perf_counter() - start_total
+        # Single-pass cycle: one snapshot shared by all phases, timed per phase
+        metrics.update(run_cycle().metrics())
 
     finally:
         # Restore original directories
@@ -515,10 +476,12 @@ def generate_markdown_report(
 
         key_metrics = [
             ("total_cycle_time", "Total Cycle Time (s)"),
+            ("snapshot_duration", "Snapshot (s)"),
             ("assign_tasks_duration", "Assign Tasks (s)"),
             ("process_completed_duration", "Process Completed (s)"),
             ("check_timeouts_duration", "Check Timeouts (s)"),
             ("detect_conflicts_duration", "Detect Conflicts (s)"),
+            ("archive_old_tasks_duration", "Archive Tasks (s)"),
             ("update_agent_status_duration", "Update Status (s)"),
             ("validation_mean", "Validation per Task (s)"),
         ]
@@ -208,6 +208,10 @@ class TelemetryConfig(BaseModel):
         db_path: Path to SQLite database file (default: ~/.llm-service/telemetry.db)
         privacy_level: Logging detail level - metadata (metrics only), full (everything), none (disabled)
         retention_days: Days to retain detailed invocation logs (default: 30, 0 = keep forever)
+        hourly_retention_days: Days to retain hourly rollups (default: 90, 0 = keep forever)
+        daily_retention_days: Days to retain daily rollups (default: 0 = keep forever)
+        retention_interval_hours: Hours between retention runs of the background writer
+        vacuum_pages: Free pages released per retention run (0 = release all)
     """
 
     enabled: bool = Field(True, description="Enable/disable telemetry logging")
@@ -221,6 +225,18 @@ class TelemetryConfig(BaseModel):
     retention_days: int = Field(
         30, ge=0, description="Days to retain detailed logs (0 = keep forever)"
     )
+    hourly_retention_days: int = Field(
+        90, ge=0, description="Days to retain hourly rollups (0 = keep forever)"
+    )
+    daily_retention_days: int = Field(
+        0, ge=0, description="Days to retain daily rollups (0 = keep forever)"
+    )
+    retention_interval_hours: float = Field(
+        1.0, gt=0, description="Hours between retention runs of the background writer"
+    )
+    vacuum_pages: int = Field(
+        1000, ge=0, description="Free pages released per retention run (0 = all)"
+    )
 
     @field_validator("privacy_level")
     @classmethod
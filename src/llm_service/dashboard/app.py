@@ -7,27 +7,109 @@ Implements ADR-036: Dashboard Markdown Rendering with XSS protection.
 Implements ADR-035: Dashboard Task Priority Editing.
 """
 
+import json
 import os
 import secrets
-from datetime import datetime, timezone
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any
-
-from flask import Flask, jsonify, request
+from typing import TYPE_CHECKING, Any
+
+from flask import (
+    Flask,
+    Response,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context,
+)
 from flask_cors import CORS
 from flask_socketio import Namespace, SocketIO, emit
 
 # Import task query functions from domain layer (ADR-046)
-from src.domain.collaboration.task_query import (
-    find_task_files,
-    load_open_tasks,
+from src.domain.collaboration.task_cache import get_task_cache
+from src.domain.collaboration.task_index import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SORT,
+    MAX_PAGE_SIZE,
+    TaskPage,
+    get_task_index,
 )
-from src.domain.collaboration.task_schema import load_task_safe
+from src.domain.collaboration.task_query import load_open_tasks
 from src.domain.collaboration.types import TaskStatus
 
+if TYPE_CHECKING:
+    from .portfolio_view import PortfolioView
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Records serialized per chunk of a streamed export
+NDJSON_CHUNK_RECORDS = 500
+
+
+def page_tasks_with_filter(
+    work_dir: Path,
+    include_done: bool = False,
+    terminal_only: bool = False,
+    *,
+    agent: str | None = None,
+    statuses: Iterable[str] | None = None,
+    priorities: Iterable[str] | None = None,
+    since: str | None = None,
+    sort: str = DEFAULT_SORT,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    reconcile: bool = True,
+) -> TaskPage:
+    """
+    Load one page of tasks, filtered and sorted by the task index.
+
+    Args:
+        work_dir: Work collaboration directory
+        include_done: Include finished (done/error) tasks
+        terminal_only: Return only terminal status tasks
+        agent: Only tasks assigned to this agent
+        statuses: Only tasks with one of these statuses
+        priorities: Only tasks with one of these priorities
+        since: Only tasks updated at or after this ISO 8601 time
+        sort: Sort key (updated, priority, id), "-" prefix for descending
+        limit: Page size
+        cursor: next_cursor of the previous page
+        reconcile: Sync the index with the file system first
+
+    Returns:
+        TaskPage (see TaskIndex.page())
+
+    Raises:
+        ValueError: If sort, limit, since or cursor are invalid
+    """
+    # Tasks with unknown statuses are never listed
+    allowed = {
+        status.value
+        for status in TaskStatus
+        if (include_done or not TaskStatus.is_terminal(status))
+        and (not terminal_only or TaskStatus.is_terminal(status))
+    }
+    if statuses is not None:
+        allowed &= set(statuses)
+
+    return get_task_index(work_dir).page(
+        statuses=sorted(allowed),
+        agent=agent,
+        priorities=priorities,
+        since=since,
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+        reconcile=reconcile,
+    )
+
 
 def load_tasks_with_filter(
-    work_dir: Path, include_done: bool = False, terminal_only: bool = False
+    work_dir: Path,
+    include_done: bool = False,
+    terminal_only: bool = False,
+    **filters: Any,
 ) -> list[dict]:
     """
     Load tasks with filtering options.
@@ -36,44 +118,190 @@ def load_tasks_with_filter(
         work_dir: Work collaboration directory
         include_done: Include finished (done/error) tasks
         terminal_only: Return only terminal status tasks
+        **filters: agent, statuses, priorities, since, sort and reconcile,
+            as for page_tasks_with_filter()
 
     Returns:
         List of task dictionaries matching filter criteria
     """
-    if not include_done and not terminal_only:
+    if not include_done and not terminal_only and not filters:
         # Use optimized function for active tasks only
         return load_open_tasks(work_dir)
 
-    # Load all tasks including finished ones
-    task_files = find_task_files(work_dir, include_done=True)
-    filtered_tasks = []
+    # Filtering and sorting happen in the index; only matching rows are
+    # loaded, page by page
+    tasks: list[dict] = []
+    cursor = None
+    while True:
+        page = page_tasks_with_filter(
+            work_dir,
+            include_done,
+            terminal_only,
+            limit=MAX_PAGE_SIZE,
+            cursor=cursor,
+            **filters,
+        )
+        tasks.extend(page.load())
+        cursor = page.next_cursor
+        if cursor is None:
+            return tasks
+        filters["reconcile"] = False
+
+
+def iter_task_records(
+    work_dir: Path,
+    include_done: bool = True,
+    **filters: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream tasks with their location, one index page at a time.
+
+    Args:
+        work_dir: Work collaboration directory
+        include_done: Include finished (done/error) tasks
+        **filters: agent, statuses, priorities, since, sort and reconcile,
+            as for page_tasks_with_filter()
 
-    for task_file in task_files:
-        task = load_task_safe(task_file)
-        if task is None:
-            continue
+    Yields:
+        {"path", "stage", "agent", "task"} records; ``path`` is relative
+        to ``work_dir`` and ``agent`` is the assigned/done subdirectory
 
-        # Check status filter
-        status = task.get("status", "")
-        try:
-            task_status = TaskStatus(status)
-
-            if terminal_only:
-                # Only include terminal status tasks
-                if TaskStatus.is_terminal(task_status):
-                    filtered_tasks.append(task)
-            elif include_done:
-                # Include all tasks
-                filtered_tasks.append(task)
-            else:
-                # Include only active tasks
-                if not TaskStatus.is_terminal(task_status):
-                    filtered_tasks.append(task)
-        except ValueError:
-            # Invalid status, skip silently
-            continue
-
-    return filtered_tasks
+    Raises:
+        ValueError: If filters are invalid (raised before the first record)
+    """
+    root = Path(work_dir).absolute()
+    page = page_tasks_with_filter(
+        work_dir, include_done, limit=MAX_PAGE_SIZE, **filters
+    )
+    filters["reconcile"] = False
+
+    def records() -> Iterator[dict[str, Any]]:
+        current = page
+        while True:
+            for entry in current.entries:
+                task = entry.load()
+                if task is not None:
+                    yield {
+                        "path": entry.path.relative_to(root).as_posix(),
+                        "stage": entry.stage,
+                        "agent": entry.bucket,
+                        "task": task,
+                    }
+            if current.next_cursor is None:
+                return
+            current = page_tasks_with_filter(
+                work_dir,
+                include_done,
+                limit=MAX_PAGE_SIZE,
+                cursor=current.next_cursor,
+                **filters,
+            )
+
+    return records()
+
+
+def ndjson_response(records: Iterable[dict[str, Any]]) -> Response:
+    """
+    Stream records as newline-delimited JSON (chunked transfer).
+
+    Records are serialized as they are produced, a few hundred per chunk,
+    so the size of the export does not affect worker memory.
+
+    Args:
+        records: Records to serialize (consumed lazily)
+
+    Returns:
+        Streaming ``application/x-ndjson`` response
+    """
+
+    def generate() -> Iterator[str]:
+        chunk: list[str] = []
+        for record in records:
+            chunk.append(json.dumps(record, default=_json_default))
+            if len(chunk) >= NDJSON_CHUNK_RECORDS:
+                yield "\n".join(chunk) + "\n"
+                chunk.clear()
+        if chunk:
+            yield "\n".join(chunk) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize YAML scalars that JSON lacks (dates, datetimes)."""
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def index_is_live(app: Flask, work_dir: Path) -> bool:
+    """
+    Whether the running FileWatcher keeps the task index of ``work_dir``
+    up to date, so queries can skip reconciling it.
+
+    Args:
+        app: Dashboard Flask app
+        work_dir: Work collaboration directory of the query
+
+    Returns:
+        True if index reconciliation can be skipped
+    """
+    watcher = app.config.get("FILE_WATCHER")
+    return bool(
+        watcher
+        and watcher.maintains_index
+        and Path(watcher.watch_dir).absolute() == Path(work_dir).absolute()
+    )
+
+
+def get_portfolio_view(app: Flask) -> "PortfolioView":
+    """
+    Get the app's materialized portfolio view, creating it on first use.
+
+    Args:
+        app: Dashboard Flask app (SPEC_DIR and WORK_DIR are read from config)
+
+    Returns:
+        PortfolioView stored in app.config["PORTFOLIO_VIEW"]
+    """
+    from .portfolio_view import PortfolioView
+
+    view = app.config.get("PORTFOLIO_VIEW")
+    if view is None:
+        view = PortfolioView(
+            app.config.get("SPEC_DIR", "specifications"),
+            app.config.get("WORK_DIR", "work/collaboration"),
+        )
+        app.config["PORTFOLIO_VIEW"] = view
+    return view
+
+
+def split_param(value: str | None) -> list[str] | None:
+    """Split a comma-separated query parameter (None when absent or empty)."""
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()] or None
+
+
+def state_etag(*parts: Any) -> str:
+    """
+    Build an ETag from the state a response was rendered from.
+
+    Args:
+        parts: Endpoint name, state epoch and version, and any query options
+            that change the body
+
+    Returns:
+        ETag value (without quotes)
+    """
+    return "-".join(str(part) for part in parts)
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a client that already holds ``etag``."""
+    response = Response(status=304)
+    response.set_etag(etag, weak=True)
+    return response
 
 
 def add_security_headers(response):
@@ -147,6 +375,9 @@ def create_app(config: dict[str, Any] | None = None) -> tuple[Flask, SocketIO]:
     # CORS origins: Flask-SocketIO doesn't support wildcard ports, use explicit list or '*'
     # For development: allow all origins. For production: set explicit list via config
     app.config["CORS_ORIGINS"] = os.environ.get("DASHBOARD_CORS_ORIGINS", "*")
+    app.config["TELEMETRY_DB"] = os.environ.get(
+        "DASHBOARD_TELEMETRY_DB", "telemetry.db"
+    )
 
     # Override with custom config
     if config:
@@ -166,7 +397,7 @@ def create_app(config: dict[str, Any] | None = None) -> tuple[Flask, SocketIO]:
     # Initialize TelemetryAPI
     from .telemetry_api import TelemetryAPI
 
-    telemetry_db = app.config.get("TELEMETRY_DB", "telemetry.db")
+    telemetry_db = app.config["TELEMETRY_DB"]
     telemetry = TelemetryAPI(telemetry_db, socketio)
     app.config["TELEMETRY_API"] = telemetry
 
@@ -191,6 +422,9 @@ def register_routes(app: Flask) -> None:
         GET /health - Health check endpoint
         GET /api/stats - Current dashboard statistics
         GET /api/tasks - Current task state (inbox/assigned/done)
+        GET /api/tasks/changes - Tasks changed since a state version
+        GET /api/export/tasks - All tasks as streamed NDJSON
+        GET /api/export/telemetry - Telemetry invocations as streamed NDJSON
     """
 
     @app.route("/", methods=["GET"])
@@ -233,30 +467,14 @@ def register_routes(app: Flask) -> None:
         task_counts = {"inbox": 0, "assigned": 0, "done": 0, "total": 0}
 
         if watcher:
-            snapshot = watcher.get_task_snapshot()
-
-            # Count inbox tasks
-            inbox_count = len(snapshot.get("inbox", []))
-
-            # Count assigned tasks (nested by agent)
-            assigned_count = sum(
-                len(tasks) for tasks in snapshot.get("assigned", {}).values()
-            )
-
-            # Count done tasks (nested by agent)
-            done_count = sum(len(tasks) for tasks in snapshot.get("done", {}).values())
-
-            task_counts = {
-                "inbox": inbox_count,
-                "assigned": assigned_count,
-                "done": done_count,
-                "total": inbox_count + assigned_count + done_count,
-            }
+            # Maintained incrementally by the watcher; no snapshot needed
+            task_counts = watcher.get_task_counts()
 
         return jsonify(
             {
                 "tasks": task_counts,
                 "costs": costs,
+                "task_cache": get_task_cache().stats().to_dict(),
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         )
@@ -269,8 +487,13 @@ def register_routes(app: Flask) -> None:
         Query Parameters:
             include_done (bool): Include finished (done/error) tasks. Default: true
 
+        Headers:
+            If-None-Match: ETag of a previous response; answered with 304
+                when the task state has not changed since
+
         Returns:
             JSON with tasks in nested format: {inbox: [], assigned: {agent: []}, done: {agent: []}}
+            plus the state ``version`` and ``epoch`` (see /api/tasks/changes)
         """
         # Get include_done parameter (default: true for backward compatibility)
         include_done = request.args.get("include_done", "true").lower() == "true"
@@ -279,6 +502,13 @@ def register_routes(app: Flask) -> None:
         watcher = app.config.get("FILE_WATCHER")
         if watcher:
             snapshot = watcher.get_task_snapshot()
+            etag = None
+            if "version" in snapshot:
+                etag = state_etag(
+                    "tasks", snapshot.get("epoch"), snapshot["version"], include_done
+                )
+                if request.if_none_match.contains_weak(etag):
+                    return not_modified(etag)
 
             # If include_done=false, remove done and error tasks from snapshot
             if not include_done:
@@ -286,7 +516,10 @@ def register_routes(app: Flask) -> None:
                 snapshot["done"] = {}
                 snapshot["error"] = {}
 
-            return jsonify(snapshot)
+            response = jsonify(snapshot)
+            if etag is not None:
+                response.set_etag(etag, weak=True)
+            return response
 
         # Fallback if watcher not initialized
         return jsonify(
@@ -299,68 +532,172 @@ def register_routes(app: Flask) -> None:
             }
         )
 
+    @app.route("/api/tasks/changes", methods=["GET"])
+    def task_changes():
+        """
+        Return only the tasks that changed since a state version.
+
+        Query Parameters:
+            since (int): ``version`` of the snapshot or delta the client holds
+            epoch (str): ``epoch`` of that version (optional, recommended)
+            include_done (bool): Report tasks in done/. Default: true
+
+        Returns:
+            JSON with ``changes`` (op: created/updated/moved/removed, path,
+            stage, agent, task or id, and ``from`` for moves), the current
+            ``version`` and ``epoch``. ``reset`` is true when the delta is
+            unavailable (version too old or from a restarted server): reload
+            /api/tasks instead.
+        """
+        since = request.args.get("since", type=int)
+        if since is None or since < 0:
+            return jsonify({"error": "since must be a non-negative integer"}), 400
+
+        include_done = request.args.get("include_done", "true").lower() == "true"
+
+        watcher = app.config.get("FILE_WATCHER")
+        if not watcher:
+            return jsonify(
+                {
+                    "version": 0,
+                    "epoch": None,
+                    "since": since,
+                    "reset": True,
+                    "changes": [],
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+
+        return jsonify(
+            watcher.get_task_changes(
+                since, epoch=request.args.get("epoch"), include_done=include_done
+            )
+        )
+
     @app.route("/api/tasks/finished", methods=["GET"])
     def tasks_finished():
         """
         Return only finished tasks (DONE and ERROR status).
 
+        Query Parameters:
+            agent (str): Only tasks of this agent
+            status (str): Comma-separated statuses (done, error)
+            priority (str): Comma-separated priorities
+            since (str): Only tasks updated at or after this ISO 8601 time
+            sort (str): updated, priority or id; "-" prefix for descending.
+                Default: -updated
+            limit (int): Page size (max 1000); enables pagination
+            cursor (str): next_cursor of the previous page
+
         Returns:
-            JSON array with tasks that have terminal status (done/error)
+            JSON array with tasks that have terminal status (done/error);
+            with limit or cursor, one page:
+            {"tasks": [...], "next_cursor": str | null, "limit": int}
         """
         work_dir = Path(app.config.get("WORK_DIR", "work/collaboration"))
-        finished_tasks = load_tasks_with_filter(
-            work_dir, include_done=True, terminal_only=True
+        args = request.args
+        filters: dict[str, Any] = {
+            "agent": args.get("agent") or None,
+            "statuses": split_param(args.get("status")),
+            "priorities": split_param(args.get("priority")),
+            "since": args.get("since") or None,
+        }
+        filters = {name: value for name, value in filters.items() if value}
+        if "sort" in args:
+            filters["sort"] = args["sort"]
+        if filters:
+            filters["reconcile"] = not index_is_live(app, work_dir)
+
+        try:
+            if "limit" not in args and "cursor" not in args:
+                finished_tasks = load_tasks_with_filter(
+                    work_dir, include_done=True, terminal_only=True, **filters
+                )
+                return jsonify(finished_tasks)
+
+            limit = args.get("limit", type=int)
+            if limit is None:
+                if "limit" in args:
+                    return jsonify({"error": "limit must be an integer"}), 400
+                limit = DEFAULT_PAGE_SIZE
+            page = page_tasks_with_filter(
+                work_dir,
+                include_done=True,
+                terminal_only=True,
+                limit=limit,
+                cursor=args.get("cursor"),
+                **{"reconcile": not index_is_live(app, work_dir), **filters},
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify(
+            {"tasks": page.load(), "next_cursor": page.next_cursor, "limit": limit}
         )
-        return jsonify(finished_tasks)
 
-    def _build_task_list(spec_tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Build task list from specification tasks."""
-        return [
-            {
-                "id": t.get("id"),
-                "title": t.get("title"),
-                "status": t.get("status"),
-                "priority": t.get("priority"),
-                "agent": t.get("agent"),
-            }
-            for t in spec_tasks
-        ]
-
-    def _calculate_spec_progress(spec_tasks: list[dict[str, Any]]) -> int:
-        """Calculate specification progress from tasks."""
-        completed_tasks = sum(1 for t in spec_tasks if t.get("status") == "done")
-        total_tasks = len(spec_tasks)
-        return int(completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-
-    def _determine_initiative_status(specs: list[dict[str, Any]]) -> str:
-        """Determine initiative status (most advanced status)."""
-        status_priority = {
-            "draft": 1,
-            "in_progress": 2,
-            "implemented": 3,
-            "complete": 3,
+    @app.route("/api/export/tasks", methods=["GET"])
+    def export_tasks():
+        """
+        Stream all tasks as newline-delimited JSON.
+
+        Query Parameters:
+            include_done (bool): Include finished (done/error) tasks. Default: true
+            agent (str): Only tasks of this agent
+            status (str): Comma-separated statuses
+            priority (str): Comma-separated priorities
+            since (str): Only tasks updated at or after this ISO 8601 time
+            sort (str): updated, priority or id; "-" prefix for descending.
+                Default: -updated
+
+        Returns:
+            application/x-ndjson, one {"path", "stage", "agent", "task"}
+            record per line
+        """
+        work_dir = Path(app.config.get("WORK_DIR", "work/collaboration"))
+        args = request.args
+        filters: dict[str, Any] = {
+            "agent": args.get("agent") or None,
+            "statuses": split_param(args.get("status")),
+            "priorities": split_param(args.get("priority")),
+            "since": args.get("since") or None,
+            "sort": args.get("sort") or None,
         }
-        return max(
-            (spec.get("status", "draft") for spec in specs),
-            key=lambda s, priority=status_priority: priority.get(s, 0),
-        )
+        filters = {name: value for name, value in filters.items() if value}
 
-    def _determine_initiative_priority(specs: list[dict[str, Any]]) -> str:
-        """Determine initiative priority (highest priority)."""
-        priority_order = {"CRITICAL": 4, "HIGH": 3, "MEDIUM": 2, "LOW": 1}
-        return max(
-            (spec.get("priority", "MEDIUM") for spec in specs),
-            key=lambda p, order=priority_order: order.get(p, 2),
-        )
+        try:
+            records = iter_task_records(
+                work_dir,
+                include_done=args.get("include_done", "true").lower() == "true",
+                reconcile=not index_is_live(app, work_dir),
+                **filters,
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-    def _calculate_initiative_progress(specs: list[dict[str, Any]]) -> int:
-        """Calculate initiative progress from all specifications."""
-        total_tasks = sum(spec["task_count"] for spec in specs)
-        completed_tasks = sum(
-            len([t for t in spec["tasks"] if t.get("status") == "done"])
-            for spec in specs
+        return ndjson_response(records)
+
+    @app.route("/api/export/telemetry", methods=["GET"])
+    def export_telemetry():
+        """
+        Stream telemetry invocation records as newline-delimited JSON.
+
+        Query Parameters:
+            since (str): Only invocations at or after this timestamp
+            until (str): Only invocations before this timestamp
+
+        Returns:
+            application/x-ndjson, one invocation record per line
+        """
+        telemetry = app.config.get("TELEMETRY_API")
+        if telemetry is None:
+            return jsonify({"error": "Telemetry not available"}), 503
+
+        return ndjson_response(
+            telemetry.iter_invocations(
+                since=request.args.get("since") or None,
+                until=request.args.get("until") or None,
+            )
         )
-        return int(completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
 
     @app.route("/api/portfolio", methods=["GET"])
     def portfolio():
@@ -393,109 +730,14 @@ def register_routes(app: Flask) -> None:
                 "orphans": [...]
             }
         """
-        from .progress_calculator import ProgressCalculator
-        from .spec_parser import SpecificationParser
-        from .task_linker import TaskLinker
-
-        # Get directories from config
-        spec_dir = app.config.get("SPEC_DIR", "specifications")
-        work_dir = app.config.get("WORK_DIR", "work/collaboration")
-
-        # Initialize components
-        parser = SpecificationParser(spec_dir)
-        linker = TaskLinker(work_dir, spec_dir=spec_dir)
-        ProgressCalculator()
-
-        # Parse all specifications
-        specifications = parser.scan_specifications(spec_dir)
-
-        # Group tasks by specification
-        task_groups = linker.group_by_specification()
-
-        # Build specification objects with their tasks
-        from collections import defaultdict
-
-        spec_objects = []
-
-        for spec_meta in specifications:
-            # Get tasks for this specification
-            from pathlib import Path
-
-            spec_full_path = str(Path(spec_dir) / spec_meta.relative_path)
-            spec_tasks = task_groups.get(spec_full_path, [])
-
-            # Build task list (tasks link to specifications, not features)
-            tasks = _build_task_list(spec_tasks)
-
-            # Calculate specification progress from tasks
-            spec_progress = _calculate_spec_progress(spec_tasks)
-
-            # Build specification object
-            spec_objects.append(
-                {
-                    "id": spec_meta.id,
-                    "title": spec_meta.title,
-                    "status": spec_meta.status,
-                    "priority": spec_meta.priority,
-                    "initiative": spec_meta.initiative,
-                    "progress": spec_progress,
-                    "task_count": len(tasks),
-                    "tasks": tasks,
-                    "specification_path": spec_meta.relative_path,
-                }
-            )
-
-        # Group specifications by initiative
-        initiatives_grouped = defaultdict(list)
-        for spec in spec_objects:
-            initiative_name = spec.get("initiative") or "Uncategorized"
-            initiatives_grouped[initiative_name].append(spec)
-
-        # Build initiative list
-        initiatives = []
-        for initiative_name, specs in sorted(initiatives_grouped.items()):
-            # Calculate initiative progress from all specifications
-            initiative_progress = _calculate_initiative_progress(specs)
-
-            # Determine initiative status (most advanced status)
-            initiative_status = _determine_initiative_status(specs)
-
-            # Determine initiative priority (highest priority)
-            initiative_priority = _determine_initiative_priority(specs)
-
-            # Calculate task count
-            total_tasks = sum(spec["task_count"] for spec in specs)
-
-            initiatives.append(
-                {
-                    "id": initiative_name.lower().replace(" ", "-"),
-                    "title": initiative_name,
-                    "status": initiative_status,
-                    "priority": initiative_priority,
-                    "progress": initiative_progress,
-                    "specifications": specs,
-                    "spec_count": len(specs),
-                    "task_count": total_tasks,
-                }
-            )
-
-        # Get orphan tasks (tasks without specification links)
-        orphan_tasks = linker.get_orphan_tasks()
-        orphans = [
-            {
-                "id": t.get("id"),
-                "title": t.get("title"),
-                "status": t.get("status"),
-                "priority": t.get("priority"),
-                "agent": t.get("agent"),
-            }
-            for t in orphan_tasks
-        ]
+        view = get_portfolio_view(app)
+        if not view.is_running:
+            # Not patched by file events (e.g. tests, no run_dashboard): rescan
+            view.rebuild()
 
         return jsonify(
             {
-                "initiatives": initiatives,
-                "orphans": orphans,
+                **view.snapshot(),
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         )
@@ -785,7 +1027,7 @@ def register_socketio_handlers(socketio: SocketIO) -> None:
     Register WebSocket event handlers.
 
     Handlers:
-        - connect: Client connection event
+        - connect: Client connection event (registers for tasks.batch)
         - disconnect: Client disconnection event
         - ping: Keep-alive ping from client
     """
@@ -793,6 +1035,10 @@ def register_socketio_handlers(socketio: SocketIO) -> None:
     @socketio.on("connect", namespace="/dashboard")
     def handle_connect():
         """Handle client connection to dashboard namespace."""
+        watcher = current_app.config.get("FILE_WATCHER")
+        if watcher:
+            watcher.add_client(request.sid)
+
         emit(
             "connection_ack",
             {
@@ -804,8 +1050,9 @@ def register_socketio_handlers(socketio: SocketIO) -> None:
     @socketio.on("disconnect", namespace="/dashboard")
     def handle_disconnect():
         """Handle client disconnection."""
-        # Log disconnection (could integrate with telemetry)
-        pass
+        watcher = current_app.config.get("FILE_WATCHER")
+        if watcher:
+            watcher.remove_client(request.sid)
 
     @socketio.on("ping", namespace="/dashboard")
     def handle_ping():
@@ -822,6 +1069,7 @@ class DashboardNamespace(Namespace):
         - task.created: New task added to inbox
         - task.assigned: Task assigned to agent
         - task.completed: Task completed by agent
+        - tasks.batch: Coalesced task changes (see FileWatcher)
         - cost.update: Cost metrics updated
         - telemetry.update: Real-time telemetry data
     """
@@ -871,6 +1119,9 @@ def run_dashboard(
     watcher = FileWatcher(watch_dir, socketio)
     app.config["FILE_WATCHER"] = watcher
 
+    # Portfolio model, patched from spec/task file events
+    portfolio_view = get_portfolio_view(app)
+
     print(f"🚀 Dashboard starting at http://{host}:{port}")
     print("📡 WebSocket namespace: /dashboard")
     print(f"💚 Health check: http://{host}:{port}/health")
@@ -879,8 +1130,10 @@ def run_dashboard(
     # Start file watcher and run server with cleanup
     try:
         watcher.start()
+        portfolio_view.start()
         socketio.run(app, host=host, port=port, debug=debug)
     finally:
+        portfolio_view.stop()
         watcher.stop()
 
 
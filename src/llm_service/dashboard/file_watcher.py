@@ -4,22 +4,72 @@ File Watcher for Dashboard - Monitors YAML task files.
 Uses watchdog to monitor work/collaboration/ directory for changes.
 Emits WebSocket events when tasks are created, assigned, or completed.
 
-Critical: Dashboard is READ-ONLY - watches files, doesn't modify them.
+While running, the watcher keeps an in-memory, versioned TaskState that is
+built once at start-up and updated by the file event handlers, so snapshot
+and count queries never rescan the work tree. The state version backs the
+dashboard's ETags, and a change journal answers "what changed since
+version N" without sending the full snapshot.
+
+Socket.IO emission is coalesced: file events are collected for a short
+window and each connected client then receives one ``tasks.batch`` diff
+(changes since the version it last got). Clients acknowledge batches; a
+client with too many unacknowledged batches is skipped and catches up with
+a single diff once it acknowledges, so bulk moves can't flood it.
+
+Critical: Dashboard is READ-ONLY for task files - watches them, never
+modifies them. The only file it writes there is the derived, disposable
+task index (.task_index.db in the watch directory); deleting it just
+costs a rescan.
 """
 
 import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from src.domain.collaboration.task_cache import get_task_cache
+from src.domain.collaboration.task_index import TaskIndex, get_task_index
+
 logger = logging.getLogger(__name__)
 
-# File pattern constants
-YAML_PATTERN = "*.yaml"
+# File pattern constants; the dashboard also lists hand-written .yml tasks,
+# which the framework's own task index (.yaml only) does not track
+TASK_SUFFIXES = (".yaml", ".yml")
+
+# Lifecycle directories below the watch directory; inbox is flat, the others
+# hold one directory per agent
+STAGES = ("inbox", "assigned", "done")
+
+# Files remembered by the TaskState change journal; delta queries older than
+# the oldest remembered change must reload the full snapshot
+MAX_JOURNAL_ENTRIES = 10_000
+
+# (stage, agent bucket or None for the inbox, parsed task)
+TaskEntry = tuple[str, str | None, dict[str, Any]]
+
+# Socket.IO emission
+NAMESPACE = "/dashboard"
+DEFAULT_COALESCE_SECONDS = 0.1
+# Per-task events (task.created, ...) sent per window; bulk changes beyond
+# this are only announced through tasks.batch
+MAX_INDIVIDUAL_EVENTS = 20
+# Unacknowledged tasks.batch messages per client before it is skipped
+MAX_IN_FLIGHT_BATCHES = 2
+# Batches unacknowledged this long are considered lost
+ACK_TIMEOUT_SECONDS = 10.0
 
 
 class TaskFileHandler(FileSystemEventHandler):
@@ -30,6 +80,7 @@ class TaskFileHandler(FileSystemEventHandler):
         - File creation (new tasks in inbox)
         - File moves (tasks moving between directories)
         - File modifications (status updates)
+        - File and directory deletions (task state only)
     """
 
     def __init__(self, watcher: "FileWatcher"):
@@ -45,6 +96,7 @@ class TaskFileHandler(FileSystemEventHandler):
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events."""
         if event.is_directory:
+            self.watcher._handle_directory_changed(Path(event.src_path))
             return
 
         file_path = Path(event.src_path)
@@ -53,14 +105,22 @@ class TaskFileHandler(FileSystemEventHandler):
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file move events (e.g., inbox → assigned)."""
-        if event.is_directory:
-            return
-
         src_path = Path(event.src_path)
         dest_path = Path(event.dest_path)
 
+        if event.is_directory:
+            self.watcher._handle_directory_changed(src_path)
+            self.watcher._handle_directory_changed(dest_path)
+            return
+
         if self._is_yaml_file(dest_path):
-            self.watcher._handle_file_moved(src_path, dest_path)
+            if self._is_replacement(src_path, dest_path):
+                # Atomic write (write_task): temp file renamed over the task
+                self.watcher._handle_file_replaced(dest_path)
+            else:
+                self.watcher._handle_file_moved(src_path, dest_path)
+        elif self._is_yaml_file(src_path):
+            self.watcher._handle_file_deleted(src_path)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events."""
@@ -71,10 +131,469 @@ class TaskFileHandler(FileSystemEventHandler):
         if self._is_yaml_file(file_path):
             self.watcher._handle_file_modified(file_path)
 
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        """Handle file and directory deletion events."""
+        path = Path(event.src_path)
+        if event.is_directory:
+            self.watcher._handle_directory_changed(path)
+        elif self._is_yaml_file(path):
+            self.watcher._handle_file_deleted(path)
+
     @staticmethod
     def _is_yaml_file(path: Path) -> bool:
         """Check if file is a YAML file."""
-        return path.suffix.lower() in [".yaml", ".yml"]
+        return path.suffix.lower() in TASK_SUFFIXES
+
+    @classmethod
+    def _is_replacement(cls, src_path: Path, dest_path: Path) -> bool:
+        """Check if a move renames a non-task temp file into place."""
+        return src_path.parent == dest_path.parent and not cls._is_yaml_file(src_path)
+
+
+class TaskChange(NamedTuple):
+    """Change journal record of one task file."""
+
+    version: int
+    """State version of the file's latest change."""
+    created: int | None
+    """Version at which the file appeared (None: before the journal horizon)."""
+    task_id: str | None
+
+
+class TaskState:
+    """
+    In-memory, versioned state of the task files below a watch directory.
+
+    Tasks are keyed by file path. refresh() re-reads one file (or drops it
+    when it is gone or unparsable), so applying the same file event twice,
+    or out of order, converges on what is on disk. Every effective change
+    bumps ``version``; per-stage counts are kept up to date on each change
+    and the nested snapshot is materialized at most once per version.
+
+    A bounded journal remembers the version at which each file last
+    changed, so changes_since() can answer delta queries. Versions are only
+    comparable within one ``epoch`` (a new process starts a new epoch).
+
+    Thread-safe: event handlers run on the observer thread while API
+    requests read the state.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        parse: Callable[[Path], dict[str, Any] | None],
+        max_changes: int = MAX_JOURNAL_ENTRIES,
+    ):
+        """
+        Initialize empty state.
+
+        Args:
+            root: Watch directory (typically work/collaboration/)
+            parse: Task file parser returning None for invalid files
+            max_changes: Files remembered by the change journal
+        """
+        self.root = Path(os.path.abspath(root))
+        # Some observers report resolved paths (e.g. /private/var on macOS)
+        self._roots = tuple(dict.fromkeys((self.root, self.root.resolve())))
+        self._parse = parse
+        self._lock = threading.RLock()
+        self._tasks: dict[Path, TaskEntry] = {}
+        self._buckets: dict[str, set[str]] = {"assigned": set(), "done": set()}
+        self._counts = dict.fromkeys(STAGES, 0)
+        self._snapshot: dict[str, Any] | None = None
+        self._journal: OrderedDict[Path, TaskChange] = OrderedDict()
+        self._max_changes = max_changes
+        self._horizon = 0
+        # Rescans in progress, and files changed by events meanwhile
+        self._scans = 0
+        self._touched: set[Path] = set()
+        self.epoch = uuid.uuid4().hex[:12]
+        self.version = 0
+
+    def _relative_parts(self, path: Path) -> tuple[str, ...] | None:
+        """Path components below the watch directory, or None if outside."""
+        path = Path(os.path.abspath(path))
+        for root in self._roots:
+            try:
+                return path.relative_to(root).parts
+            except ValueError:
+                continue
+        return None
+
+    def locate(self, path: Path) -> tuple[Path, str, str | None] | None:
+        """
+        Map a task file path to (state key, stage, agent bucket).
+
+        Returns:
+            Location tuple, or None if the path is not a tracked task file
+        """
+        parts = self._relative_parts(path)
+        if not parts or parts[0] not in STAGES:
+            return None
+        if not parts[-1].lower().endswith(TASK_SUFFIXES):
+            return None
+        if parts[0] == "inbox":
+            bucket = None
+            if len(parts) != 2:
+                return None
+        elif len(parts) == 3:
+            bucket = parts[1]
+        else:
+            return None
+        return self.root.joinpath(*parts), parts[0], bucket
+
+    def rebuild(self) -> None:
+        """
+        Scan the watch directory and bring the whole state in line with it.
+
+        Only files that differ from the current state count as changes, so
+        rescanning an unchanged tree keeps the version (and snapshot).
+        Files changed by events while the scan runs are re-read afterwards
+        instead of being reverted to the older scan result.
+        """
+        with self._lock:
+            self._scans += 1
+        try:
+            tasks, buckets = self._scan()
+        except BaseException:
+            with self._lock:
+                self._end_scan()
+            raise
+
+        with self._lock:
+            touched = self._end_scan()
+            updates: dict[Path, TaskEntry | None] = dict.fromkeys(
+                self._tasks.keys() - tasks.keys() - touched
+            )
+            updates.update(
+                (path, entry) for path, entry in tasks.items() if path not in touched
+            )
+            changed = buckets != self._buckets
+            self._buckets = buckets
+            if self._apply(updates) or changed:
+                self._changed()
+        for key in touched:
+            self.refresh(key)
+
+    def _scan(self) -> tuple[dict[Path, TaskEntry], dict[str, set[str]]]:
+        """Read every task file below the watch directory."""
+        tasks: dict[Path, TaskEntry] = {}
+        buckets: dict[str, set[str]] = {"assigned": set(), "done": set()}
+
+        for stage in STAGES:
+            stage_dir = self.root / stage
+            if stage == "inbox":
+                locations = [(stage_dir, None)]
+            else:
+                locations = []
+                for entry in _scandir(stage_dir):
+                    if entry.is_dir():
+                        buckets[stage].add(entry.name)
+                        locations.append((Path(entry.path), entry.name))
+
+            for directory, bucket in locations:
+                for path in _task_files(directory):
+                    task = self._parse(path)
+                    if task:
+                        tasks[path] = (stage, bucket, task)
+        return tasks, buckets
+
+    def _end_scan(self) -> set[Path]:
+        """Finish a rescan; returns the files to re-read (caller holds the lock)."""
+        self._scans -= 1
+        touched = set(self._touched)
+        if not self._scans:
+            self._touched.clear()
+        return touched
+
+    def refresh(self, path: Path) -> dict[str, Any] | None:
+        """
+        Re-read one task file into the state.
+
+        Args:
+            path: Task file that was created, modified or moved into place
+
+        Returns:
+            Parsed task, or None if the file is gone, invalid or untracked
+        """
+        location = self.locate(path)
+        if location is None:
+            return None
+        key, stage, bucket = location
+
+        task = self._parse(key) if key.is_file() else None
+        with self._lock:
+            # Duplicate events (e.g. modified + closed) change nothing
+            if self._apply({key: (stage, bucket, task) if task else None}):
+                self._changed()
+        return task
+
+    def contains(self, path: Path) -> bool:
+        """Check if a task file is part of the state."""
+        location = self.locate(path)
+        if location is None:
+            return False
+        with self._lock:
+            return location[0] in self._tasks
+
+    def discard(self, path: Path) -> bool:
+        """
+        Drop a deleted or moved-away task file.
+
+        Returns:
+            True if the file was part of the state
+        """
+        location = self.locate(path)
+        if location is None:
+            return False
+        with self._lock:
+            removed = self._apply({location[0]: None})
+            if removed:
+                self._changed()
+            return removed
+
+    def sync_directory(self, directory: Path) -> None:
+        """
+        Bring the state in line with a directory that appeared, disappeared
+        or moved (the files inside get no events of their own).
+
+        Args:
+            directory: Directory that changed
+        """
+        parts = self._relative_parts(directory)
+        if not parts or parts[0] not in STAGES:
+            return
+        if len(parts) == 1 or parts[0] == "inbox":
+            # A whole stage directory changed: cheaper to start over
+            self.rebuild()
+            return
+        if len(parts) != 2:
+            return
+
+        stage, bucket = parts
+        agent_dir = self.root / stage / bucket
+        found = {
+            path: (stage, bucket, task)
+            for path in _task_files(agent_dir)
+            if (task := self._parse(path))
+        }
+
+        with self._lock:
+            updates: dict[Path, TaskEntry | None] = {
+                path: None
+                for path, (task_stage, task_bucket, _) in self._tasks.items()
+                if (task_stage, task_bucket) == (stage, bucket)
+            }
+            updates.update(found)
+            exists = agent_dir.is_dir()
+            changed = exists != (bucket in self._buckets[stage])
+            if exists:
+                self._buckets[stage].add(bucket)
+            else:
+                self._buckets[stage].discard(bucket)
+            if self._apply(updates) or changed:
+                self._changed()
+
+    def counts(self) -> dict[str, int]:
+        """Task counts per stage plus total, without materializing a snapshot."""
+        with self._lock:
+            counts = dict(self._counts)
+        counts["total"] = sum(counts.values())
+        return counts
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Nested task snapshot (see FileWatcher.get_task_snapshot()).
+
+        The snapshot is shared between callers until the next change and
+        must not be mutated.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                snapshot: dict[str, Any] = {
+                    "inbox": [],
+                    **{
+                        stage: {bucket: [] for bucket in sorted(buckets)}
+                        for stage, buckets in self._buckets.items()
+                    },
+                }
+                for path in sorted(self._tasks):
+                    stage, bucket, task = self._tasks[path]
+                    if bucket is None:
+                        snapshot["inbox"].append(task)
+                    else:
+                        snapshot[stage].setdefault(bucket, []).append(task)
+                snapshot["version"] = self.version
+                self._snapshot = snapshot
+            return self._snapshot
+
+    def changes_since(self, since: int) -> tuple[int, list[dict[str, Any]] | None]:
+        """
+        Task files created, updated, moved or removed after a version.
+
+        A file that changed several times is reported once, with its
+        current content. A removal and a creation of the same task id are
+        reported as one ``moved`` change.
+
+        Args:
+            since: State version the caller is up to date with
+
+        Returns:
+            (current version, changes). Changes are ordered by version, each
+            with ``op`` (created, updated, moved, removed), ``path``
+            (relative to the watch directory), ``stage``, ``agent`` and,
+            except for removals, ``task``; moves also carry ``from``.
+            Changes are None if ``since`` lies outside the journal (too
+            old, or from another epoch): reload the full snapshot.
+        """
+        with self._lock:
+            version = self.version
+            if since < self._horizon or since > version:
+                return version, None
+
+            records: list[dict[str, Any]] = []
+            for key, change in reversed(self._journal.items()):
+                if change.version <= since:
+                    break
+                if change.created is not None and change.created > since:
+                    if key not in self._tasks:
+                        # Appeared and vanished again: nothing to report
+                        continue
+                    op = "created"
+                else:
+                    op = "updated" if key in self._tasks else "removed"
+
+                record: dict[str, Any] = {"op": op, "path": self._relative(key)}
+                if op == "removed":
+                    _, stage, bucket = self.locate(key)
+                    record.update(stage=stage, agent=bucket, id=change.task_id)
+                else:
+                    stage, bucket, task = self._tasks[key]
+                    record.update(stage=stage, agent=bucket, task=task)
+                records.append(record)
+
+        records.reverse()
+        removed = {
+            record["id"]: record
+            for record in records
+            if record["op"] == "removed" and record["id"] is not None
+        }
+        paired: set[str] = set()
+        for record in records:
+            if record["op"] != "created":
+                continue
+            source = removed.pop(_task_id(record["task"]), None)
+            if source is not None:
+                record["op"] = "moved"
+                record["from"] = source["path"]
+                paired.add(source["path"])
+        return version, [
+            record
+            for record in records
+            if not (record["op"] == "removed" and record["path"] in paired)
+        ]
+
+    def _apply(self, updates: dict[Path, TaskEntry | None]) -> bool:
+        """
+        Apply per-file updates (None removes); caller holds the lock.
+
+        Returns:
+            True if any file actually changed
+        """
+        if self._scans:
+            # Newer than what the running scan may have read
+            self._touched.update(updates)
+        changed = False
+        for key, entry in updates.items():
+            previous = self._tasks.get(key)
+            if previous == entry:
+                continue
+            if previous is not None:
+                self._counts[previous[0]] -= 1
+                del self._tasks[key]
+            if entry is not None:
+                stage, bucket, _ = entry
+                self._tasks[key] = entry
+                self._counts[stage] += 1
+                if bucket is not None:
+                    self._buckets[stage].add(bucket)
+            self._record(key, previous is not None, _task_id((entry or previous)[2]))
+            changed = True
+        return changed
+
+    def _record(self, key: Path, existed: bool, task_id: str | None) -> None:
+        """Journal a change for the upcoming version (caller holds the lock)."""
+        pending = self.version + 1
+        previous = self._journal.pop(key, None)
+        if existed:
+            created = previous.created if previous is not None else None
+        else:
+            created = pending
+        self._journal[key] = TaskChange(pending, created, task_id)
+
+        while len(self._journal) > self._max_changes:
+            _, evicted = self._journal.popitem(last=False)
+            self._horizon = max(self._horizon, evicted.version)
+
+    def _relative(self, key: Path) -> str:
+        """Journal key as a path relative to the watch directory."""
+        return key.relative_to(self.root).as_posix()
+
+    def _changed(self) -> None:
+        """Record a change (caller holds the lock)."""
+        self.version += 1
+        self._snapshot = None
+
+
+def _scandir(directory: Path) -> list[os.DirEntry]:
+    """List a directory, treating a missing or vanished one as empty."""
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def _task_files(directory: Path) -> list[Path]:
+    """Task files directly inside a directory."""
+    return [
+        Path(entry.path)
+        for entry in _scandir(directory)
+        if entry.name.lower().endswith(TASK_SUFFIXES) and entry.is_file()
+    ]
+
+
+def _hide_done(change: dict[str, Any]) -> dict[str, Any] | None:
+    """Rewrite a change for clients that don't track done/ (None: drop it)."""
+    if change["stage"] != "done":
+        return change
+    if change["op"] != "moved" or change["from"].startswith("done/"):
+        return None
+    parts = change["from"].split("/")
+    return {
+        "op": "removed",
+        "path": change["from"],
+        "stage": parts[0],
+        "agent": parts[1] if len(parts) == 3 else None,
+        "id": _task_id(change["task"]),
+    }
+
+
+def _task_id(task: dict[str, Any]) -> str | None:
+    """Task id as a string (ids may be parsed as numbers)."""
+    task_id = task.get("id")
+    return None if task_id is None else str(task_id)
+
+
+@dataclass
+class ClientChannel:
+    """Delivery state of one Socket.IO client."""
+
+    sid: str
+    version: int
+    """State version of the last batch sent to the client."""
+    in_flight: int = 0
+    sent_at: float = 0.0
 
 
 class FileWatcher:
@@ -86,29 +605,63 @@ class FileWatcher:
         - work/collaboration/assigned/<agent>/
         - work/collaboration/done/<agent>/
 
-    Emits WebSocket events:
+    Emits WebSocket events (once per coalescing window):
+        - tasks.batch: Changes since the client's last batch, to each
+          registered client (see add_client())
         - task.created: New task in inbox
         - task.assigned: Task moved to assigned
         - task.completed: Task moved to done
         - task.updated: Task file modified
+
+    The per-task events are only sent for windows with at most
+    ``max_individual_events`` changed files.
     """
 
-    def __init__(self, watch_dir: str | Path, socketio: Any | None = None):
+    def __init__(
+        self,
+        watch_dir: str | Path,
+        socketio: Any | None = None,
+        coalesce_seconds: float = DEFAULT_COALESCE_SECONDS,
+        max_individual_events: int = MAX_INDIVIDUAL_EVENTS,
+        max_in_flight: int = MAX_IN_FLIGHT_BATCHES,
+    ):
         """
         Initialize file watcher.
 
         Args:
             watch_dir: Directory to watch (typically work/collaboration/)
             socketio: SocketIO instance for event emission (optional)
+            coalesce_seconds: Window in which file events are merged
+            max_individual_events: Per-task events sent per window
+            max_in_flight: Unacknowledged batches a client may have
         """
         self.watch_dir = Path(watch_dir)
         self.socketio = socketio
         self.observer: Observer | None = None
         self.is_running = False
 
-        # Debounce tracking (prevent duplicate events)
-        self._last_events: dict[str, float] = {}
-        self._debounce_seconds = 0.1
+        self.coalesce_seconds = coalesce_seconds
+        self.max_individual_events = max_individual_events
+        self.max_in_flight = max_in_flight
+
+        # Per-task events of the current window, keyed by file (bounded)
+        self._pending: OrderedDict[str, tuple[str, dict[str, Any] | None]] = (
+            OrderedDict()
+        )
+        self._overflow = False
+        self._emit_lock = threading.Lock()
+        self._flush_needed = threading.Event()
+        self._stopping = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+        self._clients: dict[str, ClientChannel] = {}
+        self._clients_lock = threading.Lock()
+
+        # Task state; maintained incrementally while running
+        self._state = TaskState(self.watch_dir, self.parse_task_file)
+
+        # Shared task index, kept current from file events while running
+        self._index: TaskIndex | None = None
 
     def start(self) -> None:
         """Start watching for file changes."""
@@ -122,8 +675,20 @@ class FileWatcher:
         # Watch the entire collaboration directory recursively
         self.observer.schedule(handler, str(self.watch_dir), recursive=True)
         self.observer.start()
+
+        # Build the state after the observer is live: files whose events
+        # race with the scan are re-read after it, so nothing is missed
+        self._state.rebuild()
+        self._attach_index()
         self.is_running = True
 
+        if self.socketio:
+            self._stopping.clear()
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="FileWatcherEmitter", daemon=True
+            )
+            self._flusher.start()
+
         logger.info(f"FileWatcher started on {self.watch_dir}")
 
     def stop(self) -> None:
@@ -134,9 +699,75 @@ class FileWatcher:
         self.observer.stop()
         self.observer.join()
         self.is_running = False
+        self._index = None
+
+        if self._flusher is not None:
+            self._stopping.set()
+            self._flush_needed.set()
+            self._flusher.join()
+            self._flusher = None
+            # Deliver what the last window collected
+            self._flush()
 
         logger.info("FileWatcher stopped")
 
+    @property
+    def maintains_index(self) -> bool:
+        """Whether the shared task index is kept current by file events."""
+        return self.is_running and self._index is not None
+
+    def _attach_index(self) -> None:
+        """Reconcile the shared task index once, then keep it current."""
+        index = get_task_index(self.watch_dir)
+        if not index.persistent:
+            # In-memory fallback: not shared with queries, nothing to maintain
+            return
+        try:
+            index.reconcile()
+        except sqlite3.Error as e:
+            logger.warning(f"Task index not maintained by FileWatcher: {e}")
+            return
+        self._index = index
+
+    def _update_index(self, method: str, path: Path) -> None:
+        """
+        Apply a file event to the task index.
+
+        On database errors the index is detached, so queries fall back to
+        reconciling it themselves.
+
+        Args:
+            method: TaskIndex method to call (refresh, forget, reconcile)
+            path: Changed path (ignored for reconcile)
+        """
+        index = self._index
+        if index is None:
+            return
+        try:
+            if method == "reconcile":
+                index.reconcile()
+            else:
+                getattr(index, method)(Path(os.path.abspath(path)))
+        except sqlite3.Error as e:
+            logger.warning(f"Task index {method} failed ({e}); detaching index")
+            self._index = None
+
+    def add_client(self, sid: str) -> None:
+        """
+        Start sending tasks.batch messages to a Socket.IO client.
+
+        Args:
+            sid: Socket.IO session id of the client
+        """
+        version = self.version
+        with self._clients_lock:
+            self._clients[sid] = ClientChannel(sid, version)
+
+    def remove_client(self, sid: str) -> None:
+        """Stop sending to a disconnected client."""
+        with self._clients_lock:
+            self._clients.pop(sid, None)
+
     def parse_task_file(self, file_path: Path) -> dict[str, Any] | None:
         """
         Parse YAML task file and extract metadata.
@@ -148,14 +779,14 @@ class FileWatcher:
             Dictionary with task metadata, or None if parsing fails
         """
         try:
-            with open(file_path) as f:
-                data = yaml.safe_load(f)
+            # Shared with every other task loader in the process (task_cache)
+            data = get_task_cache().load(file_path)
 
-                if not isinstance(data, dict):
-                    logger.warning(f"Invalid YAML structure in {file_path}")
-                    return None
+            if not isinstance(data, dict):
+                logger.warning(f"Invalid YAML structure in {file_path}")
+                return None
 
-                return data
+            return data
 
         except yaml.YAMLError as e:
             logger.error(f"YAML parsing error in {file_path}: {e}")
@@ -186,120 +817,224 @@ class FileWatcher:
         else:
             return "unknown"
 
+    @property
+    def version(self) -> int:
+        """Task state version; increases whenever a task file changes."""
+        self._sync_if_stopped()
+        return self._state.version
+
+    @property
+    def epoch(self) -> str:
+        """Identifies the version sequence; versions of other epochs are unrelated."""
+        return self._state.epoch
+
+    def get_task_changes(
+        self, since: int, epoch: str | None = None, include_done: bool = True
+    ) -> dict[str, Any]:
+        """
+        Get the tasks created, updated, moved or removed since a version.
+
+        Args:
+            since: Version of the snapshot (or previous delta) the caller holds
+            epoch: Epoch that version belongs to (checked when given)
+            include_done: Report tasks in done/; without, a move into done/
+                is reported as a removal
+
+        Returns:
+            Dictionary with ``changes`` (see TaskState.changes_since()), the
+            current ``version`` and ``epoch``, and ``reset``: True when the
+            delta can't be computed and the full snapshot must be reloaded
+        """
+        self._sync_if_stopped()
+        version, changes = self._state.changes_since(since)
+        if epoch is not None and epoch != self._state.epoch:
+            changes = None
+        if changes and not include_done:
+            changes = [hidden for c in changes if (hidden := _hide_done(c))]
+        return {
+            "version": version,
+            "epoch": self._state.epoch,
+            "since": since,
+            "reset": changes is None,
+            "changes": changes or [],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
     def get_task_snapshot(self) -> dict[str, Any]:
         """
         Get current snapshot of all tasks in the watch directory.
 
+        While the watcher runs this is served from the in-memory task state;
+        a stopped watcher rescans the directory on every call.
+
         Returns:
-            Dictionary with tasks grouped by status (inbox/assigned/done)
+            Dictionary with tasks grouped by status (inbox/assigned/done),
+            the state version and a timestamp
         """
-        snapshot = {
-            "inbox": [],
-            "assigned": {},
-            "done": {},
+        self._sync_if_stopped()
+        return {
+            **self._state.snapshot(),
+            "epoch": self._state.epoch,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
-        # Scan inbox
-        inbox_dir = self.watch_dir / "inbox"
-        if inbox_dir.exists():
-            for yaml_file in inbox_dir.glob(YAML_PATTERN):
-                task = self.parse_task_file(yaml_file)
-                if task:
-                    snapshot["inbox"].append(task)
-            for yml_file in inbox_dir.glob("*.yml"):
-                task = self.parse_task_file(yml_file)
-                if task:
-                    snapshot["inbox"].append(task)
-
-        # Scan assigned (nested by agent)
-        assigned_dir = self.watch_dir / "assigned"
-        if assigned_dir.exists():
-            for agent_dir in assigned_dir.iterdir():
-                if agent_dir.is_dir():
-                    agent_name = agent_dir.name
-                    snapshot["assigned"][agent_name] = []
-
-                    for yaml_file in agent_dir.glob(YAML_PATTERN):
-                        task = self.parse_task_file(yaml_file)
-                        if task:
-                            snapshot["assigned"][agent_name].append(task)
-                    for yml_file in agent_dir.glob("*.yml"):
-                        task = self.parse_task_file(yml_file)
-                        if task:
-                            snapshot["assigned"][agent_name].append(task)
-
-        # Scan done (nested by agent)
-        done_dir = self.watch_dir / "done"
-        if done_dir.exists():
-            for agent_dir in done_dir.iterdir():
-                if agent_dir.is_dir():
-                    agent_name = agent_dir.name
-                    snapshot["done"][agent_name] = []
-
-                    for yaml_file in agent_dir.glob(YAML_PATTERN):
-                        task = self.parse_task_file(yaml_file)
-                        if task:
-                            snapshot["done"][agent_name].append(task)
-                    for yml_file in agent_dir.glob("*.yml"):
-                        task = self.parse_task_file(yml_file)
-                        if task:
-                            snapshot["done"][agent_name].append(task)
-
-        return snapshot
-
-    def _should_emit(self, event_key: str) -> bool:
-        """
-        Check if event should be emitted (debouncing).
-
-        Args:
-            event_key: Unique key for the event
+    def get_task_counts(self) -> dict[str, int]:
+        """
+        Get the number of tasks per status without building a snapshot.
 
         Returns:
-            True if event should be emitted
+            Dictionary with inbox, assigned, done and total counts
         """
-        now = datetime.now(timezone.utc).timestamp()
-        last_time = self._last_events.get(event_key, 0)
+        self._sync_if_stopped()
+        return self._state.counts()
 
-        if now - last_time < self._debounce_seconds:
-            return False
+    def _sync_if_stopped(self) -> None:
+        """Without file events the state can't be trusted: rescan."""
+        if not self.is_running:
+            self._state.rebuild()
+
+    def _queue_event(self, key: str, name: str, payload: dict[str, Any] | None) -> None:
+        """
+        Queue a per-task event for the current coalescing window.
 
-        self._last_events[event_key] = now
-        return True
+        Events for the same file are merged (the first event name is kept,
+        the task content is the latest). Once a window holds
+        ``max_individual_events`` files, per-task events are dropped for
+        that window and only tasks.batch is sent.
+
+        Args:
+            key: File the event is about
+            name: Event name (task.created, task.assigned, ...)
+            payload: Event payload, or None if the file isn't readable yet
+                (a later event in the window supplies it)
+        """
+        if not self.socketio:
+            return
+
+        with self._emit_lock:
+            if not self._overflow:
+                queued = self._pending.get(key)
+                if queued is not None:
+                    if name == "task.updated":
+                        name = queued[0]
+                    if queued[1] is not None:
+                        payload = {**queued[1], **(payload or {})}
+                    self._pending[key] = (name, payload)
+                elif len(self._pending) < self.max_individual_events:
+                    self._pending[key] = (name, payload)
+                else:
+                    self._overflow = True
+                    self._pending.clear()
+            self._flush_needed.set()
+
+    def _flush_loop(self) -> None:
+        """Emit once per coalescing window while events arrive."""
+        while not self._stopping.is_set():
+            self._flush_needed.wait()
+            if self._stopping.wait(self.coalesce_seconds):
+                break
+            self._flush()
+
+    def _flush(self) -> None:
+        """Emit the events of the finished window and client batches."""
+        with self._emit_lock:
+            events = list(self._pending.values())
+            overflow = self._overflow
+            self._pending.clear()
+            self._overflow = False
+            self._flush_needed.clear()
+
+        if not self.socketio:
+            return
+        if overflow:
+            logger.info("Coalesced a bulk task change into tasks.batch")
+        for name, payload in events:
+            if payload is not None:
+                self.socketio.emit(name, payload, namespace=NAMESPACE)
+        self._send_batches()
+
+    def _send_batches(self) -> None:
+        """Send each client that is behind the changes since its version."""
+        now = time.monotonic()
+        due: dict[int, list[ClientChannel]] = {}
+        with self._clients_lock:
+            version = self._state.version
+            for client in self._clients.values():
+                if client.version == version:
+                    continue
+                if client.in_flight >= self.max_in_flight:
+                    if now - client.sent_at < ACK_TIMEOUT_SECONDS:
+                        # Backpressure: catch up in one diff once it acks
+                        continue
+                    client.in_flight = 0
+                due.setdefault(client.version, []).append(client)
+
+        for since, clients in due.items():
+            batch = self.get_task_changes(since)
+            for client in clients:
+                with self._clients_lock:
+                    if self._clients.get(client.sid) is not client:
+                        continue
+                    client.version = batch["version"]
+                    client.in_flight += 1
+                    client.sent_at = now
+                self.socketio.emit(
+                    "tasks.batch",
+                    batch,
+                    to=client.sid,
+                    namespace=NAMESPACE,
+                    callback=partial(self._acknowledge, client.sid),
+                )
+
+    def _acknowledge(self, sid: str, *_: Any) -> None:
+        """Record a client's acknowledgement of a tasks.batch message."""
+        with self._clients_lock:
+            client = self._clients.get(sid)
+            if client is None:
+                return
+            client.in_flight = max(0, client.in_flight - 1)
+            behind = client.version != self._state.version
+        if behind:
+            # Skipped while busy: catch up with the next window
+            self._flush_needed.set()
 
     def _handle_file_created(self, file_path: Path) -> None:
         """Handle file creation event."""
-        event_key = f"created:{file_path}"
-        if not self._should_emit(event_key):
-            return
+        task_data = self._state.refresh(file_path)
+        self._update_index("refresh", file_path)
 
-        task_data = self.parse_task_file(file_path)
         if not task_data:
+            task_data = self.parse_task_file(file_path)
+        if not task_data:
+            # Usually still being written: report it as created once the
+            # modification in the same window makes it readable
+            self._queue_event(str(file_path), "task.created", None)
             return
 
         status = self.infer_status_from_path(file_path)
 
-        if self.socketio:
-            self.socketio.emit(
-                "task.created",
-                {
-                    "task": task_data,
-                    "status": status,
-                    "file_path": str(file_path),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                },
-                namespace="/dashboard",
-            )
+        self._queue_event(
+            str(file_path),
+            "task.created",
+            {
+                "task": task_data,
+                "status": status,
+                "file_path": str(file_path),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
 
         logger.info(f"Task created: {task_data.get('id', 'unknown')} in {status}")
 
     def _handle_file_moved(self, src_path: Path, dest_path: Path) -> None:
         """Handle file move event."""
-        event_key = f"moved:{dest_path}"
-        if not self._should_emit(event_key):
-            return
+        self._state.discard(src_path)
+        task_data = self._state.refresh(dest_path)
+        self._update_index("forget", src_path)
+        self._update_index("refresh", dest_path)
 
-        task_data = self.parse_task_file(dest_path)
+        if not task_data:
+            task_data = self.parse_task_file(dest_path)
         if not task_data:
             return
 
@@ -314,50 +1049,70 @@ class FileWatcher:
         else:
             event_name = "task.moved"
 
-        if self.socketio:
-            self.socketio.emit(
-                event_name,
-                {
-                    "task": task_data,
-                    "old_status": old_status,
-                    "new_status": new_status,
-                    "file_path": str(dest_path),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                },
-                namespace="/dashboard",
-            )
+        self._queue_event(
+            str(dest_path),
+            event_name,
+            {
+                "task": task_data,
+                "old_status": old_status,
+                "new_status": new_status,
+                "file_path": str(dest_path),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
 
         logger.info(
             f"Task {event_name}: {task_data.get('id', 'unknown')} "
             f"from {old_status} to {new_status}"
         )
 
+    def _handle_file_replaced(self, file_path: Path) -> None:
+        """Handle a temp file renamed over a task file (atomic write)."""
+        if self._state.contains(file_path):
+            self._handle_file_modified(file_path)
+        else:
+            self._handle_file_created(file_path)
+
     def _handle_file_modified(self, file_path: Path) -> None:
         """Handle file modification event."""
-        event_key = f"modified:{file_path}"
-        if not self._should_emit(event_key):
-            return
+        task_data = self._state.refresh(file_path)
+        self._update_index("refresh", file_path)
 
-        task_data = self.parse_task_file(file_path)
+        if not task_data:
+            task_data = self.parse_task_file(file_path)
         if not task_data:
             return
 
         status = self.infer_status_from_path(file_path)
 
-        if self.socketio:
-            self.socketio.emit(
-                "task.updated",
-                {
-                    "task": task_data,
-                    "status": status,
-                    "file_path": str(file_path),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                },
-                namespace="/dashboard",
-            )
+        self._queue_event(
+            str(file_path),
+            "task.updated",
+            {
+                "task": task_data,
+                "status": status,
+                "file_path": str(file_path),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
 
         logger.debug(f"Task updated: {task_data.get('id', 'unknown')}")
 
+    def _handle_file_deleted(self, file_path: Path) -> None:
+        """Handle file deletion event (reported through tasks.batch only)."""
+        self._update_index("forget", file_path)
+        if self._state.discard(file_path):
+            logger.debug(f"Task file removed: {file_path}")
+            self._flush_needed.set()
+
+    def _handle_directory_changed(self, directory: Path) -> None:
+        """Handle creation, deletion or move of a directory."""
+        version = self._state.version
+        self._state.sync_directory(directory)
+        self._update_index("reconcile", directory)
+        if self._state.version != version:
+            self._flush_needed.set()
+
 
 def create_watcher(
     collaboration_dir: str | Path, socketio: Any | None = None
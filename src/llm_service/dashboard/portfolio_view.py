@@ -0,0 +1,506 @@
+"""
+Materialized Portfolio View for Initiative Tracking.
+
+Holds the initiative → specification → task model behind /api/portfolio in
+memory. The view is built once with a full scan; afterwards specification
+and task file events patch it: a changed file is re-parsed on its own and
+only the initiatives it belongs to (before and after the change) are
+recomputed on the next read. Unaffected initiatives are served as-is.
+
+The view's TaskLinker is fed from the same observer (task events and
+rescans are forwarded), so its grouping queries are served from its
+index as well instead of rescanning the work directory.
+
+Implements ADR-037: Dashboard Initiative Tracking.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from src.domain.collaboration.task_index import TASK_SUFFIX
+
+from .spec_parser import SpecificationMetadata, SpecificationParser
+from .task_linker import TaskLinker
+
+logger = logging.getLogger(__name__)
+
+SPEC_SUFFIX = ".md"
+UNCATEGORIZED = "Uncategorized"
+
+
+@dataclass(frozen=True)
+class LinkedTask:
+    """Portfolio entry of one task file."""
+
+    summary: dict[str, Any]
+    group: str | None
+    """Normalized ``specification`` field (None when missing or unsafe)."""
+    target: str | None
+    """Specification file the task points at (for orphan detection)."""
+    orphan: bool
+
+
+class PortfolioEventHandler(FileSystemEventHandler):
+    """Forwards specification and task file events to a PortfolioView."""
+
+    def __init__(self, view: "PortfolioView"):
+        """
+        Initialize handler.
+
+        Args:
+            view: View to patch
+        """
+        super().__init__()
+        self.view = view
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle a new specification or task file."""
+        if event.is_directory:
+            return
+        self.view.file_changed(Path(event.src_path))
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        """Handle an edited specification or task file."""
+        if event.is_directory:
+            return
+        self.view.file_changed(Path(event.src_path))
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle a renamed file (task lifecycle moves, atomic writes)."""
+        if event.is_directory:
+            # Files inside a moved directory get no events of their own
+            self.view.rebuild()
+            return
+        self.view.file_removed(Path(event.src_path))
+        self.view.file_changed(Path(event.dest_path))
+
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        """Handle a removed file or directory."""
+        if event.is_directory:
+            self.view.rebuild()
+            return
+        self.view.file_removed(Path(event.src_path))
+
+
+class PortfolioView:
+    """
+    In-memory portfolio model, patched incrementally from file events.
+
+    Matching of tasks to specifications and orphan detection follow
+    TaskLinker; progress, status and priority roll-ups follow the rules the
+    /api/portfolio endpoint has always used.
+
+    Thread-safe: events arrive on the observer thread while requests read.
+
+    Usage:
+        >>> view = PortfolioView("specifications", "work/collaboration")
+        >>> view.start()
+        >>> view.snapshot()["initiatives"]
+    """
+
+    def __init__(self, spec_dir: str | Path, work_dir: str | Path):
+        """
+        Initialize an empty view (call rebuild() or start()).
+
+        Args:
+            spec_dir: Specifications directory (as configured in SPEC_DIR)
+            work_dir: Task directory (as configured in WORK_DIR)
+        """
+        # Tasks reference specifications as "<SPEC_DIR>/<relative path>",
+        # so the configured spelling of spec_dir is part of the link key.
+        self.spec_dir = str(spec_dir)
+        self.parser = SpecificationParser(self.spec_dir)
+        self.linker = TaskLinker(str(work_dir), spec_dir=self.spec_dir)
+        self.spec_root = self.parser.base_dir
+        self.work_root = self.linker.work_dir
+
+        self.observer: Observer | None = None
+        self.version = 0
+
+        self._lock = threading.RLock()
+        self._specs: dict[str, SpecificationMetadata] = {}
+        self._spec_by_group: dict[str, str] = {}
+        self._tasks: dict[str, LinkedTask] = {}
+        self._groups: dict[str, dict[str, dict[str, Any]]] = {}
+        self._targets: dict[str, set[str]] = {}
+        self._initiatives: dict[str, dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+        self._orphans: list[dict[str, Any]] | None = None
+        # Rescans in progress, and files changed by events meanwhile
+        self._scans = 0
+        self._touched: set[str] = set()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether file events keep the view up to date."""
+        return self.observer is not None and self.observer.is_alive()
+
+    def start(self) -> None:
+        """Build the view and start patching it from file events."""
+        if self.is_running:
+            return
+
+        observer = Observer()
+        handler = PortfolioEventHandler(self)
+        for root in (self.spec_root, self.work_root):
+            if root.is_dir():
+                observer.schedule(handler, str(root), recursive=True)
+            else:
+                logger.warning(f"Portfolio view: {root} not found, not watching")
+        observer.daemon = True
+        observer.start()
+        self.observer = observer
+
+        # Scan after the observer is live: files whose events race with
+        # the scan are re-read after it, so no change slips through
+        self.rebuild()
+        self.linker.attach()
+        logger.info(f"Portfolio view started ({len(self._specs)} specifications)")
+
+    def stop(self) -> None:
+        """Stop watching for file events."""
+        if self.observer is None:
+            return
+        self.linker.detach()
+        self.observer.stop()
+        self.observer.join(timeout=2.0)
+        self.observer = None
+
+    # ------------------------------------------------------------------
+    # Building and patching
+    # ------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """
+        Rescan all specifications and tasks and replace the model.
+
+        Files changed while the scan runs are re-read afterwards, so their
+        events aren't lost to the older scan result.
+        """
+        with self._lock:
+            self._scans += 1
+        try:
+            specs = {
+                meta.path: meta
+                for meta in self.parser.scan_specifications(self.spec_dir)
+            }
+            scanned = self.linker.scan_tasks()
+            self.linker.rebuild(scanned)
+            tasks = {task["_path"]: self._link(task) for task in scanned}
+        except BaseException:
+            with self._lock:
+                self._end_scan()
+            raise
+
+        with self._lock:
+            touched = self._end_scan()
+            self._specs = {}
+            self._spec_by_group = {}
+            self._tasks = {}
+            self._groups = {}
+            self._targets = {}
+            self._initiatives = {}
+            self._orphans = None
+            for path, meta in specs.items():
+                self._put_spec(path, meta)
+            for path, linked in tasks.items():
+                self._put_task(path, linked)
+            self._dirty = {self._initiative_of(meta) for meta in specs.values()}
+            self.version += 1
+        for key in touched:
+            self.file_changed(Path(key))
+
+    def _end_scan(self) -> set[str]:
+        """Finish a rescan; returns the files to re-read (caller holds the lock)."""
+        self._scans -= 1
+        touched = set(self._touched)
+        if not self._scans:
+            self._touched.clear()
+        return touched
+
+    def _touch(self, key: str) -> None:
+        """Remember a file changed during a rescan (before reading it)."""
+        with self._lock:
+            if self._scans:
+                self._touched.add(key)
+
+    def file_changed(self, path: Path) -> None:
+        """
+        Re-read one created, modified or moved-in file.
+
+        Args:
+            path: Specification (.md) or task (.yaml) file
+        """
+        kind = self._kind(path)
+        if kind is not None:
+            self._touch(os.path.abspath(path))
+        if kind == "spec":
+            self._refresh_spec(path)
+        elif kind == "task":
+            self._refresh_task(path)
+
+    def file_removed(self, path: Path) -> None:
+        """
+        Drop one deleted or moved-away file.
+
+        Args:
+            path: Specification (.md) or task (.yaml) file
+        """
+        kind = self._kind(path)
+        key = os.path.abspath(path)
+        if kind is not None:
+            self._touch(key)
+        if kind == "task":
+            self.linker.file_removed(Path(key))
+        with self._lock:
+            if kind == "spec":
+                self._drop_spec(key)
+            elif kind == "task":
+                self._drop_task(key)
+            else:
+                return
+            self.version += 1
+
+    def _kind(self, path: Path) -> str | None:
+        """Classify a path as 'spec', 'task' or None (ignored)."""
+        path = Path(os.path.abspath(path))
+        if path.suffix == SPEC_SUFFIX and path.is_relative_to(self.spec_root):
+            return "spec"
+        if path.suffix == TASK_SUFFIX and path.is_relative_to(self.work_root):
+            return "task"
+        return None
+
+    def _refresh_spec(self, path: Path) -> None:
+        key = os.path.abspath(path)
+        meta = self.parser.parse_frontmatter(key) if Path(key).is_file() else None
+        with self._lock:
+            self._drop_spec(key)
+            if meta is not None:
+                self._put_spec(key, meta)
+            self.version += 1
+
+    def _refresh_task(self, path: Path) -> None:
+        key = os.path.abspath(path)
+        # Patches the linker's index with the same parse
+        task = self.linker.file_changed(Path(key))
+        linked = self._link(task) if task else None
+        with self._lock:
+            self._drop_task(key)
+            if linked is not None:
+                self._put_task(key, linked)
+            self.version += 1
+
+    def _link(self, task: dict[str, Any]) -> LinkedTask:
+        """Derive the portfolio entry of a task (mirrors TaskLinker)."""
+        summary = {
+            "id": task.get("id"),
+            "title": task.get("title"),
+            "status": task.get("status"),
+            "priority": task.get("priority"),
+            "agent": task.get("agent"),
+        }
+        spec_path = task.get("specification")
+        if not spec_path:
+            return LinkedTask(summary, None, None, orphan=True)
+        if not self.linker.validate_spec_path(spec_path):
+            return LinkedTask(summary, None, None, orphan=True)
+
+        target = self.linker.resolve_spec_path(spec_path)
+        return LinkedTask(
+            summary,
+            group=spec_path.lstrip("./"),
+            target=target,
+            orphan=not Path(target).exists(),
+        )
+
+    def _put_spec(self, key: str, meta: SpecificationMetadata) -> None:
+        """Insert a specification (caller holds the lock)."""
+        self._specs[key] = meta
+        self._spec_by_group[self._group_of(meta)] = key
+        self._dirty.add(self._initiative_of(meta))
+        self._recheck_orphans(key)
+
+    def _drop_spec(self, key: str) -> None:
+        """Remove a specification (caller holds the lock)."""
+        meta = self._specs.pop(key, None)
+        if meta is not None:
+            self._spec_by_group.pop(self._group_of(meta), None)
+            self._dirty.add(self._initiative_of(meta))
+        self._recheck_orphans(key)
+
+    def _put_task(self, key: str, linked: LinkedTask) -> None:
+        """Insert a task (caller holds the lock)."""
+        self._tasks[key] = linked
+        if linked.group is not None:
+            self._groups.setdefault(linked.group, {})[key] = linked.summary
+            self._touch_group(linked.group)
+        if linked.target is not None:
+            self._targets.setdefault(linked.target, set()).add(key)
+        if linked.orphan:
+            self._orphans = None
+
+    def _drop_task(self, key: str) -> None:
+        """Remove a task (caller holds the lock)."""
+        linked = self._tasks.pop(key, None)
+        if linked is None:
+            return
+        if linked.group is not None:
+            group = self._groups.get(linked.group, {})
+            group.pop(key, None)
+            if not group:
+                self._groups.pop(linked.group, None)
+            self._touch_group(linked.group)
+        if linked.target is not None:
+            holders = self._targets.get(linked.target, set())
+            holders.discard(key)
+            if not holders:
+                self._targets.pop(linked.target, None)
+        if linked.orphan:
+            self._orphans = None
+
+    def _recheck_orphans(self, spec_file: str) -> None:
+        """Re-evaluate tasks pointing at a specification file that changed."""
+        exists = Path(spec_file).exists()
+        for key in self._targets.get(spec_file, ()):
+            linked = self._tasks[key]
+            if linked.orphan == exists:
+                self._tasks[key] = LinkedTask(
+                    linked.summary, linked.group, linked.target, orphan=not exists
+                )
+                self._orphans = None
+
+    def _touch_group(self, group: str) -> None:
+        """Mark the initiative of the specification a task group links to."""
+        spec_key = self._spec_by_group.get(group)
+        if spec_key is not None:
+            self._dirty.add(self._initiative_of(self._specs[spec_key]))
+
+    def _group_of(self, meta: SpecificationMetadata) -> str:
+        """Key under which tasks reference a specification."""
+        return str(Path(self.spec_dir) / meta.relative_path)
+
+    @staticmethod
+    def _initiative_of(meta: SpecificationMetadata) -> str:
+        return meta.initiative or UNCATEGORIZED
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Portfolio response body (without timestamp).
+
+        Only initiatives touched since the previous call are recomputed.
+        The returned structures are shared and must not be mutated.
+
+        Returns:
+            Dictionary with ``initiatives`` and ``orphans`` lists
+        """
+        with self._lock:
+            if self._dirty:
+                by_initiative: dict[str, list[SpecificationMetadata]] = {}
+                for meta in self._specs.values():
+                    name = self._initiative_of(meta)
+                    if name in self._dirty:
+                        by_initiative.setdefault(name, []).append(meta)
+                for name in self._dirty:
+                    specs = by_initiative.get(name)
+                    if specs:
+                        self._initiatives[name] = self._build_initiative(name, specs)
+                    else:
+                        self._initiatives.pop(name, None)
+                self._dirty.clear()
+
+            if self._orphans is None:
+                self._orphans = [
+                    linked.summary
+                    for _, linked in sorted(self._tasks.items())
+                    if linked.orphan
+                ]
+
+            return {
+                "initiatives": [
+                    self._initiatives[name] for name in sorted(self._initiatives)
+                ],
+                "orphans": self._orphans,
+            }
+
+    def _build_initiative(
+        self, name: str, metas: list[SpecificationMetadata]
+    ) -> dict[str, Any]:
+        """Materialize one initiative with its specifications and tasks."""
+        specs = []
+        for meta in sorted(metas, key=lambda m: m.relative_path):
+            group = self._groups.get(self._group_of(meta), {})
+            tasks = [group[key] for key in sorted(group)]
+            specs.append(
+                {
+                    "id": meta.id,
+                    "title": meta.title,
+                    "status": meta.status,
+                    "priority": meta.priority,
+                    "initiative": meta.initiative,
+                    "progress": calculate_spec_progress(tasks),
+                    "task_count": len(tasks),
+                    "tasks": tasks,
+                    "specification_path": meta.relative_path,
+                }
+            )
+
+        return {
+            "id": name.lower().replace(" ", "-"),
+            "title": name,
+            "status": determine_initiative_status(specs),
+            "priority": determine_initiative_priority(specs),
+            "progress": calculate_initiative_progress(specs),
+            "specifications": specs,
+            "spec_count": len(specs),
+            "task_count": sum(spec["task_count"] for spec in specs),
+        }
+
+
+def calculate_spec_progress(spec_tasks: list[dict[str, Any]]) -> int:
+    """Calculate specification progress from tasks."""
+    completed_tasks = sum(1 for t in spec_tasks if t.get("status") == "done")
+    total_tasks = len(spec_tasks)
+    return int(completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+
+
+def determine_initiative_status(specs: list[dict[str, Any]]) -> str:
+    """Determine initiative status (most advanced status)."""
+    status_priority = {
+        "draft": 1,
+        "in_progress": 2,
+        "implemented": 3,
+        "complete": 3,
+    }
+    return max(
+        (spec.get("status", "draft") for spec in specs),
+        key=lambda s, priority=status_priority: priority.get(s, 0),
+    )
+
+
+def determine_initiative_priority(specs: list[dict[str, Any]]) -> str:
+    """Determine initiative priority (highest priority)."""
+    priority_order = {"CRITICAL": 4, "HIGH": 3, "MEDIUM": 2, "LOW": 1}
+    return max(
+        (spec.get("priority", "MEDIUM") for spec in specs),
+        key=lambda p, order=priority_order: order.get(p, 2),
+    )
+
+
+def calculate_initiative_progress(specs: list[dict[str, Any]]) -> int:
+    """Calculate initiative progress from all specifications."""
+    total_tasks = sum(spec["task_count"] for spec in specs)
+    completed_tasks = sum(
+        len([t for t in spec["tasks"] if t.get("status") == "done"]) for spec in specs
+    )
+    return int(completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
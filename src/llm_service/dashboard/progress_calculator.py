@@ -4,16 +4,51 @@ Progress Calculator for Initiative Tracking.
 Calculates completion percentages for features and initiatives based on
 task status with weighted progress values.
 
+With caching enabled, results are memoized on a digest of the member
+tasks' (id, status) pairs, so progress is only recomputed when a task set
+actually changes. Named features and initiatives are always checked
+against their digest; task change events (see TaskLinker.add_listener)
+only drop their memoized results early.
+
 Implements ADR-037: Dashboard Initiative Tracking.
 """
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 
 # Import status enums (ADR-043)
 from src.domain.collaboration.types import TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Memoized results kept per calculator (least recently used are evicted)
+MAX_CACHE_ENTRIES = 4096
+
+
+def task_status_digest(tasks: Iterable[dict], feature: str | None = None) -> str:
+    """
+    Digest of the (id, status) pairs of a task set, independent of order.
+
+    Args:
+        tasks: Task dictionaries with 'id' and 'status' fields
+        feature: Feature the tasks belong to (distinguishes groupings)
+
+    Returns:
+        Hex digest identifying the task set and its statuses
+    """
+    pairs = sorted(
+        f"{task.get('id', '')}\0{task.get('status', TaskStatus.INBOX.value)}"
+        for task in tasks
+    )
+    h = hashlib.blake2b(digest_size=16)
+    h.update(b"\1" if feature is None else f"\2{feature}".encode())
+    for pair in pairs:
+        h.update(b"\n" + pair.encode())
+    return h.hexdigest()
+
 
 class ProgressCalculator:
     """
@@ -24,6 +59,14 @@ class ProgressCalculator:
     - in_progress: 50% (weight 0.5)
     - blocked: 25% (weight 0.25)
     - inbox/assigned: 0% (weight 0.0)
+
+    Caching (enable_cache=True):
+    - Results are memoized by task_status_digest(), so unchanged task sets
+      are never recomputed, whatever scope they are requested for
+    - A result requested with a feature_id or initiative_id is remembered
+      for that id; invalidate_cache() or task_changed() drop it from the
+      memo (wire task_changed to TaskLinker.add_listener), and a missed
+      event is still caught by the digest check
     """
 
     DEFAULT_STATUS_WEIGHTS = {
@@ -43,12 +86,20 @@ class ProgressCalculator:
 
         Args:
             status_weights: Custom status weight mappings (optional)
-            enable_cache: Enable caching of calculations (future optimization)
+            enable_cache: Memoize feature and initiative progress
         """
         self.status_weights = status_weights or self.DEFAULT_STATUS_WEIGHTS.copy()
         self.enable_cache = enable_cache
         self.cache_hits = 0
-        self._cache: dict[str, int] = {}
+
+        # Digest -> progress memo; named scope (feature or initiative id) ->
+        # digest it was last computed for, and its task ids; task id ->
+        # scopes containing it
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._scopes: dict[str, str] = {}
+        self._scope_tasks: dict[str, list[str]] = {}
+        self._task_scopes: dict[str, set[str]] = {}
 
     def get_status_weight(self, status: str) -> float:
         """
@@ -73,7 +124,8 @@ class ProgressCalculator:
 
         Args:
             tasks: List of task dictionaries with 'status' field
-            feature_id: Optional feature ID for caching (future)
+            feature_id: Optional feature ID; with caching enabled the result
+                is remembered for this ID until invalidated
 
         Returns:
             Progress percentage (0-100)
@@ -81,12 +133,79 @@ class ProgressCalculator:
         if not tasks:
             return 0
 
-        # Check cache if enabled (future optimization)
-        if self.enable_cache and feature_id:
-            if feature_id in self._cache:
-                self.cache_hits += 1
-                return self._cache[feature_id]
+        if not self.enable_cache:
+            return self._weighted_progress(tasks)
+
+        scope = f"feature:{feature_id}" if feature_id else None
+        return self._memoized(
+            scope,
+            tasks,
+            lambda: task_status_digest(tasks),
+            lambda: self._weighted_progress(tasks),
+        )
+
+    def calculate_feature_tree_progress(
+        self,
+        features: dict[str | None, list[dict]],
+        initiative_id: str | None = None,
+    ) -> int:
+        """
+        Calculate initiative progress straight from its tasks, by feature.
+
+        Each feature's progress is calculated from its tasks and the
+        initiative progress is their average, as in
+        calculate_initiative_progress(). With caching enabled, unchanged
+        features are served from the memo and the whole result is
+        remembered for initiative_id until one of its tasks changes.
+
+        Args:
+            features: Mapping of feature ID to its tasks (as returned by
+                TaskLinker.group_by_feature)
+            initiative_id: Optional initiative ID for caching
+
+        Returns:
+            Progress percentage (0-100)
+        """
+        groups = {feature: tasks for feature, tasks in features.items() if tasks}
+        if not groups:
+            return 0
 
+        def compute() -> int:
+            return self.calculate_initiative_progress(
+                [
+                    {"progress": self._feature_progress(feature, tasks)}
+                    for feature, tasks in groups.items()
+                ]
+            )
+
+        if not self.enable_cache:
+            return compute()
+
+        def digest() -> str:
+            h = hashlib.blake2b(digest_size=16)
+            for part in sorted(
+                task_status_digest(tasks, feature) for feature, tasks in groups.items()
+            ):
+                h.update(part.encode())
+            return h.hexdigest()
+
+        scope = f"initiative:{initiative_id}" if initiative_id else None
+        members = [task for tasks in groups.values() for task in tasks]
+        return self._memoized(scope, members, digest, compute)
+
+    def _feature_progress(self, feature: str | None, tasks: list[dict]) -> int:
+        """Progress of one feature of a tree, memoized by digest only."""
+        if not self.enable_cache:
+            return self._weighted_progress(tasks)
+        return self._memoized(
+            None,
+            tasks,
+            lambda: task_status_digest(tasks, feature),
+            lambda: self._weighted_progress(tasks),
+        )
+
+    def _weighted_progress(self, tasks: list[dict]) -> int:
+        """Uncached weighted progress of a non-empty task list."""
         # Calculate weighted progress
         total_weight = 0.0
 
@@ -100,13 +219,51 @@ class ProgressCalculator:
         progress_percent = int(progress_fraction * 100)
 
         # Clamp to 0-100 range
-        progress_percent = max(0, min(100, progress_percent))
+        return max(0, min(100, progress_percent))
 
-        # Cache result if enabled
-        if self.enable_cache and feature_id:
-            self._cache[feature_id] = progress_percent
+    def _memoized(
+        self,
+        scope: str | None,
+        tasks: list[dict],
+        digest: Callable[[], str],
+        compute: Callable[[], int],
+    ) -> int:
+        """
+        Serve a result from the cache or compute and remember it.
 
-        return progress_percent
+        Args:
+            scope: Named scope remembering the result, or None
+            tasks: Member tasks (indexed by ID for task_changed)
+            digest: Callable returning the task set digest
+            compute: Callable computing the result on a miss
+
+        Returns:
+            Progress percentage (0-100)
+        """
+        key = digest()
+        with self._lock:
+            progress = self._cache.get(key)
+            if progress is not None:
+                self.cache_hits += 1
+                self._cache.move_to_end(key)
+
+        # Computed outside the lock: tree progress memoizes its features
+        if progress is None:
+            progress = compute()
+
+        with self._lock:
+            if scope:
+                self._forget_scope(scope)
+                self._scopes[scope] = key
+                task_ids = [task["id"] for task in tasks if task.get("id")]
+                self._scope_tasks[scope] = task_ids
+                for task_id in task_ids:
+                    self._task_scopes.setdefault(task_id, set()).add(scope)
+            self._cache[key] = progress
+            self._cache.move_to_end(key)
+            while len(self._cache) > MAX_CACHE_ENTRIES:
+                self._cache.popitem(last=False)
+        return progress
 
     def calculate_initiative_progress(
         self, features: list[dict], manual_override: int | None = None
@@ -198,17 +355,75 @@ class ProgressCalculator:
 
         return max(0, min(100, progress_percent))
 
-    def invalidate_cache(self, feature_id: str | None = None):
+    def invalidate_cache(
+        self, feature_id: str | None = None, task_id: str | None = None
+    ) -> None:
         """
         Invalidate progress cache.
 
+        Drops the memoized result of each invalidated feature and
+        initiative, so it is recomputed on its next calculation. Results
+        memoized for unnamed task sets (e.g. the features of a tree) stay
+        valid, as they are keyed by the exact task statuses.
+
+        Args:
+            feature_id: Specific feature or initiative to invalidate
+            task_id: Invalidate every feature and initiative containing
+                this task
+
+        Without arguments the whole cache is cleared.
+        """
+        with self._lock:
+            if feature_id is None and task_id is None:
+                self._cache.clear()
+                self._scopes.clear()
+                self._scope_tasks.clear()
+                self._task_scopes.clear()
+                return
+            if feature_id is not None:
+                self._forget_scope(f"feature:{feature_id}")
+                self._forget_scope(f"initiative:{feature_id}")
+            if task_id is not None:
+                for scope in list(self._task_scopes.get(task_id, ())):
+                    self._forget_scope(scope)
+
+    def task_changed(self, previous: dict | None, current: dict | None) -> None:
+        """
+        Invalidate cached progress affected by a task change event.
+
+        Drops the features and initiatives that contain the task, plus
+        those named by its 'feature' or 'specification' field (covering
+        tasks that just joined them). Suitable as a TaskLinker listener.
+
         Args:
-            feature_id: Specific feature to invalidate, or None to clear all
+            previous: Task before the change (None if created)
+            current: Task after the change (None if removed)
         """
-        if feature_id:
-            self._cache.pop(feature_id, None)
-        else:
-            self._cache.clear()
+        for task in (previous, current):
+            if task is None:
+                continue
+            if task.get("id"):
+                self.invalidate_cache(task_id=task["id"])
+            if task.get("feature"):
+                self.invalidate_cache(str(task["feature"]))
+            if task.get("specification"):
+                spec_path = str(task["specification"])
+                # TaskLinker groups by the path without a leading "./"
+                for name in {spec_path, spec_path.removeprefix("./")}:
+                    self.invalidate_cache(name)
+
+    def _forget_scope(self, scope: str) -> None:
+        """Drop a named scope, its result and task index (caller holds lock)."""
+        key = self._scopes.pop(scope, None)
+        if key is None:
+            return
+        self._cache.pop(key, None)
+        for task_id in self._scope_tasks.pop(scope, ()):
+            scopes = self._task_scopes.get(task_id)
+            if scopes is not None:
+                scopes.discard(scope)
+                if not scopes:
+                    del self._task_scopes[task_id]
 
     def get_feature_status_summary(self, tasks: list[dict]) -> dict[str, int]:
         """
@@ -3,7 +3,16 @@ Specification Frontmatter Caching Layer.
 
 Implements two-tier caching strategy for specification frontmatter parsing:
 - Tier 1: In-memory cache (process lifetime)
-- Tier 2: File watcher invalidation (watchdog library)
+- Tier 2: Optional on-disk SQLite store (survives restarts; enabled by
+  passing a store_path outside the specifications tree), keyed by path and
+  validated by (mtime_ns, size), then by a BLAKE2 digest of the content
+- Invalidation: File watcher (watchdog library); created, modified,
+  moved and deleted specs are dropped at once and re-parsed in the
+  background after a short debounce, then listeners are notified
+
+On a warm start, preload_all() only stats the files and decodes their
+stored metadata. Files that changed (and whose content digest changed)
+are parsed again, in a process pool when there are many of them.
 
 Performance requirements (NFR-P2):
 - Initial load (startup): <2 seconds for 50 specs
@@ -16,26 +25,168 @@ References:
 - Implements ATDD (Directive 016) and TDD (Directive 017)
 """
 
+import hashlib
 import logging
+import marshal
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from src.domain.collaboration.task_codec import pack_document, unpack_document
+from src.domain.collaboration.task_loader import PoolKind, map_chunked
+
 if TYPE_CHECKING:
     from llm_service.dashboard.spec_parser import SpecificationMetadata
 
 logger = logging.getLogger(__name__)
 
+# Quiet period after the last event for a spec before it is re-parsed
+DEFAULT_REFRESH_DELAY = 0.05
+
+# Called with (spec_path, metadata) after a background refresh changed a
+# spec; metadata is None when the spec was removed or became invalid
+SpecListener = Callable[[str, Optional["SpecificationMetadata"]], None]
+
+# Bump when the stored representation of SpecificationMetadata changes
+STORE_FORMAT_VERSION = 1
+
+_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS specs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    metadata BLOB
+);
+"""
+
+
+class StoredSpec(NamedTuple):
+    """Row of the on-disk store; ``metadata`` is None for invalid specs."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    metadata: bytes | None
+
+
+class SpecStore:
+    """
+    On-disk second tier of the specification cache.
+
+    Stores the parsed metadata of each specification file (or the fact
+    that it failed to parse) in SQLite. An entry is valid while the file's
+    (mtime_ns, size) is unchanged, or - after a touch or checkout - while
+    its content digest is. Specification files remain the source of truth;
+    the store can be deleted at any time.
+
+    When the database can't be opened, the store is disabled and every
+    lookup misses. Thread-safe: a single connection behind a lock.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the store.
+
+        Args:
+            db_path: SQLite database location
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != (
+                STORE_FORMAT_VERSION
+            ):
+                conn.execute("DROP TABLE IF EXISTS specs")
+                conn.execute(f"PRAGMA user_version = {STORE_FORMAT_VERSION}")
+            conn.executescript(_STORE_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Specification store unavailable at {db_path}: {e}")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are persisted."""
+        return self._conn is not None
+
+    def get(self, path: str) -> StoredSpec | None:
+        """Stored entry for an absolute specification path."""
+        if self._conn is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, digest, metadata FROM specs WHERE path = ?",
+                (path,),
+            ).fetchone()
+        return StoredSpec(*row) if row else None
+
+    def all(self) -> dict[str, StoredSpec]:
+        """All stored entries by path (one query, for preloading)."""
+        if self._conn is None:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, mtime_ns, size, digest, metadata FROM specs"
+            ).fetchall()
+        return {row[0]: StoredSpec(*row[1:]) for row in rows}
+
+    def put_many(self, entries: Sequence[tuple[str, StoredSpec]]) -> None:
+        """Insert or replace entries in one transaction."""
+        if self._conn is None or not entries:
+            return
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO specs VALUES (?, ?, ?, ?, ?)",
+                    [(path, *entry) for path, entry in entries],
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Specification store write failed: {e}")
+
+    def delete_many(self, paths: Sequence[str]) -> None:
+        """Drop entries of specification files that no longer exist."""
+        if self._conn is None or not paths:
+            return
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    "DELETE FROM specs WHERE path = ?", [(path,) for path in paths]
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Specification store write failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
 
 class SpecChangeHandler(FileSystemEventHandler):
     """
     File system event handler for specification file changes.
 
-    Monitors .md files in specifications/ directory and invalidates
-    cache entries when files are modified or deleted.
+    Monitors .md files in specifications/ directory. Every created,
+    modified, moved or deleted spec is invalidated at once and queued for
+    a debounced background refresh.
     """
 
     def __init__(self, cache: "SpecificationCache"):
@@ -48,42 +199,63 @@ class SpecChangeHandler(FileSystemEventHandler):
         super().__init__()
         self.cache = cache
 
+    def on_created(self, event: FileSystemEvent) -> None:
+        """
+        Handle file creation events.
+
+        Args:
+            event: File system event
+        """
+        if not event.is_directory:
+            self._changed(Path(event.src_path), "creation")
+
     def on_modified(self, event: FileSystemEvent) -> None:
         """
         Handle file modification events.
 
-        When a .md file is modified, invalidate its cache entry.
+        Args:
+            event: File system event
+        """
+        if not event.is_directory:
+            self._changed(Path(event.src_path), "modification")
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """
+        Handle file and directory renames.
+
+        A moved directory gets no events for the files inside it, so they
+        are refreshed individually.
 
         Args:
             event: File system event
         """
         if event.is_directory:
+            src_dir = os.path.join(str(event.src_path), "")
+            for spec_path in list(self.cache.cache):
+                if spec_path.startswith(src_dir):
+                    self._changed(Path(spec_path), "move")
+            for md_file in Path(str(event.dest_path)).rglob("*.md"):
+                self._changed(md_file, "move")
             return
 
-        file_path = Path(event.src_path)
-
-        # Only process markdown files
-        if file_path.suffix.lower() == ".md":
-            logger.debug(f"Detected modification: {file_path}")
-            self.cache.invalidate(str(file_path))
+        self._changed(Path(event.src_path), "move")
+        self._changed(Path(event.dest_path), "move")
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """
         Handle file deletion events.
 
-        When a .md file is deleted, remove it from cache.
-
         Args:
             event: File system event
         """
-        if event.is_directory:
-            return
-
-        file_path = Path(event.src_path)
+        if not event.is_directory:
+            self._changed(Path(event.src_path), "deletion")
 
+    def _changed(self, file_path: Path, kind: str) -> None:
+        # Only process markdown files
         if file_path.suffix.lower() == ".md":
-            logger.debug(f"Detected deletion: {file_path}")
-            self.cache.invalidate(str(file_path))
+            logger.debug(f"Detected {kind}: {file_path}")
+            self.cache._schedule_refresh(str(file_path))
 
 
 class SpecificationCache:
@@ -105,12 +277,23 @@ class SpecificationCache:
         >>> cache.stop_file_watcher()
     """
 
-    def __init__(self, base_dir: str):
+    def __init__(
+        self,
+        base_dir: str,
+        store_path: str | Path | None = None,
+        load_pool: PoolKind = "process",
+        refresh_delay: float = DEFAULT_REFRESH_DELAY,
+    ):
         """
         Initialize specification cache.
 
         Args:
             base_dir: Base directory containing specification files
+            store_path: On-disk store file, e.g. in the dashboard's cache
+                directory (default: None, memory only)
+            load_pool: Pool used to parse large batches of cold specifications
+                ("process", "thread" or "serial")
+            refresh_delay: Debounce (seconds) before a changed spec is re-parsed
         """
         self.base_dir = Path(base_dir)
 
@@ -125,11 +308,26 @@ class SpecificationCache:
         # File watcher (initialized by start_file_watcher)
         self.file_watcher: Observer | None = None
 
+        # Background refresh of changed specs (runs with the file watcher)
+        # Structure: {spec_path: (deadline, metadata before the change)}
+        self.refresh_delay = refresh_delay
+        self._pending: dict[str, tuple[float, SpecificationMetadata | None]] = {}
+        self._pending_lock = threading.Lock()
+        self._refresh_needed = threading.Event()
+        self._stopping = threading.Event()
+        self._refresher: threading.Thread | None = None
+        self._listeners: list[SpecListener] = []
+
         # Import SpecificationParser (lazy to avoid circular dependencies)
         from llm_service.dashboard.spec_parser import SpecificationParser
 
         self.parser = SpecificationParser(str(self.base_dir))
 
+        self.load_pool = load_pool
+        self.store: SpecStore | None = None
+        if store_path is not None and self.base_dir.is_dir():
+            self.store = SpecStore(Path(store_path))
+
         logger.info(f"SpecificationCache initialized with base_dir: {self.base_dir}")
 
     def get_spec(self, spec_path: str) -> Optional["SpecificationMetadata"]:
@@ -156,7 +354,7 @@ class SpecificationCache:
 
     def _parse_and_cache(self, spec_path: str) -> Optional["SpecificationMetadata"]:
         """
-        Parse specification and store in cache.
+        Load specification from the disk store or parse it, and cache it.
 
         Args:
             spec_path: Path to specification file
@@ -164,8 +362,15 @@ class SpecificationCache:
         Returns:
             Parsed SpecificationMetadata, or None if parsing fails
         """
-        # Use existing SpecificationParser
-        metadata = self.parser.parse_frontmatter(spec_path)
+        if self.store is None:
+            # Use existing SpecificationParser
+            metadata = self.parser.parse_frontmatter(spec_path)
+        else:
+            key = str(Path(spec_path).absolute())
+            stored = self.store.get(key)
+            found, metadata = self._validate(key, stored)
+            if not found:
+                metadata = self._parse_stored(spec_path, key)
 
         if metadata is not None:
             # Store in cache
@@ -174,6 +379,54 @@ class SpecificationCache:
 
         return metadata
 
+    def _validate(
+        self, key: str, stored: StoredSpec | None
+    ) -> tuple[bool, Optional["SpecificationMetadata"]]:
+        """
+        Check a stored entry against the file.
+
+        Returns:
+            (True, metadata) if the entry is current, (False, None) otherwise
+        """
+        if stored is None:
+            return False, None
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return False, None
+
+        if (stat.st_mtime_ns, stat.st_size) != (stored.mtime_ns, stored.size):
+            # Touched or rewritten: current if the content is the same
+            digest = _file_digest(key)
+            if digest != stored.digest:
+                return False, None
+            if self.store is not None:
+                self.store.put_many(
+                    [
+                        (
+                            key,
+                            stored._replace(
+                                mtime_ns=stat.st_mtime_ns, size=stat.st_size
+                            ),
+                        )
+                    ]
+                )
+
+        try:
+            return True, _unpack_metadata(stored.metadata)
+        except (EOFError, ValueError, TypeError):
+            return False, None
+
+    def _parse_stored(
+        self, spec_path: str, key: str
+    ) -> Optional["SpecificationMetadata"]:
+        """Parse one specification and record the outcome in the disk store."""
+        entry = _stat_entry(key)
+        metadata = self.parser.parse_frontmatter(spec_path)
+        if entry is not None and self.store is not None:
+            self.store.put_many([(key, entry._replace(metadata=_pack(metadata)))])
+        return metadata
+
     def invalidate(self, spec_path: str) -> None:
         """
         Invalidate cache entry for specified path.
@@ -188,6 +441,100 @@ class SpecificationCache:
             del self.cache[spec_path]
             logger.debug(f"Invalidated cache: {spec_path}")
 
+    def add_listener(self, listener: SpecListener) -> None:
+        """
+        Subscribe to spec-changed notifications.
+
+        Listeners run on the background refresh thread after a changed
+        spec was re-parsed (only when its metadata actually changed), so
+        they never delay requests. Exceptions are logged and ignored.
+
+        Args:
+            listener: Callable receiving (spec_path, metadata or None)
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: SpecListener) -> None:
+        """Unsubscribe a listener (safe to call if not subscribed)."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _schedule_refresh(self, spec_path: str) -> None:
+        """
+        Invalidate a changed spec and queue it for a background re-parse.
+
+        Events for the same spec within refresh_delay are coalesced.
+        Reads in the meantime parse inline, so they never see stale data.
+        """
+        with self._pending_lock:
+            if spec_path in self._pending:
+                previous = self._pending[spec_path][1]
+            else:
+                previous = self.cache.get(spec_path)
+            self.invalidate(spec_path)
+            self._pending[spec_path] = (
+                time.monotonic() + self.refresh_delay,
+                previous,
+            )
+        self._refresh_needed.set()
+
+    def _refresh_loop(self) -> None:
+        """Background thread: re-parse specs whose debounce expired."""
+        timeout: float | None = None
+        while True:
+            self._refresh_needed.wait(timeout)
+            if self._stopping.is_set():
+                return
+            self._refresh_needed.clear()
+            timeout = self._refresh_due()
+
+    def _refresh_due(self) -> float | None:
+        """
+        Refresh every spec whose debounce expired.
+
+        Returns:
+            Seconds until the next pending deadline, or None if none pending
+        """
+        now = time.monotonic()
+        with self._pending_lock:
+            due = [
+                (spec_path, previous)
+                for spec_path, (deadline, previous) in self._pending.items()
+                if deadline <= now
+            ]
+            for spec_path, _ in due:
+                del self._pending[spec_path]
+            next_deadline = min(
+                (deadline for deadline, _ in self._pending.values()), default=None
+            )
+
+        for spec_path, previous in due:
+            try:
+                self._refresh(spec_path, previous)
+            except Exception as e:
+                logger.error(f"Background refresh of {spec_path} failed: {e}")
+
+        if next_deadline is None:
+            return None
+        return max(0.0, next_deadline - time.monotonic())
+
+    def _refresh(
+        self, spec_path: str, previous: Optional["SpecificationMetadata"]
+    ) -> None:
+        """Re-parse one spec and notify listeners if it changed."""
+        metadata = None
+        if Path(spec_path).is_file():
+            metadata = self._parse_and_cache(spec_path)
+        if metadata == previous:
+            return
+
+        logger.debug(f"Specification changed: {spec_path}")
+        for listener in list(self._listeners):
+            try:
+                listener(spec_path, metadata)
+            except Exception as e:
+                logger.error(f"Spec change listener failed for {spec_path}: {e}")
+
     def preload_all(self) -> None:
         """
         Preload all specifications from base directory into cache.
@@ -206,16 +553,71 @@ class SpecificationCache:
             return
 
         # Find all .md files recursively
+        paths = [str(md_file) for md_file in self.base_dir.rglob("*.md")]
+
+        if self.store is None:
+            loaded = self._parse_many(paths)
+        else:
+            loaded = self._load_stored(self.store, paths)
+
         count = 0
-        for md_file in self.base_dir.rglob("*.md"):
-            # Parse and cache
-            metadata = self._parse_and_cache(str(md_file))
-            if metadata:
+        for spec_path, metadata in zip(paths, loaded, strict=True):
+            if metadata is not None:
+                self.cache[spec_path] = metadata
                 count += 1
 
         elapsed = (datetime.now() - start_time).total_seconds()
         logger.info(f"Preloaded {count} specifications in {elapsed:.3f}s")
 
+    def _load_stored(
+        self, store: SpecStore, paths: list[str]
+    ) -> list[Optional["SpecificationMetadata"]]:
+        """
+        Load many specifications through the disk store.
+
+        Current entries are decoded; the rest are parsed in one batch and
+        written back in a single transaction. Entries of files that no
+        longer exist below base_dir are dropped.
+        """
+        stored = store.all()
+        keys = [str(Path(spec_path).absolute()) for spec_path in paths]
+
+        loaded: list[SpecificationMetadata | None] = []
+        cold: list[int] = []
+        for i, key in enumerate(keys):
+            found, metadata = self._validate(key, stored.get(key))
+            loaded.append(metadata)
+            if not found:
+                cold.append(i)
+
+        if cold:
+            # Stat before parsing: a file changing meanwhile stays stale
+            entries = [_stat_entry(keys[i]) for i in cold]
+            parsed = self._parse_many([paths[i] for i in cold])
+            writes = []
+            for i, entry, metadata in zip(cold, entries, parsed, strict=True):
+                loaded[i] = metadata
+                if entry is not None:
+                    writes.append((keys[i], entry._replace(metadata=_pack(metadata))))
+            store.put_many(writes)
+            logger.info(f"Parsed {len(cold)} changed specifications")
+
+        seen = set(keys)
+        store.delete_many(
+            [
+                key
+                for key in stored
+                if key not in seen and Path(key).is_relative_to(self.base_dir)
+            ]
+        )
+        return loaded
+
+    def _parse_many(self, paths: list[str]) -> list[Optional["SpecificationMetadata"]]:
+        """Parse specifications, in a worker pool when there are many."""
+        return map_chunked(
+            partial(_parse_chunk, str(self.base_dir)), paths, pool=self.load_pool
+        )
+
     def get_all_specs(self) -> list["SpecificationMetadata"]:
         """
         Get list of all cached specifications.
@@ -232,8 +634,9 @@ class SpecificationCache:
         """
         Start watchdog file watcher for specifications directory.
 
-        Monitors base_dir recursively for .md file changes and automatically
-        invalidates cache entries when files are modified or deleted.
+        Monitors base_dir recursively for .md file changes. Changed specs
+        are invalidated at once and re-parsed by a background thread, which
+        then notifies listeners (see add_listener()).
 
         Safe to call multiple times (idempotent).
         """
@@ -253,6 +656,12 @@ class SpecificationCache:
         # Start observer thread
         self.file_watcher.start()
 
+        self._stopping.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="SpecCacheRefresher", daemon=True
+        )
+        self._refresher.start()
+
         logger.info("File watcher started")
 
     def stop_file_watcher(self) -> None:
@@ -271,6 +680,15 @@ class SpecificationCache:
             self.file_watcher.join(timeout=2.0)
             logger.info("File watcher stopped")
 
+        if self._refresher is not None:
+            self._stopping.set()
+            self._refresh_needed.set()
+            self._refresher.join(timeout=2.0)
+            self._refresher = None
+            # Specs still pending stay invalidated and load on next read
+            with self._pending_lock:
+                self._pending.clear()
+
     def clear(self) -> None:
         """
         Clear all cached specifications.
@@ -283,3 +701,49 @@ class SpecificationCache:
     def __del__(self):
         """Destructor - ensure file watcher is stopped."""
         self.stop_file_watcher()
+        if getattr(self, "store", None) is not None:
+            self.store.close()
+
+
+def _file_digest(path: str) -> str:
+    """BLAKE2 digest of a file's content."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=20).hexdigest()
+
+
+def _stat_entry(path: str) -> StoredSpec | None:
+    """Store entry for a file's current stat and digest (without metadata)."""
+    try:
+        stat = os.stat(path)
+        digest = _file_digest(path)
+    except OSError:
+        return None
+    return StoredSpec(stat.st_mtime_ns, stat.st_size, digest, None)
+
+
+def _pack(metadata: Optional["SpecificationMetadata"]) -> bytes | None:
+    """Serialize metadata for the store (None stays None)."""
+    if metadata is None:
+        return None
+    return marshal.dumps(pack_document(asdict(metadata)))
+
+
+def _unpack_metadata(blob: bytes | None) -> Optional["SpecificationMetadata"]:
+    """Reverse :func:`_pack`."""
+    if blob is None:
+        return None
+    from llm_service.dashboard.spec_parser import Feature, SpecificationMetadata
+
+    data: dict[str, Any] = unpack_document(marshal.loads(blob))
+    data["features"] = [Feature(**feature) for feature in data["features"]]
+    return SpecificationMetadata(**data)
+
+
+def _parse_chunk(
+    base_dir: str, paths: Sequence[str]
+) -> list[Optional["SpecificationMetadata"]]:
+    """Parse a chunk of specifications; runs inside pool workers."""
+    from llm_service.dashboard.spec_parser import SpecificationParser
+
+    parser = SpecificationParser(base_dir)
+    return [parser.parse_frontmatter(spec_path) for spec_path in paths]
@@ -92,22 +92,17 @@
 
         socket.on('task.created', (data) => {
             console.log('📋 Task created:', data);
-            handleTaskCreated(data);
             addActivity('Task Created', data.task.title || data.task.id, 'created');
         });
 
         socket.on('task.assigned', (data) => {
             console.log('🔄 Task assigned:', data);
-            handleTaskAssigned(data);
             addActivity('Task Assigned', `${data.task.title || data.task.id} → ${data.task.agent}`, 'assigned');
         });
 
         socket.on('task.completed', (data) => {
             console.log('✅ Task completed:', data);
-            handleTaskCompleted(data);
             addActivity('Task Completed', data.task.title || data.task.id, 'completed');
-            // Refresh portfolio on task completion
-            loadPortfolioData();
         });
 
         socket.on('task.updated', (data) => {
@@ -118,13 +113,22 @@
                 updatePriorityInUI(data.task_id, data.new_value);
             }
             
-            handleTaskUpdated(data);
             // Refresh portfolio on task status changes
             if (data.field === 'status') {
                 loadPortfolioData();
             }
         });
 
+        // Coalesced task changes; reload the board once per batch and
+        // acknowledge so the server keeps sending (backpressure)
+        socket.on('tasks.batch', (batch, ack) => {
+            console.log(`📦 Task batch: ${batch.changes.length} change(s)`, batch);
+            handleTaskBatch(batch);
+            if (typeof ack === 'function') {
+                ack(batch.version);
+            }
+        });
+
         socket.on('cost.update', (data) => {
             console.log('💰 Cost update:', data);
             updateCostMetrics(data.costs);
@@ -443,20 +447,16 @@
         return !nonEditableStatuses.includes(status);
     }
 
-    function handleTaskCreated(data) {
-        loadDashboardData(); // Reload entire board
-    }
-
-    function handleTaskAssigned(data) {
-        loadDashboardData(); // Reload entire board
-    }
-
-    function handleTaskCompleted(data) {
-        loadDashboardData(); // Reload entire board
-    }
-
-    function handleTaskUpdated(data) {
+    // Per-task events only feed the activity list; the board is reloaded
+    // once per tasks.batch, which follows every coalescing window
+    function handleTaskBatch(batch) {
+        if (!batch.reset && batch.changes.length === 0) {
+            return;
+        }
         loadDashboardData(); // Reload entire board
+        if (batch.reset || batch.changes.some(change => change.stage === 'done')) {
+            loadPortfolioData();
+        }
     }
 
     function updateCostMetrics(costs) {
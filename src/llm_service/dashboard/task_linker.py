@@ -4,17 +4,76 @@ Task Linker for Initiative Tracking.
 Links tasks to specifications and features by scanning task YAML files
 and matching them to specification paths.
 
+The specification → feature → task grouping is kept as an index. Without
+an event source every query rebuilds it with one scan. Once started (own
+observer) or attached (events forwarded by an owner such as
+PortfolioView), task file events patch it, so per-specification,
+per-feature and orphan lookups no longer touch the file system. Queries
+return copies, so callers can't corrupt the index. Listeners are told
+about every task that changed, e.g. to invalidate cached progress.
+
 Implements ADR-037: Dashboard Initiative Tracking.
 """
 
+import copy
 import logging
+import os
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
 # Import shared task loading function (ADR-042)
+from src.domain.collaboration.task_index import TASK_SUFFIX
 from src.domain.collaboration.task_schema import load_task_safe
 
 logger = logging.getLogger(__name__)
 
+# Called with (previous task or None, current task or None) for each change
+TaskListener = Callable[[dict | None, dict | None], None]
+
+
+class TaskLinkerEventHandler(FileSystemEventHandler):
+    """Forwards task file events to a TaskLinker."""
+
+    def __init__(self, linker: "TaskLinker"):
+        """
+        Initialize handler.
+
+        Args:
+            linker: Linker whose index is patched
+        """
+        super().__init__()
+        self.linker = linker
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle a new task file."""
+        if not event.is_directory:
+            self.linker.file_changed(Path(event.src_path))
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        """Handle an edited task file."""
+        if not event.is_directory:
+            self.linker.file_changed(Path(event.src_path))
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle a task moving between lifecycle directories."""
+        if event.is_directory:
+            # Files inside a moved directory get no events of their own
+            self.linker.rebuild()
+            return
+        self.linker.file_removed(Path(event.src_path))
+        self.linker.file_changed(Path(event.dest_path))
+
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        """Handle a removed task file or directory."""
+        if event.is_directory:
+            self.linker.rebuild()
+            return
+        self.linker.file_removed(Path(event.src_path))
+
 
 class TaskLinker:
     """
@@ -22,6 +81,17 @@ class TaskLinker:
 
     Scans work/collaboration directory for task YAML files and matches them
     to specification files via the `specification:` field.
+
+    Thread-safe: events arrive on the observer thread while callers query.
+
+    Usage:
+        >>> linker = TaskLinker("work/collaboration", "specifications")
+        >>> linker.start()  # optional: keep the index current from events
+        >>> linker.get_tasks_for_specification("dashboard/feature.md")
+
+    An owner that already watches the work directory calls attach()
+    instead of start() and forwards task events to file_changed(),
+    file_removed() and rebuild().
     """
 
     def __init__(self, work_dir: str, spec_dir: str | None = None):
@@ -41,6 +111,69 @@ class TaskLinker:
         if self.spec_dir and not self.spec_dir.is_absolute():
             self.spec_dir = self.spec_dir.absolute()
 
+        self.observer: Observer | None = None
+        self._attached = False
+
+        # Index: task path -> task, specification -> feature -> task path ->
+        # task, specification file -> task paths; unlinked tasks are orphans
+        self._lock = threading.RLock()
+        self._tasks: dict[str, dict] = {}
+        self._by_spec: dict[str, dict[str | None, dict[str, dict]]] = {}
+        self._targets: dict[str, set[str]] = {}
+        self._unlinked: dict[str, dict] = {}
+        self._listeners: list[TaskListener] = []
+        # Files changed while a rescan runs; re-read once it is applied
+        self._scans = 0
+        self._touched: set[str] = set()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether file events keep the index up to date."""
+        return self._attached or (
+            self.observer is not None and self.observer.is_alive()
+        )
+
+    def attach(self) -> None:
+        """
+        Trust the index without an observer of its own.
+
+        The caller forwards every task file event to file_changed() or
+        file_removed(), and directory changes to rebuild(), from the time
+        it built the index on.
+        """
+        self._attached = True
+
+    def detach(self) -> None:
+        """Stop trusting forwarded events; queries rescan again."""
+        self._attached = False
+
+    def start(self) -> None:
+        """Build the index and start patching it from task file events."""
+        if self.is_running:
+            return
+        if not self.work_dir.is_dir():
+            logger.warning(f"Work directory not found: {self.work_dir}")
+            return
+
+        observer = Observer()
+        observer.schedule(
+            TaskLinkerEventHandler(self), str(self.work_dir), recursive=True
+        )
+        observer.daemon = True
+        observer.start()
+        self.observer = observer
+
+        # Scan after the observer is live so no change slips through
+        self.rebuild()
+
+    def stop(self) -> None:
+        """Stop watching for task file events."""
+        if self.observer is None:
+            return
+        self.observer.stop()
+        self.observer.join(timeout=2.0)
+        self.observer = None
+
     def load_task(self, task_path: str) -> dict | None:
         """
         Load and parse task YAML file.
@@ -81,7 +214,7 @@ class TaskLinker:
             return tasks
 
         # Scan all YAML files recursively
-        for yaml_file in self.work_dir.rglob("*.yaml"):
+        for yaml_file in self.work_dir.rglob(f"*{TASK_SUFFIX}"):
             task = self.load_task(str(yaml_file))
             if task:
                 tasks.append(task)
@@ -89,6 +222,177 @@ class TaskLinker:
         logger.info(f"Scanned {self.work_dir}: found {len(tasks)} tasks")
         return tasks
 
+    def rebuild(self, tasks: list[dict] | None = None) -> None:
+        """
+        Rescan all task files and replace the index.
+
+        Files changed while the scan runs are re-read afterwards, so their
+        events aren't lost to the older scan result.
+
+        Args:
+            tasks: Result of scan_tasks() if the caller already scanned;
+                the caller then re-forwards files changed during its scan
+        """
+        with self._lock:
+            self._scans += 1
+        try:
+            if tasks is None:
+                tasks = self.scan_tasks()
+        except BaseException:
+            with self._lock:
+                self._end_scan()
+            raise
+
+        with self._lock:
+            touched = self._end_scan()
+            previous = self._tasks
+            self._tasks = {}
+            self._by_spec = {}
+            self._targets = {}
+            self._unlinked = {}
+            for task in tasks:
+                self._put_task(os.path.abspath(task["_path"]), task)
+            current = self._tasks
+        if self._listeners:
+            for key in previous.keys() | current.keys():
+                self._notify(previous.get(key), current.get(key))
+        for key in touched:
+            self.file_changed(Path(key))
+
+    def _end_scan(self) -> set[str]:
+        """Finish a rescan; returns the files to re-read (caller holds the lock)."""
+        self._scans -= 1
+        touched = set(self._touched)
+        if not self._scans:
+            self._touched.clear()
+        return touched
+
+    def file_changed(self, path: Path) -> dict | None:
+        """
+        Re-read one created, modified or moved-in task file.
+
+        Args:
+            path: Task file below the work directory
+
+        Returns:
+            The task as indexed (not to be mutated), or None if the file is
+            gone, invalid or not a task file
+        """
+        key = self._key(path)
+        if key is None:
+            return None
+        task = self.load_task(key) if Path(key).is_file() else None
+        with self._lock:
+            if self._scans:
+                self._touched.add(key)
+            previous = self._drop_task(key)
+            if task is not None:
+                self._put_task(key, task)
+        self._notify(previous, task)
+        return task
+
+    def file_removed(self, path: Path) -> None:
+        """
+        Drop one deleted or moved-away task file.
+
+        Args:
+            path: Task file below the work directory
+        """
+        key = self._key(path)
+        if key is None:
+            return
+        with self._lock:
+            if self._scans:
+                self._touched.add(key)
+            previous = self._drop_task(key)
+        self._notify(previous, None)
+
+    def add_listener(self, listener: TaskListener) -> None:
+        """
+        Subscribe to task change notifications.
+
+        Listeners run on the observer thread (or the thread rescanning a
+        stopped linker) after the index was updated, once per task that
+        was created, modified or removed. Exceptions are logged and ignored.
+
+        Args:
+            listener: Callable receiving (previous task, current task),
+                either of which is None for creations and removals
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: TaskListener) -> None:
+        """Unsubscribe a listener (safe to call if not subscribed)."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, previous: dict | None, current: dict | None) -> None:
+        """Tell listeners about a task change, if anything changed."""
+        if previous == current:
+            return
+        for listener in list(self._listeners):
+            try:
+                listener(previous, current)
+            except Exception as e:
+                path = (current or previous or {}).get("_path")
+                logger.error(f"Task change listener failed for {path}: {e}")
+
+    def _key(self, path: Path) -> str | None:
+        """Absolute path of a task file in the work directory, else None."""
+        key = os.path.abspath(path)
+        if Path(key).suffix != TASK_SUFFIX or not Path(key).is_relative_to(
+            self.work_dir
+        ):
+            return None
+        return key
+
+    def _link(self, task: dict) -> tuple[str, str] | None:
+        """(Normalized specification, specification file) of a task, if linked."""
+        spec_path = task.get("specification")
+        if not spec_path or not self.validate_spec_path(spec_path):
+            return None
+        return spec_path.lstrip("./"), self.resolve_spec_path(spec_path)
+
+    def _put_task(self, key: str, task: dict) -> None:
+        """Insert a task into the index (caller holds the lock)."""
+        self._tasks[key] = task
+        link = self._link(task)
+        if link is None:
+            self._unlinked[key] = task
+            return
+        group, target = link
+        features = self._by_spec.setdefault(group, {})
+        features.setdefault(task.get("feature"), {})[key] = task
+        self._targets.setdefault(target, set()).add(key)
+
+    def _drop_task(self, key: str) -> dict | None:
+        """Remove a task from the index and return it (caller holds the lock)."""
+        task = self._tasks.pop(key, None)
+        if task is None:
+            return None
+        link = self._link(task)
+        if link is None:
+            self._unlinked.pop(key, None)
+            return task
+        group, target = link
+        features = self._by_spec.get(group, {})
+        feature = task.get("feature")
+        features.get(feature, {}).pop(key, None)
+        if not features.get(feature, True):
+            features.pop(feature, None)
+        if not features:
+            self._by_spec.pop(group, None)
+        holders = self._targets.get(target, set())
+        holders.discard(key)
+        if not holders:
+            self._targets.pop(target, None)
+        return task
+
+    def _sync_if_stopped(self) -> None:
+        """Without file events the index can't be trusted: rescan."""
+        if not self.is_running:
+            self.rebuild()
+
     def validate_spec_path(self, spec_path: str) -> bool:
         """
         Validate specification path for security (prevent path traversal).
@@ -154,29 +458,15 @@ class TaskLinker:
         Returns:
             Dictionary mapping specification paths to lists of tasks
         """
-        groups: dict[str, list[dict]] = {}
-
-        tasks = self.scan_tasks()
-
-        for task in tasks:
-            spec_path = task.get("specification")
-
-            if not spec_path:
-                continue  # Skip tasks without specification field
-
-            # Validate path
-            if not self.validate_spec_path(spec_path):
-                continue
-
-            # Normalize path (remove leading ./ if present)
-            spec_path = spec_path.lstrip("./")
-
-            if spec_path not in groups:
-                groups[spec_path] = []
-
-            groups[spec_path].append(task)
-
-        return groups
+        self._sync_if_stopped()
+        with self._lock:
+            groups = {
+                spec_path: [
+                    task for tasks in features.values() for task in tasks.values()
+                ]
+                for spec_path, features in self._by_spec.items()
+            }
+        return copy.deepcopy(groups)
 
     def group_by_feature(self, spec_path: str) -> dict[str | None, list[dict]]:
         """
@@ -189,27 +479,18 @@ class TaskLinker:
             Dictionary mapping feature IDs to lists of tasks
             Uses None key for tasks without feature field
         """
-        feature_groups: dict[str | None, list[dict]] = {}
-
-        all_groups = self.group_by_specification()
+        self._sync_if_stopped()
 
         # Normalize path for lookup
         normalized_path = spec_path.lstrip("./")
 
-        if normalized_path not in all_groups:
-            return feature_groups
-
-        tasks = all_groups[normalized_path]
-
-        for task in tasks:
-            feature_id = task.get("feature")
-
-            if feature_id not in feature_groups:
-                feature_groups[feature_id] = []
-
-            feature_groups[feature_id].append(task)
-
-        return feature_groups
+        with self._lock:
+            features = self._by_spec.get(normalized_path, {})
+            groups = {
+                feature_id: list(tasks.values())
+                for feature_id, tasks in features.items()
+            }
+        return copy.deepcopy(groups)
 
     def get_tasks_for_specification(self, spec_path: str) -> list[dict]:
         """
@@ -221,9 +502,8 @@ class TaskLinker:
         Returns:
             List of task dictionaries
         """
-        all_groups = self.group_by_specification()
-        normalized_path = spec_path.lstrip("./")
-        return all_groups.get(normalized_path, [])
+        groups = self.group_by_feature(spec_path)
+        return [task for tasks in groups.values() for task in tasks]
 
     def get_orphan_tasks(self) -> list[dict]:
         """
@@ -236,28 +516,16 @@ class TaskLinker:
         Returns:
             List of orphan task dictionaries
         """
-        orphans = []
-        tasks = self.scan_tasks()
-
-        for task in tasks:
-            spec_path = task.get("specification")
-
-            # No specification field
-            if not spec_path:
-                orphans.append(task)
-                continue
-
-            # Invalid path (security check)
-            if not self.validate_spec_path(spec_path):
-                orphans.append(task)
-                continue
-
-            # Specification file doesn't exist
-            if self.spec_dir and not self.spec_exists(spec_path):
-                orphans.append(task)
-                continue
-
-        return orphans
+        self._sync_if_stopped()
+
+        with self._lock:
+            orphans = list(self._unlinked.values())
+            if self.spec_dir:
+                # One existence check per specification file, not per task
+                for target, keys in self._targets.items():
+                    if not Path(target).exists():
+                        orphans.extend(self._tasks[key] for key in keys)
+        return copy.deepcopy(orphans)
 
     def get_task_count_by_status(self, tasks: list[dict]) -> dict[str, int]:
         """
@@ -2,16 +2,112 @@
 Telemetry API for Dashboard - Query cost/metrics from SQLite.
 
 Provides read-only access to telemetry database for dashboard visualization.
+
+Queries run on a small pool of reused, query-only connections; the
+TelemetryLogger writer puts the database in WAL mode, so dashboard reads
+don't block it. Cost and
+model figures are derived from one per-day, per-model summary: closed days
+come from the daily_costs rollup, today from a range scan of today's
+invocations. The summary is cached for a few seconds and dropped as soon as
+any writer commits (detected via PRAGMA data_version), so /api/stats stays
+constant-time as the invocations table grows.
 """
 
 import logging
+import queue
 import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per query when streaming invocations
+EXPORT_BATCH_SIZE = 1000
+
+# Idle read connections kept open
+DEFAULT_POOL_SIZE = 4
+
+# Seconds a cached summary is served without re-checking the database
+DEFAULT_CACHE_TTL = 5.0
+
+
+class DailyUsage(NamedTuple):
+    """Aggregated usage of one model on one day (UTC)."""
+
+    date: str
+    model_name: str
+    invocations: int
+    total_tokens: int
+    cost_usd: float
+
+
+class ConnectionPool:
+    """
+    Pool of reusable read connections to one SQLite database.
+
+    Connections are created lazily, shared across threads (one user at a
+    time) and marked query-only. At most ``size`` idle connections are
+    kept; extra ones are closed when returned.
+    """
+
+    def __init__(self, db_path: Path, size: int = DEFAULT_POOL_SIZE):
+        """
+        Initialize an empty pool.
+
+        Args:
+            db_path: Path to SQLite database
+            size: Maximum number of idle connections kept open
+        """
+        self.db_path = db_path
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(size)
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a new read connection."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection for the duration of a with-block.
+
+        Yields:
+            Read-only SQLite connection
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        healthy = False
+        try:
+            yield conn
+            healthy = True
+        finally:
+            # Connections that saw an error (or an abandoned stream) are
+            # closed rather than handed to the next user
+            if healthy and not conn.in_transaction:
+                try:
+                    self._idle.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+            else:
+                conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
 
 class TelemetryAPI:
     """
@@ -26,16 +122,26 @@ class TelemetryAPI:
     Note: This is READ-ONLY. Write operations handled by TelemetryLogger.
     """
 
-    def __init__(self, db_path: str | Path, socketio: Any | None = None):
+    def __init__(
+        self,
+        db_path: str | Path,
+        socketio: Any | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ):
         """
         Initialize telemetry API.
 
         Args:
             db_path: Path to SQLite telemetry database
             socketio: SocketIO instance for event emission (optional)
+            pool_size: Idle read connections kept open
+            cache_ttl: Seconds cached figures are served without checking
+                for new writes (0 disables caching)
         """
         self.db_path = Path(db_path)
         self.socketio = socketio
+        self.cache_ttl = cache_ttl
 
         # Ensure database exists
         if not self.db_path.exists():
@@ -43,6 +149,15 @@ class TelemetryAPI:
             # Create empty database with schema
             self._init_empty_db()
 
+        self.pool = ConnectionPool(self.db_path, pool_size)
+
+        # Cached results; data_version on the sentinel connection changes
+        # whenever another connection commits
+        self._cache_lock = threading.Lock()
+        self._cache: dict[Any, tuple[float, Any]] = {}
+        self._sentinel: sqlite3.Connection | None = None
+        self._data_version: int | None = None
+
     def _init_empty_db(self) -> None:
         """Initialize empty database with schema."""
         schema_path = Path(__file__).parent.parent / "telemetry" / "schema.sql"
@@ -56,6 +171,138 @@ class TelemetryAPI:
         else:
             logger.error(f"Schema file not found: {schema_path}")
 
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.pool.close()
+        with self._cache_lock:
+            if self._sentinel is not None:
+                self._sentinel.close()
+                self._sentinel = None
+            self._cache.clear()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached results (e.g. after writing through another path)."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _cached(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Serve a result from the TTL cache, recomputing after writes.
+
+        Args:
+            key: Cache key
+            compute: Callable producing the result on a miss
+
+        Returns:
+            Cached or freshly computed result
+        """
+        if self.cache_ttl <= 0:
+            return compute()
+
+        now = time.monotonic()
+        with self._cache_lock:
+            self._check_data_version()
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+
+        value = compute()
+        with self._cache_lock:
+            self._cache[key] = (now + self.cache_ttl, value)
+        return value
+
+    def _check_data_version(self) -> None:
+        """Clear the cache if a writer committed since the last check."""
+        try:
+            if self._sentinel is None:
+                self._sentinel = sqlite3.connect(self.db_path, check_same_thread=False)
+            version = self._sentinel.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.debug(f"data_version check failed for {self.db_path}: {e}")
+            self._cache.clear()
+            return
+        if version != self._data_version:
+            self._data_version = version
+            self._cache.clear()
+
+    def daily_usage(self) -> list[DailyUsage]:
+        """
+        Usage per day and model, the basis of all cost figures.
+
+        Closed days (before today, UTC) are read from the daily_costs
+        rollup maintained by TelemetryLogger. If the rollup doesn't cover
+        the stored invocations (missing table, or rows written without the
+        logger) they are aggregated from invocations instead. Today's
+        figures always come from invocations, via the timestamp index.
+
+        Returns:
+            DailyUsage rows ordered by date
+        """
+        return self._cached("daily_usage", self._load_daily_usage)
+
+    def _load_daily_usage(self) -> list[DailyUsage]:
+        """Query daily_usage() rows (uncached)."""
+        today = datetime.now(timezone.utc).date().isoformat()
+        with self.pool.connection() as conn:
+            if self._rollup_covers_history(conn, today):
+                closed = conn.execute(
+                    """
+                    SELECT date, model_name, SUM(invocations),
+                        SUM(total_tokens), SUM(total_cost_usd)
+                    FROM daily_costs
+                    WHERE date < ?
+                    GROUP BY date, model_name
+                """,
+                    (today,),
+                ).fetchall()
+            else:
+                closed = self._aggregate_invocations(conn, "timestamp < ?", today)
+            current = self._aggregate_invocations(conn, "timestamp >= ?", today)
+
+        return sorted(
+            (
+                DailyUsage(
+                    row[0], row[1], row[2] or 0, row[3] or 0, float(row[4] or 0.0)
+                )
+                for row in [*closed, *current]
+            ),
+            key=lambda usage: usage.date,
+        )
+
+    @staticmethod
+    def _rollup_covers_history(conn: sqlite3.Connection, today: str) -> bool:
+        """Whether daily_costs holds the invocations before today."""
+        has_rollup = conn.execute("""
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_costs'
+        """).fetchone()
+        if not has_rollup:
+            return False
+        oldest = conn.execute("SELECT MIN(timestamp) FROM invocations").fetchone()[0]
+        if oldest is None or oldest >= today:
+            return True
+        return (
+            conn.execute(
+                "SELECT 1 FROM daily_costs WHERE date < ? LIMIT 1", (today,)
+            ).fetchone()
+            is not None
+        )
+
+    @staticmethod
+    def _aggregate_invocations(
+        conn: sqlite3.Connection, condition: str, today: str
+    ) -> list[sqlite3.Row]:
+        """Aggregate invocations per day and model (range on timestamp)."""
+        return conn.execute(
+            f"""
+            SELECT substr(timestamp, 1, 10) AS date, model_name, COUNT(*),
+                SUM(total_tokens), SUM(cost_usd)
+            FROM invocations
+            WHERE {condition}
+            GROUP BY date, model_name
+        """,
+            (today,),
+        ).fetchall()
+
     def get_total_cost(self) -> float:
         """
         Get total cost across all invocations.
@@ -63,11 +310,7 @@ class TelemetryAPI:
         Returns:
             Total cost in USD
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT COALESCE(SUM(cost_usd), 0.0) FROM invocations
-            """)
-            return cursor.fetchone()[0]
+        return sum(usage.cost_usd for usage in self.daily_usage())
 
     def get_today_cost(self) -> float:
         """
@@ -76,18 +319,10 @@ class TelemetryAPI:
         Returns:
             Today's cost in USD
         """
-        today = datetime.now(timezone.utc).date()
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT COALESCE(SUM(cost_usd), 0.0)
-                FROM invocations
-                WHERE DATE(timestamp) = ?
-            """,
-                (today.isoformat(),),
-            )
-            return cursor.fetchone()[0]
+        today = datetime.now(timezone.utc).date().isoformat()
+        return sum(
+            usage.cost_usd for usage in self.daily_usage() if usage.date == today
+        )
 
     def get_monthly_cost(self) -> float:
         """
@@ -96,19 +331,10 @@ class TelemetryAPI:
         Returns:
             Current month's cost in USD
         """
-        now = datetime.now(timezone.utc)
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT COALESCE(SUM(cost_usd), 0.0)
-                FROM invocations
-                WHERE timestamp >= ?
-            """,
-                (month_start.isoformat(),),
-            )
-            return cursor.fetchone()[0]
+        month_start = datetime.now(timezone.utc).date().replace(day=1).isoformat()
+        return sum(
+            usage.cost_usd for usage in self.daily_usage() if usage.date >= month_start
+        )
 
     def get_model_usage_stats(self) -> list[dict[str, Any]]:
         """
@@ -117,20 +343,22 @@ class TelemetryAPI:
         Returns:
             List of dicts with model_name, invocations, total_tokens, total_cost_usd
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT
-                    model_name,
-                    COUNT(*) as invocations,
-                    SUM(total_tokens) as total_tokens,
-                    SUM(cost_usd) as total_cost_usd
-                FROM invocations
-                GROUP BY model_name
-                ORDER BY total_cost_usd DESC
-            """)
+        models: dict[str, dict[str, Any]] = {}
+        for usage in self.daily_usage():
+            stats = models.setdefault(
+                usage.model_name,
+                {
+                    "model_name": usage.model_name,
+                    "invocations": 0,
+                    "total_tokens": 0,
+                    "total_cost_usd": 0.0,
+                },
+            )
+            stats["invocations"] += usage.invocations
+            stats["total_tokens"] += usage.total_tokens
+            stats["total_cost_usd"] += usage.cost_usd
 
-            return [dict(row) for row in cursor.fetchall()]
+        return sorted(models.values(), key=lambda s: s["total_cost_usd"], reverse=True)
 
     def get_cost_trend(self, days: int = 7) -> list[dict[str, Any]]:
         """
@@ -142,24 +370,14 @@ class TelemetryAPI:
         Returns:
             List of dicts with date and cost_usd for each day
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT
-                    DATE(timestamp) as date,
-                    SUM(cost_usd) as cost_usd
-                FROM invocations
-                WHERE timestamp >= ?
-                GROUP BY DATE(timestamp)
-                ORDER BY date ASC
-            """,
-                (cutoff.isoformat(),),
-            )
+        trend: dict[str, float] = {}
+        for usage in self.daily_usage():
+            if usage.date >= cutoff:
+                trend[usage.date] = trend.get(usage.date, 0.0) + usage.cost_usd
 
-            return [dict(row) for row in cursor.fetchall()]
+        return [{"date": date, "cost_usd": cost} for date, cost in trend.items()]
 
     def get_active_operations(self) -> list[dict[str, Any]]:
         """
@@ -173,8 +391,7 @@ class TelemetryAPI:
         """
         cutoff = datetime.now(timezone.utc) - timedelta(minutes=5)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.pool.connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT
@@ -197,6 +414,51 @@ class TelemetryAPI:
 
             return [dict(row) for row in cursor.fetchall()]
 
+    def iter_invocations(
+        self,
+        since: str | None = None,
+        until: str | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream invocation records in insertion order.
+
+        Rows are read in batches keyed on the row id, each batch in its own
+        short read, so memory stays flat and the logger is never blocked
+        for the duration of an export. Rows appended while streaming are
+        included.
+
+        Args:
+            since: Only invocations at or after this timestamp (optional)
+            until: Only invocations before this timestamp (optional)
+            batch_size: Rows fetched per query
+
+        Yields:
+            Invocation records as dictionaries
+        """
+        conditions = ["id > ?"]
+        params: list[Any] = []
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(until)
+        query = (
+            f"SELECT * FROM invocations WHERE {' AND '.join(conditions)} "
+            "ORDER BY id LIMIT ?"
+        )
+
+        last_id = 0
+        with self.pool.connection() as conn:
+            while True:
+                rows = conn.execute(query, (last_id, *params, batch_size)).fetchall()
+                for row in rows:
+                    yield dict(row)
+                if len(rows) < batch_size:
+                    return
+                last_id = rows[-1]["id"]
+
     def to_dashboard_dict(self) -> dict[str, Any]:
         """
         Convert telemetry data to dashboard-friendly dictionary.
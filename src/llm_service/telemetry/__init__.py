@@ -7,18 +7,28 @@ for all LLM service requests.
 Key Components:
 - TelemetryLogger: Main logging interface (SQLite)
 - InvocationRecord: Data structure for invocation metadata
+- RetentionEngine / RetentionPolicy: Rollups, pruning and compaction
 - EventWriter: Append-only JSONL event writer (ADR-047)
+- Durability: Group-commit durability levels for EventWriter
+- EventReader: Streaming, indexed JSONL event reader
 - Event / EventType: JSONL event schema
 """
 
 from .logger import InvocationRecord, TelemetryLogger
+from .retention import RetentionEngine, RetentionPolicy, RetentionReport
 from .event_schema import Event, EventType
-from .event_writer import EventWriter
+from .event_writer import Durability, EventWriter
+from .event_reader import EventReader
 
 __all__ = [
     "TelemetryLogger",
     "InvocationRecord",
+    "RetentionEngine",
+    "RetentionPolicy",
+    "RetentionReport",
     "Event",
     "EventType",
     "EventWriter",
+    "Durability",
+    "EventReader",
 ]
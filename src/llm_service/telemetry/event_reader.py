@@ -0,0 +1,475 @@
+"""
+Streaming, indexed reader for JSONL telemetry events (ADR-047).
+
+Events are streamed line by line and filtered while reading (event type,
+run_id, task_id, time range), so memory stays flat however large the
+file grows.
+
+Lookups by run_id or task_id use a sidecar byte-offset index
+(``<file>.idx``, SQLite) and only read the matching lines. The index is
+brought up to date by the reader: each lookup first indexes the lines
+appended since the last one, so writers (in any process) pay nothing
+extra. Rotation is detected from the file identity and triggers a
+rebuild.
+
+follow() tails the file from a saved byte offset, yielding each event
+with the offset to resume from. It and the index hold back a final line
+without a newline until it is complete; one-off reads parse it if it is
+already valid JSON.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Collection, Iterator
+from datetime import datetime, timezone
+from itertools import chain
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from .event_schema import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+
+# Bump when the index layout changes; older indexes are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+# Seconds follow() sleeps at the end of the file
+DEFAULT_POLL_INTERVAL = 0.25
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    PRIMARY KEY (key, offset)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class EventFilter(NamedTuple):
+    """
+    Server-side event filter; None fields match everything.
+
+    Times compare as ISO-8601 strings, so bounds are normalized to the
+    writer's UTC "+00:00" form.
+    """
+
+    event_types: frozenset[str] | None = None
+    run_id: str | None = None
+    task_id: str | None = None
+    since: str | None = None
+    until: str | None = None
+
+    @classmethod
+    def build(
+        cls,
+        event_types: Collection[EventType | str] | None = None,
+        run_id: str | None = None,
+        task_id: str | None = None,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+    ) -> "EventFilter":
+        """Normalize user-facing filter arguments."""
+        return cls(
+            (
+                frozenset(EventType(t).value for t in event_types)
+                if event_types is not None
+                else None
+            ),
+            run_id,
+            task_id,
+            _iso(since),
+            _iso(until),
+        )
+
+    def matches(self, data: dict) -> bool:
+        """Whether a decoded event line passes the filter."""
+        if self.event_types is not None and data.get("event") not in self.event_types:
+            return False
+        if self.run_id is not None and data.get("run_id") != self.run_id:
+            return False
+        if self.task_id is not None and data.get("task_id") != self.task_id:
+            return False
+        ts = data.get("ts", "")
+        if self.since is not None and ts < self.since:
+            return False
+        if self.until is not None and ts >= self.until:
+            return False
+        return True
+
+
+class EventReader:
+    """
+    Streams events from a JSONL file written by EventWriter.
+
+    Args:
+        path: Path to the JSONL file (may not exist yet).
+        use_index: Maintain the sidecar index for run_id/task_id lookups.
+            Falls back to scanning if the index can't be used.
+
+    Example:
+        >>> reader = EventReader(Path("events.jsonl"))
+        >>> for event in reader.iter_events(task_id="t-1"):
+        ...     print(event.event, event.status)
+        >>> for offset, event in reader.follow(offset=saved_offset):
+        ...     saved_offset = offset
+    """
+
+    def __init__(self, path: Path, use_index: bool = True):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.use_index = use_index
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def iter_events(
+        self,
+        event_types: Collection[EventType | str] | None = None,
+        run_id: str | None = None,
+        task_id: str | None = None,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        offset: int = 0,
+    ) -> Iterator[Event]:
+        """
+        Stream events matching all given filters, in file order.
+
+        Corrupt or incomplete lines are skipped (crash-safety).
+
+        Args:
+            event_types: Only these event types
+            run_id: Only events of this run (index lookup)
+            task_id: Only events of this task (index lookup)
+            since: Only events at or after this time
+            until: Only events before this time
+            offset: Byte offset to start from (e.g. saved from follow())
+
+        Yields:
+            Matching Event objects
+        """
+        criteria = EventFilter.build(event_types, run_id, task_id, since, until)
+        for _, event in self._iter(criteria, offset):
+            yield event
+
+    def follow(
+        self,
+        offset: int = 0,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        stop: threading.Event | None = None,
+        **filters,
+    ) -> Iterator[tuple[int, Event]]:
+        """
+        Tail the file from a byte offset, waiting for new events.
+
+        Yields each matching event with the offset just after it, so a
+        consumer can persist the offset and resume later. Continues in
+        the new file after a rotation.
+
+        Args:
+            offset: Byte offset to start from (0 = beginning)
+            poll_interval: Seconds to sleep at the end of the file
+            stop: Returns once set and the file is drained (default: never)
+            **filters: Filters as accepted by iter_events()
+
+        Yields:
+            (next offset, Event) tuples
+        """
+        criteria = EventFilter.build(**filters)
+        handle: BinaryIO | None = None
+        try:
+            while True:
+                if handle is None:
+                    handle = _open(self.path)
+                    if handle is None:
+                        if stop is not None and stop.is_set():
+                            return
+                        time.sleep(poll_interval)
+                        continue
+                    if offset > os.fstat(handle.fileno()).st_size:
+                        offset = 0  # saved offset from before a rotation
+                    handle.seek(offset)
+
+                for _, offset, data in _read_lines(handle):
+                    if criteria.matches(data):
+                        event = _to_event(data)
+                        if event is not None:
+                            yield offset, event
+
+                if _rotated(self.path, handle):
+                    handle.close()
+                    handle, offset = None, 0
+                    continue
+                if stop is not None and stop.is_set():
+                    return
+                time.sleep(poll_interval)
+        finally:
+            if handle is not None:
+                handle.close()
+
+    def end_offset(self) -> int:
+        """Byte offset of the end of the file (start here to tail new events)."""
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def reindex(self) -> None:
+        """Drop and rebuild the sidecar index."""
+        with self._lock:
+            conn = self._index()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM entries")
+                    conn.execute("DELETE FROM meta")
+                self._catch_up(conn)
+
+    def close(self) -> None:
+        """Close the index connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _iter(self, criteria: EventFilter, start: int) -> Iterator[tuple[int, Event]]:
+        """Yield (offset after the line, event) for matching events."""
+        handle = _open(self.path)
+        if handle is None:
+            return
+        with handle:
+            lookup = self._lookup(criteria, start)
+            if lookup is None:
+                lines = _read_from(handle, start)
+            else:
+                # Indexed matches, then whatever follows the indexed part
+                offsets, indexed = lookup
+                lines = chain(
+                    _read_at(handle, offsets),
+                    _read_from(handle, max(start, indexed)),
+                )
+            for _, offset, data in lines:
+                if criteria.matches(data):
+                    event = _to_event(data)
+                    if event is not None:
+                        yield offset, event
+
+    def _lookup(
+        self, criteria: EventFilter, start: int
+    ) -> tuple[list[int], int] | None:
+        """
+        Offsets of candidate lines from the index and the indexed length,
+        or None to scan.
+        """
+        keys = [
+            key
+            for key in (
+                _key("run", criteria.run_id),
+                _key("task", criteria.task_id),
+            )
+            if key is not None
+        ]
+        if not keys or not self.use_index:
+            return None
+        with self._lock:
+            conn = self._index()
+            if conn is None:
+                return None
+            try:
+                indexed = self._catch_up(conn)
+                query = " INTERSECT ".join(
+                    "SELECT offset FROM entries WHERE key = ? AND offset >= ?"
+                    for _ in keys
+                )
+                params = [value for key in keys for value in (key, start)]
+                offsets = [
+                    row[0] for row in conn.execute(f"{query} ORDER BY offset", params)
+                ]
+                return offsets, indexed
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Event index unavailable for {self.path}: {e}")
+                self._disable_index()
+                return None
+
+    def _index(self) -> sqlite3.Connection | None:
+        """Open the index on first use (caller holds the lock)."""
+        if self._conn is None and self.use_index:
+            try:
+                conn = sqlite3.connect(self.index_path, check_same_thread=False)
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version != INDEX_FORMAT_VERSION:
+                    conn.executescript(
+                        "DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS meta;"
+                    )
+                conn.executescript(_INDEX_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {INDEX_FORMAT_VERSION}")
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"Cannot open event index {self.index_path}: {e}")
+                self.use_index = False
+        return self._conn
+
+    def _disable_index(self) -> None:
+        """Stop using a failing index (caller holds the lock)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self.use_index = False
+
+    def _catch_up(self, conn: sqlite3.Connection) -> int:
+        """
+        Index lines appended since the last lookup (caller holds the lock).
+
+        Returns the indexed length of the file.
+        """
+        handle = _open(self.path)
+        if handle is None:
+            return 0
+        with handle:
+            stat = os.fstat(handle.fileno())
+            meta = dict(conn.execute("SELECT name, value FROM meta").fetchall())
+            indexed = meta.get("indexed_upto", 0)
+            if meta.get("inode") != stat.st_ino or stat.st_size < indexed:
+                # New or rotated file: start over
+                with conn:
+                    conn.execute("DELETE FROM entries")
+                indexed = 0
+            if indexed == stat.st_size and meta.get("inode") == stat.st_ino:
+                return indexed
+
+            handle.seek(indexed)
+            entries = []
+            for start, _, data in _read_lines(handle):
+                for key in (
+                    _key("run", data.get("run_id")),
+                    _key("task", data.get("task_id")),
+                ):
+                    if key is not None:
+                        entries.append((key, start))
+            # Up to the incomplete trailing line, if any
+            indexed = handle.tell()
+
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO entries (key, offset) VALUES (?, ?)",
+                    entries,
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                    [("inode", stat.st_ino), ("indexed_upto", indexed)],
+                )
+            return indexed
+
+
+def _key(kind: str, value: str | None) -> str | None:
+    """Index key of a run or task id."""
+    return f"{kind}:{value}" if value is not None else None
+
+
+def _iso(value: datetime | str | None) -> str | None:
+    """
+    Timestamp filter as an ISO string in the writer's UTC form.
+
+    Naive datetimes are taken as UTC; strings are parsed ("Z" included)
+    and converted, and compared as given if they aren't ISO 8601.
+    """
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _open(path: Path) -> BinaryIO | None:
+    """Open the event file for binary reading, or None if missing."""
+    try:
+        return open(path, "rb")
+    except FileNotFoundError:
+        return None
+
+
+def _rotated(path: Path, handle: BinaryIO) -> bool:
+    """Whether path now refers to a different file than the open handle."""
+    try:
+        return os.stat(path).st_ino != os.fstat(handle.fileno()).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _read_lines(
+    handle: BinaryIO, final: bool = False
+) -> Iterator[tuple[int, int, dict]]:
+    """
+    Decode complete lines from the current position.
+
+    Yields (line start, line end, decoded object); corrupt lines are
+    skipped. Stops before an incomplete trailing line (still being
+    written) and leaves the handle positioned at its start, unless
+    final is set: then a trailing line without a newline is decoded too
+    if it is valid JSON.
+    """
+    while True:
+        start = handle.tell()
+        line = handle.readline()
+        if not line.endswith(b"\n"):
+            data = _decode(line) if final and line else None
+            if data is not None:
+                yield start, handle.tell(), data
+            else:
+                handle.seek(start)
+            return
+        data = _decode(line)
+        if data is not None:
+            yield start, handle.tell(), data
+
+
+def _read_from(handle: BinaryIO, offset: int) -> Iterator[tuple[int, int, dict]]:
+    """Decode every line from offset to the end, trailing line included."""
+    handle.seek(offset)
+    yield from _read_lines(handle, final=True)
+
+
+def _read_at(handle: BinaryIO, offsets: list[int]) -> Iterator[tuple[int, int, dict]]:
+    """Decode the lines starting at the given offsets."""
+    for offset in offsets:
+        handle.seek(offset)
+        line = handle.readline()
+        if line.endswith(b"\n"):
+            data = _decode(line)
+            if data is not None:
+                yield offset, handle.tell(), data
+
+
+def _decode(line: bytes) -> dict | None:
+    """Decode one JSON line, or None if it is blank or corrupt."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        data = json.loads(line)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _to_event(data: dict) -> Event | None:
+    """Build an Event from a decoded line, or None if it doesn't fit."""
+    try:
+        data = dict(data)
+        data["event"] = EventType(data["event"])
+        return Event(**data)
+    except (ValueError, KeyError, TypeError):
+        return None
@@ -4,15 +4,40 @@ Append-only JSONL event writer for telemetry (ADR-047).
 Writes lifecycle and execution events to a JSONL file with fsync
 guarantee. Crash-safe: partial writes produce incomplete lines that
 are detectable on read.
+
+Group-commit mode keeps the file open and lets a flusher thread write
+the lines of concurrent emitters in batches, with one fsync per batch
+instead of one per event. emit() then returns a future that resolves
+once the event reached the requested durability level.
 """
 
+import atexit
+import logging
 import os
 import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future
+from enum import Enum
 from pathlib import Path
-from typing import Optional
 
+from .event_reader import EventReader
 from .event_schema import Event
 
+logger = logging.getLogger(__name__)
+
+# Group commit defaults: seconds a batch stays open, events per batch
+DEFAULT_BATCH_WINDOW = 0.005
+DEFAULT_BATCH_EVENTS = 256
+
+
+class Durability(str, Enum):
+    """How far an event must get before its emit() future resolves."""
+
+    FSYNC = "fsync"  # On disk: the batch was fsynced
+    WRITTEN = "written"  # Handed to the OS: survives a process crash
+    QUEUED = "queued"  # Buffered in memory: resolves immediately
+
 
 class EventWriter:
     """
@@ -21,35 +46,200 @@ class EventWriter:
     Each call to emit() appends one JSON line and calls fsync to ensure
     durability. Thread-safe via a threading lock.
 
+    With group_commit=True the file descriptor stays open and lines are
+    written by a flusher thread in batches: a batch closes after
+    batch_window seconds or batch_events events, is written with one
+    write and, if any of its events asks for Durability.FSYNC, fsynced
+    once. Batches without FSYNC events are fsynced on rotation and close().
+
     Args:
         path: Path to the JSONL file. Created if it does not exist.
         max_size_bytes: Optional maximum file size before rotation.
             When exceeded, the current file is renamed with a .1 suffix
             and a new file is started. Set to None to disable rotation.
+        group_commit: Batch concurrent events behind a persistent fd.
+        durability: Default durability of emitted events (group commit).
+        batch_window: Seconds a batch waits for more events (group commit).
+        batch_events: Events that close a batch early (group commit).
+
+    Example:
+        >>> writer = EventWriter(path, group_commit=True)
+        >>> writer.emit(event)  # returns once queued
+        >>> writer.emit(event, Durability.FSYNC).result()  # wait until on disk
+        >>> writer.close()  # drains and fsyncs (also registered atexit)
     """
 
-    def __init__(self, path: Path, max_size_bytes: Optional[int] = None):
+    def __init__(
+        self,
+        path: Path,
+        max_size_bytes: int | None = None,
+        group_commit: bool = False,
+        durability: Durability = Durability.FSYNC,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        batch_events: int = DEFAULT_BATCH_EVENTS,
+    ):
         self.path = Path(path)
         self.max_size_bytes = max_size_bytes
         self._lock = threading.Lock()
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
-    def emit(self, event: Event) -> None:
+        self.reader = EventReader(self.path)
+
+        self.group_commit = group_commit
+        self.durability = Durability(durability)
+        self.batch_window = batch_window
+        self.batch_events = batch_events
+
+        # Group commit: pending (line, future, needs fsync) entries, guarded
+        # by _pending_cond; the fd is only used by the flusher thread
+        self._pending_cond = threading.Condition()
+        self._pending: list[tuple[bytes, Future, bool]] = []
+        self._emitted = 0
+        self._committed = 0
+        self._batch_opened = 0.0
+        self._closing = False
+        self._fd: int | None = None
+        self._flusher: threading.Thread | None = None
+        if group_commit:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="event-writer", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(self.close)
+
+    def emit(self, event: Event, durability: Durability | None = None) -> Future:
         """
         Append event as a single JSON line with fsync.
 
+        In group-commit mode the line is queued for the next batch and the
+        returned future resolves once the event reached ``durability``
+        (default: the writer's). Call ``.result()`` to wait for it.
+
         Args:
             event: Event dataclass to write.
+            durability: Durability level for this event (group commit).
+
+        Returns:
+            Future resolving to None once the event is durable enough
+            (already resolved outside group-commit mode).
         """
-        line = event.to_json() + "\n"
+        line = (event.to_json() + "\n").encode("utf-8")
+        ack: Future = Future()
+        level = Durability(durability or self.durability)
+        flusher = self._flusher
+        if flusher is not None and flusher.is_alive():
+            with self._pending_cond:
+                if not self._closing:
+                    if not self._pending:
+                        self._batch_opened = time.monotonic()
+                    self._pending.append((line, ack, level is Durability.FSYNC))
+                    self._emitted += 1
+                    self._pending_cond.notify_all()
+                    if level is Durability.QUEUED:
+                        ack.set_result(None)
+                    return ack
+
+        # Synchronous: one fsynced write per event
         with self._lock:
             self._maybe_rotate()
             fd = os.open(str(self.path), os.O_WRONLY | os.O_CREAT | os.O_APPEND)
             try:
-                os.write(fd, line.encode("utf-8"))
+                os.write(fd, line)
                 os.fsync(fd)
             finally:
                 os.close(fd)
+        ack.set_result(None)
+        return ack
+
+    def flush(self) -> None:
+        """Block until every event emitted so far is written (group commit)."""
+        with self._pending_cond:
+            target = self._emitted
+            self._batch_opened = 0.0  # close the open batch now
+            self._pending_cond.notify_all()
+            flusher = self._flusher
+            while self._committed < target and flusher and flusher.is_alive():
+                self._pending_cond.wait(0.1)
+
+    def close(self) -> None:
+        """Write and fsync all pending events, then stop the flusher."""
+        flusher = self._flusher
+        if flusher is None:
+            return
+        atexit.unregister(self.close)
+        with self._pending_cond:
+            self._closing = True
+            self._pending_cond.notify()
+        flusher.join()
+        self._flusher = None
+
+    def __enter__(self) -> "EventWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _flush_loop(self) -> None:
+        """Flusher thread: collect batches and write each with one syscall."""
+        try:
+            while True:
+                with self._pending_cond:
+                    while not self._pending and not self._closing:
+                        self._pending_cond.wait()
+                    if not self._pending:
+                        return
+                    while len(self._pending) < self.batch_events and not self._closing:
+                        remaining = (
+                            self._batch_opened + self.batch_window - time.monotonic()
+                        )
+                        if remaining <= 0:
+                            break
+                        self._pending_cond.wait(remaining)
+                    batch, self._pending = self._pending, []
+                try:
+                    self._commit(batch)
+                except Exception as e:
+                    logger.error(f"Event writer batch for {self.path} failed: {e}")
+                    _fail(batch, e)
+                with self._pending_cond:
+                    self._committed += len(batch)
+                    self._pending_cond.notify_all()
+        finally:
+            # Later emits write synchronously; fail whatever is still queued
+            with self._pending_cond:
+                self._closing = True
+                stranded, self._pending = self._pending, []
+                self._committed += len(stranded)
+                self._pending_cond.notify_all()
+            _fail(stranded, RuntimeError(f"Event writer for {self.path} stopped"))
+            if self._fd is not None:
+                try:
+                    os.fsync(self._fd)
+                finally:
+                    os.close(self._fd)
+                    self._fd = None
+
+    def _commit(self, batch: list[tuple[bytes, Future, bool]]) -> None:
+        """Write one batch (fsync if requested) and resolve its futures."""
+        try:
+            with self._lock:
+                self._maybe_rotate()
+                if self._fd is None:
+                    self._fd = os.open(
+                        str(self.path), os.O_WRONLY | os.O_CREAT | os.O_APPEND
+                    )
+                data = memoryview(b"".join(line for line, _, _ in batch))
+                while data:
+                    data = data[os.write(self._fd, data) :]
+                if any(needs_fsync for _, _, needs_fsync in batch):
+                    os.fsync(self._fd)
+        except OSError as e:
+            logger.error(f"Failed to write {len(batch)} events to {self.path}: {e}")
+            _fail(batch, e)
+            return
+        for _, ack, _ in batch:
+            if not ack.done():
+                ack.set_result(None)
 
     def _maybe_rotate(self) -> None:
         """Rotate file if max_size_bytes is set and exceeded."""
@@ -58,6 +248,11 @@ class EventWriter:
         if not self.path.exists():
             return
         if self.path.stat().st_size >= self.max_size_bytes:
+            if self._fd is not None:
+                # Group commit: make the old file durable before moving on
+                os.fsync(self._fd)
+                os.close(self._fd)
+                self._fd = None
             rotated = self.path.with_suffix(self.path.suffix + ".1")
             self.path.rename(rotated)
 
@@ -65,22 +260,34 @@ class EventWriter:
         """
         Read all valid events from the JSONL file.
 
-        Skips incomplete or corrupt lines (crash-safety).
+        Skips incomplete or corrupt lines (crash-safety). Prefer
+        iter_events() for large files or filtered lookups.
 
         Returns:
             List of successfully parsed Event objects.
         """
-        events = []
-        if not self.path.exists():
-            return events
-        with open(self.path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    events.append(Event.from_json(line))
-                except (ValueError, KeyError, TypeError):
-                    # Skip corrupt/incomplete lines (crash-safety)
-                    continue
-        return events
+        return list(self.iter_events())
+
+    def iter_events(self, **filters) -> Iterator[Event]:
+        """
+        Stream events from the JSONL file, filtered while reading.
+
+        Pending group-commit events are written right away, when this is
+        called rather than when the returned iterator is first advanced.
+        run_id/task_id lookups use the sidecar index (see EventReader).
+
+        Args:
+            **filters: event_types, run_id, task_id, since, until, offset
+
+        Returns:
+            Iterator over matching Event objects in file order.
+        """
+        self.flush()
+        return self.reader.iter_events(**filters)
+
+
+def _fail(batch: list[tuple[bytes, Future, bool]], error: BaseException) -> None:
+    """Fail the futures of events that could not be written."""
+    for _, ack, _ in batch:
+        if not ack.done():
+            ack.set_exception(error)
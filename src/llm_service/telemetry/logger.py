@@ -10,14 +10,56 @@ Provides SQLite-backed logging of LLM invocations with:
 - Daily cost aggregation
 
 Thread-safe for concurrent invocations.
+
+In background mode records are queued and written by a single writer
+thread, in batches of one transaction each (WAL, synchronous=NORMAL), so
+log_invocation() costs the caller a queue put rather than a commit.
 """
 
+import atexit
+import logging
+import queue
 import sqlite3
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .retention import RetentionEngine, RetentionPolicy
+
+logger = logging.getLogger(__name__)
+
+# Background writer defaults: records per transaction, seconds a partial
+# batch may wait, and records queued before new ones are dropped
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 0.25
+DEFAULT_QUEUE_SIZE = 10_000
+
+_INSERT_INVOCATION = """
+    INSERT INTO invocations (
+        invocation_id, timestamp, agent_name, tool_name, model_name,
+        prompt_tokens, completion_tokens, total_tokens, cost_usd,
+        latency_ms, status, error_message, privacy_level
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_DAILY_COSTS = """
+    INSERT INTO daily_costs (
+        date, agent_name, tool_name, model_name,
+        invocations, total_tokens, total_cost_usd
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date, agent_name, tool_name, model_name) DO UPDATE SET
+        invocations = invocations + excluded.invocations,
+        total_tokens = total_tokens + excluded.total_tokens,
+        total_cost_usd = total_cost_usd + excluded.total_cost_usd
+"""
+
+# Queue markers: write the pending batch now / and then stop the writer
+_FLUSH = object()
+_STOP = object()
+_MARKERS = (_FLUSH, _STOP)
+
 
 @dataclass
 class InvocationRecord:
@@ -81,15 +123,41 @@ class TelemetryLogger:
         ...     status="success"
         ... )
         >>> logger.log_invocation(record)
+
+    Background mode:
+        >>> logger = TelemetryLogger(Path("telemetry.db"), background=True)
+        >>> logger.log_invocation(record)  # queued, returns immediately
+        >>> logger.close()  # drains the queue (also registered atexit)
+
+    With a RetentionPolicy, the background writer also rolls up, prunes
+    and compacts the database every retention_interval seconds.
     """
 
-    def __init__(self, db_path: Path, privacy_level: str = "metadata"):
+    def __init__(
+        self,
+        db_path: Path,
+        privacy_level: str = "metadata",
+        background: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        retention: RetentionPolicy | None = None,
+        retention_interval: float | None = None,
+    ):
         """
         Initialize telemetry logger.
 
         Args:
             db_path: Path to SQLite database file
             privacy_level: Default privacy level (metadata, full, none)
+            background: Queue records for a background writer thread
+            batch_size: Maximum records written per transaction (background)
+            flush_interval: Seconds a partial batch waits for more records
+                (background)
+            max_queue: Records queued before new ones are dropped (background)
+            retention: Retention policy applied between batches (background)
+            retention_interval: Seconds between retention runs (background;
+                defaults to the policy's interval_hours)
         """
         self.db_path = Path(db_path)
         self.privacy_level = privacy_level
@@ -101,6 +169,24 @@ class TelemetryLogger:
         # Initialize schema
         self._ensure_schema()
 
+        self.background = background
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped_records = 0
+        self.retention = retention
+        if retention_interval is None and retention is not None:
+            retention_interval = retention.interval_hours * 3600
+        self.retention_interval = retention_interval
+        self._retention_due = time.monotonic()
+        self._queue: queue.Queue = queue.Queue(max_queue)
+        self._writer: threading.Thread | None = None
+        if background:
+            self._writer = threading.Thread(
+                target=self._write_loop, name="telemetry-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
+
     def _ensure_schema(self):
         """Initialize database schema if not exists."""
         schema_path = Path(__file__).parent / "schema.sql"
@@ -116,47 +202,38 @@ class TelemetryLogger:
 
         with sqlite3.connect(self.db_path, detect_types=0) as conn:
             conn.executescript(schema)
+            # Persistent: dashboard readers no longer block this writer
+            conn.execute("PRAGMA journal_mode = WAL")
 
     def log_invocation(self, record: InvocationRecord):
         """
         Log an invocation to the database.
 
+        In background mode the record is queued and written later; if the
+        queue is full it is dropped and counted in ``dropped_records``.
+
         Args:
             record: InvocationRecord with invocation details
 
         Raises:
             sqlite3.IntegrityError: If invocation_id already exists
+                (synchronous mode only; the background writer logs it)
         """
+        # Use record timestamp or current time
+        timestamp = record.timestamp or datetime.now(timezone.utc)
+
+        if self._writer is not None:
+            try:
+                self._queue.put_nowait((record, timestamp))
+            except queue.Full:
+                with self._lock:
+                    self.dropped_records += 1
+            return
+
         with self._lock:
             with sqlite3.connect(self.db_path, detect_types=0) as conn:
-                # Use record timestamp or current time
-                timestamp = record.timestamp or datetime.now(timezone.utc)
-
                 # Insert invocation (convert datetime to ISO format string)
-                conn.execute(
-                    """
-                    INSERT INTO invocations (
-                        invocation_id, timestamp, agent_name, tool_name, model_name,
-                        prompt_tokens, completion_tokens, total_tokens, cost_usd,
-                        latency_ms, status, error_message, privacy_level
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        record.invocation_id,
-                        timestamp.isoformat(),
-                        record.agent_name,
-                        record.tool_name,
-                        record.model_name,
-                        record.prompt_tokens,
-                        record.completion_tokens,
-                        record.total_tokens,
-                        record.cost_usd,
-                        record.latency_ms,
-                        record.status,
-                        record.error_message,
-                        record.privacy_level,
-                    ),
-                )
+                conn.execute(_INSERT_INVOCATION, _invocation_row(record, timestamp))
 
                 # Update daily aggregates
                 self._update_daily_costs(conn, record, timestamp)
@@ -172,31 +249,148 @@ class TelemetryLogger:
             record: InvocationRecord being logged
             timestamp: Timestamp for the invocation
         """
-        date = timestamp.date()
-
         # Use INSERT OR REPLACE pattern for SQLite (UPSERT)
-        # Convert date to ISO format string to avoid deprecated adapter
         conn.execute(
-            """
-            INSERT INTO daily_costs (
-                date, agent_name, tool_name, model_name,
-                invocations, total_tokens, total_cost_usd
-            ) VALUES (?, ?, ?, ?, 1, ?, ?)
-            ON CONFLICT(date, agent_name, tool_name, model_name) DO UPDATE SET
-                invocations = invocations + 1,
-                total_tokens = total_tokens + ?,
-                total_cost_usd = total_cost_usd + ?
-        """,
-            (
-                date.isoformat(),
-                record.agent_name,
-                record.tool_name,
-                record.model_name,
-                record.total_tokens,
-                record.cost_usd,
-                record.total_tokens,
-                record.cost_usd,
-            ),
+            _UPSERT_DAILY_COSTS,
+            (*_daily_key(record, timestamp), 1, record.total_tokens, record.cost_usd),
+        )
+
+    def flush(self) -> None:
+        """Block until every queued record has been written (background)."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self) -> None:
+        """
+        Write all queued records and stop the background writer.
+
+        Safe to call more than once; records logged afterwards are written
+        synchronously.
+        """
+        writer = self._writer
+        if writer is None:
+            return
+        self._writer = None
+        atexit.unregister(self.close)
+        if writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join()
+
+        # Records that raced past the stop marker are written here
+        leftovers = []
+        while True:
+            try:
+                leftovers.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        records = [item for item in leftovers if item not in _MARKERS]
+        if records:
+            conn = sqlite3.connect(self.db_path, detect_types=0)
+            try:
+                self._write_batch(conn, records)
+            finally:
+                conn.close()
+
+    def __enter__(self) -> "TelemetryLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write_loop(self) -> None:
+        """Background writer: collect batches and write each in one transaction."""
+        conn = sqlite3.connect(self.db_path, detect_types=0)
+        # Durable at checkpoints; a crash may lose only the last commits
+        conn.execute("PRAGMA synchronous = NORMAL")
+        try:
+            stopping = False
+            while not stopping:
+                batch = [self._next_item()]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size and batch[-1] not in _MARKERS:
+                    timeout = deadline - time.monotonic()
+                    try:
+                        batch.append(
+                            self._queue.get(timeout=timeout)
+                            if timeout > 0
+                            else self._queue.get_nowait()
+                        )
+                    except queue.Empty:
+                        break
+                if batch[-1] is _STOP:
+                    stopping = True
+                records = [item for item in batch if item not in _MARKERS]
+                try:
+                    if records:
+                        self._write_batch(conn, records)
+                except Exception as e:
+                    logger.error(f"Dropping {len(records)} telemetry records: {e}")
+                    with self._lock:
+                        self.dropped_records += len(records)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            conn.close()
+
+    def _next_item(self):
+        """Wait for the next queued item, running retention while idle."""
+        while True:
+            if self.retention is None:
+                return self._queue.get()
+            wait = self._retention_due - time.monotonic()
+            if wait > 0:
+                try:
+                    return self._queue.get(timeout=wait)
+                except queue.Empty:
+                    continue
+            try:
+                RetentionEngine(self.db_path, self.retention).run()
+            except Exception as e:
+                logger.error(f"Telemetry retention failed: {e}")
+            self._retention_due = time.monotonic() + self.retention_interval
+
+    def _write_batch(
+        self, conn: sqlite3.Connection, records: list[tuple[InvocationRecord, datetime]]
+    ) -> None:
+        """
+        Write queued records in one transaction.
+
+        If the batch fails (e.g. a duplicate invocation_id) it is retried
+        record by record so only the offending records are lost.
+        """
+        try:
+            with conn:
+                self._insert_records(conn, records)
+            return
+        except sqlite3.Error as e:
+            if len(records) == 1:
+                record = records[0][0]
+                logger.error(f"Dropping invocation {record.invocation_id}: {e}")
+                with self._lock:
+                    self.dropped_records += 1
+                return
+        for item in records:
+            self._write_batch(conn, [item])
+
+    @staticmethod
+    def _insert_records(
+        conn: sqlite3.Connection, records: list[tuple[InvocationRecord, datetime]]
+    ) -> None:
+        """Insert invocations and their summed daily aggregates (caller commits)."""
+        conn.executemany(
+            _INSERT_INVOCATION,
+            [_invocation_row(record, timestamp) for record, timestamp in records],
+        )
+        totals: dict[tuple, list] = {}
+        for record, timestamp in records:
+            total = totals.setdefault(_daily_key(record, timestamp), [0, 0, 0.0])
+            total[0] += 1
+            total[1] += record.total_tokens
+            total[2] += record.cost_usd
+        conn.executemany(
+            _UPSERT_DAILY_COSTS, [(*key, *total) for key, total in totals.items()]
         )
 
     def get_daily_costs(self, start_date=None, end_date=None, agent_name=None):
@@ -211,6 +405,7 @@ class TelemetryLogger:
         Returns:
             List of daily cost records as dictionaries
         """
+        self.flush()
         with sqlite3.connect(self.db_path, detect_types=0) as conn:
             conn.row_factory = sqlite3.Row
 
@@ -265,6 +460,7 @@ class TelemetryLogger:
         Returns:
             List of invocation records as dictionaries
         """
+        self.flush()
         with sqlite3.connect(self.db_path, detect_types=0) as conn:
             conn.row_factory = sqlite3.Row
 
@@ -322,6 +518,7 @@ class TelemetryLogger:
             - avg_latency_ms
             - error_count
         """
+        self.flush()
         with sqlite3.connect(self.db_path, detect_types=0) as conn:
             query = """
                 SELECT
@@ -351,3 +548,32 @@ class TelemetryLogger:
                 "avg_latency_ms": row[4] or 0.0,
                 "error_count": row[5] or 0,
             }
+
+
+def _invocation_row(record: InvocationRecord, timestamp: datetime) -> tuple:
+    """Parameters for _INSERT_INVOCATION."""
+    return (
+        record.invocation_id,
+        timestamp.isoformat(),
+        record.agent_name,
+        record.tool_name,
+        record.model_name,
+        record.prompt_tokens,
+        record.completion_tokens,
+        record.total_tokens,
+        record.cost_usd,
+        record.latency_ms,
+        record.status,
+        record.error_message,
+        record.privacy_level,
+    )
+
+
+def _daily_key(record: InvocationRecord, timestamp: datetime) -> tuple:
+    """daily_costs primary key of a record (date as ISO string)."""
+    return (
+        timestamp.date().isoformat(),
+        record.agent_name,
+        record.tool_name,
+        record.model_name,
+    )
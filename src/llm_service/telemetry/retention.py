@@ -0,0 +1,388 @@
+"""
+Telemetry retention: downsampling, pruning and compaction.
+
+Keeps telemetry.db bounded under sustained traffic:
+- Raw invocations are rolled up into hourly and daily usage aggregates
+  (tokens, cost, latency sum/max and a latency histogram)
+- Raw rows past the raw horizon are deleted once rolled up, as are
+  rollups past their own horizons
+- Freed pages are returned to the file system with incremental VACUUM
+  (databases created before incremental auto-vacuum need a one-time
+  convert_to_incremental() maintenance step first)
+
+Roll-up is incremental: a watermark remembers the last rolled-up
+invocation id, so every run only reads new rows and each invocation is
+counted exactly once (late arrivals are added to their own buckets).
+
+Example:
+    >>> policy = RetentionPolicy.from_config(config)
+    >>> report = RetentionEngine(config.get_db_path(), policy).run()
+"""
+
+import json
+import logging
+import sqlite3
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from llm_service.config.schemas import TelemetryConfig
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (inclusive) of the latency histogram buckets; one extra
+# bucket counts everything slower
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10_000, 30_000, 60_000)
+
+# Raw rows read per roll-up query
+ROLLUP_BATCH_SIZE = 5000
+
+SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+_WATERMARK = "rollup_watermark"
+
+_UPSERT_USAGE = """
+    INSERT INTO {table} (
+        {period}, agent_name, tool_name, model_name, status, invocations,
+        prompt_tokens, completion_tokens, total_tokens, total_cost_usd,
+        total_latency_ms, max_latency_ms, latency_histogram
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT({period}, agent_name, tool_name, model_name, status) DO UPDATE SET
+        invocations = invocations + excluded.invocations,
+        prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+        completion_tokens = completion_tokens + excluded.completion_tokens,
+        total_tokens = total_tokens + excluded.total_tokens,
+        total_cost_usd = total_cost_usd + excluded.total_cost_usd,
+        total_latency_ms = total_latency_ms + excluded.total_latency_ms,
+        max_latency_ms = MAX(max_latency_ms, excluded.max_latency_ms),
+        latency_histogram = excluded.latency_histogram
+"""
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    How long each level of detail is kept.
+
+    Attributes:
+        raw_days: Days of raw invocations kept (0 = keep forever)
+        hourly_days: Days of hourly rollups kept (0 = keep forever)
+        daily_days: Days of daily rollups, including daily_costs, kept
+            (0 = keep forever)
+        vacuum_pages: Free pages released per run (0 = release all)
+        interval_hours: Hours between runs of the TelemetryLogger
+            background writer
+    """
+
+    raw_days: int = 30
+    hourly_days: int = 90
+    daily_days: int = 0
+    vacuum_pages: int = 1000
+    interval_hours: float = 1.0
+
+    @classmethod
+    def from_config(cls, config: "TelemetryConfig") -> "RetentionPolicy":
+        """Build the policy from telemetry configuration."""
+        return cls(
+            raw_days=config.retention_days,
+            hourly_days=config.hourly_retention_days,
+            daily_days=config.daily_retention_days,
+            vacuum_pages=config.vacuum_pages,
+            interval_hours=config.retention_interval_hours,
+        )
+
+
+@dataclass
+class RetentionReport:
+    """
+    Outcome of one retention run.
+
+    Attributes:
+        rolled_up: Raw invocations added to the rollups
+        pruned_invocations: Raw invocations deleted
+        pruned_hourly: Hourly rollup rows deleted
+        pruned_daily: Daily rollup rows deleted (usage_daily and daily_costs)
+        freed_pages: Pages released by incremental vacuum
+    """
+
+    rolled_up: int = 0
+    pruned_invocations: int = 0
+    pruned_hourly: int = 0
+    pruned_daily: int = 0
+    freed_pages: int = 0
+
+
+class RetentionEngine:
+    """
+    Applies a RetentionPolicy to a telemetry database.
+
+    Safe to run while TelemetryLogger writes: each step is its own short
+    transaction, and raw rows are only deleted after they were rolled up.
+    """
+
+    def __init__(self, db_path: str | Path, policy: RetentionPolicy | None = None):
+        """
+        Initialize retention engine.
+
+        Args:
+            db_path: Path to SQLite telemetry database (missing tables are created)
+            policy: Retention policy (defaults to RetentionPolicy())
+        """
+        self.db_path = Path(db_path)
+        self.policy = policy or RetentionPolicy()
+
+    def run(self, now: datetime | None = None) -> RetentionReport:
+        """
+        Roll up new invocations, prune expired data and compact the file.
+
+        Args:
+            now: Reference time for the horizons (defaults to now, UTC)
+
+        Returns:
+            RetentionReport with what was done
+        """
+        now = now or datetime.now(timezone.utc)
+        report = RetentionReport()
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            # Adds the rollup tables to databases created before them
+            conn.executescript(SCHEMA_PATH.read_text())
+            report.rolled_up = self.roll_up(conn)
+            self.prune(conn, now, report)
+            report.freed_pages = self.vacuum(conn)
+        finally:
+            conn.close()
+        logger.info(
+            f"Telemetry retention: rolled up {report.rolled_up}, pruned "
+            f"{report.pruned_invocations} invocations, {report.pruned_hourly} "
+            f"hourly and {report.pruned_daily} daily rows, freed "
+            f"{report.freed_pages} pages"
+        )
+        return report
+
+    def roll_up(self, conn: sqlite3.Connection) -> int:
+        """
+        Add invocations past the watermark to the hourly and daily rollups.
+
+        Args:
+            conn: Connection in autocommit mode
+
+        Returns:
+            Number of invocations rolled up
+        """
+        rolled_up = 0
+        while True:
+            with _transaction(conn):
+                rows = conn.execute(
+                    """
+                    SELECT id, timestamp, agent_name, tool_name, model_name,
+                        status, prompt_tokens, completion_tokens, total_tokens,
+                        cost_usd, latency_ms
+                    FROM invocations
+                    WHERE id > ?
+                    ORDER BY id
+                    LIMIT ?
+                """,
+                    (_get_state(conn, _WATERMARK), ROLLUP_BATCH_SIZE),
+                ).fetchall()
+                if rows:
+                    hourly, daily = _aggregate(rows)
+                    _merge(conn, "usage_hourly", "hour", hourly)
+                    _merge(conn, "usage_daily", "date", daily)
+                    _set_state(conn, _WATERMARK, rows[-1][0])
+            rolled_up += len(rows)
+            if len(rows) < ROLLUP_BATCH_SIZE:
+                return rolled_up
+
+    def prune(
+        self, conn: sqlite3.Connection, now: datetime, report: RetentionReport
+    ) -> None:
+        """
+        Delete rolled-up raw rows and rollups past their horizons.
+
+        Args:
+            conn: Connection in autocommit mode
+            now: Reference time for the horizons
+            report: Report updated with the deleted row counts
+        """
+        policy = self.policy
+        with _transaction(conn):
+            if policy.raw_days:
+                report.pruned_invocations = conn.execute(
+                    "DELETE FROM invocations WHERE timestamp < ? AND id <= ?",
+                    (_horizon(now, policy.raw_days), _get_state(conn, _WATERMARK)),
+                ).rowcount
+            if policy.hourly_days:
+                report.pruned_hourly = conn.execute(
+                    "DELETE FROM usage_hourly WHERE hour < ?",
+                    (_horizon(now, policy.hourly_days),),
+                ).rowcount
+            if policy.daily_days:
+                horizon = _horizon(now, policy.daily_days)
+                report.pruned_daily = (
+                    conn.execute(
+                        "DELETE FROM usage_daily WHERE date < ?", (horizon,)
+                    ).rowcount
+                    + conn.execute(
+                        "DELETE FROM daily_costs WHERE date < ?", (horizon,)
+                    ).rowcount
+                )
+
+    def vacuum(self, conn: sqlite3.Connection) -> int:
+        """
+        Release free pages to the file system.
+
+        Databases created before incremental auto-vacuum are left alone
+        (see convert_to_incremental()).
+
+        Args:
+            conn: Connection in autocommit mode
+
+        Returns:
+            Number of pages released
+        """
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            logger.warning(
+                f"{self.db_path} does not use incremental auto-vacuum; free "
+                "pages are kept until RetentionEngine.convert_to_incremental() "
+                "is run"
+            )
+            return 0
+
+        free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        pages = self.policy.vacuum_pages or free
+        conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+        return free - conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+    def convert_to_incremental(self) -> int:
+        """
+        Switch a database to incremental auto-vacuum with a full VACUUM.
+
+        A maintenance step for databases created before incremental
+        auto-vacuum: the VACUUM rewrites the whole file and blocks writers
+        until it is done, so run it while no TelemetryLogger is writing.
+        Does nothing if the database is already incremental.
+
+        Returns:
+            Number of pages released
+
+        Raises:
+            sqlite3.OperationalError: If the database is busy
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return 0
+            logger.info(f"Enabling incremental auto-vacuum for {self.db_path}")
+            before = conn.execute("PRAGMA page_count").fetchone()[0]
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            return before - conn.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            conn.close()
+
+
+def latency_bucket(latency_ms: int) -> int:
+    """Index of the LATENCY_BUCKETS_MS histogram bucket for a latency."""
+    return bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+
+
+def _aggregate(rows: list[tuple]) -> tuple[dict, dict]:
+    """Aggregate raw rows per hour and per day (same keys, bar the period)."""
+    hourly: dict[tuple, list] = {}
+    daily: dict[tuple, list] = {}
+    for (
+        _,
+        timestamp,
+        agent,
+        tool,
+        model,
+        status,
+        prompt,
+        completion,
+        tokens,
+        cost,
+        latency,
+    ) in rows:
+        timestamp = str(timestamp)
+        date = timestamp[:10]
+        hour = f"{date} {timestamp[11:13] or '00'}"
+        latency = latency or 0
+        for totals, period in ((hourly, hour), (daily, date)):
+            key = (period, agent or "", tool, model, status)
+            total = totals.get(key)
+            if total is None:
+                total = totals[key] = [0, 0, 0, 0, 0.0, 0, 0, _empty_histogram()]
+            total[0] += 1
+            total[1] += prompt or 0
+            total[2] += completion or 0
+            total[3] += tokens or 0
+            total[4] += cost or 0.0
+            total[5] += latency
+            total[6] = max(total[6], latency)
+            total[7][latency_bucket(latency)] += 1
+    return hourly, daily
+
+
+def _merge(conn: sqlite3.Connection, table: str, period: str, totals: dict) -> None:
+    """Upsert aggregated totals, adding histograms to the stored ones."""
+    for key, total in totals.items():
+        stored = conn.execute(
+            f"""
+            SELECT latency_histogram FROM {table}
+            WHERE {period} = ? AND agent_name = ? AND tool_name = ?
+                AND model_name = ? AND status = ?
+        """,
+            key,
+        ).fetchone()
+        if stored is not None:
+            previous = json.loads(stored[0])
+            total[7] = [a + b for a, b in zip(total[7], previous, strict=False)]
+    conn.executemany(
+        _UPSERT_USAGE.format(table=table, period=period),
+        [(*key, *total[:7], json.dumps(total[7])) for key, total in totals.items()],
+    )
+
+
+def _empty_histogram() -> list[int]:
+    """Histogram with one count per bucket plus the overflow bucket."""
+    return [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+
+def _horizon(now: datetime, days: int) -> str:
+    """ISO date before which data is expired (compares with any timestamp)."""
+    return (now - timedelta(days=days)).date().isoformat()
+
+
+def _get_state(conn: sqlite3.Connection, name: str) -> int:
+    """Read a retention_state value (0 if unset)."""
+    row = conn.execute(
+        "SELECT value FROM retention_state WHERE name = ?", (name,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _set_state(conn: sqlite3.Connection, name: str, value: int) -> None:
+    """Write a retention_state value."""
+    conn.execute(
+        "INSERT INTO retention_state (name, value) VALUES (?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+        (name, value),
+    )
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Explicit write transaction on an autocommit connection."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
@@ -1,7 +1,12 @@
 -- SQLite Schema for LLM Service Telemetry
--- Version: 1.0.0
+-- Version: 1.1.0
 -- Purpose: Track LLM invocations, costs, and performance metrics
 
+-- Free pages are released by the retention engine (incremental vacuum).
+-- Only takes effect on new databases; existing ones keep their mode until
+-- RetentionEngine.convert_to_incremental() runs (a one-off, blocking VACUUM).
+PRAGMA auto_vacuum = INCREMENTAL;
+
 -- ============================================================================
 -- Invocations Table
 -- ============================================================================
@@ -42,6 +47,54 @@ CREATE TABLE IF NOT EXISTS daily_costs (
     PRIMARY KEY (date, agent_name, tool_name, model_name)
 );
 
+-- ============================================================================
+-- Usage Rollup Tables
+-- ============================================================================
+-- Hourly and daily aggregates maintained by the retention engine
+-- (retention.py), which prunes raw invocations once they are rolled up.
+-- agent_name is '' for invocations without an agent. latency_histogram is
+-- a JSON array of counts per LATENCY_BUCKETS_MS bucket (last: overflow).
+
+CREATE TABLE IF NOT EXISTS usage_hourly (
+    hour TEXT NOT NULL,                      -- 'YYYY-MM-DD HH' (UTC)
+    agent_name TEXT NOT NULL DEFAULT '',
+    tool_name TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    invocations INTEGER DEFAULT 0,
+    prompt_tokens INTEGER DEFAULT 0,
+    completion_tokens INTEGER DEFAULT 0,
+    total_tokens INTEGER DEFAULT 0,
+    total_cost_usd REAL DEFAULT 0.0,
+    total_latency_ms INTEGER DEFAULT 0,
+    max_latency_ms INTEGER DEFAULT 0,
+    latency_histogram TEXT NOT NULL,
+    PRIMARY KEY (hour, agent_name, tool_name, model_name, status)
+);
+
+CREATE TABLE IF NOT EXISTS usage_daily (
+    date TEXT NOT NULL,                      -- 'YYYY-MM-DD' (UTC)
+    agent_name TEXT NOT NULL DEFAULT '',
+    tool_name TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    invocations INTEGER DEFAULT 0,
+    prompt_tokens INTEGER DEFAULT 0,
+    completion_tokens INTEGER DEFAULT 0,
+    total_tokens INTEGER DEFAULT 0,
+    total_cost_usd REAL DEFAULT 0.0,
+    total_latency_ms INTEGER DEFAULT 0,
+    max_latency_ms INTEGER DEFAULT 0,
+    latency_histogram TEXT NOT NULL,
+    PRIMARY KEY (date, agent_name, tool_name, model_name, status)
+);
+
+-- Retention bookkeeping (e.g. id of the last rolled-up invocation)
+CREATE TABLE IF NOT EXISTS retention_state (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
 -- ============================================================================
 -- Indexes for Query Performance
 -- ============================================================================
@@ -83,3 +136,6 @@ CREATE TABLE IF NOT EXISTS schema_version (
 
 INSERT OR IGNORE INTO schema_version (version, description)
 VALUES ('1.0.0', 'Initial telemetry schema with invocations and daily_costs tables');
+
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES ('1.1.0', 'Hourly and daily usage rollups with latency histograms');
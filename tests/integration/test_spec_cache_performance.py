@@ -31,6 +31,7 @@ import statistics
 import time
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -334,6 +335,51 @@ class TestInitialLoadPerformance:
         ), f"Max incremental load: {max_incremental*1000:.0f}ms, expected <300ms"
 
 
+class TestWarmStartPerformance:
+    """
+    Performance tests for restarts served from the on-disk store.
+
+    Requirements:
+    - Warm start of a large portfolio (5,000 specs) well under 2 seconds
+    - No specification is re-parsed when nothing changed
+    """
+
+    def test_warm_start_5000_specs_from_store(
+        self, spec_directory: Path, create_spec_file, tmp_path: Path
+    ):
+        """
+        Warm start: 5,000 stored specs preload in under a second.
+
+        GIVEN 5,000 specifications already parsed into the on-disk store
+        WHEN a new SpecificationCache (a dashboard restart) preloads them
+        THEN all specs are loaded without parsing within 1 second
+        """
+        for i in range(5000):
+            create_spec_file(
+                f"spec-{i:04d}.md",
+                f"SPEC-WARM-{i:04d}",
+                f"Warm Start Specification {i}",
+                f"Initiative-{i % 25}",
+            )
+        store_path = tmp_path / "cache" / "specs.db"
+        SpecificationCache(str(spec_directory), store_path=store_path).preload_all()
+        gc.collect()
+
+        cache = SpecificationCache(str(spec_directory), store_path=store_path)
+        with patch.object(
+            SpecificationCache,
+            "_parse_many",
+            side_effect=AssertionError("warm start re-parsed specifications"),
+        ):
+            start_time = time.perf_counter()
+            cache.preload_all()
+            elapsed = time.perf_counter() - start_time
+
+        assert len(cache.cache) == 5000
+        print(f"\nWarm start: 5000 specs = {elapsed:.3f}s")
+        assert elapsed < 1.0, f"Warm start took {elapsed:.3f}s, expected <1.0s"
+
+
 # ============================================================================
 # Performance Test: Cached Reads (NFR-P2)
 # ============================================================================
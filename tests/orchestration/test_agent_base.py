@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for agent_base.py Module
+
+Tests AgentBase task processing:
+- Per-thread task state (current_task, artifacts_created)
+- Concurrent execution with max_concurrency
+- Result and error blocks written for pooled tasks
+- Continuous mode wake-ups (file notifications, adaptive polling)
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+# Add orchestration directory to path for imports
+sys.path.insert(
+    0, str(Path(__file__).parent.parent.parent / "src" / "framework" / "orchestration")
+)
+
+import agent_base
+from agent_base import AgentBase
+
+from src.domain.collaboration import task_index, task_loader
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+class BarrierAgent(AgentBase):
+    """Agent whose tasks only finish once `parties` of them run at once."""
+
+    def __init__(self, parties: int, **kwargs: Any):
+        super().__init__(agent_name="test-agent", **kwargs)
+        self.barrier = threading.Barrier(parties, timeout=10)
+        self.seen: dict[str, tuple[str, list[str]]] = {}
+
+    def validate_task(self, task: dict[str, Any]) -> bool:
+        return True
+
+    def execute_task(self, task: dict[str, Any]) -> dict[str, Any]:
+        self.artifacts_created.append(f"{task['id']}.md")
+        self.barrier.wait()
+        if task.get("fail"):
+            raise RuntimeError(f"boom {task['id']}")
+        self.seen[task["id"]] = (self.current_task["id"], list(self.artifacts_created))
+        return {"summary": f"Done {task['id']}"}
+
+
+def write_assigned(work_dir: Path, task_id: str, **fields: Any) -> Path:
+    """Write an assigned task for test-agent."""
+    task_file = (
+        work_dir / "collaboration" / "assigned" / "test-agent" / f"{task_id}.yaml"
+    )
+    task_file.parent.mkdir(parents=True, exist_ok=True)
+    task = {
+        "id": task_id,
+        "agent": "test-agent",
+        "status": "assigned",
+        "title": f"Task {task_id}",
+        **fields,
+    }
+    task_file.write_text(yaml.safe_dump(task), encoding="utf-8")
+    return task_file
+
+
+# ============================================================================
+# Concurrency Tests
+# ============================================================================
+
+
+def test_rejects_invalid_max_concurrency(tmp_path: Path) -> None:
+    """max_concurrency must be at least 1."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        BarrierAgent(parties=1, work_dir=tmp_path / "work", max_concurrency=0)
+
+
+def test_process_available_tasks_runs_concurrently(tmp_path: Path) -> None:
+    """Tasks of one batch run at the same time, each with its own state."""
+    work_dir = tmp_path / "work"
+    for i in range(3):
+        write_assigned(work_dir, f"task-{i}")
+
+    # The barrier only releases when all three tasks execute at once
+    agent = BarrierAgent(parties=3, work_dir=work_dir, max_concurrency=3)
+    assert agent.process_available_tasks() == 3
+
+    assert agent.seen == {
+        f"task-{i}": (f"task-{i}", [f"task-{i}.md"]) for i in range(3)
+    }
+    done_dir = work_dir / "collaboration" / "done" / "test-agent"
+    for i in range(3):
+        task = yaml.safe_load((done_dir / f"task-{i}.yaml").read_text())
+        assert task["status"] == "done"
+        assert task["result"]["summary"] == f"Done task-{i}"
+        assert task["result"]["artefacts"] == [f"task-{i}.md"]
+
+
+def test_failed_task_does_not_stop_other_workers(tmp_path: Path) -> None:
+    """A failing task gets an error block; its siblings still complete."""
+    work_dir = tmp_path / "work"
+    failing = write_assigned(work_dir, "task-bad", fail=True)
+    write_assigned(work_dir, "task-good")
+
+    agent = BarrierAgent(parties=2, work_dir=work_dir, max_concurrency=2)
+    assert agent.process_available_tasks() == 2
+
+    task = yaml.safe_load(failing.read_text())
+    assert task["status"] == "error"
+    assert task["error"]["message"] == "boom task-bad"
+    assert task["error"]["agent"] == "test-agent"
+    assert (
+        work_dir / "collaboration" / "done" / "test-agent" / "task-good.yaml"
+    ).exists()
+    assert agent._in_flight == set()
+
+
+def test_claim_skips_in_flight_and_non_assigned(tmp_path: Path) -> None:
+    """Claimed tasks are not handed out twice; other statuses are ignored."""
+    work_dir = tmp_path / "work"
+    write_assigned(work_dir, "task-a")
+    write_assigned(work_dir, "task-b")
+    write_assigned(work_dir, "task-c", status="in_progress")
+
+    agent = BarrierAgent(parties=1, work_dir=work_dir, max_concurrency=4)
+    first = agent.claim_assigned_tasks(1)
+    second = agent.claim_assigned_tasks(4)
+
+    assert [task["id"] for _, task in first] == ["task-a"]
+    assert [task["id"] for _, task in second] == ["task-b"]
+    assert agent.claim_assigned_tasks(4) == []
+
+
+def test_serial_processing_unchanged(tmp_path: Path) -> None:
+    """With the default max_concurrency, run() processes a single task."""
+    work_dir = tmp_path / "work"
+    write_assigned(work_dir, "task-1")
+    write_assigned(work_dir, "task-2")
+
+    agent = BarrierAgent(parties=1, work_dir=work_dir)
+    agent.run()
+
+    assert list(agent.seen) == ["task-1"]
+    assert agent.current_task["id"] == "task-1"
+    assert agent.current_task_file.parent.name == "test-agent"
+    assert agent.current_task_file.parent.parent.name == "done"
+
+
+# ============================================================================
+# Continuous Mode Tests
+# ============================================================================
+
+
+def test_find_ready_tasks_reads_status_from_index(tmp_path: Path) -> None:
+    """Unchanged queued files are not parsed again on every scan."""
+    work_dir = tmp_path / "work"
+    write_assigned(work_dir, "task-busy", status="in_progress")
+    write_assigned(work_dir, "task-ready")
+
+    agent = BarrierAgent(parties=1, work_dir=work_dir)
+    assert [e.task_id for e in agent.find_ready_tasks()] == ["task-ready"]
+
+    with (
+        patch.object(task_index, "read_task") as index_read,
+        patch.object(task_loader, "read_task") as loader_read,
+    ):
+        assert [e.task_id for e in agent.find_ready_tasks()] == ["task-ready"]
+
+    index_read.assert_not_called()
+    loader_read.assert_not_called()
+
+
+def test_continuous_run_wakes_on_new_task(tmp_path: Path) -> None:
+    """A task dropped into assigned/<agent>/ is picked up without polling."""
+    work_dir = tmp_path / "work"
+    agent = BarrierAgent(parties=1, work_dir=work_dir)
+    runner = threading.Thread(target=agent.run, kwargs={"continuous": True})
+    runner.start()
+    try:
+        deadline = time.monotonic() + 10
+        while agent._observer is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert agent._observer is not None
+
+        write_assigned(work_dir, "task-1")
+
+        done = work_dir / "collaboration" / "done" / "test-agent" / "task-1.yaml"
+        # Well below IDLE_RESCAN_SECONDS: only a notification can explain it
+        while not done.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert done.exists()
+    finally:
+        agent.stop()
+        runner.join(timeout=10)
+
+    assert not runner.is_alive()
+    assert agent._observer is None
+
+
+def test_polling_fallback_backs_off_and_resets(tmp_path, monkeypatch) -> None:
+    """Without notifications the poll interval doubles and resets on activity."""
+    monkeypatch.setattr(agent_base, "MIN_POLL_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(agent_base, "MAX_POLL_INTERVAL_SECONDS", 0.04)
+    agent = BarrierAgent(parties=1, work_dir=tmp_path / "work")
+
+    with patch.object(agent_base.Observer, "start", side_effect=OSError("limit")):
+        agent._start_watching()
+    assert agent._observer is None
+
+    intervals = []
+    for _ in range(3):
+        agent._wait_for_work()
+        intervals.append(agent._poll_interval)
+    assert intervals == [0.02, 0.04, 0.04]
+
+    agent._wakeup.set()
+    agent._wait_for_work()
+    assert agent._poll_interval == 0.01
+    assert not agent._wakeup.is_set()
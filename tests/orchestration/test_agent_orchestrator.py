@@ -14,12 +14,18 @@ Tests orchestrator functions for:
 
 from __future__ import annotations
 
+import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
+from watchdog.events import DirCreatedEvent, FileCreatedEvent, FileMovedEvent
 
 # Add orchestration directory to path for imports
 sys.path.insert(
@@ -28,6 +34,8 @@ sys.path.insert(
 
 import agent_orchestrator as orchestrator
 
+from src.domain.collaboration import task_index, task_loader
+
 # ============================================================================
 # Test Fixtures
 # ============================================================================
@@ -210,6 +218,29 @@ def test_assign_tasks_unknown_agent(temp_work_env: Path) -> None:
     # Arrange
 
 
+def test_assign_tasks_batches_directory_fsyncs(temp_work_env: Path) -> None:
+    """Test inbox floods are committed with one fsync per directory."""
+    # Arrange
+    for i in range(20):
+        write_task(
+            orchestrator.INBOX_DIR / f"task-{i}.yaml",
+            {
+                "id": f"task-{i}",
+                "agent": f"test-agent{'-2' if i % 2 else ''}",
+                "status": "new",
+            },
+        )
+
+    # Act
+    with patch("os.fsync", wraps=os.fsync) as fsync:
+        assigned = orchestrator.assign_tasks()
+
+    # Assert: 20 files + 2 agent directories + inbox
+    assert assigned == 20
+    assert fsync.call_count == 23
+    assert list(orchestrator.INBOX_DIR.iterdir()) == []
+
+
 def test_assign_tasks_preserves_task_data(temp_work_env: Path) -> None:
     """Test task assignment preserves all task fields."""
 
@@ -370,6 +401,87 @@ def test_process_completed_no_duplicate_followup(temp_work_env: Path) -> None:
     assert len(inbox_files) == 1
 
 
+def test_process_completed_followup_not_recreated_after_assignment(
+    temp_work_env: Path,
+) -> None:
+    """Test follow-ups are created once per source task across cycles."""
+    # Arrange
+    task = {
+        "id": "task-once",
+        "agent": "test-agent",
+        "status": "done",
+        "result": {"summary": "Done", "next_agent": "test-agent-2"},
+    }
+    write_task(orchestrator.DONE_DIR / "task-once.yaml", task)
+
+    # Act: the follow-up leaves the inbox, then the minute rolls over
+    orchestrator.run_cycle()
+    orchestrator.run_cycle()
+    with patch.object(orchestrator, "datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime.now(timezone.utc) + timedelta(
+            minutes=5
+        )
+        followups = orchestrator.process_completed_tasks()
+
+    # Assert
+    assert followups == 0
+    all_followups = list(
+        orchestrator.INBOX_DIR.parent.glob("**/*-followup-task-once.yaml")
+    )
+    assert len(all_followups) == 1
+
+
+def test_process_completed_retry_after_crash_finds_followup(
+    temp_work_env: Path,
+) -> None:
+    """Test a crash before the ledger update doesn't lose or duplicate the follow-up."""
+    # Arrange
+    task = {
+        "id": "task-crash",
+        "agent": "test-agent",
+        "status": "done",
+        "result": {"summary": "Done", "next_agent": "test-agent-2"},
+    }
+    write_task(orchestrator.DONE_DIR / "task-crash.yaml", task)
+
+    # Act: the follow-up is written, then recording it in the ledger fails
+    with patch.object(
+        task_index.TaskIndex, "record_followup", side_effect=RuntimeError("crash")
+    ):
+        assert orchestrator.process_completed_tasks() == 0
+    followups = orchestrator.process_completed_tasks()
+
+    # Assert
+    assert followups == 0
+    names = [f.name for f in orchestrator.INBOX_DIR.glob("*.yaml")]
+    assert len(names) == 1
+    assert names[0].endswith("-test-agent-2-followup-task-crash.yaml")
+    assert orchestrator._task_index().pending_followups() == []
+
+
+def test_process_completed_skips_handled_tasks_without_loading(
+    temp_work_env: Path,
+) -> None:
+    """Test that handed-off done tasks are not re-read on later cycles."""
+    # Arrange
+    task = {
+        "id": "task-loaded",
+        "agent": "test-agent",
+        "status": "done",
+        "result": {"summary": "Done", "next_agent": "test-agent-2"},
+    }
+    write_task(orchestrator.DONE_DIR / "task-loaded.yaml", task)
+    orchestrator.process_completed_tasks()
+
+    # Act
+    with patch.object(task_index.IndexedTask, "load") as load:
+        followups = orchestrator.process_completed_tasks()
+
+    # Assert
+    assert followups == 0
+    load.assert_not_called()
+
+
 # ============================================================================
 # check_timeouts Tests
 # ============================================================================
@@ -715,6 +827,39 @@ def test_archive_old_tasks_old_task(temp_work_env: Path) -> None:
     # Arrange
 
 
+def test_archive_old_tasks_archives_followups(temp_work_env: Path) -> None:
+    """Test generated follow-ups carry a date prefix archival can read."""
+
+    # Arrange
+    completed = datetime.now(timezone.utc) - timedelta(days=35)
+    source_id = f"{completed:%Y-%m-%d}T0000-task-source"
+    task = {
+        "id": source_id,
+        "agent": "test-agent",
+        "status": "done",
+        "result": {
+            "summary": "Done",
+            "next_agent": "test-agent-2",
+            "completed_at": completed.isoformat().replace("+00:00", "Z"),
+        },
+    }
+    write_task(orchestrator.DONE_DIR / f"{source_id}.yaml", task)
+    assert orchestrator.process_completed_tasks() == 1
+    (followup_file,) = orchestrator.INBOX_DIR.glob(f"*-followup-{source_id}.yaml")
+    assert followup_file.name.startswith(completed.strftime("%Y-%m-%dT%H%M"))
+
+    # Act: the follow-up is completed as well
+    done_followup = orchestrator.DONE_DIR / "test-agent-2" / followup_file.name
+    done_followup.parent.mkdir(parents=True, exist_ok=True)
+    followup_file.rename(done_followup)
+    archived = orchestrator.archive_old_tasks()
+
+    # Assert
+    assert archived == 2
+    archive_month = orchestrator.ARCHIVE_DIR / completed.strftime("%Y-%m")
+    assert (archive_month / followup_file.name).exists()
+
+
 def test_archive_old_tasks_multiple(temp_work_env: Path) -> None:
     """Test archival handles multiple old tasks."""
 
@@ -779,6 +924,206 @@ def test_log_handoff_appends(temp_work_env: Path) -> None:
     assert "task-2" in content
 
 
+# ============================================================================
+# run_cycle Tests
+# ============================================================================
+
+
+def test_run_cycle_reports_phase_timings(temp_work_env: Path) -> None:
+    """Test single-pass cycle exposes counts and per-phase timings."""
+    write_task(
+        orchestrator.INBOX_DIR / "task-cycle.yaml",
+        {"id": "task-cycle", "agent": "test-agent", "status": "new"},
+    )
+
+    report = orchestrator.run_cycle()
+    metrics = report.metrics()
+
+    assert report.assigned == 1
+    assert metrics["tasks_assigned"] == 1
+    for phase in [
+        "snapshot",
+        "assign_tasks",
+        "process_completed",
+        "check_timeouts",
+        "detect_conflicts",
+        "archive_old_tasks",
+        "update_agent_status",
+    ]:
+        assert metrics[f"{phase}_duration"] >= 0
+    assert metrics["total_cycle_time"] >= metrics["snapshot_duration"]
+
+
+def test_run_cycle_snapshot_tracks_assignments(temp_work_env: Path) -> None:
+    """Test later phases see tasks assigned earlier in the same cycle."""
+    write_task(
+        orchestrator.INBOX_DIR / "task-fresh.yaml",
+        {"id": "task-fresh", "agent": "test-agent", "status": "new"},
+    )
+
+    orchestrator.run_cycle()
+
+    content = (orchestrator.COLLAB_DIR / "AGENT_STATUS.md").read_text()
+    assert "## test-agent\n\n- **Status**: Idle\n- **Assigned**: 1 tasks" in content
+
+
+def test_run_cycle_parses_each_file_once(temp_work_env: Path) -> None:
+    """Test phases share the snapshot instead of re-reading task files."""
+    for i in range(3):
+        write_task(
+            orchestrator.ASSIGNED_DIR / "test-agent" / f"task-{i}.yaml",
+            {"id": f"task-{i}", "agent": "test-agent", "status": "in_progress"},
+        )
+
+    with patch.object(task_loader, "read_task", wraps=task_loader.read_task) as reader:
+        orchestrator.run_cycle()
+
+    assert reader.call_count == 3
+
+
+# ============================================================================
+# Event-Driven Daemon Tests
+# ============================================================================
+
+
+def test_assign_task_file_assigns_single_task(temp_work_env: Path) -> None:
+    """Test that one inbox file is assigned without a full cycle."""
+    # Arrange
+    task = {"id": "task-a", "agent": "test-agent", "status": "new"}
+    task_file = orchestrator.INBOX_DIR / "task-a.yaml"
+    write_task(task_file, task)
+
+    # Act
+    result = orchestrator.assign_task_file(task_file)
+
+    # Assert
+    assert result is True
+    assert not task_file.exists()
+    assigned = read_task(orchestrator.ASSIGNED_DIR / "test-agent" / "task-a.yaml")
+    assert assigned["status"] == "assigned"
+
+
+def test_assign_task_file_ignores_missing_and_other_stages(
+    temp_work_env: Path,
+) -> None:
+    """Test that stale events and non-inbox files are ignored."""
+    # Arrange
+    done_file = orchestrator.DONE_DIR / "test-agent" / "task.yaml"
+    write_task(done_file, {"id": "task", "agent": "test-agent", "status": "done"})
+
+    # Act / Assert
+    assert orchestrator.assign_task_file(orchestrator.INBOX_DIR / "gone.yaml") is False
+    assert orchestrator.assign_task_file(done_file) is False
+    assert done_file.exists()
+
+
+def test_process_completed_file_creates_followup(temp_work_env: Path) -> None:
+    """Test follow-up creation for a single completed task."""
+    # Arrange
+    done_file = orchestrator.DONE_DIR / "test-agent" / "task-b.yaml"
+    write_task(
+        done_file,
+        {
+            "id": "task-b",
+            "agent": "test-agent",
+            "status": "done",
+            "result": {"summary": "ok", "next_agent": "test-agent-2"},
+        },
+    )
+
+    # Act
+    result = orchestrator.process_completed_file(done_file)
+
+    # Assert
+    assert result is True
+    followups = list(orchestrator.INBOX_DIR.glob("*-followup-task-b.yaml"))
+    assert len(followups) == 1
+    assert read_task(followups[0])["agent"] == "test-agent-2"
+
+
+def test_event_handler_queues_task_files(temp_work_env: Path) -> None:
+    """Test that the handler queues YAML files and move destinations only."""
+    # Arrange
+    events: queue.Queue = queue.Queue()
+    handler = orchestrator.CoordinatorEventHandler(events)
+    inbox = orchestrator.INBOX_DIR
+
+    # Act
+    handler.on_created(FileCreatedEvent(str(inbox / "a.yaml")))
+    handler.on_created(FileCreatedEvent(str(inbox / "notes.md")))
+    handler.on_created(DirCreatedEvent(str(inbox / "sub.yaml")))
+    handler.on_moved(FileMovedEvent(str(inbox / ".tmp"), str(inbox / "b.yaml")))
+
+    # Assert
+    queued = [events.get_nowait() for _ in range(events.qsize())]
+    assert queued == [inbox / "a.yaml", inbox / "b.yaml"]
+
+
+def test_daemon_waits_for_settle_period(temp_work_env: Path) -> None:
+    """Test that queued files are only handled once they have been quiet."""
+    # Arrange
+    task_file = (orchestrator.INBOX_DIR / "task-c.yaml").absolute()
+    write_task(task_file, {"id": "task-c", "agent": "test-agent", "status": "new"})
+    daemon = orchestrator.CoordinatorDaemon(settle_seconds=60)
+    daemon._pending[task_file] = time.monotonic() + 60
+
+    # Act / Assert
+    assert daemon.process_pending() == 0
+    assert task_file.exists()
+    assert daemon.process_pending(force=True) == 1
+    assert not task_file.exists()
+    assert (orchestrator.COLLAB_DIR / "AGENT_STATUS.md").exists()
+
+
+@pytest.mark.timeout(30)
+def test_daemon_reacts_to_inbox_and_done_events(temp_work_env: Path) -> None:
+    """Test end-to-end event handling: inbox → assigned, done → follow-up."""
+    # Arrange
+    daemon = orchestrator.CoordinatorDaemon(
+        reconcile_interval=3600, settle_seconds=0.05
+    )
+    daemon.start()
+    thread = threading.Thread(target=daemon.run, daemon=True)
+    thread.start()
+
+    def wait_for(condition) -> bool:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.05)
+        return False
+
+    try:
+        assert wait_for(lambda: daemon.sweeps == 1)
+
+        # Act: new inbox task
+        write_task(
+            orchestrator.INBOX_DIR / "task-d.yaml",
+            {"id": "task-d", "agent": "test-agent", "status": "new"},
+        )
+        assigned_file = orchestrator.ASSIGNED_DIR / "test-agent" / "task-d.yaml"
+        assert wait_for(assigned_file.exists)
+
+        # Act: agent completes it with a hand-off
+        task = read_task(assigned_file)
+        task["status"] = "done"
+        task["result"] = {"summary": "ok", "next_agent": "test-agent-2"}
+        done_file = orchestrator.DONE_DIR / "test-agent" / "task-d.yaml"
+        write_task(done_file, task)
+        assigned_file.unlink()
+
+        # Assert: follow-up is created and then itself assigned
+        followup_dir = orchestrator.ASSIGNED_DIR / "test-agent-2"
+        assert wait_for(lambda: any(followup_dir.glob("*-followup-task-d.yaml")))
+        assert daemon.sweeps == 1
+    finally:
+        daemon.stop()
+        thread.join(timeout=5)
+
+    assert not thread.is_alive()
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
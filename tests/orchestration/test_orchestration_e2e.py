@@ -37,6 +37,7 @@ sys.path.insert(
 
 # Import orchestrator module
 import agent_orchestrator as orchestrator
+import task_utils
 
 
 @pytest.fixture
@@ -564,7 +565,7 @@ def test_orchestrator_function_coverage(temp_work_env: Path) -> None:
     # Test read_task / write_task (via task_utils)
     task = create_task("2025-11-23T1800-test-coverage", "test-agent")
     task_file = write_task(work_dir, "inbox", task)
-    read_task_data = orchestrator.read_task(task_file)
+    read_task_data = task_utils.read_task(task_file)
     assert read_task_data["id"] == task["id"]
 
     # Test assign_tasks
@@ -0,0 +1,132 @@
+"""
+Performance tests for bulk task loading.
+
+Compares serial parsing against the worker pools of
+src.domain.collaboration.task_loader on generated task trees.
+
+Test Approach
+-------------
+The pytest run uses 500 files and is informational: it checks that every
+mode returns identical results and reports timings, without failing on
+speed (CI machines often have few cores).
+
+For the full comparison at 1k/10k/50k files run the module directly:
+
+    python -m tests.performance.collaboration.test_task_loader_performance
+    python -m tests.performance.collaboration.test_task_loader_performance \\
+        --sizes 1000 10000 50000 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.domain.collaboration.task_loader import load_tasks_bulk
+
+MODES = ("serial", "thread", "process")
+
+
+def generate_tasks(directory: Path, count: int) -> list[Path]:
+    """Write ``count`` realistic task files below ``directory``."""
+    paths = []
+    for i in range(count):
+        agent = f"agent-{i % 12}"
+        path = directory / agent / f"2026-02-10T{i:06d}-{agent}-task.yaml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        task = {
+            "id": path.stem,
+            "agent": agent,
+            "status": "done" if i % 3 else "in_progress",
+            "title": f"Generated task {i}",
+            "priority": "medium",
+            "artefacts": [f"docs/generated/{i}.md", f"src/generated/{i}.py"],
+            "context": {"notes": ["benchmark", "generated"], "repo": "sample"},
+            "created_at": "2026-02-10T10:00:00Z",
+            "result": {"summary": "Done", "completed_at": "2026-02-10T11:00:00Z"},
+        }
+        path.write_text(yaml.dump(task, sort_keys=False))
+        paths.append(path)
+    return paths
+
+
+def time_mode(paths: list[Path], mode: str, workers: int | None) -> float:
+    """Seconds taken to load ``paths`` with one pool mode."""
+    start = time.perf_counter()
+    load_tasks_bulk(paths, pool=mode, workers=workers, parallel_threshold=0)
+    return time.perf_counter() - start
+
+
+@pytest.fixture(scope="module")
+def task_paths(tmp_path_factory) -> list[Path]:
+    """500 generated task files."""
+    return generate_tasks(tmp_path_factory.mktemp("tasks"), 500)
+
+
+class TestTaskLoaderPerformance:
+    """Benchmarks for serial vs parallel task loading."""
+
+    def test_parallel_matches_serial(self, task_paths: list[Path]):
+        """All pool modes return the same tasks in the same order."""
+        serial = load_tasks_bulk(task_paths, pool="serial")
+
+        for mode in ("thread", "process"):
+            parallel = load_tasks_bulk(
+                task_paths, pool=mode, workers=2, parallel_threshold=0
+            )
+            assert parallel == serial
+
+    def test_load_performance(self, task_paths: list[Path]):
+        """Report load time per mode for the generated task files."""
+        timings = {mode: time_mode(task_paths, mode, None) for mode in MODES}
+
+        print(f"\n📊 Task Loading Performance ({len(task_paths)} files):")
+        for mode, elapsed in timings.items():
+            print(
+                f"   {mode:<8} {elapsed * 1000:8.1f}ms "
+                f"({timings['serial'] / elapsed:.2f}x serial)"
+            )
+
+        # Informational only: parallel speed-up depends on available cores
+        assert all(elapsed > 0 for elapsed in timings.values())
+
+
+def main() -> None:
+    """Run the serial vs parallel comparison and print a markdown table."""
+    parser = argparse.ArgumentParser(description="Benchmark bulk task loading")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Numbers of task files to generate (default: 1000 10000 50000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Pool size (default: os.cpu_count() = {os.cpu_count()})",
+    )
+    args = parser.parse_args()
+
+    print("| Files | Serial (s) | Thread (s) | Process (s) | Process speed-up |")
+    print("|------:|-----------:|-----------:|------------:|-----------------:|")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = generate_tasks(Path(tmp), size)
+            timings = {mode: time_mode(paths, mode, args.workers) for mode in MODES}
+        print(
+            f"| {size} | {timings['serial']:.2f} | {timings['thread']:.2f} | "
+            f"{timings['process']:.2f} | "
+            f"{timings['serial'] / timings['process']:.2f}x |"
+        )
+
+
+if __name__ == "__main__":
+    main()
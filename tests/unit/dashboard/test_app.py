@@ -5,8 +5,23 @@ Tests Flask + SocketIO integration following TDD (Directive 017).
 """
 
 import json
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
 from unittest.mock import ANY, Mock, patch
 
+import pytest
+import yaml
+
+
+@pytest.fixture(autouse=True)
+def telemetry_db(tmp_path, monkeypatch):
+    """Point created apps at a temporary telemetry database."""
+    db_path = tmp_path / "telemetry.db"
+    monkeypatch.setenv("DASHBOARD_TELEMETRY_DB", str(db_path))
+    return db_path
+
 
 class TestDashboardApp:
     """Test suite for Flask + SocketIO dashboard server."""
@@ -365,6 +380,47 @@ class TestDashboardAPIFiltering:
                 ANY, include_done=True, terminal_only=True
             )
 
+    def test_tasks_finished_pagination_and_filters(self):
+        """Test: /api/tasks/finished pages filtered tasks with a cursor."""
+        from llm_service.dashboard.app import create_app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            done = Path(tmpdir) / "done" / "agent-a"
+            done.mkdir(parents=True)
+            for i in range(5):
+                (done / f"t{i}.yaml").write_text(
+                    yaml.dump(
+                        {
+                            "id": f"t{i}",
+                            "status": "error" if i == 2 else "done",
+                            "agent": "agent-a",
+                            "completed_at": f"2026-02-10T11:0{i}:00Z",
+                        }
+                    )
+                )
+
+            app, _ = create_app()
+            app.config["WORK_DIR"] = tmpdir
+            client = app.test_client()
+
+            first = client.get("/api/tasks/finished?status=done&limit=2").get_json()
+            assert [t["id"] for t in first["tasks"]] == ["t4", "t3"]
+            assert first["limit"] == 2
+
+            second = client.get(
+                "/api/tasks/finished?status=done&limit=2"
+                f"&cursor={first['next_cursor']}"
+            ).get_json()
+            assert [t["id"] for t in second["tasks"]] == ["t1", "t0"]
+            assert second["next_cursor"] is None
+
+            errors = client.get("/api/tasks/finished?status=error&agent=agent-a")
+            assert [t["id"] for t in errors.get_json()] == ["t2"]
+
+            assert client.get("/api/tasks/finished?limit=x").status_code == 400
+            assert client.get("/api/tasks/finished?sort=title").status_code == 400
+            assert client.get("/api/tasks/finished?since=abc").status_code == 400
+
     def test_tasks_websocket_events_include_status(self):
         """Test: WebSocket events include status metadata."""
         from llm_service.dashboard.app import create_app
@@ -400,3 +456,175 @@ class TestDashboardAPIFiltering:
         event_data = task_events[0]["args"][0]
         assert "status" in event_data
         assert "task_data" in event_data
+
+
+class TestDashboardExport:
+    """Test suite for streamed NDJSON exports."""
+
+    def test_export_tasks_streams_ndjson(self):
+        """Test: /api/export/tasks streams one JSON record per task."""
+        from llm_service.dashboard.app import create_app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "inbox").mkdir()
+            (root / "done" / "agent-a").mkdir(parents=True)
+            (root / "inbox" / "t1.yaml").write_text(
+                yaml.dump({"id": "t1", "status": "new"})
+            )
+            (root / "done" / "agent-a" / "t2.yaml").write_text(
+                yaml.dump(
+                    {
+                        "id": "t2",
+                        "status": "done",
+                        "completed_at": datetime(2026, 2, 10, 11, 0),
+                    }
+                )
+            )
+
+            app, _ = create_app()
+            app.config["WORK_DIR"] = tmpdir
+            client = app.test_client()
+
+            response = client.get("/api/export/tasks?sort=id")
+            assert response.mimetype == "application/x-ndjson"
+            assert response.is_streamed
+            records = [json.loads(line) for line in response.data.splitlines()]
+            assert [(r["path"], r["stage"], r["agent"]) for r in records] == [
+                ("inbox/t1.yaml", "inbox", None),
+                ("done/agent-a/t2.yaml", "done", "agent-a"),
+            ]
+            assert records[1]["task"]["completed_at"] == "2026-02-10T11:00:00"
+
+            active = client.get("/api/export/tasks?include_done=false")
+            assert [
+                json.loads(line)["task"]["id"] for line in active.data.splitlines()
+            ] == ["t1"]
+            assert client.get("/api/export/tasks?sort=title").status_code == 400
+
+    def test_export_telemetry_streams_invocations(self):
+        """Test: /api/export/telemetry streams invocation records."""
+        from llm_service.dashboard.app import create_app
+
+        telemetry = Mock()
+        telemetry.iter_invocations.return_value = iter(
+            [{"invocation_id": "inv-1"}, {"invocation_id": "inv-2"}]
+        )
+
+        app, _ = create_app()
+        app.config["TELEMETRY_API"] = telemetry
+        client = app.test_client()
+
+        response = client.get("/api/export/telemetry?since=2026-02-01")
+
+        assert (
+            response.data == b'{"invocation_id": "inv-1"}\n{"invocation_id": "inv-2"}\n'
+        )
+        telemetry.iter_invocations.assert_called_once_with(
+            since="2026-02-01", until=None
+        )
+
+
+class TestDashboardConditionalRequests:
+    """Test suite for ETag and delta (changes since version) task queries."""
+
+    @staticmethod
+    def _make_app(tmpdir: str):
+        from llm_service.dashboard.app import create_app
+        from llm_service.dashboard.file_watcher import FileWatcher
+
+        root = Path(tmpdir)
+        (root / "inbox").mkdir()
+        (root / "inbox" / "t1.yaml").write_text(yaml.dump({"id": "t1"}))
+
+        app, _ = create_app()
+        app.config["FILE_WATCHER"] = FileWatcher(watch_dir=tmpdir)
+        return app, root
+
+    def test_tasks_etag_answers_not_modified(self):
+        """Test: /api/tasks returns 304 until the task state changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            app, root = self._make_app(tmpdir)
+            client = app.test_client()
+
+            first = client.get("/api/tasks")
+            etag = first.headers["ETag"]
+            assert first.status_code == 200
+
+            cached = client.get("/api/tasks", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.data == b""
+
+            # include_done changes the body, so it changes the ETag
+            other = client.get(
+                "/api/tasks?include_done=false", headers={"If-None-Match": etag}
+            )
+            assert other.status_code == 200
+
+            (root / "inbox" / "t2.yaml").write_text(yaml.dump({"id": "t2"}))
+            changed = client.get("/api/tasks", headers={"If-None-Match": etag})
+            assert changed.status_code == 200
+            assert changed.headers["ETag"] != etag
+
+    def test_task_changes_since_version(self):
+        """Test: /api/tasks/changes returns only tasks changed since a version."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            app, root = self._make_app(tmpdir)
+            client = app.test_client()
+            snapshot = client.get("/api/tasks").get_json()
+
+            (root / "inbox" / "t2.yaml").write_text(yaml.dump({"id": "t2"}))
+            response = client.get(
+                f"/api/tasks/changes?since={snapshot['version']}"
+                f"&epoch={snapshot['epoch']}"
+            )
+
+            data = response.get_json()
+            assert response.status_code == 200
+            assert data["reset"] is False
+            assert data["version"] > snapshot["version"]
+            assert [(c["op"], c["task"]["id"]) for c in data["changes"]] == [
+                ("created", "t2")
+            ]
+
+            stale = client.get(
+                f"/api/tasks/changes?since={data['version']}&epoch=restarted"
+            )
+            assert stale.get_json()["reset"] is True
+
+    def test_task_changes_hides_done_on_request(self):
+        """Test: Without include_done, a move into done/ is a removal."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            app, root = self._make_app(tmpdir)
+            client = app.test_client()
+            version = client.get("/api/tasks").get_json()["version"]
+
+            (root / "done" / "agent-a").mkdir(parents=True)
+            shutil.move(
+                str(root / "inbox" / "t1.yaml"),
+                str(root / "done" / "agent-a" / "t1.yaml"),
+            )
+            data = client.get(
+                f"/api/tasks/changes?since={version}&include_done=false"
+            ).get_json()
+
+            assert data["changes"] == [
+                {
+                    "op": "removed",
+                    "path": "inbox/t1.yaml",
+                    "stage": "inbox",
+                    "agent": None,
+                    "id": "t1",
+                }
+            ]
+
+    def test_task_changes_requires_since(self):
+        """Test: A missing or invalid since parameter is a client error."""
+        from llm_service.dashboard.app import create_app
+
+        app, _ = create_app()
+        client = app.test_client()
+
+        assert client.get("/api/tasks/changes").status_code == 400
+        assert client.get("/api/tasks/changes?since=abc").status_code == 400
+        assert client.get("/api/tasks/changes?since=0").get_json()["reset"] is True
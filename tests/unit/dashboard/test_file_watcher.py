@@ -8,7 +8,7 @@ import shutil
 import tempfile
 import time
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import yaml
 
@@ -226,3 +226,403 @@ class TestFileWatcher:
             assert len(snapshot["inbox"]) == 1
             assert len(snapshot["assigned"]) >= 1  # May have nested structure
             assert len(snapshot["done"]) >= 1
+
+
+class TestTaskState:
+    """Test suite for the incrementally maintained task state."""
+
+    @staticmethod
+    def _make_tree(root: Path) -> None:
+        for sub in ["inbox", "assigned/agent-a", "done/agent-a", "done/agent-b"]:
+            (root / sub).mkdir(parents=True)
+        (root / "inbox" / "t1.yaml").write_text(yaml.dump({"id": "t1"}))
+        (root / "assigned" / "agent-a" / "t2.yml").write_text(yaml.dump({"id": "t2"}))
+        (root / "done" / "agent-a" / "t3.yaml").write_text(yaml.dump({"id": "t3"}))
+
+    def test_rebuild_matches_directory_layout(self):
+        """Test: Initial build groups tasks by stage and agent directory."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            state = TaskState(root, FileWatcher(root).parse_task_file)
+            state.rebuild()
+
+            snapshot = state.snapshot()
+            assert [t["id"] for t in snapshot["inbox"]] == ["t1"]
+            assert [t["id"] for t in snapshot["assigned"]["agent-a"]] == ["t2"]
+            assert [t["id"] for t in snapshot["done"]["agent-a"]] == ["t3"]
+            assert snapshot["done"]["agent-b"] == []
+            assert state.counts() == {"inbox": 1, "assigned": 1, "done": 1, "total": 3}
+
+    def test_events_update_state_without_rescan(self):
+        """Test: Moves and deletions touch only the files involved."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            parse = Mock(side_effect=FileWatcher(root).parse_task_file)
+            state = TaskState(root, parse)
+            state.rebuild()
+            version = state.version
+            parse.reset_mock()
+
+            src = root / "inbox" / "t1.yaml"
+            dest = root / "assigned" / "agent-a" / "t1.yaml"
+            shutil.move(str(src), str(dest))
+            assert state.discard(src)
+            assert state.refresh(dest)["id"] == "t1"
+
+            (root / "done" / "agent-a" / "t3.yaml").unlink()
+            assert state.discard(root / "done" / "agent-a" / "t3.yaml")
+
+            assert parse.call_count == 1
+            assert state.version == version + 3
+            assert state.counts() == {"inbox": 0, "assigned": 2, "done": 0, "total": 2}
+            assigned = state.snapshot()["assigned"]["agent-a"]
+            assert [t["id"] for t in assigned] == ["t1", "t2"]
+
+    def test_snapshot_cached_per_version(self):
+        """Test: Unchanged state returns the same snapshot object."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            state = TaskState(root, FileWatcher(root).parse_task_file)
+            state.rebuild()
+
+            first = state.snapshot()
+            assert state.snapshot() is first
+            assert first["version"] == state.version
+
+            # Duplicate events for an unchanged file don't bump the version
+            state.refresh(root / "inbox" / "t1.yaml")
+            assert state.snapshot() is first
+
+            (root / "inbox" / "t1.yaml").write_text(yaml.dump({"id": "t1", "x": 1}))
+            state.refresh(root / "inbox" / "t1.yaml")
+            assert state.snapshot() is not first
+            assert state.snapshot()["inbox"] == [{"id": "t1", "x": 1}]
+
+    def test_rescan_of_unchanged_tree_keeps_version(self):
+        """Test: Rebuilding without file changes is not a state change."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            state = TaskState(root, FileWatcher(root).parse_task_file)
+            state.rebuild()
+            first = state.snapshot()
+
+            state.rebuild()
+            assert state.snapshot() is first
+
+            (root / "done" / "agent-c").mkdir()
+            state.rebuild()
+            assert state.snapshot()["done"]["agent-c"] == []
+            assert state.version == first["version"] + 1
+
+    def test_events_during_rebuild_are_kept(self):
+        """Test: Events racing with a rescan aren't reverted by its result."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            parse_task_file = FileWatcher(root).parse_task_file
+            t1 = root / "inbox" / "t1.yaml"
+            t2 = root / "assigned" / "agent-a" / "t2.yml"
+
+            def parse(path):
+                if path.name == "t3.yaml" and t2.exists():
+                    # Files the scan already read change before it ends
+                    t1.write_text(yaml.dump({"id": "t1", "x": 1}))
+                    state.refresh(t1)
+                    t2.unlink()
+                    state.discard(t2)
+                return parse_task_file(path)
+
+            state = TaskState(root, parse)
+            state.rebuild()
+
+            snapshot = state.snapshot()
+            assert snapshot["inbox"] == [{"id": "t1", "x": 1}]
+            assert snapshot["assigned"]["agent-a"] == []
+            assert state.counts()["total"] == 2
+
+    def test_changes_since_reports_each_file_once(self):
+        """Test: Deltas carry current content and fold moves and churn."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            state = TaskState(root, FileWatcher(root).parse_task_file)
+            state.rebuild()
+            since = state.version
+
+            # Move t1 to assigned, edit t2 twice, delete t3
+            src = root / "inbox" / "t1.yaml"
+            dest = root / "assigned" / "agent-a" / "t1.yaml"
+            shutil.move(str(src), str(dest))
+            state.discard(src)
+            state.refresh(dest)
+            t2 = root / "assigned" / "agent-a" / "t2.yml"
+            for n in (1, 2):
+                t2.write_text(yaml.dump({"id": "t2", "n": n}))
+                state.refresh(t2)
+            (root / "done" / "agent-a" / "t3.yaml").unlink()
+            state.discard(root / "done" / "agent-a" / "t3.yaml")
+
+            # A task that appears and vanishes again is not reported
+            tmp = root / "inbox" / "t9.yaml"
+            tmp.write_text(yaml.dump({"id": "t9"}))
+            state.refresh(tmp)
+            tmp.unlink()
+            state.discard(tmp)
+
+            version, changes = state.changes_since(since)
+            assert version == state.version
+            assert [(c["op"], c["path"]) for c in changes] == [
+                ("moved", "assigned/agent-a/t1.yaml"),
+                ("updated", "assigned/agent-a/t2.yml"),
+                ("removed", "done/agent-a/t3.yaml"),
+            ]
+            assert changes[0]["from"] == "inbox/t1.yaml"
+            assert changes[1]["task"] == {"id": "t2", "n": 2}
+            assert changes[2] == {
+                "op": "removed",
+                "path": "done/agent-a/t3.yaml",
+                "stage": "done",
+                "agent": "agent-a",
+                "id": "t3",
+            }
+            assert state.changes_since(version) == (version, [])
+
+    def test_changes_since_outside_journal_requires_reset(self):
+        """Test: Versions older than the journal or from the future get None."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            state = TaskState(root, FileWatcher(root).parse_task_file, max_changes=2)
+            state.rebuild()
+
+            assert state.changes_since(0)[1] is None
+            assert state.changes_since(state.version + 1)[1] is None
+
+            since = state.version
+            (root / "inbox" / "t4.yaml").write_text(yaml.dump({"id": "t4"}))
+            state.refresh(root / "inbox" / "t4.yaml")
+            assert [c["op"] for c in state.changes_since(since)[1]] == ["created"]
+
+    def test_untracked_paths_ignored(self):
+        """Test: Files outside the lifecycle layout are not part of the state."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            nested = root / "done" / "agent-a" / "archive" / "old.yaml"
+            nested.parent.mkdir()
+            nested.write_text(yaml.dump({"id": "old"}))
+            state = TaskState(root, FileWatcher(root).parse_task_file)
+
+            assert state.refresh(nested) is None
+            assert state.refresh(root / "notes.yaml") is None
+            assert state.counts()["total"] == 0
+
+    def test_yml_tasks_are_tracked(self):
+        """Test: Tasks saved with a .yml suffix are listed like .yaml ones."""
+        from llm_service.dashboard.file_watcher import (
+            FileWatcher,
+            TaskFileHandler,
+            TaskState,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            state = TaskState(root, FileWatcher(root).parse_task_file)
+            state.rebuild()
+
+            added = root / "inbox" / "t4.yml"
+            added.write_text(yaml.dump({"id": "t4"}))
+
+            assert TaskFileHandler._is_yaml_file(added)
+            assert state.refresh(added) is not None
+            assert [t["id"] for t in state.snapshot()["inbox"]] == ["t1", "t4"]
+            assert state.counts()["total"] == 4
+
+    def test_running_watcher_serves_counts_from_state(self):
+        """Test: A started watcher answers queries without rescanning."""
+        from llm_service.dashboard.file_watcher import FileWatcher, TaskState
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._make_tree(root)
+            watcher = FileWatcher(watch_dir=tmpdir)
+            watcher.start()
+            try:
+                with patch.object(TaskState, "rebuild") as rebuild:
+                    (root / "inbox" / "t4.yaml").write_text(yaml.dump({"id": "t4"}))
+
+                    deadline = time.monotonic() + 5
+                    while (
+                        watcher.get_task_counts()["inbox"] != 2
+                        and time.monotonic() < deadline
+                    ):
+                        time.sleep(0.02)
+
+                    assert watcher.get_task_counts()["inbox"] == 2
+                    snapshot = watcher.get_task_snapshot()
+                    assert {t["id"] for t in snapshot["inbox"]} == {"t1", "t4"}
+                    rebuild.assert_not_called()
+            finally:
+                watcher.stop()
+
+
+class TestEventCoalescing:
+    """Test suite for coalesced Socket.IO emission and client backpressure."""
+
+    @staticmethod
+    def _emitted(socketio: Mock) -> list[str]:
+        return [c.args[0] for c in socketio.emit.call_args_list]
+
+    @staticmethod
+    def _write(path: Path, **task) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(yaml.dump(task))
+        return path
+
+    def test_bulk_change_becomes_one_batch(self):
+        """Test: A burst beyond the per-task limit is one tasks.batch per client."""
+        from llm_service.dashboard.file_watcher import FileWatcher
+
+        socketio = Mock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            inbox = Path(tmpdir) / "inbox"
+            watcher = FileWatcher(tmpdir, socketio, max_individual_events=3)
+            watcher.add_client("sid-1")
+
+            for i in range(10):
+                watcher._handle_file_created(
+                    self._write(inbox / f"t{i}.yaml", id=f"t{i}")
+                )
+            assert len(watcher._pending) == 0
+            watcher._flush()
+
+            assert self._emitted(socketio) == ["tasks.batch"]
+            call = socketio.emit.call_args
+            assert call.kwargs["to"] == "sid-1"
+            assert call.kwargs["namespace"] == "/dashboard"
+            batch = call.args[1]
+            assert batch["reset"] is False
+            assert sorted(c["task"]["id"] for c in batch["changes"]) == [
+                f"t{i}" for i in range(10)
+            ]
+
+    def test_events_for_one_file_are_merged(self):
+        """Test: Create + writes within a window are one task.created event."""
+        from llm_service.dashboard.file_watcher import FileWatcher
+
+        socketio = Mock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task_file = Path(tmpdir) / "inbox" / "t1.yaml"
+            watcher = FileWatcher(tmpdir, socketio)
+
+            # Created while still empty, then written
+            task_file.parent.mkdir()
+            task_file.touch()
+            watcher._handle_file_created(task_file)
+            watcher._handle_file_modified(self._write(task_file, id="t1"))
+            watcher._handle_file_modified(self._write(task_file, id="t1", x=1))
+            watcher._flush()
+
+            # No registered clients: only the per-task event is sent
+            assert self._emitted(socketio) == ["task.created"]
+            assert socketio.emit.call_args.args[1]["task"] == {"id": "t1", "x": 1}
+
+    def test_slow_client_catches_up_after_ack(self):
+        """Test: Unacknowledged clients are skipped, then get one catch-up diff."""
+        from llm_service.dashboard.file_watcher import FileWatcher
+
+        socketio = Mock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            inbox = Path(tmpdir) / "inbox"
+            watcher = FileWatcher(
+                tmpdir, socketio, max_individual_events=0, max_in_flight=1
+            )
+            watcher.add_client("slow")
+
+            watcher._handle_file_created(self._write(inbox / "t1.yaml", id="t1"))
+            watcher._flush()
+            first = socketio.emit.call_args
+            assert self._emitted(socketio) == ["tasks.batch"]
+
+            for i in (2, 3):
+                watcher._handle_file_created(
+                    self._write(inbox / f"t{i}.yaml", id=f"t{i}")
+                )
+                watcher._flush()
+            assert socketio.emit.call_count == 1
+
+            first.kwargs["callback"](first.args[1]["version"])
+            assert watcher._flush_needed.is_set()
+            watcher._flush()
+
+            assert socketio.emit.call_count == 2
+            catch_up = socketio.emit.call_args.args[1]
+            assert catch_up["since"] == first.args[1]["version"]
+            assert [c["task"]["id"] for c in catch_up["changes"]] == ["t2", "t3"]
+
+    def test_removed_client_gets_nothing(self):
+        """Test: Disconnected clients are dropped from batch delivery."""
+        from llm_service.dashboard.file_watcher import FileWatcher
+
+        socketio = Mock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            watcher = FileWatcher(tmpdir, socketio, max_individual_events=0)
+            watcher.add_client("gone")
+            watcher.remove_client("gone")
+
+            watcher._handle_file_created(
+                self._write(Path(tmpdir) / "inbox" / "t1.yaml", id="t1")
+            )
+            watcher._flush()
+
+            socketio.emit.assert_not_called()
+
+    def test_atomic_writes_are_created_and_updated(self):
+        """Test: write_task's temp-file rename is a create or update, not a move."""
+        from llm_service.dashboard.file_watcher import FileWatcher
+        from src.domain.collaboration.task_schema import write_task
+
+        socketio = Mock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task_file = Path(tmpdir) / "inbox" / "t1.yaml"
+            task_file.parent.mkdir()
+            watcher = FileWatcher(tmpdir, socketio, coalesce_seconds=0.01)
+            watcher.start()
+            try:
+                for status, expected in (
+                    ("new", "task.created"),
+                    ("done", "task.updated"),
+                ):
+                    write_task(task_file, {"id": "t1", "status": status})
+                    deadline = time.monotonic() + 5
+                    while (
+                        expected not in self._emitted(socketio)
+                        and time.monotonic() < deadline
+                    ):
+                        time.sleep(0.02)
+            finally:
+                watcher.stop()
+
+            assert self._emitted(socketio) == ["task.created", "task.updated"]
+            assert socketio.emit.call_args.args[1]["task"]["status"] == "done"
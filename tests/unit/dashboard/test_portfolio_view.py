@@ -0,0 +1,230 @@
+"""
+Unit tests for PortfolioView.
+
+Tests the materialized initiative → specification → task model and its
+incremental patching from single-file changes.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.llm_service.dashboard.portfolio_view import PortfolioView
+
+
+def write_spec(spec_dir: Path, name: str, initiative: str, **fields) -> Path:
+    """Write a specification with valid frontmatter."""
+    frontmatter = {
+        "id": name,
+        "title": f"Spec {name}",
+        "status": "in_progress",
+        "initiative": initiative,
+        "priority": "MEDIUM",
+        **fields,
+    }
+    spec_file = spec_dir / f"{name}.md"
+    spec_file.write_text(f"---\n{yaml.safe_dump(frontmatter)}---\n\n# {name}\n")
+    return spec_file
+
+
+def write_task(work_dir: Path, task_id: str, spec: str | None, **fields) -> Path:
+    """Write a task in the inbox linked to a specification."""
+    task = {"id": task_id, "title": f"Task {task_id}", "status": "new", **fields}
+    if spec is not None:
+        task["specification"] = spec
+    task_file = work_dir / "inbox" / f"{task_id}.yaml"
+    task_file.write_text(yaml.safe_dump(task))
+    return task_file
+
+
+@pytest.fixture
+def dirs(tmp_path: Path, monkeypatch) -> tuple[Path, Path]:
+    """Specification and work directories; tasks link specs relative to cwd."""
+    spec_dir = tmp_path / "specifications"
+    work_dir = tmp_path / "work"
+    spec_dir.mkdir()
+    (work_dir / "inbox").mkdir(parents=True)
+    monkeypatch.chdir(spec_dir)
+    return spec_dir, work_dir
+
+
+@pytest.fixture
+def view(dirs: tuple[Path, Path]) -> PortfolioView:
+    spec_dir, work_dir = dirs
+    write_spec(spec_dir, "alpha", "Alpha")
+    write_spec(spec_dir, "beta", "Beta", status="implemented", priority="HIGH")
+    write_task(work_dir, "t1", "alpha.md", status="done")
+    write_task(work_dir, "t2", "alpha.md")
+    write_task(work_dir, "t3", "beta.md", status="done")
+    write_task(work_dir, "t4", None)
+
+    view = PortfolioView(".", work_dir)
+    view.rebuild()
+    return view
+
+
+def initiatives(snapshot: dict) -> dict:
+    return {initiative["title"]: initiative for initiative in snapshot["initiatives"]}
+
+
+class TestPortfolioView:
+    """Unit tests for the incrementally patched portfolio model."""
+
+    def test_rebuild_groups_tasks_by_initiative(self, view: PortfolioView):
+        """Specifications roll up into initiatives with linked tasks."""
+        snapshot = view.snapshot()
+        by_title = initiatives(snapshot)
+
+        assert list(by_title) == ["Alpha", "Beta"]
+        alpha = by_title["Alpha"]
+        assert alpha["id"] == "alpha"
+        assert alpha["task_count"] == 2
+        assert alpha["progress"] == 50
+        assert [t["id"] for t in alpha["specifications"][0]["tasks"]] == ["t1", "t2"]
+        assert by_title["Beta"]["priority"] == "HIGH"
+        assert by_title["Beta"]["status"] == "implemented"
+        assert [t["id"] for t in snapshot["orphans"]] == ["t4"]
+
+    def test_task_change_recomputes_only_its_initiative(
+        self, view: PortfolioView, dirs: tuple[Path, Path]
+    ):
+        """Editing one task leaves unrelated initiatives untouched."""
+        _, work_dir = dirs
+        before = initiatives(view.snapshot())
+        version = view.version
+
+        task_file = write_task(work_dir, "t2", "alpha.md", status="done")
+        view.file_changed(task_file)
+        after = initiatives(view.snapshot())
+
+        assert view.version == version + 1
+        assert after["Alpha"]["progress"] == 100
+        assert after["Alpha"] is not before["Alpha"]
+        assert after["Beta"] is before["Beta"]
+
+    def test_unchanged_view_serves_cached_structures(self, view: PortfolioView):
+        """Reads without intervening changes do no recomputation."""
+        first = view.snapshot()
+        second = view.snapshot()
+
+        assert second["orphans"] is first["orphans"]
+        for a, b in zip(first["initiatives"], second["initiatives"], strict=True):
+            assert a is b
+
+    def test_removed_task_leaves_initiative(
+        self, view: PortfolioView, dirs: tuple[Path, Path]
+    ):
+        """A deleted (or moved-away) task is dropped from its specification."""
+        _, work_dir = dirs
+        task_file = work_dir / "inbox" / "t1.yaml"
+        task_file.unlink()
+        view.file_removed(task_file)
+
+        alpha = initiatives(view.snapshot())["Alpha"]
+        assert [t["id"] for t in alpha["specifications"][0]["tasks"]] == ["t2"]
+        assert alpha["progress"] == 0
+
+    def test_spec_creation_and_deletion_toggle_orphans(
+        self, view: PortfolioView, dirs: tuple[Path, Path]
+    ):
+        """Tasks become orphans when their specification disappears, and back."""
+        spec_dir, work_dir = dirs
+        view.file_changed(write_task(work_dir, "t5", "gamma.md"))
+        assert "t5" in [t["id"] for t in view.snapshot()["orphans"]]
+
+        spec_file = write_spec(spec_dir, "gamma", "Alpha")
+        view.file_changed(spec_file)
+        snapshot = view.snapshot()
+        assert "t5" not in [t["id"] for t in snapshot["orphans"]]
+        alpha = initiatives(snapshot)["Alpha"]
+        assert alpha["spec_count"] == 2
+        assert alpha["task_count"] == 3
+
+        spec_file.unlink()
+        view.file_removed(spec_file)
+        snapshot = view.snapshot()
+        assert "t5" in [t["id"] for t in snapshot["orphans"]]
+        assert initiatives(snapshot)["Alpha"]["spec_count"] == 1
+
+    def test_spec_moved_between_initiatives(
+        self, view: PortfolioView, dirs: tuple[Path, Path]
+    ):
+        """Changing a spec's initiative updates both old and new initiative."""
+        spec_dir, _ = dirs
+        view.file_changed(write_spec(spec_dir, "beta", "Alpha"))
+
+        by_title = initiatives(view.snapshot())
+        assert list(by_title) == ["Alpha"]
+        assert by_title["Alpha"]["spec_count"] == 2
+        assert by_title["Alpha"]["task_count"] == 3
+
+    def test_started_view_keeps_its_linker_current(
+        self, view: PortfolioView, dirs: tuple[Path, Path], monkeypatch
+    ):
+        """The view's observer feeds the linker, so its queries don't rescan."""
+        _, work_dir = dirs
+        view.start()
+        try:
+            monkeypatch.setattr(
+                view.linker, "scan_tasks", lambda: pytest.fail("linker rescanned")
+            )
+            view.file_changed(write_task(work_dir, "t5", "alpha.md", feature="f1"))
+            (work_dir / "inbox" / "t1.yaml").unlink()
+            view.file_removed(work_dir / "inbox" / "t1.yaml")
+
+            groups = view.linker.group_by_feature("alpha.md")
+            assert sorted(t["id"] for ts in groups.values() for t in ts) == [
+                "t2",
+                "t5",
+            ]
+        finally:
+            view.stop()
+        assert not view.linker.is_running
+
+    def test_change_during_rebuild_is_kept(
+        self, view: PortfolioView, dirs: tuple[Path, Path]
+    ):
+        """Events arriving while rebuild() scans aren't lost to the scan."""
+        _, work_dir = dirs
+        scan = view.linker.scan_tasks
+
+        def scan_with_concurrent_changes():
+            tasks = scan()
+            view.file_changed(write_task(work_dir, "t2", "alpha.md", status="done"))
+            (work_dir / "inbox" / "t1.yaml").unlink()
+            view.file_removed(work_dir / "inbox" / "t1.yaml")
+            return tasks
+
+        with patch.object(
+            view.linker, "scan_tasks", side_effect=scan_with_concurrent_changes
+        ):
+            view.rebuild()
+
+        alpha = initiatives(view.snapshot())["Alpha"]
+        assert alpha["specifications"][0]["tasks"] == [
+            {
+                "id": "t2",
+                "title": "Task t2",
+                "status": "done",
+                "priority": None,
+                "agent": None,
+            }
+        ]
+        groups = view.linker.group_by_feature("alpha.md")
+        assert [t["id"] for ts in groups.values() for t in ts] == ["t2"]
+
+    def test_ignores_unrelated_files(
+        self, view: PortfolioView, dirs: tuple[Path, Path]
+    ):
+        """Files that are neither specifications nor tasks do not bump version."""
+        spec_dir, _ = dirs
+        notes = spec_dir / "notes.txt"
+        notes.write_text("scratch")
+        version = view.version
+
+        view.file_changed(notes)
+        view.file_removed(notes)
+
+        assert view.version == version
@@ -13,6 +13,7 @@ Tests:
 
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -441,11 +442,11 @@ priority: MEDIUM
         self, spec_dir: Path, sample_spec_file: Path
     ):
         """
-        Test file watcher detects file modifications and invalidates cache.
+        Test file watcher detects file modifications and refreshes the cache.
 
         GIVEN a running file watcher
         WHEN a spec file is modified
-        THEN the cache entry is invalidated
+        THEN the cache entry is re-parsed in the background
         """
 
         from src.llm_service.dashboard.spec_cache import SpecificationCache
@@ -469,11 +470,16 @@ initiative: Test
 ---
 """)
 
-            # Wait for file watcher event (small delay)
-            time.sleep(0.15)
+            # Wait for file watcher event and debounced refresh
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                cached = cache.cache.get(str(sample_spec_file))
+                if cached is not None and cached.id == "SPEC-MODIFIED":
+                    break
+                time.sleep(0.02)
 
-            # Assert: Cache entry was invalidated
-            assert str(sample_spec_file) not in cache.cache
+            # Assert: Cache entry was refreshed without a read
+            assert cache.cache[str(sample_spec_file)].title == "Modified"
 
         finally:
             cache.stop_file_watcher()
@@ -532,6 +538,83 @@ initiative: Test
         finally:
             cache.stop_file_watcher()
 
+    def test_file_watcher_picks_up_created_and_moved_specs(self, spec_dir: Path):
+        """
+        Test new and renamed specs appear without preload_all().
+
+        GIVEN a running file watcher and a listener
+        WHEN a spec is created and then renamed
+        THEN get_all_specs() follows, and the listener is notified
+        """
+
+        from src.llm_service.dashboard.spec_cache import SpecificationCache
+
+        cache = SpecificationCache(str(spec_dir))
+        changes = []
+        cache.add_listener(
+            lambda path, meta: changes.append((Path(path).name, meta and meta.id))
+        )
+        cache.start_file_watcher()
+
+        try:
+            (spec_dir / "new.md").write_text("""---
+id: SPEC-NEW
+title: New
+status: draft
+initiative: Test
+---
+""")
+            self._wait_for(
+                lambda: [s.id for s in cache.get_all_specs()] == ["SPEC-NEW"]
+            )
+
+            (spec_dir / "new.md").rename(spec_dir / "renamed.md")
+            self._wait_for(lambda: ("new.md", None) in changes)
+            self._wait_for(lambda: ("renamed.md", "SPEC-NEW") in changes)
+
+            assert list(cache.cache) == [str(spec_dir / "renamed.md")]
+            assert changes[0] == ("new.md", "SPEC-NEW")
+        finally:
+            cache.stop_file_watcher()
+
+    def test_refresh_is_debounced_and_skips_unchanged(self, spec_dir: Path):
+        """
+        Test bursts of events cause a single re-parse and no notification
+        when the metadata did not change.
+        """
+
+        from src.llm_service.dashboard.spec_cache import SpecificationCache
+
+        spec = spec_dir / "spec.md"
+        spec.write_text("---\nid: S\ntitle: T\nstatus: draft\ninitiative: I\n---\n")
+        cache = SpecificationCache(str(spec_dir), refresh_delay=0.2)
+        cache.get_spec(str(spec))
+        changes = []
+        cache.add_listener(lambda path, meta: changes.append(meta))
+        cache.start_file_watcher()
+
+        try:
+            with patch.object(
+                cache.parser, "parse_frontmatter", wraps=cache.parser.parse_frontmatter
+            ) as parse:
+                for _ in range(5):
+                    spec.write_text(spec.read_text())
+                    time.sleep(0.02)
+                self._wait_for(lambda: str(spec) in cache.cache)
+
+            assert parse.call_count == 1
+            assert changes == []
+        finally:
+            cache.stop_file_watcher()
+
+    @staticmethod
+    def _wait_for(condition, timeout: float = 2.0) -> None:
+        """Poll until condition() is true (file events are asynchronous)."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline, "condition not met in time"
+            time.sleep(0.02)
+
     # ========================================================================
     # Edge Case Tests
     # ========================================================================
@@ -610,3 +693,115 @@ No frontmatter here.
         result = cache.get_spec(str(no_fm))
 
         assert result is None
+
+
+class TestSpecificationStore:
+    """Unit tests for the on-disk second tier of SpecificationCache."""
+
+    SPEC = """---
+id: SPEC-{n}
+title: Spec {n}
+status: draft
+initiative: Test Initiative
+created: 2026-02-09
+features:
+  - id: FEAT-{n}
+    title: Feature {n}
+---
+
+# Spec {n}
+"""
+
+    @pytest.fixture
+    def spec_dir(self, tmp_path: Path) -> Path:
+        """Specifications directory with three valid specs and one invalid."""
+        specs_dir = tmp_path / "specifications"
+        (specs_dir / "nested").mkdir(parents=True)
+        for n, name in enumerate(["a.md", "b.md", "nested/c.md"]):
+            (specs_dir / name).write_text(self.SPEC.format(n=n))
+        (specs_dir / "notes.md").write_text("# No frontmatter\n")
+        return specs_dir
+
+    @pytest.fixture
+    def store_path(self, tmp_path: Path) -> Path:
+        """Store file in a cache directory outside the specifications."""
+        return tmp_path / "cache" / "specs.db"
+
+    def test_restart_loads_from_store_without_parsing(
+        self, spec_dir: Path, store_path: Path
+    ):
+        """
+        GIVEN a cache that preloaded all specs
+        WHEN a new cache for the same directory preloads
+        THEN the metadata comes from the store and nothing is parsed
+        """
+        from src.llm_service.dashboard.spec_cache import SpecificationCache
+
+        first = SpecificationCache(str(spec_dir), store_path=store_path)
+        first.preload_all()
+
+        second = SpecificationCache(str(spec_dir), store_path=store_path)
+        with patch.object(second.parser, "parse_frontmatter") as parse:
+            second.preload_all()
+            single = second.get_spec(str(spec_dir / "notes.md"))
+
+        parse.assert_not_called()
+        assert single is None
+        assert sorted(second.cache) == sorted(first.cache)
+        restored = second.cache[str(spec_dir / "nested" / "c.md")]
+        assert restored == first.cache[str(spec_dir / "nested" / "c.md")]
+        assert restored.features[0].title == "Feature 2"
+        assert restored.created.isoformat() == "2026-02-09"
+
+    def test_touched_file_is_matched_by_content(self, spec_dir: Path, store_path: Path):
+        """A changed mtime with unchanged content is still a store hit."""
+        import os
+
+        from src.llm_service.dashboard.spec_cache import SpecificationCache
+
+        SpecificationCache(str(spec_dir), store_path=store_path).preload_all()
+        spec = spec_dir / "a.md"
+        os.utime(spec, ns=(0, 0))
+
+        cache = SpecificationCache(str(spec_dir), store_path=store_path)
+        with patch.object(cache.parser, "parse_frontmatter") as parse:
+            assert cache.get_spec(str(spec)).id == "SPEC-0"
+
+        parse.assert_not_called()
+
+    def test_changed_file_is_parsed_again(self, spec_dir: Path, store_path: Path):
+        """Only specs whose content changed are re-parsed on preload."""
+        from src.llm_service.dashboard import spec_cache
+        from src.llm_service.dashboard.spec_cache import SpecificationCache
+
+        SpecificationCache(str(spec_dir), store_path=store_path).preload_all()
+        (spec_dir / "b.md").write_text(self.SPEC.format(n=42))
+        (spec_dir / "nested" / "c.md").unlink()
+
+        parsed: list[str] = []
+        parse_chunk = spec_cache._parse_chunk
+
+        def recording_parse_chunk(base_dir, paths):
+            parsed.extend(paths)
+            return parse_chunk(base_dir, paths)
+
+        cache = SpecificationCache(str(spec_dir), store_path=store_path)
+        with patch.object(spec_cache, "_parse_chunk", recording_parse_chunk):
+            cache.preload_all()
+
+        assert parsed == [str(spec_dir / "b.md")]
+        assert cache.cache[str(spec_dir / "b.md")].id == "SPEC-42"
+        assert len(cache.cache) == 2
+        assert len(cache.store.all()) == 3  # a, b and the invalid notes.md
+
+    def test_memory_only_cache_writes_no_store(self, spec_dir: Path):
+        """Without a store_path nothing is written into the specs tree."""
+        from src.llm_service.dashboard.spec_cache import SpecificationCache
+
+        before = sorted(spec_dir.rglob("*"))
+        cache = SpecificationCache(str(spec_dir))
+        cache.preload_all()
+
+        assert cache.store is None
+        assert len(cache.cache) == 3
+        assert sorted(spec_dir.rglob("*")) == before
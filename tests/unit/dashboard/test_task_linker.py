@@ -6,6 +6,7 @@ Implements TDD (Directive 017) - RED phase.
 """
 
 from pathlib import Path
+from unittest.mock import PropertyMock, patch
 
 import pytest
 import yaml
@@ -467,6 +468,170 @@ class TestErrorHandling:
         assert True  # Placeholder
 
 
+class TestTaskIndex:
+    """Unit tests for the specification → feature → task index."""
+
+    @pytest.fixture
+    def linker(self, tmp_path: Path):
+        from src.llm_service.dashboard.task_linker import TaskLinker
+
+        spec_dir = tmp_path / "specs"
+        work_dir = tmp_path / "work"
+        spec_dir.mkdir()
+        (work_dir / "inbox").mkdir(parents=True)
+        (spec_dir / "a.md").write_text("---\nid: a\n---\n")
+        for task_id, spec, feature in [
+            ("t1", "a.md", "f1"),
+            ("t2", "a.md", "f2"),
+            ("t3", "missing.md", None),
+            ("t4", None, None),
+        ]:
+            task = {
+                "id": task_id,
+                "status": "new",
+                "specification": spec,
+                "feature": feature,
+            }
+            (work_dir / "inbox" / f"{task_id}.yaml").write_text(
+                yaml.dump({k: v for k, v in task.items() if v})
+            )
+        return TaskLinker(str(work_dir), spec_dir=str(spec_dir))
+
+    @pytest.fixture
+    def indexed(self, linker):
+        """Linker with a built index, trusted as if file events kept it current."""
+        from src.llm_service.dashboard.task_linker import TaskLinker
+
+        linker.rebuild()
+        with patch.object(
+            TaskLinker, "is_running", new_callable=PropertyMock, return_value=True
+        ):
+            yield linker
+
+    def test_queries_use_one_scan(self, indexed):
+        """Per-specification lookups don't rescan once the index is built."""
+        linker = indexed
+
+        with patch.object(linker, "scan_tasks") as scan_tasks:
+            by_feature = linker.group_by_feature("a.md")
+            specification = linker.get_tasks_for_specification("./a.md")
+            orphans = linker.get_orphan_tasks()
+
+        scan_tasks.assert_not_called()
+        assert {f: [t["id"] for t in ts] for f, ts in by_feature.items()} == {
+            "f1": ["t1"],
+            "f2": ["t2"],
+        }
+        assert len(specification) == 2
+        assert sorted(t["id"] for t in orphans) == ["t3", "t4"]
+
+    def test_file_events_patch_index(self, indexed, tmp_path: Path):
+        """Changed, moved and removed task files update the groups."""
+        linker = indexed
+        inbox = tmp_path / "work" / "inbox"
+
+        (inbox / "t3.yaml").write_text(
+            yaml.dump(
+                {"id": "t3", "status": "new", "specification": "a.md", "feature": "f1"}
+            )
+        )
+        linker.file_changed(inbox / "t3.yaml")
+        (inbox / "t1.yaml").unlink()
+        linker.file_removed(inbox / "t1.yaml")
+
+        assert [t["id"] for t in linker.group_by_feature("a.md")["f1"]] == ["t3"]
+        assert [t["id"] for t in linker.get_orphan_tasks()] == ["t4"]
+
+    def test_missing_specification_appears_later(self, indexed, tmp_path: Path):
+        """Orphan status follows the specification file without re-parsing."""
+        linker = indexed
+        (tmp_path / "specs" / "missing.md").write_text("---\nid: m\n---\n")
+
+        assert [t["id"] for t in linker.get_orphan_tasks()] == ["t4"]
+
+    def test_listeners_receive_task_changes(self, indexed, tmp_path: Path):
+        """Listeners see (previous, current) for changed and removed tasks."""
+        linker = indexed
+        inbox = tmp_path / "work" / "inbox"
+        changes = []
+        linker.add_listener(
+            lambda previous, current: changes.append(
+                (previous and previous["status"], current and current["status"])
+            )
+        )
+
+        (inbox / "t1.yaml").write_text(
+            yaml.dump({"id": "t1", "status": "done", "specification": "a.md"})
+        )
+        linker.file_changed(inbox / "t1.yaml")
+        linker.file_changed(inbox / "t2.yaml")  # unchanged: no notification
+        (inbox / "t4.yaml").unlink()
+        linker.file_removed(inbox / "t4.yaml")
+
+        assert changes == [("new", "done"), ("new", None)]
+
+    def test_queries_return_copies(self, indexed):
+        """Mutating query results leaves the index intact."""
+        linker = indexed
+
+        linker.group_by_feature("a.md")["f1"][0]["status"] = "done"
+        linker.get_orphan_tasks()[0]["id"] = "changed"
+
+        assert linker.group_by_feature("a.md")["f1"][0]["status"] == "new"
+        assert sorted(t["id"] for t in linker.get_orphan_tasks()) == ["t3", "t4"]
+
+    def test_change_during_rescan_is_kept(self, linker, tmp_path: Path):
+        """An event arriving while rebuild() scans isn't lost to the scan."""
+        inbox = tmp_path / "work" / "inbox"
+        scan = linker.scan_tasks
+
+        def scan_with_concurrent_change():
+            tasks = scan()
+            (inbox / "t1.yaml").write_text(
+                yaml.dump(
+                    {
+                        "id": "t1",
+                        "status": "done",
+                        "specification": "a.md",
+                        "feature": "f1",
+                    }
+                )
+            )
+            linker.file_changed(inbox / "t1.yaml")
+            return tasks
+
+        with patch.object(
+            linker, "scan_tasks", side_effect=scan_with_concurrent_change
+        ):
+            linker.rebuild()
+        linker.attach()
+
+        assert linker.group_by_feature("a.md")["f1"][0]["status"] == "done"
+
+    def test_running_linker_follows_file_system(self, linker, tmp_path: Path):
+        """With the observer running, new task files reach the index."""
+        import time
+
+        linker.start()
+        try:
+            (tmp_path / "work" / "inbox" / "t5.yaml").write_text(
+                yaml.dump(
+                    {
+                        "id": "t5",
+                        "status": "new",
+                        "specification": "a.md",
+                        "feature": "f3",
+                    }
+                )
+            )
+            deadline = time.monotonic() + 5
+            while "f3" not in linker.group_by_feature("a.md"):
+                assert time.monotonic() < deadline, "event not applied"
+                time.sleep(0.05)
+        finally:
+            linker.stop()
+
+
 # Test coverage summary
 """
 Unit Test Coverage for TaskLinker:
@@ -290,6 +290,129 @@ class TestTelemetryAPI:
             call_args = mock_socketio.emit.call_args
             assert call_args[0][0] == "cost.update"
 
+    def test_iter_invocations_streams_in_batches(self):
+        """Test: Invocations are streamed in insertion order across batches."""
+        from llm_service.dashboard.telemetry_api import TelemetryAPI
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            self._create_test_db(db_path)
+
+            with sqlite3.connect(db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO invocations (invocation_id, timestamp, tool_name, model_name, status)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    [
+                        (f"inv-{i}", f"2026-02-1{i} 10:00:00", "cli", "gpt-4", "ok")
+                        for i in range(7)
+                    ],
+                )
+
+            api = TelemetryAPI(db_path=db_path)
+            records = list(api.iter_invocations(batch_size=3))
+            recent = api.iter_invocations(since="2026-02-15", batch_size=3)
+
+            assert [r["invocation_id"] for r in records] == [
+                f"inv-{i}" for i in range(7)
+            ]
+            assert records[0]["model_name"] == "gpt-4"
+            assert [r["invocation_id"] for r in recent] == ["inv-5", "inv-6"]
+
+    def test_costs_use_rollup_for_closed_days(self):
+        """Test: Past days come from daily_costs, today from invocations."""
+        from llm_service.dashboard.telemetry_api import TelemetryAPI
+        from llm_service.telemetry.logger import InvocationRecord, TelemetryLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            telemetry = TelemetryLogger(db_path)
+            now = datetime.now(timezone.utc)
+            for i, (when, cost) in enumerate(
+                [(now - timedelta(days=40), 1.0), (now - timedelta(days=1), 0.5)]
+            ):
+                telemetry.log_invocation(self._record(InvocationRecord, i, when, cost))
+            telemetry.log_invocation(self._record(InvocationRecord, 2, now, 0.25))
+
+            # Pruned history stays in the rollup
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("DELETE FROM invocations WHERE invocation_id = 'inv-0'")
+
+            api = TelemetryAPI(db_path=db_path, cache_ttl=0)
+
+            assert api.get_total_cost() == 1.75
+            assert api.get_today_cost() == 0.25
+            assert [s["invocations"] for s in api.get_model_usage_stats()] == [3]
+            assert [t["cost_usd"] for t in api.get_cost_trend(days=7)] == [0.5, 0.25]
+
+    def test_costs_fall_back_without_rollup(self):
+        """Test: Invocations not in daily_costs are aggregated directly."""
+        from llm_service.dashboard.telemetry_api import TelemetryAPI
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            self._create_test_db(db_path)
+            last_week = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO invocations (invocation_id, timestamp, tool_name, model_name, cost_usd, status)
+                    VALUES ('old', ?, 'cli', 'gpt-4', 0.5, 'success')
+                """,
+                    (last_week,),
+                )
+
+            api = TelemetryAPI(db_path=db_path)
+
+            assert api.get_total_cost() == 0.5
+            assert api.get_today_cost() == 0.0
+
+    def test_cached_costs_refresh_after_writes(self):
+        """Test: Cached figures are reused until another connection writes."""
+        from unittest.mock import patch
+
+        from llm_service.dashboard.telemetry_api import TelemetryAPI
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "telemetry.db"
+            self._create_test_db(db_path)
+            api = TelemetryAPI(db_path=db_path, cache_ttl=60)
+
+            with patch.object(
+                api, "_load_daily_usage", wraps=api._load_daily_usage
+            ) as load:
+                assert api.get_total_cost() == 0.0
+                assert api.get_today_cost() == 0.0
+                assert load.call_count == 1
+
+                with sqlite3.connect(db_path) as conn:
+                    conn.execute("""
+                        INSERT INTO invocations (invocation_id, tool_name, model_name, cost_usd, status)
+                        VALUES ('new', 'cli', 'gpt-4', 0.25, 'success')
+                    """)
+
+                assert api.get_total_cost() == 0.25
+                assert load.call_count == 2
+            api.close()
+
+    @staticmethod
+    def _record(record_type, i: int, timestamp: datetime, cost: float):
+        """Helper: Invocation record for a given time and cost."""
+        return record_type(
+            invocation_id=f"inv-{i}",
+            agent_name="dev",
+            tool_name="cli",
+            model_name="gpt-4",
+            prompt_tokens=10,
+            completion_tokens=10,
+            total_tokens=20,
+            cost_usd=cost,
+            latency_ms=100,
+            status="success",
+            timestamp=timestamp,
+        )
+
     @staticmethod
     def _create_test_db(db_path: Path):
         """Helper: Create test database with schema."""
@@ -0,0 +1,136 @@
+"""
+Unit tests for the process-wide parsed-task cache.
+
+Tests src.domain.collaboration.task_cache: identity-keyed hits, change
+detection, LRU eviction under the memory cap and sharing between loaders.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.domain.collaboration import task_codec
+from src.domain.collaboration.task_cache import ParsedTaskCache, get_task_cache
+from src.domain.collaboration.task_schema import load_task_safe, read_task
+from src.llm_service.dashboard.file_watcher import FileWatcher
+from src.llm_service.dashboard.task_linker import TaskLinker
+
+
+def _write(path: Path, content: str, age_seconds: float = 60) -> Path:
+    """Write a file and backdate it out of the racy window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    mtime_ns = time.time_ns() - int(age_seconds * 1e9)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture
+def task_file(tmp_path: Path) -> Path:
+    """Task file last modified a minute ago."""
+    return _write(
+        tmp_path / "inbox" / "t-1.yaml",
+        "id: t-1\nstatus: new\ncreated_at: 2026-02-10T10:00:00Z\n",
+    )
+
+
+@pytest.fixture
+def cache() -> ParsedTaskCache:
+    """Cleared process-wide cache."""
+    cache = get_task_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+class TestParsedTaskCache:
+    """Test cache hits, misses and eviction."""
+
+    def test_unchanged_file_is_parsed_once(self, task_file, cache):
+        """Test that repeated loads hit the cache and return copies."""
+        first = cache.load(task_file)
+        first["status"] = "mutated"
+
+        with patch.object(
+            task_codec.YAMLTaskCodec, "loads", side_effect=AssertionError
+        ):
+            second = cache.load(task_file)
+
+        assert second["status"] == "new"
+        assert second["created_at"] == datetime(2026, 2, 10, 10, tzinfo=timezone.utc)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_modified_file_is_reparsed(self, task_file, cache):
+        """Test that a new mtime/size invalidates the entry."""
+        cache.load(task_file)
+        _write(task_file, "id: t-1\nstatus: assigned\n", age_seconds=30)
+
+        assert cache.load(task_file)["status"] == "assigned"
+        assert cache.stats().entries == 1
+
+    def test_recently_modified_file_not_cached(self, tmp_path, cache):
+        """Test that files inside the racy window are always re-read."""
+        path = _write(tmp_path / "t.yaml", "id: t\nstatus: new\n", age_seconds=0)
+
+        cache.load(path)
+        cache.load(path)
+
+        assert cache.stats().hits == 0
+        assert cache.stats().entries == 0
+
+    def test_lru_eviction_under_memory_cap(self, tmp_path):
+        """Test that least recently used entries go first."""
+        paths = [
+            _write(tmp_path / f"t{i}.yaml", f"id: t{i}\nstatus: new\n")
+            for i in range(3)
+        ]
+        cache = ParsedTaskCache()
+        cache.load(paths[0])
+        cache.max_bytes = cache.stats().bytes * 2
+
+        cache.load(paths[1])
+        cache.load(paths[0])  # Refresh t0
+        cache.load(paths[2])  # Evicts t1
+
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.bytes <= stats.max_bytes
+        cache.load(paths[0])
+        assert cache.stats().hits == 2
+
+    def test_parse_errors_are_not_cached(self, tmp_path, cache):
+        """Test that invalid files raise on every load."""
+        path = _write(tmp_path / "broken.yaml", "id: [unclosed\n")
+
+        for _ in range(2):
+            with pytest.raises(yaml.YAMLError):
+                cache.load(path)
+
+        assert cache.stats().entries == 0
+
+
+class TestSharedAcrossLoaders:
+    """Test that the task loaders share one cache."""
+
+    def test_loaders_share_parsed_tasks(self, tmp_path, task_file, cache):
+        """Test read_task, TaskLinker and FileWatcher reuse one parse."""
+        read_task(task_file)
+
+        with patch.object(
+            task_codec.YAMLTaskCodec, "loads", side_effect=AssertionError
+        ):
+            assert load_task_safe(task_file)["id"] == "t-1"
+            assert TaskLinker(str(tmp_path)).scan_tasks()[0]["id"] == "t-1"
+            assert FileWatcher(tmp_path).parse_task_file(task_file)["id"] == "t-1"
+
+        assert cache.stats().misses == 1
+        assert cache.stats().hits == 3
@@ -0,0 +1,195 @@
+"""
+Unit tests for the task codec layer.
+
+Tests src.domain.collaboration.task_codec: the libyaml-backed YAML codec,
+codec pluggability and the content-addressed sidecar cache beneath
+read_task()/write_task().
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.domain.collaboration import task_codec
+from src.domain.collaboration.task_cache import get_task_cache
+from src.domain.collaboration.task_codec import (
+    SidecarCache,
+    TaskCodec,
+    configure_sidecar_cache,
+    get_task_codec,
+    set_task_codec,
+)
+from src.domain.collaboration.task_schema import TaskIOError, read_task, write_task
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    """Reset module-level codec state after each test."""
+    codec = get_task_codec()
+    sidecar = task_codec.get_sidecar_cache()
+    yield
+    set_task_codec(codec)
+    task_codec._sidecar = sidecar
+
+
+@pytest.fixture
+def task_file(tmp_path: Path) -> Path:
+    """Task file with a timestamp field."""
+    path = tmp_path / "task.yaml"
+    path.write_text(
+        "id: t-1\nstatus: new\ncreated_at: 2026-02-10T10:00:00Z\n"
+        "artefacts:\n- docs/a.md\n"
+    )
+    return path
+
+
+class TestYAMLTaskCodec:
+    """Test the default YAML codec."""
+
+    def test_uses_libyaml_when_available(self):
+        """Test that the C loader/dumper are selected when compiled in."""
+        if not yaml.__with_libyaml__:
+            pytest.skip("PyYAML built without libyaml")
+        assert task_codec.YAML_LOADER is yaml.CSafeLoader
+        assert task_codec.YAML_DUMPER is yaml.CSafeDumper
+
+    def test_round_trip(self, tmp_path):
+        """Test that write_task output reads back identically, in key order."""
+        task = {
+            "id": "t-1",
+            "status": "new",
+            "title": "Round trip",
+            "created_at": datetime(2026, 2, 10, 10, tzinfo=timezone.utc),
+            "context": {"notes": ["a", "b"]},
+        }
+        path = tmp_path / "task.yaml"
+
+        write_task(path, task)
+
+        assert read_task(path) == task
+        assert path.read_text().startswith("id: t-1\nstatus: new\n")
+
+
+class TestPluggableCodec:
+    """Test replacing the codec used by read_task/write_task."""
+
+    def test_custom_codec_is_used(self, tmp_path):
+        """Test that a registered codec handles both directions."""
+
+        class JSONCodec(TaskCodec):
+            name = "json"
+
+            def loads(self, content):
+                return json.loads(content)
+
+            def dump(self, task, stream):
+                json.dump(task, stream)
+
+        set_task_codec(JSONCodec())
+        path = tmp_path / "task.yaml"
+
+        write_task(path, {"id": "t-1", "status": "new"})
+
+        assert json.loads(path.read_text()) == {"id": "t-1", "status": "new"}
+        assert read_task(path)["id"] == "t-1"
+
+
+class TestSidecarCache:
+    """Test the binary sidecar cache."""
+
+    def test_disabled_by_default(self, task_file):
+        """Test that no sidecar is used unless configured."""
+        configure_sidecar_cache(None)
+
+        read_task(task_file)
+
+        assert task_codec.get_sidecar_cache() is None
+
+    def test_unchanged_file_skips_parsing(self, task_file, tmp_path):
+        """Test that a second read is served from the sidecar."""
+        cache = configure_sidecar_cache(tmp_path / "cache")
+        first = read_task(task_file)
+        get_task_cache().clear()  # As if in a new process
+
+        with patch.object(
+            task_codec.YAMLTaskCodec, "loads", side_effect=AssertionError
+        ):
+            second = read_task(task_file)
+
+        assert second == first
+        assert second["created_at"] == datetime(2026, 2, 10, 10, tzinfo=timezone.utc)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_file_is_reparsed(self, task_file, tmp_path):
+        """Test that new content gets a new digest."""
+        configure_sidecar_cache(tmp_path / "cache")
+        read_task(task_file)
+
+        task_file.write_text("id: t-1\nstatus: done\n")
+
+        assert read_task(task_file)["status"] == "done"
+
+    def test_corrupt_entry_is_a_miss(self, task_file, tmp_path):
+        """Test that unreadable entries fall back to parsing."""
+        cache = configure_sidecar_cache(tmp_path / "cache")
+        read_task(task_file)
+        for entry in cache.directory.rglob("*.bin"):
+            entry.write_bytes(b"\x00garbage")
+
+        assert read_task(task_file)["id"] == "t-1"
+
+    def test_unmarshallable_document_not_cached(self, tmp_path):
+        """Test that documents marshal can't hold are just not cached."""
+        cache = SidecarCache(tmp_path / "cache")
+        digest = SidecarCache.digest(b"x", get_task_codec())
+
+        cache.put(digest, {datetime(2026, 1, 1): "non-string key"})
+
+        assert cache.get(digest) == (False, None)
+
+    def test_errors_are_not_cached(self, tmp_path):
+        """Test that invalid YAML is reported on every read."""
+        configure_sidecar_cache(tmp_path / "cache")
+        path = tmp_path / "broken.yaml"
+        path.write_text("id: [unclosed\n")
+
+        for _ in range(2):
+            with pytest.raises(TaskIOError, match="Invalid YAML"):
+                read_task(path)
+
+    def test_oldest_entries_pruned_beyond_limit(self, tmp_path):
+        """Test that the sidecar directory can't grow without bound."""
+        cache = SidecarCache(tmp_path / "cache", max_entries=10)
+        digests = [
+            SidecarCache.digest(str(i).encode(), get_task_codec()) for i in range(11)
+        ]
+        for i, digest in enumerate(digests[:10]):
+            cache.put(digest, {"id": i})
+            entry = cache._entry_path(digest)
+            os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+        cache.put(digests[10], {"id": 10})
+
+        remaining = {p.stem for p in cache.directory.rglob("*.bin")}
+        assert remaining == set(digests[-9:])
+
+
+class TestCodecInterface:
+    """Test the TaskCodec interface."""
+
+    def test_incomplete_codec_cannot_be_instantiated(self):
+        """Test that codecs must implement both loads() and dump()."""
+
+        class LoadOnlyCodec(TaskCodec):
+            def loads(self, content):
+                return content
+
+        with pytest.raises(TypeError):
+            LoadOnlyCodec()
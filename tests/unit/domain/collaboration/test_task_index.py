@@ -0,0 +1,393 @@
+"""
+Unit tests for the persistent task index.
+
+Tests the reconciliation and query logic in
+src.domain.collaboration.task_index, ensuring the index stays in sync with
+task files and only re-parses files that changed.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.domain.collaboration import task_index
+from src.domain.collaboration.task_index import TaskIndex, get_task_index
+
+
+def _write(path: Path, task: dict) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.dump(task, sort_keys=False))
+    return path
+
+
+@pytest.fixture
+def work_dir(tmp_path: Path) -> Path:
+    """Collaboration directory with one task per lifecycle stage."""
+    work_dir = tmp_path / "collaboration"
+    _write(
+        work_dir / "inbox" / "t-inbox.yaml",
+        {"id": "t-inbox", "status": "new", "agent": "python-pedro"},
+    )
+    _write(
+        work_dir / "assigned" / "python-pedro" / "t-active.yaml",
+        {
+            "id": "t-active",
+            "status": "in_progress",
+            "agent": "python-pedro",
+            "artefacts": ["docs/a.md"],
+            "started_at": "2026-02-10T10:00:00Z",
+        },
+    )
+    _write(
+        work_dir / "done" / "python-pedro" / "t-done.yaml",
+        {
+            "id": "t-done",
+            "status": "done",
+            "agent": "python-pedro",
+            "result": {"summary": "ok", "next_agent": "backend-benny"},
+        },
+    )
+    return work_dir
+
+
+class TestReconcile:
+    """Test synchronisation between index and file system."""
+
+    def test_initial_reconcile_indexes_all_stages(self, work_dir):
+        """Test that every task file is indexed with its metadata."""
+        index = TaskIndex(work_dir)
+
+        entries = {e.task_id: e for e in index.entries()}
+
+        assert set(entries) == {"t-inbox", "t-active", "t-done"}
+        assert entries["t-active"].stage == "assigned"
+        assert entries["t-active"].bucket == "python-pedro"
+        assert entries["t-active"].artefacts == ["docs/a.md"]
+        assert entries["t-done"].next_agent == "backend-benny"
+        assert entries["t-inbox"].bucket is None
+
+    def test_unchanged_files_are_not_reparsed(self, work_dir):
+        """Test that a second reconcile does no parsing."""
+        index = TaskIndex(work_dir)
+        index.reconcile()
+
+        with patch.object(task_index, "read_task") as read_task:
+            assert index.reconcile() == 0
+            index.load_tasks()
+
+        read_task.assert_not_called()
+
+    def test_modified_file_is_reparsed(self, work_dir):
+        """Test that a changed file is picked up on the next reconcile."""
+        index = TaskIndex(work_dir)
+        index.reconcile()
+
+        task_file = work_dir / "inbox" / "t-inbox.yaml"
+        _write(task_file, {"id": "t-inbox", "status": "assigned", "agent": "x"})
+        stat = task_file.stat()
+        os.utime(task_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert index.reconcile() == 1
+        assert index.find_by_id("t-inbox").status == "assigned"
+
+    def test_removed_file_is_dropped(self, work_dir):
+        """Test that deleted files disappear from the index."""
+        index = TaskIndex(work_dir)
+        index.reconcile()
+
+        (work_dir / "done" / "python-pedro" / "t-done.yaml").unlink()
+
+        assert index.find_by_id("t-done") is None
+
+    def test_invalid_file_recorded_as_error(self, work_dir):
+        """Test that unparseable files are indexed with their error."""
+        (work_dir / "inbox" / "broken.yaml").write_text("id: [unclosed\n")
+        index = TaskIndex(work_dir)
+
+        broken = [e for e in index.entries(("inbox",)) if e.error]
+
+        assert len(broken) == 1
+        assert broken[0].load() is None
+        assert not broken[0].is_open
+
+    def test_index_survives_new_instance(self, work_dir):
+        """Test that the on-disk index is reused by a new instance."""
+        TaskIndex(work_dir).reconcile()
+
+        with patch.object(task_index, "read_task") as read_task:
+            assert TaskIndex(work_dir).reconcile() == 0
+
+        read_task.assert_not_called()
+
+
+class TestQueries:
+    """Test index query helpers."""
+
+    def test_load_returns_fresh_documents(self, work_dir):
+        """Test that loaded documents round-trip and are independent copies."""
+        index = TaskIndex(work_dir)
+        entry = index.find_by_id("t-active")
+
+        first = entry.load()
+        first["status"] = "mutated"
+
+        assert entry.load()["status"] == "in_progress"
+
+    def test_datetimes_round_trip(self, tmp_path):
+        """Test that YAML timestamps keep their Python type."""
+        work_dir = tmp_path / "collaboration"
+        (work_dir / "inbox").mkdir(parents=True)
+        (work_dir / "inbox" / "t.yaml").write_text(
+            "id: t\nstatus: new\ncreated_at: 2026-02-10T10:00:00Z\n"
+        )
+
+        task = TaskIndex(work_dir).load_tasks()[0]
+
+        assert task["created_at"] == datetime(2026, 2, 10, 10, tzinfo=timezone.utc)
+
+    def test_open_only_excludes_terminal_tasks(self, work_dir):
+        """Test filtering to non-terminal tasks."""
+        tasks = TaskIndex(work_dir).load_tasks(open_only=True)
+
+        assert {t["id"] for t in tasks} == {"t-inbox", "t-active"}
+
+    def test_record_and_forget(self, work_dir):
+        """Test write-through hooks used after moving a file."""
+        index = TaskIndex(work_dir)
+        index.reconcile()
+        src = work_dir / "inbox" / "t-inbox.yaml"
+        dest = work_dir / "assigned" / "python-pedro" / "t-inbox.yaml"
+        task = {"id": "t-inbox", "status": "assigned", "agent": "python-pedro"}
+        _write(dest, task)
+        src.unlink()
+
+        index.record(dest, task)
+        index.forget(src)
+
+        with patch.object(task_index, "read_task") as read_task:
+            entry = index.find_by_id("t-inbox")
+
+        read_task.assert_not_called()
+        assert entry.stage == "assigned"
+
+    def test_refresh_single_file(self, work_dir):
+        """Test reconciling one file without walking the tree."""
+        index = TaskIndex(work_dir)
+        index.reconcile()
+        task_file = work_dir / "inbox" / "t-new.yaml"
+        _write(task_file, {"id": "t-new", "status": "new", "agent": "x"})
+
+        entry = index.refresh(task_file)
+        with patch.object(task_index, "read_task") as read_task:
+            assert index.refresh(task_file) == entry
+
+        read_task.assert_not_called()
+        assert entry.task_id == "t-new"
+
+        task_file.unlink()
+        assert index.refresh(task_file) is None
+        assert index.find_by_id("t-new") is None
+
+    def test_only_task_suffix_is_indexed(self, work_dir):
+        """Test that scans and single-file refreshes agree on task files."""
+        stray = _write(work_dir / "inbox" / "t-stray.yml", {"id": "t-stray"})
+        index = TaskIndex(work_dir)
+
+        assert index.refresh(stray) is None
+        assert index.find_by_id("t-stray") is None
+
+    def test_bucket_reconcile_only_touches_one_agent(self, work_dir):
+        """Test that a bucket reconcile leaves other agents' rows alone."""
+        index = TaskIndex(work_dir)
+        index.reconcile()
+        other = work_dir / "assigned" / "backend-benny" / "t-other.yaml"
+        _write(other, {"id": "t-other", "status": "assigned"})
+        (work_dir / "assigned" / "python-pedro" / "t-active.yaml").unlink()
+        _write(
+            work_dir / "assigned" / "python-pedro" / "t-new.yaml",
+            {"id": "t-new", "status": "assigned"},
+        )
+
+        assert index.reconcile(("assigned",), bucket="python-pedro") == 2
+
+        pedro = index.entries(("assigned",), bucket="python-pedro", reconcile=False)
+        assert [e.task_id for e in pedro] == ["t-new"]
+        assert (
+            index.entries(("assigned",), bucket="backend-benny", reconcile=False) == []
+        )
+
+
+class TestPaging:
+    """Test filtered, keyset-paginated queries."""
+
+    @pytest.fixture
+    def done_dir(self, tmp_path: Path) -> Path:
+        """Collaboration directory with 25 finished tasks of two agents."""
+        work_dir = tmp_path / "collaboration"
+        for i in range(25):
+            agent = "python-pedro" if i % 2 else "backend-benny"
+            _write(
+                work_dir / "done" / agent / f"t-{i:02d}.yaml",
+                {
+                    "id": f"t-{i:02d}",
+                    "status": "done" if i % 5 else "error",
+                    "agent": agent,
+                    "priority": ["low", "medium", "high"][i % 3],
+                    "completed_at": f"2026-03-01T10:{i:02d}:00+00:00",
+                },
+            )
+        return work_dir
+
+    @staticmethod
+    def _all_ids(index: TaskIndex, **query) -> list[str]:
+        ids: list[str] = []
+        cursor = None
+        while True:
+            page = index.page(cursor=cursor, **query)
+            ids.extend(e.task_id for e in page.entries)
+            cursor = page.next_cursor
+            if cursor is None:
+                return ids
+
+    def test_pages_follow_sort_order(self, done_dir):
+        """Test that pages together list every task once, newest first."""
+        index = TaskIndex(done_dir)
+
+        ids = self._all_ids(index, limit=7)
+
+        assert ids == [f"t-{i:02d}" for i in reversed(range(25))]
+        assert self._all_ids(index, sort="id", limit=4) == sorted(ids)
+
+    def test_filters_are_combined(self, done_dir):
+        """Test filtering by agent, status, priority and update time."""
+        index = TaskIndex(done_dir)
+
+        page = index.page(
+            agent="python-pedro",
+            statuses=["done"],
+            priorities=["HIGH"],
+            since="2026-03-01T10:10:00Z",
+        )
+
+        assert [e.task_id for e in page.entries] == ["t-23", "t-17", "t-11"]
+        assert page.next_cursor is None
+
+    def test_priority_sort_ranks_critical_first(self, done_dir):
+        """Test that priority sorts by rank, not alphabetically."""
+        index = TaskIndex(done_dir)
+
+        entries = index.page(sort="priority", limit=25).entries
+
+        ranks = [e.priority for e in entries]
+        assert ranks == sorted(ranks, key=["high", "medium", "low"].index)
+
+    def test_cursor_is_stable_while_tasks_move(self, done_dir):
+        """Test that tasks added or removed behind the cursor don't shift pages."""
+        index = TaskIndex(done_dir)
+        first = index.page(limit=10)
+
+        # A newer task lands before the cursor, a listed one disappears
+        _write(
+            done_dir / "done" / "python-pedro" / "t-new.yaml",
+            {"id": "t-new", "status": "done", "completed_at": "2026-03-02T00:00:00Z"},
+        )
+        (done_dir / "done" / "python-pedro" / "t-23.yaml").unlink()
+        second = index.page(limit=10, cursor=first.next_cursor)
+
+        assert [e.task_id for e in second.entries] == [
+            f"t-{i:02d}" for i in range(14, 4, -1)
+        ]
+
+    def test_z_suffix_times_without_native_support(self, done_dir, monkeypatch):
+        """Test "Z" times are normalized where fromisoformat rejects them."""
+
+        class StrictDatetime(datetime):
+            """fromisoformat() as on Python 3.10, which has no "Z" support."""
+
+            @classmethod
+            def fromisoformat(cls, value):
+                if value.endswith("Z"):
+                    raise ValueError(f"Invalid isoformat string: {value!r}")
+                return super().fromisoformat(value)
+
+        monkeypatch.setattr(task_index, "datetime", StrictDatetime)
+
+        assert task_index.timestamp_key("2026-03-01T10:20:00Z") == (
+            task_index.timestamp_key("2026-03-01T10:20:00+00:00")
+        )
+        page = TaskIndex(done_dir).page(since="2026-03-01T10:20:00Z", sort="id")
+        assert [e.task_id for e in page.entries] == [
+            f"t-{i:02d}" for i in range(20, 25)
+        ]
+
+    def test_invalid_arguments_raise(self, done_dir):
+        """Test that bad sort keys, limits, times and cursors are rejected."""
+        index = TaskIndex(done_dir)
+        cursor = index.page(limit=1).next_cursor
+
+        with pytest.raises(ValueError):
+            index.page(sort="title")
+        with pytest.raises(ValueError):
+            index.page(limit=0)
+        with pytest.raises(ValueError):
+            index.page(cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            index.page(sort="id", cursor=cursor)
+        with pytest.raises(ValueError):
+            index.page(since="yesterday")
+
+
+class TestFollowupLedger:
+    """Test the follow-up ledger used by the coordinator."""
+
+    def test_record_removes_task_from_pending(self, work_dir):
+        """Test that a recorded follow-up is no longer pending."""
+        index = TaskIndex(work_dir)
+        assert [e.task_id for e in index.pending_followups()] == ["t-done"]
+        assert index.find_followup("t-done") is None
+
+        index.record_followup("t-done", "f-1")
+        index.record_followup("t-done", "f-2")
+
+        assert index.find_followup("t-done") == "f-1"
+        assert index.pending_followups() == []
+
+    def test_ledger_survives_new_instance(self, work_dir):
+        """Test that recorded follow-ups are durable across processes."""
+        TaskIndex(work_dir).record_followup("t-done", "f-1")
+
+        assert TaskIndex(work_dir).pending_followups() == []
+
+    def test_existing_followup_file_is_found(self, work_dir):
+        """Test that follow-up files on disk are found before the ledger has them."""
+        _write(
+            work_dir / "assigned" / "backend-benny" / "x-followup-t-done.yaml",
+            {"id": "x-followup-t-done", "status": "assigned"},
+        )
+        index = TaskIndex(work_dir)
+        index.reconcile()
+
+        assert index.find_followup("t-done") == "x-followup-t-done"
+
+    def test_tasks_without_id_are_not_pending(self, work_dir):
+        """Test that a completion without an id can't stay pending forever."""
+        _write(
+            work_dir / "done" / "backend-benny" / "no-id.yaml",
+            {"id": None, "status": "done", "result": {"next_agent": "x"}},
+        )
+
+        assert [e.task_id for e in TaskIndex(work_dir).pending_followups()] == [
+            "t-done"
+        ]
+
+
+def test_get_task_index_is_shared_per_directory(work_dir):
+    """Test that the registry returns one index per directory."""
+    assert get_task_index(work_dir) is get_task_index(work_dir)
+    assert (work_dir / task_index.INDEX_FILENAME).exists()
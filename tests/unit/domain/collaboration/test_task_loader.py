@@ -0,0 +1,79 @@
+"""
+Unit tests for the bulk task loader.
+
+Tests src.domain.collaboration.task_loader: ordering, error collection and
+the serial/thread/process pool variants.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.domain.collaboration.task_loader import load_tasks_bulk
+
+
+@pytest.fixture
+def task_files(tmp_path: Path) -> list[Path]:
+    """Twenty task files with one broken file in the middle."""
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"task-{i:02d}.yaml"
+        if i == 7:
+            path.write_text("id: [unclosed\n")
+        else:
+            path.write_text(yaml.dump({"id": f"task-{i:02d}", "status": "new"}))
+        paths.append(path)
+    # Shuffle so ordering is not accidentally alphabetical
+    return paths[::2] + paths[1::2]
+
+
+@pytest.mark.parametrize("pool", ["serial", "thread", "process"])
+def test_results_follow_input_order(task_files, pool):
+    """Test that every pool kind returns one result per path, in order."""
+    results = load_tasks_bulk(
+        task_files, pool=pool, workers=2, chunk_size=3, parallel_threshold=0
+    )
+
+    assert [r.path for r in results] == task_files
+    loaded = [r.task["id"] for r in results if r.task is not None]
+    assert loaded == [p.stem for p in task_files if p.stem != "task-07"]
+
+
+@pytest.mark.parametrize("pool", ["serial", "process"])
+def test_errors_are_collected_and_logged(task_files, pool, caplog):
+    """Test that failures are reported like load_task_safe, not raised."""
+    missing = task_files[0].parent / "missing.yaml"
+
+    with caplog.at_level(logging.WARNING):
+        results = load_tasks_bulk(
+            [*task_files, missing], pool=pool, workers=2, parallel_threshold=0
+        )
+
+    failed = {r.path.name: r.error for r in results if r.task is None}
+    assert set(failed) == {"task-07.yaml", "missing.yaml"}
+    assert "not found" in failed["missing.yaml"]
+    assert "Failed to load task" in caplog.text
+
+
+def test_small_batches_are_parsed_inline(task_files, monkeypatch):
+    """Test that no pool is created below the parallel threshold."""
+    from src.domain.collaboration import task_loader
+
+    def fail(*args, **kwargs):
+        raise AssertionError("pool should not be used")
+
+    monkeypatch.setattr(task_loader, "_make_executor", fail)
+
+    results = load_tasks_bulk(task_files, pool="process", parallel_threshold=100)
+
+    assert len(results) == len(task_files)
+
+
+def test_unknown_pool_kind_rejected(task_files):
+    """Test that an invalid pool kind is a programming error."""
+    with pytest.raises(ValueError, match="Unknown pool kind"):
+        load_tasks_bulk(task_files, pool="gpu", workers=2, parallel_threshold=0)
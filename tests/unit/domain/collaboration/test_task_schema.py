@@ -0,0 +1,149 @@
+"""
+Unit tests for task file writes and batched moves.
+
+Tests the atomic write path of write_task() and the move_tasks() batch API
+in src.domain.collaboration.task_schema.
+"""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.domain.collaboration import task_schema
+from src.domain.collaboration.task_schema import (
+    TaskIOError,
+    TaskMove,
+    TaskValidationError,
+    move_tasks,
+    read_task,
+    write_task,
+)
+
+
+def _task(task_id: str, status: str = "new") -> dict:
+    return {"id": task_id, "status": status, "agent": "python-pedro"}
+
+
+class TestWriteTask:
+    """Test atomic single-task writes."""
+
+    def test_failed_write_keeps_previous_content(self, tmp_path):
+        """Test that an encoding failure never truncates the existing file."""
+        path = tmp_path / "task.yaml"
+        write_task(path, _task("t-1"))
+
+        with patch.object(task_schema, "encode_task", side_effect=RuntimeError):
+            with pytest.raises(TaskIOError):
+                write_task(path, _task("t-1", "done"))
+
+        assert read_task(path)["status"] == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["task.yaml"]
+
+    def test_respects_umask_file_mode(self, tmp_path):
+        """Test that files get the same mode as a plain open() would give."""
+        reference = tmp_path / "reference"
+        reference.write_text("")
+        path = tmp_path / "task.yaml"
+
+        write_task(path, _task("t-1"))
+
+        assert path.stat().st_mode == reference.stat().st_mode
+
+
+class TestMoveTasks:
+    """Test the batched transactional move API."""
+
+    def test_moves_batch_and_removes_sources(self, tmp_path):
+        """Test that every task lands at its destination exactly once."""
+        inbox = tmp_path / "inbox"
+        moves = []
+        for i in range(5):
+            source = inbox / f"t-{i}.yaml"
+            write_task(source, _task(f"t-{i}"))
+            dest = tmp_path / "assigned" / f"agent-{i % 2}" / source.name
+            moves.append(
+                TaskMove(dest=dest, task=_task(f"t-{i}", "assigned"), source=source)
+            )
+
+        errors = move_tasks(moves)
+
+        assert errors == [None] * 5
+        assert list(inbox.iterdir()) == []
+        for move in moves:
+            assert read_task(move.dest)["status"] == "assigned"
+
+    def test_directories_fsynced_once_per_batch(self, tmp_path):
+        """Test one fsync per file plus one per affected directory."""
+        moves = []
+        for i in range(10):
+            source = tmp_path / "inbox" / f"t-{i}.yaml"
+            write_task(source, _task(f"t-{i}"))
+            dest = tmp_path / "assigned" / "agent" / source.name
+            moves.append(TaskMove(dest=dest, task=_task(f"t-{i}"), source=source))
+
+        with patch.object(task_schema.os, "fsync", wraps=os.fsync) as fsync:
+            move_tasks(moves)
+
+        # 10 files + assigned/agent/ + inbox/
+        assert fsync.call_count == 12
+
+    def test_non_durable_skips_fsync(self, tmp_path):
+        """Test that durable=False trades crash durability for speed."""
+        with patch.object(task_schema.os, "fsync") as fsync:
+            move_tasks(
+                [TaskMove(dest=tmp_path / "t.yaml", task=_task("t"))], durable=False
+            )
+
+        fsync.assert_not_called()
+        assert read_task(tmp_path / "t.yaml")["id"] == "t"
+
+    def test_failed_entry_leaves_source_untouched(self, tmp_path):
+        """Test per-move errors: invalid tasks stay put, others complete."""
+        good_source = tmp_path / "inbox" / "good.yaml"
+        bad_source = tmp_path / "inbox" / "bad.yaml"
+        write_task(good_source, _task("good"))
+        write_task(bad_source, _task("bad"))
+
+        errors = move_tasks(
+            [
+                TaskMove(tmp_path / "out" / "bad.yaml", {"id": "bad"}, bad_source),
+                TaskMove(tmp_path / "out" / "good.yaml", _task("good"), good_source),
+            ]
+        )
+
+        assert isinstance(errors[0], TaskValidationError)
+        assert errors[1] is None
+        assert bad_source.exists()
+        assert not (tmp_path / "out" / "bad.yaml").exists()
+        assert not good_source.exists()
+
+    def test_interrupted_write_never_exposes_partial_file(self, tmp_path):
+        """Test that a crash while encoding leaves no task file behind."""
+        dest = tmp_path / "out" / "t.yaml"
+
+        def partial_dump(task, stream):
+            stream.write("id: t\nstat")
+            raise OSError("disk full")
+
+        with patch.object(task_schema, "encode_task", side_effect=partial_dump):
+            errors = move_tasks([TaskMove(dest=dest, task=_task("t"))])
+
+        assert isinstance(errors[0], TaskIOError)
+        assert list((tmp_path / "out").iterdir()) == []
+
+    def test_temp_files_are_not_task_files(self, tmp_path):
+        """Test that in-flight temp files don't match *.yaml globs."""
+        seen = []
+
+        def dump_and_look(task, stream):
+            seen.extend(p.name for p in (tmp_path).glob("*.yaml"))
+            yaml.safe_dump(task, stream)
+
+        with patch.object(task_schema, "encode_task", side_effect=dump_and_look):
+            move_tasks([TaskMove(dest=tmp_path / "t.yaml", task=_task("t"))])
+
+        assert seen == []
@@ -0,0 +1,210 @@
+"""
+Unit tests for the streaming, indexed JSONL EventReader (ADR-047).
+
+Validates server-side filters, sidecar offset index lookups, index
+catch-up and rotation, and tail/follow from saved offsets.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from llm_service.telemetry import event_reader
+from llm_service.telemetry.event_reader import EventReader
+from llm_service.telemetry.event_schema import Event, EventType
+from llm_service.telemetry.event_writer import EventWriter
+
+
+@pytest.fixture
+def jsonl_path(tmp_path):
+    """Temporary JSONL file path."""
+    return tmp_path / "events.jsonl"
+
+
+@pytest.fixture
+def writer(jsonl_path):
+    """EventWriter with no rotation."""
+    return EventWriter(jsonl_path)
+
+
+def _make_event(event_type=EventType.TASK_STARTED, **kwargs):
+    """Helper to create test events."""
+    return Event(event=event_type, **kwargs)
+
+
+def _populate(writer):
+    """Two runs with two tasks each, started and completed."""
+    for run in ("r1", "r2"):
+        for task in ("t1", "t2"):
+            for hour, event_type in (
+                (1, EventType.TASK_STARTED),
+                (2, EventType.TASK_COMPLETED),
+            ):
+                writer.emit(
+                    _make_event(
+                        event_type,
+                        run_id=run,
+                        task_id=f"{run}-{task}",
+                        ts=f"2026-03-01T0{hour}:00:00+00:00",
+                    )
+                )
+
+
+class TestEventReaderFilters:
+    """Server-side filtering while streaming."""
+
+    def test_filters_combine(self, writer, jsonl_path):
+        _populate(writer)
+        reader = EventReader(jsonl_path)
+
+        completed = reader.iter_events(
+            event_types=[EventType.TASK_COMPLETED], run_id="r2"
+        )
+        assert [e.task_id for e in completed] == ["r2-t1", "r2-t2"]
+        task = list(reader.iter_events(task_id="r1-t2"))
+        assert [e.event for e in task] == [
+            EventType.TASK_STARTED,
+            EventType.TASK_COMPLETED,
+        ]
+        early = reader.iter_events(until="2026-03-01T02:00:00+00:00")
+        assert len(list(early)) == 4
+
+    def test_time_bounds_are_normalized_to_utc(self, writer, jsonl_path):
+        _populate(writer)
+        reader = EventReader(jsonl_path)
+
+        for since in (
+            "2026-03-01T02:00:00Z",
+            datetime(2026, 3, 1, 2),  # naive: taken as UTC
+            datetime(2026, 3, 1, 4, tzinfo=timezone(timedelta(hours=2))),
+        ):
+            later = list(reader.iter_events(since=since))
+            assert len(later) == 4
+            assert {e.event for e in later} == {EventType.TASK_COMPLETED}
+        assert len(list(reader.iter_events(until="2026-03-01T02:00:00Z"))) == 4
+
+    def test_final_line_without_newline_is_read(self, writer, jsonl_path):
+        writer.emit(_make_event(run_id="r1", task_id="a"))
+        with open(jsonl_path, "a") as f:
+            f.write(_make_event(run_id="r1", task_id="b").to_json())
+        reader = EventReader(jsonl_path)
+
+        assert [e.task_id for e in reader.iter_events()] == ["a", "b"]
+        assert [e.task_id for e in reader.iter_events(run_id="r1")] == ["a", "b"]
+        assert [e.task_id for e in writer.read_events()] == ["a", "b"]
+        stop = threading.Event()
+        stop.set()
+        # follow() waits for the newline, so a resumed offset never splits it
+        assert [e.task_id for _, e in reader.follow(stop=stop)] == ["a"]
+
+    def test_streams_lazily(self, writer, jsonl_path):
+        _populate(writer)
+        events = EventReader(jsonl_path).iter_events()
+
+        assert next(events).task_id == "r1-t1"
+
+    def test_writer_iter_events_includes_pending(self, jsonl_path):
+        with EventWriter(jsonl_path, group_commit=True, batch_window=10) as w:
+            w.emit(_make_event(task_id="pending"))
+
+            assert [e.task_id for e in w.iter_events(task_id="pending")] == ["pending"]
+
+
+class TestEventReaderIndex:
+    """Sidecar byte-offset index per run_id/task_id."""
+
+    def test_lookup_reads_only_new_and_matching_lines(
+        self, writer, jsonl_path, monkeypatch
+    ):
+        _populate(writer)
+        reader = EventReader(jsonl_path)
+        assert len(list(reader.iter_events(task_id="r1-t1"))) == 2
+        assert reader.index_path.exists()
+
+        decoded = []
+        decode = event_reader._decode
+        monkeypatch.setattr(
+            event_reader,
+            "_decode",
+            lambda line: (decoded.append(line), decode(line))[1],
+        )
+        writer.emit(_make_event(run_id="r3", task_id="r3-t1"))
+
+        assert [e.task_id for e in reader.iter_events(run_id="r3")] == ["r3-t1"]
+        assert len(decoded) == 2  # catch-up of the new line + the match
+
+    def test_incomplete_line_indexed_once_complete(self, writer, jsonl_path):
+        writer.emit(_make_event(task_id="a"))
+        reader = EventReader(jsonl_path)
+        partial = _make_event(task_id="b").to_json()
+        with open(jsonl_path, "a") as f:
+            f.write("{corrupt\n" + partial[:10])
+
+        assert list(reader.iter_events(task_id="b")) == []
+        with open(jsonl_path, "a") as f:
+            f.write(partial[10:] + "\n")
+
+        assert [e.task_id for e in reader.iter_events(task_id="b")] == ["b"]
+
+    def test_rotation_rebuilds_index(self, writer, jsonl_path):
+        reader = EventReader(jsonl_path)
+        for _ in range(3):
+            writer.emit(_make_event(task_id="same"))
+        assert len(list(reader.iter_events(task_id="same"))) == 3
+
+        jsonl_path.rename(jsonl_path.with_suffix(".jsonl.1"))
+        writer.emit(_make_event(task_id="same", summary="after rotation"))
+
+        assert [e.summary for e in reader.iter_events(task_id="same")] == [
+            "after rotation"
+        ]
+
+    def test_unusable_index_falls_back_to_scan(self, writer, jsonl_path):
+        _populate(writer)
+        reader = EventReader(jsonl_path)
+        reader.index_path.mkdir()  # can't be opened as a database
+
+        assert len(list(reader.iter_events(run_id="r1"))) == 4
+        assert reader.use_index is False
+
+
+class TestEventReaderFollow:
+    """Tail/follow from saved offsets."""
+
+    def test_resume_from_saved_offset(self, writer, jsonl_path):
+        reader = EventReader(jsonl_path)
+        stop = threading.Event()
+        stop.set()  # drain and return
+        writer.emit(_make_event(task_id="one"))
+        writer.emit(_make_event(task_id="two"))
+
+        seen = list(reader.follow(stop=stop))
+        assert [e.task_id for _, e in seen] == ["one", "two"]
+        saved = seen[-1][0]
+        assert saved == reader.end_offset()
+
+        writer.emit(_make_event(task_id="three"))
+        assert [e.task_id for _, e in reader.follow(saved, stop=stop)] == ["three"]
+        assert [e.task_id for e in reader.iter_events(offset=saved)] == ["three"]
+
+    def test_follow_waits_for_new_events(self, writer, jsonl_path):
+        reader = EventReader(jsonl_path)
+        stop = threading.Event()
+        received = []
+
+        def tail():
+            for _, event in reader.follow(
+                reader.end_offset(), poll_interval=0.01, stop=stop, task_id="live"
+            ):
+                received.append(event.task_id)
+                stop.set()
+
+        thread = threading.Thread(target=tail)
+        thread.start()
+        writer.emit(_make_event(task_id="other"))
+        writer.emit(_make_event(task_id="live"))
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert received == ["live"]
@@ -7,11 +7,11 @@ Validates append-only write with fsync, file rotation, crash-safety
 
 import json
 import threading
+
 import pytest
-from pathlib import Path
 
 from llm_service.telemetry.event_schema import Event, EventType
-from llm_service.telemetry.event_writer import EventWriter
+from llm_service.telemetry.event_writer import Durability, EventWriter
 
 
 @pytest.fixture
@@ -184,12 +184,124 @@ class TestEventWriterConcurrency:
         assert len(events) == 100  # 5 threads × 20 events
 
 
+class TestEventWriterGroupCommit:
+    """Group-commit mode: persistent fd, batched fsync, ack futures."""
+
+    def test_concurrent_emitters_share_fsyncs(self, jsonl_path, monkeypatch):
+        import os
+
+        fsyncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: (fsyncs.append(fd), real_fsync(fd)))
+        w = EventWriter(jsonl_path, group_commit=True, batch_window=0.02)
+
+        def write_events(start):
+            acks = [
+                w.emit(_make_event(task_id=f"thread-{start}-{i}")) for i in range(50)
+            ]
+            for ack in acks:
+                ack.result(timeout=5)
+
+        threads = [threading.Thread(target=write_events, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        w.close()
+
+        lines = jsonl_path.read_text().splitlines()
+        assert len(lines) == 200
+        assert all(json.loads(line)["event"] == "task_started" for line in lines)
+        assert len(fsyncs) < 50  # far fewer than one per event
+
+    def test_fsync_ack_means_on_disk(self, jsonl_path):
+        with EventWriter(
+            jsonl_path, group_commit=True, durability=Durability.QUEUED
+        ) as w:
+            queued = w.emit(_make_event(task_id="queued"))
+            strict = w.emit(_make_event(task_id="strict"), Durability.FSYNC)
+
+            assert queued.done()
+            strict.result(timeout=5)
+            lines = jsonl_path.read_text().splitlines()
+            assert [json.loads(line)["task_id"] for line in lines] == [
+                "queued",
+                "strict",
+            ]
+
+    def test_written_durability_skips_fsync(self, jsonl_path, monkeypatch):
+        import os
+
+        fsyncs = []
+        monkeypatch.setattr(os, "fsync", fsyncs.append)
+        w = EventWriter(jsonl_path, group_commit=True, durability=Durability.WRITTEN)
+        w.emit(_make_event()).result(timeout=5)
+
+        assert jsonl_path.read_text().count("\n") == 1
+        assert fsyncs == []
+        w.close()
+        assert len(fsyncs) == 1  # close makes everything durable
+
+    def test_read_events_sees_pending_events(self, jsonl_path):
+        with EventWriter(jsonl_path, group_commit=True, batch_window=10) as w:
+            w.emit(_make_event(task_id="pending"))
+
+            assert [e.task_id for e in w.read_events()] == ["pending"]
+
+    def test_rotation_with_persistent_fd(self, jsonl_path):
+        with EventWriter(jsonl_path, max_size_bytes=200, group_commit=True) as w:
+            for i in range(10):
+                w.emit(_make_event(task_id=f"task-{i}", summary="x" * 50)).result(
+                    timeout=5
+                )
+
+        rotated = jsonl_path.with_suffix(".jsonl.1")
+        assert rotated.exists()
+        last = jsonl_path.read_text().splitlines()[-1]
+        assert json.loads(last)["task_id"] == "task-9"
+
+    def test_emit_after_close_is_synchronous(self, jsonl_path):
+        w = EventWriter(jsonl_path, group_commit=True)
+        w.close()
+
+        assert w.emit(_make_event(task_id="late")).done()
+        assert [e.task_id for e in w.read_events()] == ["late"]
+
+    def test_failed_batch_fails_its_futures(self, jsonl_path, monkeypatch):
+        with EventWriter(jsonl_path, group_commit=True) as w:
+            monkeypatch.setattr(
+                w, "_maybe_rotate", lambda: (_ for _ in ()).throw(ValueError("bad"))
+            )
+            with pytest.raises(ValueError, match="bad"):
+                w.emit(_make_event(task_id="lost")).result(timeout=5)
+
+            monkeypatch.undo()
+            w.emit(_make_event(task_id="kept")).result(timeout=5)  # still flushing
+        assert [e.task_id for e in w.read_events()] == ["kept"]
+
+    def test_emit_with_dead_flusher_is_synchronous(self, jsonl_path):
+        w = EventWriter(jsonl_path, group_commit=True)
+        flusher = w._flusher
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+        w._flusher = dead
+
+        ack = w.emit(_make_event(task_id="late"), Durability.FSYNC)
+
+        assert ack.done()
+        assert [e.task_id for e in w.read_events()] == ["late"]
+        w._flusher = flusher
+        w.close()
+
+
 class TestEventWriterCompatibility:
     """Compatibility with existing telemetry (no breaking changes)."""
 
     def test_does_not_affect_sqlite_telemetry(self, tmp_path):
         """EventWriter operates on JSONL; SQLite logger is independent."""
         from llm_service.telemetry.logger import TelemetryLogger
+
         db_path = tmp_path / "telemetry.db"
         jsonl_path = tmp_path / "events.jsonl"
 
@@ -555,3 +555,89 @@ def test_query_invocations_by_status(logger):
 
     assert error_count == 2
     assert success_count == 3
+
+
+def _record(invocation_id: str, cost_usd: float = 0.01) -> InvocationRecord:
+    """Helper: minimal successful invocation record."""
+    return InvocationRecord(
+        invocation_id=invocation_id,
+        agent_name="test-agent",
+        tool_name="claude-code",
+        model_name="claude-3.5-sonnet",
+        prompt_tokens=10,
+        completion_tokens=20,
+        total_tokens=30,
+        cost_usd=cost_usd,
+        latency_ms=100,
+        status="success",
+    )
+
+
+def test_background_writer_drains_on_close(temp_db):
+    """Test background mode writes every queued record before close returns."""
+    logger = TelemetryLogger(temp_db, background=True, batch_size=16)
+    for i in range(100):
+        logger.log_invocation(_record(f"bg-{i}"))
+    logger.close()
+
+    with sqlite3.connect(temp_db) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM invocations").fetchone()[0]
+        rollup = conn.execute(
+            "SELECT SUM(invocations), SUM(total_tokens) FROM daily_costs"
+        ).fetchone()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert count == 100
+    assert rollup == (100, 3000)
+    assert journal_mode == "wal"
+    assert logger.dropped_records == 0
+
+
+def test_background_writer_queries_see_queued_records(temp_db):
+    """Test queries flush the queue first (read-your-writes)."""
+    with TelemetryLogger(temp_db, background=True, flush_interval=10) as logger:
+        logger.log_invocation(_record("queued"))
+
+        assert [r["invocation_id"] for r in logger.get_invocations()] == ["queued"]
+
+
+def test_background_writer_drops_duplicates_only(temp_db):
+    """Test a failing record doesn't take the rest of its batch with it."""
+    with TelemetryLogger(temp_db, background=True) as logger:
+        for invocation_id in ["a", "b", "a", "c"]:
+            logger.log_invocation(_record(invocation_id))
+        logger.flush()
+
+        assert logger.dropped_records == 1
+        assert logger.get_statistics()["total_invocations"] == 3
+
+
+def test_background_writer_counts_records_dropped_when_full(temp_db):
+    """Test records beyond the queue bound are dropped and counted."""
+    import threading
+    import time
+    from unittest.mock import patch
+
+    release = threading.Event()
+    write_batch = TelemetryLogger._write_batch
+
+    def blocked_write(self, conn, records):
+        release.wait(timeout=5)
+        write_batch(self, conn, records)
+
+    with patch.object(TelemetryLogger, "_write_batch", blocked_write):
+        logger = TelemetryLogger(temp_db, background=True, batch_size=1, max_queue=2)
+        logger.log_invocation(_record("first"))
+        deadline = time.monotonic() + 5
+        while logger._queue.qsize():  # wait for the writer to take it
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        for i in range(3):
+            logger.log_invocation(_record(f"queued-{i}"))
+        release.set()
+        logger.close()
+
+    assert logger.dropped_records == 1
+    with sqlite3.connect(temp_db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM invocations").fetchone()[0] == 3
@@ -0,0 +1,192 @@
+"""
+Unit tests for telemetry retention (rollups, pruning, compaction).
+"""
+
+import json
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from llm_service.telemetry.logger import InvocationRecord, TelemetryLogger
+from llm_service.telemetry.retention import (
+    LATENCY_BUCKETS_MS,
+    RetentionEngine,
+    RetentionPolicy,
+    latency_bucket,
+)
+
+NOW = datetime(2026, 6, 30, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create temporary database."""
+    return tmp_path / "test_telemetry.db"
+
+
+@pytest.fixture
+def logger(temp_db):
+    """Create telemetry logger."""
+    return TelemetryLogger(temp_db)
+
+
+def _log(logger, invocation_id, timestamp, latency_ms=100, cost_usd=0.01, agent=None):
+    """Helper: log one invocation."""
+    logger.log_invocation(
+        InvocationRecord(
+            invocation_id=invocation_id,
+            agent_name=agent,
+            tool_name="claude-code",
+            model_name="claude-3.5-sonnet",
+            prompt_tokens=10,
+            completion_tokens=20,
+            total_tokens=30,
+            cost_usd=cost_usd,
+            latency_ms=latency_ms,
+            status="success",
+            timestamp=timestamp,
+        )
+    )
+
+
+def _rows(db_path, query):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(query).fetchall()
+
+
+def test_latency_buckets():
+    """Test latencies map to inclusive upper-bound buckets plus overflow."""
+    assert latency_bucket(0) == 0
+    assert latency_bucket(100) == 0
+    assert latency_bucket(101) == 1
+    assert latency_bucket(10**9) == len(LATENCY_BUCKETS_MS)
+
+
+def test_roll_up_aggregates_hourly_and_daily(logger, temp_db):
+    """Test invocations are summed per hour and day with a latency histogram."""
+    _log(logger, "a", NOW.replace(hour=9, minute=5), latency_ms=50)
+    _log(logger, "b", NOW.replace(hour=9, minute=55), latency_ms=700)
+    _log(logger, "c", NOW.replace(hour=10), latency_ms=90_000)
+
+    report = RetentionEngine(temp_db, RetentionPolicy(raw_days=0)).run(now=NOW)
+
+    assert report.rolled_up == 3
+    hourly = _rows(
+        temp_db,
+        "SELECT hour, agent_name, invocations, total_latency_ms, max_latency_ms, "
+        "latency_histogram FROM usage_hourly ORDER BY hour",
+    )
+    assert [row[:5] for row in hourly] == [
+        ("2026-06-30 09", "", 2, 750, 700),
+        ("2026-06-30 10", "", 1, 90_000, 90_000),
+    ]
+    histogram = json.loads(hourly[0][5])
+    assert histogram[latency_bucket(50)] == 1
+    assert histogram[latency_bucket(700)] == 1
+    assert sum(histogram) == 2
+    assert _rows(
+        temp_db, "SELECT date, invocations, total_tokens FROM usage_daily"
+    ) == [("2026-06-30", 3, 90)]
+
+
+def test_roll_up_is_incremental(logger, temp_db):
+    """Test later runs only add new invocations and merge histograms."""
+    engine = RetentionEngine(temp_db, RetentionPolicy(raw_days=0))
+    _log(logger, "a", NOW, latency_ms=50)
+    engine.run(now=NOW)
+    _log(logger, "b", NOW, latency_ms=50)
+
+    assert engine.run(now=NOW).rolled_up == 1
+    assert engine.run(now=NOW).rolled_up == 0
+    invocations, histogram = _rows(
+        temp_db, "SELECT invocations, latency_histogram FROM usage_daily"
+    )[0]
+    assert invocations == 2
+    assert json.loads(histogram)[latency_bucket(50)] == 2
+
+
+def test_prune_keeps_rollups_and_recent_rows(logger, temp_db):
+    """Test raw rows past the horizon go once rolled up; totals survive."""
+    _log(logger, "old", NOW - timedelta(days=45), cost_usd=1.0)
+    _log(logger, "older", NOW - timedelta(days=120), cost_usd=2.0)
+    _log(logger, "new", NOW - timedelta(days=1), cost_usd=0.5)
+
+    report = RetentionEngine(temp_db, RetentionPolicy(raw_days=30)).run(now=NOW)
+
+    assert report.pruned_invocations == 2
+    assert report.pruned_hourly == 1  # hourly rollups are kept 90 days
+    assert _rows(temp_db, "SELECT invocation_id FROM invocations") == [("new",)]
+    assert _rows(temp_db, "SELECT SUM(total_cost_usd) FROM usage_daily") == [(3.5,)]
+    assert _rows(temp_db, "SELECT SUM(total_cost_usd) FROM daily_costs") == [(3.5,)]
+
+
+def test_daily_retention_prunes_daily_costs(logger, temp_db):
+    """Test a daily horizon also applies to the daily_costs rollup."""
+    _log(logger, "old", NOW - timedelta(days=400))
+    _log(logger, "new", NOW)
+
+    policy = RetentionPolicy(raw_days=30, hourly_days=30, daily_days=365)
+    report = RetentionEngine(temp_db, policy).run(now=NOW)
+
+    assert report.pruned_daily == 2
+    assert _rows(temp_db, "SELECT date FROM daily_costs") == [("2026-06-30",)]
+
+
+def test_vacuum_releases_pages(temp_db):
+    """Test legacy databases are only converted as a maintenance step."""
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("CREATE TABLE filler (data BLOB)")
+        conn.executemany(
+            "INSERT INTO filler VALUES (?)", [(b"x" * 4096,) for _ in range(200)]
+        )
+    logger = TelemetryLogger(temp_db)  # schema added after tables exist
+    _log(logger, "a", NOW)
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("DELETE FROM filler")
+    engine = RetentionEngine(temp_db)
+
+    assert engine.run(now=NOW).freed_pages == 0
+    assert _rows(temp_db, "PRAGMA auto_vacuum") == [(0,)]
+
+    assert engine.convert_to_incremental() >= 200
+    assert _rows(temp_db, "PRAGMA auto_vacuum") == [(2,)]
+    assert engine.convert_to_incremental() == 0
+
+
+def test_policy_from_config():
+    """Test the policy follows TelemetryConfig."""
+    from llm_service.config.schemas import TelemetryConfig
+
+    config = TelemetryConfig(retention_days=7, hourly_retention_days=14)
+
+    assert RetentionPolicy.from_config(config) == RetentionPolicy(
+        raw_days=7, hourly_days=14, daily_days=0, vacuum_pages=1000
+    )
+
+
+def test_logger_runs_retention_at_policy_interval(temp_db):
+    """Test the writer's retention interval defaults to the policy's."""
+    from llm_service.config.schemas import TelemetryConfig
+
+    policy = RetentionPolicy.from_config(TelemetryConfig(retention_interval_hours=0.5))
+
+    assert TelemetryLogger(temp_db, retention=policy).retention_interval == 1800
+    logger = TelemetryLogger(temp_db, retention=policy, retention_interval=5)
+    assert logger.retention_interval == 5
+
+
+def test_background_writer_applies_retention(temp_db):
+    """Test the background writer runs retention while idle."""
+    with TelemetryLogger(
+        temp_db,
+        background=True,
+        retention=RetentionPolicy(raw_days=0),
+        retention_interval=0.05,
+    ) as logger:
+        _log(logger, "a", datetime.now(timezone.utc))
+        deadline = time.monotonic() + 5
+        while not _rows(temp_db, "SELECT * FROM usage_daily"):
+            assert time.monotonic() < deadline, "retention did not run"
+            time.sleep(0.05)